@@ -0,0 +1,90 @@
+"""Benchmarks for the validation of large messages from asyncio code with
+`flockwave.spec.async_validator`.
+
+The workload validates a batch of large UAV-INF responses while a heartbeat
+task tries to wake up every millisecond. The benchmark reports the longest
+time the event loop was blocked, as seen by the heartbeat, and the time it
+took to validate the entire batch. The baseline validates the responses
+directly in the coroutine.
+"""
+
+import asyncio
+from time import perf_counter
+from typing import Any
+
+from bench_validation import create_uav_inf_response
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.async_validator import AsyncValidator
+from flockwave.spec.validator import create_dispatching_validator
+
+NUM_MESSAGES = 20
+"""Number of messages in the batch."""
+
+NUM_UAVS = 5000
+"""Number of UAVs in a single UAV-INF response."""
+
+MESSAGE_SIZE = NUM_UAVS * 100
+"""Approximate size of a single encoded UAV-INF response, in bytes."""
+
+
+async def measure_stall(validate: Any, bodies: list[Any]) -> tuple[float, float]:
+    """Validates the given bodies with the given coroutine function and returns
+    the longest stall of the event loop and the total time of the validation.
+    """
+    longest_stall = 0.0
+    done = False
+
+    async def heartbeat() -> None:
+        nonlocal longest_stall
+        while not done:
+            started_at = perf_counter()
+            await asyncio.sleep(0.001)
+            longest_stall = max(longest_stall, perf_counter() - started_at)
+
+    task = asyncio.ensure_future(heartbeat())
+    await asyncio.sleep(0.01)
+
+    started_at = perf_counter()
+    await asyncio.gather(*(validate(body) for body in bodies))
+    elapsed = perf_counter() - started_at
+
+    done = True
+    await task
+    return longest_stall, elapsed
+
+
+def report(ctx: BenchmarkContext, name: str, result: tuple[float, float]) -> None:
+    for suffix, value in zip(("stall", "total"), result, strict=True):
+        ctx.report(
+            f"async_validation/{name}/{suffix}", value, "s", higher_is_better=False
+        )
+
+
+async def validate_offloaded(executor: str, bodies: list[Any]) -> tuple[float, float]:
+    """Validates the given bodies with an `AsyncValidator` that offloads them
+    to a pool of the given type and measures the stalls of the event loop.
+    """
+    validator = AsyncValidator("response", executor=executor)  # type: ignore
+    async with validator:
+
+        async def validate(body: Any) -> None:
+            await validator.validate(body, size=MESSAGE_SIZE)
+
+        # Warm up the workers so their start-up cost is not measured
+        await asyncio.gather(*(validate(body) for body in bodies[:4]))
+        return await measure_stall(validate, bodies)
+
+
+@benchmark("async_validation")
+def run(ctx: BenchmarkContext) -> None:
+    bodies = [create_uav_inf_response(NUM_UAVS) for _ in range(NUM_MESSAGES)]
+    validator = create_dispatching_validator("response")
+    validator(bodies[0])
+
+    async def validate_inline(body: Any) -> None:
+        validator(body)
+
+    report(ctx, "inline", asyncio.run(measure_stall(validate_inline, bodies)))
+    for executor in ("thread", "process"):
+        report(ctx, executor, asyncio.run(validate_offloaded(executor, bodies)))
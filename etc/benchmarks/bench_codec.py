@@ -0,0 +1,54 @@
+"""Benchmarks comparing the binary codec of `flockwave.spec.codec` with JSON,
+in terms of the size of the encoded messages and encoding and decoding
+throughput.
+"""
+
+import json
+from typing import Any
+
+from bench_validation import UAV_COUNTS, create_uav_inf_response, load_example_bodies
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.codec import decode, encode
+
+
+def create_message(body: Any) -> dict[str, Any]:
+    """Wraps a message body in a message envelope."""
+    return {
+        "$fw.version": "1.0",
+        "id": "a1b2c3d4e5f60718293a4b5c6d7e8f90",
+        "body": body,
+    }
+
+
+def encode_json(message: Any) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode("utf-8")
+
+
+@benchmark("codec")
+def run(ctx: BenchmarkContext) -> None:
+    examples = [
+        create_message(body)
+        for bodies in load_example_bodies().values()
+        for body in bodies
+    ]
+    workloads = {"examples": examples}
+    for num_uavs in UAV_COUNTS:
+        workloads[f"UAV-INF/{num_uavs}"] = [
+            create_message(create_uav_inf_response(num_uavs))
+        ]
+
+    for name, messages in workloads.items():
+        for codec, encoder, decoder in (
+            ("json", encode_json, json.loads),
+            ("binary", encode, decode),
+        ):
+            encoded = [encoder(message) for message in messages]
+            ctx.report(
+                f"codec/{codec}/{name}/size",
+                sum(len(item) for item in encoded) / len(encoded),
+                "bytes",
+                higher_is_better=False,
+            )
+            ctx.measure_throughput(f"codec/{codec}/{name}/encode", encoder, messages)
+            ctx.measure_throughput(f"codec/{codec}/{name}/decode", decoder, encoded)
@@ -0,0 +1,126 @@
+"""Benchmarks for the columnar decoding of UAV-INF responses into NumPy
+arrays and the encoding of NumPy arrays into UAV-INF responses.
+
+The baseline of the decoder validates the response with the schema validator
+and then builds the arrays from the status objects field by field, which is
+what a typical analytics client would do without `flockwave.spec.columnar`.
+The baseline of the encoder builds a status object for each UAV from the
+arrays, validates the response and serializes it with the `json` module.
+"""
+
+import json
+from typing import Any
+
+import numpy as np
+from bench_validation import UAV_COUNTS, create_uav_inf_response
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.columnar import decode_uav_inf, encode_uav_inf
+from flockwave.spec.validator import create_dispatching_validator
+
+
+def extract_columns(body: dict[str, Any]) -> dict[str, np.ndarray]:
+    """Builds some of the columns of a UAV-INF response object by object."""
+    items = list(body["status"].values())
+    return {
+        "latitude": np.array(
+            [item["position"][0] if "position" in item else 0 for item in items],
+            dtype=np.int32,
+        ),
+        "longitude": np.array(
+            [item["position"][1] if "position" in item else 0 for item in items],
+            dtype=np.int32,
+        ),
+        "heading": np.array([item.get("heading", 0) for item in items], np.int16),
+        "battery_voltage": np.array(
+            [item["battery"][0] if "battery" in item else 0 for item in items],
+            dtype=np.int32,
+        ),
+        "light": np.array([item.get("light", 0) for item in items], np.uint16),
+        "timestamp": np.array([item["timestamp"] for item in items], np.float64),
+    }
+
+
+def create_fleet_arrays(num_uavs: int) -> dict[str, Any]:
+    """Creates the state of a simulated fleet as arrays."""
+    rows = np.arange(num_uavs)
+    return {
+        "ids": [f"{index:05}" for index in range(num_uavs)],
+        "timestamp": 1449562661000,
+        "mode": "mission",
+        "position": np.column_stack(
+            [47.47 + rows * 1e-6, 19.06 - rows * 1e-6, np.full(num_uavs, 120.0)]
+        ),
+        "heading": (rows * 7.5) % 360,
+        "velocity": np.column_stack(
+            [np.full(num_uavs, 2.0), rows % 3 - 1.0, np.zeros(num_uavs)]
+        ),
+        "battery_voltage": np.full(num_uavs, 12.4),
+        "battery_percentage": np.full(num_uavs, 80),
+        "light": np.column_stack([rows % 256, np.full(num_uavs, 255), rows % 7]),
+        "errors": [[17, 41] if index % 10 == 0 else [] for index in range(num_uavs)],
+    }
+
+
+def encode_status_objects(fleet: dict[str, Any], validator: Any) -> str:
+    """Encodes the state of a fleet into a UAV-INF response object by object,
+    optionally validating the response before serializing it.
+    """
+    position = fleet["position"].tolist()
+    velocity = fleet["velocity"].tolist()
+    heading = fleet["heading"].tolist()
+    voltage = fleet["battery_voltage"].tolist()
+    percentage = fleet["battery_percentage"].tolist()
+    light = fleet["light"].tolist()
+    status = {}
+    for row, uav_id in enumerate(fleet["ids"]):
+        lat, lon, amsl = position[row]
+        red, green, blue = light[row]
+        status[uav_id] = {
+            "id": uav_id,
+            "mode": fleet["mode"],
+            "position": [round(lat * 1e7), round(lon * 1e7), round(amsl * 1000)],
+            "heading": round(heading[row] * 10) % 3600,
+            "velocity": [round(x * 1000) for x in velocity[row]],
+            "timestamp": fleet["timestamp"],
+            "battery": [round(voltage[row] * 10), percentage[row]],
+            "light": ((red >> 3) << 11) | ((green >> 2) << 5) | (blue >> 3),
+            "errors": fleet["errors"][row],
+        }
+    body = {"type": "UAV-INF", "status": status}
+    if validator is not None:
+        validator(body)
+    return json.dumps(body, separators=(",", ":"))
+
+
+@benchmark("columnar")
+def run(ctx: BenchmarkContext) -> None:
+    validator = create_dispatching_validator("response")
+
+    def validate_and_extract(body: dict[str, Any]) -> None:
+        validator(body)
+        extract_columns(body)
+
+    for num_uavs in UAV_COUNTS:
+        bodies = [create_uav_inf_response(num_uavs)]
+        prefix = f"columnar/UAV-INF/{num_uavs}"
+        ctx.measure_throughput(f"{prefix}/extract", extract_columns, bodies)
+        ctx.measure_throughput(
+            f"{prefix}/validate+extract", validate_and_extract, bodies
+        )
+        ctx.measure_throughput(f"{prefix}/decode", decode_uav_inf, bodies)
+
+        fleets = [create_fleet_arrays(num_uavs)]
+        ctx.measure_throughput(
+            f"{prefix}/build+dumps",
+            lambda fleet: encode_status_objects(fleet, None),
+            fleets,
+        )
+        ctx.measure_throughput(
+            f"{prefix}/build+validate+dumps",
+            lambda fleet: encode_status_objects(fleet, validator),
+            fleets,
+        )
+        ctx.measure_throughput(
+            f"{prefix}/encode", lambda fleet: encode_uav_inf(**fleet), fleets
+        )
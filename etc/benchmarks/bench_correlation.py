@@ -0,0 +1,152 @@
+"""Benchmarks for the correlation of requests, responses and asynchronous
+command executions in `flockwave.spec.correlation`.
+
+The workload models a command that is fanned out to a large fleet: one
+request per UAV, each of them matched with its response, and a single
+request whose response contains a receipt for every UAV, followed by one
+``ASYNC-RESP`` notification per receipt. The baseline for the timeouts is
+one asyncio timer per request, scheduled with ``loop.call_later()`` and
+cancelled when the response arrives.
+"""
+
+import asyncio
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.correlation import DEFAULT_TIMEOUT, CorrelationTable
+
+NUM_REQUESTS = 100000
+"""Number of requests and receipts in flight at the same time."""
+
+
+def measure_batch(
+    ctx: BenchmarkContext,
+    name: str,
+    setup: Callable[[], Any],
+    func: Callable[[Any], Any],
+    count: int = NUM_REQUESTS,
+) -> None:
+    """Measures how long it takes to process a batch of the given number of
+    items with a fresh state created by the setup function, and reports the
+    best result in ``items/s``.
+    """
+    best = float("inf")
+    for _ in range(ctx.repeat):
+        state = setup()
+        started_at = perf_counter()
+        func(state)
+        best = min(best, perf_counter() - started_at)
+    ctx.report(name, count / best, "items/s", higher_is_better=True)
+
+
+class Workload:
+    """Requests, responses and notifications of a command fanned out to a
+    fleet of the given size.
+    """
+
+    def __init__(self, size: int = NUM_REQUESTS):
+        self.ids = [f"{index:08x}-0000-4000-8000-000000000000" for index in range(size)]
+        self.responses = [
+            {"$fw.version": "1.0", "id": "r", "refs": id} for id in self.ids
+        ]
+        receipts = {f"{index:05}": f"rcpt-{index}" for index in range(size)}
+        self.fan_out = {
+            "id": "r",
+            "refs": self.ids[0],
+            "body": {"type": "UAV-TAKEOFF", "receipt": receipts},
+        }
+        self.notifications = [
+            {"type": "ASYNC-RESP", "id": id} for id in receipts.values()
+        ]
+
+    def add_requests(self, table: CorrelationTable) -> CorrelationTable:
+        for id in self.ids:
+            table.add_request(id)
+        return table
+
+    def create_table_with_requests(self) -> CorrelationTable:
+        return self.add_requests(CorrelationTable())
+
+    def create_table_with_receipts(self) -> CorrelationTable:
+        table = CorrelationTable()
+        table.add_request(self.ids[0])
+        table.match_response(self.fan_out)
+        return table
+
+    def match_responses(self, table: CorrelationTable) -> None:
+        for message in self.responses:
+            table.match_response(message)
+
+    def match_notifications(self, table: CorrelationTable) -> None:
+        for body in self.notifications:
+            table.match_notification(body)
+
+    def add_requests_and_match_responses(self, table: CorrelationTable) -> None:
+        self.add_requests(table)
+        self.match_responses(table)
+
+    def schedule_and_cancel_asyncio_timers(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        handles = {id: loop.call_later(30, int) for id in self.ids}
+        for message in self.responses:
+            handles.pop(message["refs"]).cancel()
+
+
+def expire_all(table: CorrelationTable) -> None:
+    expired = table.expire(table._clock() + DEFAULT_TIMEOUT + 1)
+    assert expired.requests and len(table) == 0
+
+
+@benchmark("correlation")
+def run(ctx: BenchmarkContext) -> None:
+    workload = Workload()
+
+    measure_batch(
+        ctx, "correlation/add-request", CorrelationTable, workload.add_requests
+    )
+    measure_batch(
+        ctx,
+        "correlation/match-response",
+        workload.create_table_with_requests,
+        workload.match_responses,
+    )
+    measure_batch(
+        ctx,
+        "correlation/fan-out-receipts",
+        workload.create_table_with_requests,
+        lambda table: table.match_response(workload.fan_out),
+    )
+    measure_batch(
+        ctx,
+        "correlation/match-async-resp",
+        workload.create_table_with_receipts,
+        workload.match_notifications,
+    )
+    measure_batch(
+        ctx,
+        "correlation/expire",
+        workload.create_table_with_requests,
+        expire_all,
+    )
+
+    # Baseline: one asyncio timer per request, cancelled by the response
+    loop = asyncio.new_event_loop()
+    try:
+        measure_batch(
+            ctx,
+            "correlation/request+response/asyncio-timers",
+            lambda: loop,
+            workload.schedule_and_cancel_asyncio_timers,
+        )
+    finally:
+        loop.close()
+    measure_batch(
+        ctx,
+        "correlation/request+response/timer-wheel",
+        CorrelationTable,
+        workload.add_requests_and_match_responses,
+    )
@@ -0,0 +1,104 @@
+"""Benchmarks for the delta encoding of UAV-INF responses.
+
+A fleet of UAVs is simulated for a number of ticks; in each tick, the
+position, velocity, attitude and timestamp of each UAV changes, while the
+remaining fields change only occasionally. The size of the encoded messages
+and the time needed to serialize them is compared between full UAV-INF
+bodies and delta frames.
+"""
+
+import json
+from typing import Any
+
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.delta import DEFAULT_KEYFRAME_INTERVAL, DeltaDecoder, DeltaEncoder
+
+NUM_UAVS = (100, 1000)
+"""Numbers of UAVs in the simulated fleets."""
+
+NUM_TICKS = 50
+"""Number of ticks to simulate."""
+
+
+def simulate_fleet(num_uavs: int, num_ticks: int) -> list[dict[str, Any]]:
+    """Returns the UAV-INF bodies sent in each tick of a simulated flight."""
+    result = []
+    for tick in range(num_ticks):
+        status = {}
+        for index in range(num_uavs):
+            uav_id = f"{index:04}"
+            phase = tick + index
+            status[uav_id] = {
+                "id": uav_id,
+                "mode": "mission" if tick < num_ticks - 5 else "land",
+                "position": [519976597 + phase * 13, -7406863 - phase * 7, 93765],
+                "positionXYZ": [index * 100 + tick, index * 50, 10000],
+                "gps": [3, 17],
+                "heading": (index * 10 + tick // 10) % 3600,
+                "attitude": [phase % 50, -(phase % 30), 900],
+                "velocity": [2000 + phase % 100, 2000, -phase % 50],
+                "velocityXYZ": [2000, 2000 + phase % 100, 0],
+                "timestamp": 1449562661000 + tick * 100,
+                "battery": [124 - tick // 10, 85 - tick // 10],
+                "light": 2016,
+                "errors": [],
+                "rssi": [80],
+            }
+        result.append({"type": "UAV-INF", "status": status})
+    return result
+
+
+def encode_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+def encode_full(bodies: list[dict[str, Any]]) -> None:
+    for body in bodies:
+        encode_json(body)
+
+
+def encode_delta(bodies: list[dict[str, Any]]) -> None:
+    encoder = DeltaEncoder(DEFAULT_KEYFRAME_INTERVAL)
+    for body in bodies:
+        encode_json(encoder.encode(body))
+
+
+def decode_full(messages: list[str]) -> None:
+    for message in messages:
+        json.loads(message)
+
+
+def decode_delta(frames: list[str]) -> None:
+    decoder = DeltaDecoder()
+    for frame in frames:
+        decoder.decode(json.loads(frame))
+
+
+@benchmark("delta")
+def run(ctx: BenchmarkContext) -> None:
+    for num_uavs in NUM_UAVS:
+        bodies = simulate_fleet(num_uavs, NUM_TICKS)
+
+        encoder = DeltaEncoder(DEFAULT_KEYFRAME_INTERVAL)
+        frames = [encode_json(encoder.encode(body)) for body in bodies]
+        full = [encode_json(body) for body in bodies]
+
+        prefix = f"delta/UAV-INF/{num_uavs}"
+        ctx.report(
+            f"{prefix}/full/size",
+            sum(len(item) for item in full) / NUM_TICKS,
+            "bytes",
+            higher_is_better=False,
+        )
+        ctx.report(
+            f"{prefix}/delta/size",
+            sum(len(item) for item in frames) / NUM_TICKS,
+            "bytes",
+            higher_is_better=False,
+        )
+
+        ctx.measure_time(f"{prefix}/full/encode", lambda b=bodies: encode_full(b))
+        ctx.measure_time(f"{prefix}/delta/encode", lambda b=bodies: encode_delta(b))
+        ctx.measure_time(f"{prefix}/full/decode", lambda f=full: decode_full(f))
+        ctx.measure_time(f"{prefix}/delta/decode", lambda f=frames: decode_delta(f))
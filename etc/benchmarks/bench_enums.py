@@ -0,0 +1,38 @@
+"""Benchmarks for converting the strings in incoming messages into members of
+the enums of `flockwave.spec.enums`.
+
+The workload is a list of device class strings, as found in the device trees
+of a large fleet. The baselines are a new enum class built for every lookup
+(what repeated calls to `get_enum_from_schema()` used to do) and calls to the
+enum class itself, which go through ``Enum.__call__``.
+"""
+
+from enum import Enum
+
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.enums import get_enum, get_enum_table
+
+NUM_VALUES = 100000
+"""Number of strings in the workload."""
+
+
+@benchmark("enums")
+def run(ctx: BenchmarkContext) -> None:
+    table = get_enum_table("deviceClass")
+    enum = get_enum("deviceClass")
+    values = [table.values[index % len(table)] for index in range(NUM_VALUES)]
+
+    ctx.measure_time(
+        "enums/deviceClass/rebuild-per-lookup",
+        lambda: [Enum("DeviceClass", table.values)[value] for value in values[:1000]],
+    )
+    ctx.measure_time(
+        "enums/deviceClass/enum-call", lambda: [enum(value) for value in values]
+    )
+    ctx.measure_time(
+        "enums/deviceClass/by-value",
+        lambda: [table.by_value[value] for value in values],
+    )
+    ctx.measure_time("enums/deviceClass/to-members", lambda: table.to_members(values))
+    ctx.measure_time("enums/deviceClass/to-ordinals", lambda: table.to_ordinals(values))
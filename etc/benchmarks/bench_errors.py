@@ -0,0 +1,84 @@
+"""Benchmarks for the fleet-wide aggregation of error codes in
+`flockwave.spec.errors`.
+
+The baselines convert each error code of each UAV into a `FlockwaveErrorCode`
+member first, which is what a status board would do without the lookup
+tables of the module.
+"""
+
+from collections import Counter
+from typing import Any
+
+from bench_validation import UAV_COUNTS
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.errors import (
+    FlockwaveErrorCode,
+    count_uavs_per_error_code,
+    get_error_abbreviation,
+    get_worst_severity_per_uav,
+)
+
+
+def create_status(num_uavs: int) -> dict[str, Any]:
+    """Creates a status map where every third UAV reports one to three error
+    codes that are defined in `FlockwaveErrorCode`.
+    """
+    codes = [int(code) for code in FlockwaveErrorCode]
+    status = {}
+    for index in range(num_uavs):
+        uav_id = f"{index:05}"
+        errors = [codes[(index * k) % len(codes)] for k in range(1, index % 3 + 2)]
+        status[uav_id] = {"id": uav_id, "errors": errors if index % 3 == 0 else []}
+    return status
+
+
+def get_worst_severity_per_uav_with_enum(status: dict[str, Any]) -> dict[str, Any]:
+    result = {}
+    for uav_id, item in status.items():
+        codes = [FlockwaveErrorCode(code) for code in item.get("errors", ())]
+        result[uav_id] = max(codes) >> 6 if codes else None
+    return result
+
+
+def count_uavs_per_error_code_with_enum(status: dict[str, Any]) -> Counter[Any]:
+    result: Counter[Any] = Counter()
+    for item in status.values():
+        result.update({FlockwaveErrorCode(code) for code in item.get("errors", ())})
+    return result
+
+
+def get_abbreviations_with_enum(status: dict[str, Any]) -> list[list[str]]:
+    return [
+        [FlockwaveErrorCode(code).abbreviation for code in item.get("errors", ())]
+        for item in status.values()
+    ]
+
+
+def get_abbreviations(status: dict[str, Any]) -> list[list[str]]:
+    return [
+        [get_error_abbreviation(code) for code in item.get("errors", ())]
+        for item in status.values()
+    ]
+
+
+@benchmark("errors")
+def run(ctx: BenchmarkContext) -> None:
+    for num_uavs in UAV_COUNTS[1:]:
+        status = [create_status(num_uavs)]
+        prefix = f"errors/UAV-INF/{num_uavs}"
+        for name, baseline, func in (
+            (
+                "worst_severity",
+                get_worst_severity_per_uav_with_enum,
+                get_worst_severity_per_uav,
+            ),
+            (
+                "count_per_code",
+                count_uavs_per_error_code_with_enum,
+                count_uavs_per_error_code,
+            ),
+            ("abbreviations", get_abbreviations_with_enum, get_abbreviations),
+        ):
+            ctx.measure_throughput(f"{prefix}/{name}/enum", baseline, status)
+            ctx.measure_throughput(f"{prefix}/{name}/table", func, status)
@@ -0,0 +1,34 @@
+"""Benchmarks for the synthetic message generator."""
+
+from json import JSONEncoder
+
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.generate import GeneratorOptions, MessageGenerator
+
+UAV_COUNTS = (1, 100, 5000)
+"""Numbers of UAVs in the generated UAV-INF responses."""
+
+
+@benchmark("generate")
+def run(ctx: BenchmarkContext) -> None:
+    encode = JSONEncoder(separators=(",", ":")).encode
+
+    generator = MessageGenerator(seed=0)
+    types = generator.message_types
+    ctx.measure_throughput(
+        "generate/all",
+        lambda message_type: encode(generator.generate_body(message_type)),
+        types,
+    )
+
+    for num_uavs in UAV_COUNTS:
+        options = GeneratorOptions(sizes={"status": num_uavs})
+        generator = MessageGenerator("response", seed=0, options=options)
+        ctx.measure_throughput(
+            f"generate/response/UAV-INF/{num_uavs}",
+            lambda message_type, generator=generator: encode(
+                generator.generate_body(message_type)
+            ),
+            ["UAV-INF"],
+        )
@@ -0,0 +1,68 @@
+"""Benchmarks for the validation of object IDs and usernames in
+`flockwave.spec.ids`.
+
+A server typically checks the same few thousand IDs in every message, so the
+workload consists of a fixed set of identifiers that is validated repeatedly.
+The baselines are the checks performed on one identifier at a time without
+any caching.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.ids import (
+    _user_regex,
+    are_valid_object_ids,
+    are_valid_user_names,
+    are_valid_users,
+    is_valid_object_id,
+    make_valid_object_id,
+    make_valid_object_ids,
+    parse_users,
+)
+
+NUM_IDENTIFIERS = 5000
+"""Number of distinct identifiers in the workload."""
+
+
+def per_item(func: Callable[[str], Any]) -> Callable[[list[str]], list[Any]]:
+    """Turns a function operating on a single identifier into a function
+    operating on a list of identifiers.
+    """
+    return lambda identifiers: [func(identifier) for identifier in identifiers]
+
+
+def parse_user_uncached(identifier: str) -> tuple[str, str]:
+    match = _user_regex.match(identifier)
+    if not match:
+        raise ValueError(f"{identifier!r} is not a valid username")
+    return match.group("name") or "", match.group("domain") or ""
+
+
+@benchmark("ids")
+def run(ctx: BenchmarkContext) -> None:
+    object_ids = [f"drone-{index:04}" for index in range(NUM_IDENTIFIERS)]
+    users = [f"pilot{index}@fleet{index % 7}.example.com" for index in range(500)]
+    users = users * (NUM_IDENTIFIERS // len(users))
+
+    workloads: list[tuple[str, Callable[[list[str]], Any], list[str]]] = [
+        ("object_id/single", per_item(is_valid_object_id), object_ids),
+        ("object_id/batch", are_valid_object_ids, object_ids),
+        ("make_object_id/single", per_item(make_valid_object_id), object_ids),
+        ("make_object_id/batch", make_valid_object_ids, object_ids),
+        ("user/single", per_item(_user_regex.match), users),
+        ("user/batch", are_valid_users, users),
+        ("user_name/batch", are_valid_user_names, users),
+        ("parse_user/single", per_item(parse_user_uncached), users),
+        ("parse_user/batch", parse_users, users),
+    ]
+    for name, func, identifiers in workloads:
+        rate = ctx.measure_throughput(f"ids/{name}", func, [identifiers])
+        ctx.report(
+            f"ids/{name}/identifiers",
+            rate * len(identifiers),
+            "items/s",
+            higher_is_better=True,
+        )
@@ -0,0 +1,82 @@
+"""Benchmarks comparing the generated model classes of `flockwave.spec.models`
+with the plain dictionaries that are validated by the JSON schema validators.
+
+Decoding a UAV-INF response into model classes checks the types of the values
+and builds the objects in a single pass; the baseline is the validation of the
+same response as a dictionary. Memory usage is measured per UAV status object.
+"""
+
+import json
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from bench_validation import UAV_COUNTS, create_uav_inf_response
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.models import UAVStatusInfo, decode_body
+from flockwave.spec.validator import create_dispatching_validator
+
+NUM_UAVS_FOR_MEMORY = 1000
+"""Number of UAV status objects to create when measuring memory usage."""
+
+
+def measure_memory(func: Callable[[], Any]) -> int:
+    """Returns the number of bytes allocated by the given function for the
+    object that it returns.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return after - before
+
+
+@benchmark("models")
+def run(ctx: BenchmarkContext) -> None:
+    validator = create_dispatching_validator("response")
+    for num_uavs in UAV_COUNTS:
+        body = create_uav_inf_response(num_uavs)
+        ctx.measure_throughput(
+            f"models/dict/response/UAV-INF/{num_uavs}", validator, [body]
+        )
+        ctx.measure_throughput(
+            f"models/decode/response/UAV-INF/{num_uavs}",
+            lambda body: decode_body(body, "response"),
+            [body],
+        )
+
+        model = decode_body(body, "response")
+        ctx.measure_throughput(
+            f"models/encode/response/UAV-INF/{num_uavs}",
+            lambda model: model.to_json(),
+            [model],
+        )
+
+    # Memory usage is measured on status objects parsed from JSON so the
+    # strings in the objects are not shared with the template
+    body = create_uav_inf_response(NUM_UAVS_FOR_MEMORY)
+    encoded = json.dumps(list(body["status"].values()))
+
+    num_bytes = measure_memory(lambda: json.loads(encoded))
+    ctx.report(
+        "models/memory/dict/UAVStatusInfo",
+        num_bytes / NUM_UAVS_FOR_MEMORY,
+        "bytes",
+        higher_is_better=False,
+    )
+
+    num_bytes = measure_memory(
+        lambda: [UAVStatusInfo.from_json(item) for item in json.loads(encoded)]
+    )
+    ctx.report(
+        "models/memory/model/UAVStatusInfo",
+        num_bytes / NUM_UAVS_FOR_MEMORY,
+        "bytes",
+        higher_is_better=False,
+    )
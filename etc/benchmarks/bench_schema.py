@@ -0,0 +1,51 @@
+"""Benchmarks for loading the JSON schemas and compiling validators.
+
+All the measurements in this module are performed in a fresh Python
+interpreter because the results of the measured functions are memoized.
+"""
+
+from common import BenchmarkContext, benchmark
+
+BODY_SCHEMA_GETTERS = (
+    "get_message_body_schema",
+    "get_notification_body_schema",
+    "get_request_body_schema",
+    "get_response_body_schema",
+)
+
+
+@benchmark("schema")
+def run(ctx: BenchmarkContext) -> None:
+    ctx.measure_time_in_subprocess(
+        "import/flockwave.spec.schema", "", "import flockwave.spec.schema"
+    )
+
+    ctx.measure_time_in_subprocess(
+        "schema/get_message_schema",
+        "from flockwave.spec.schema import get_message_schema",
+        "get_message_schema()",
+    )
+
+    for getter in BODY_SCHEMA_GETTERS:
+        ctx.measure_time_in_subprocess(
+            f"schema/{getter}",
+            f"from flockwave.spec.schema import {getter}",
+            f"{getter}()",
+        )
+
+    ctx.measure_time_in_subprocess(
+        "schema/get_message_schema/lazy",
+        "from flockwave.spec.schema import enable_lazy_resolution, "
+        "get_message_schema\n"
+        "enable_lazy_resolution()",
+        "get_message_schema()",
+    )
+
+    for getter in ("get_message_schema", *BODY_SCHEMA_GETTERS):
+        ctx.measure_time_in_subprocess(
+            f"compile/{getter}",
+            f"from flockwave.spec.schema import {getter}\n"
+            "from flockwave.spec.validator import create_validator_for_schema\n"
+            f"schema = {getter}()",
+            "create_validator_for_schema(schema)",
+        )
@@ -0,0 +1,68 @@
+"""Benchmarks for the schema-generated serializers of outgoing messages.
+
+Each message body is encoded in three ways: with `json.dumps()` only (no
+validation, the lower bound), with a dispatching validator followed by
+`json.dumps()` (the usual path of a server) and with a `MessageSerializer`
+that validates and encodes in a single pass.
+"""
+
+import json
+from collections.abc import Callable
+from copy import deepcopy
+from typing import Any
+
+from bench_validation import UAV_COUNTS, create_uav_inf_response
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.serializer import MessageSerializer
+from flockwave.spec.validator import create_dispatching_validator
+
+
+def create_async_st_notification() -> dict[str, Any]:
+    """Creates an ASYNC-ST notification with a progress report."""
+    return {
+        "type": "ASYNC-ST",
+        "id": "b7e3c1f2-a9d8-4c5e-8f6a-0123456789ab",
+        "progress": {"percentage": 42, "message": "Uploading show"},
+        "suspended": False,
+    }
+
+
+def dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def create_validate_and_dumps(kind: str) -> Callable[[Any], str]:
+    validate = create_dispatching_validator(kind)  # type: ignore
+
+    def validate_and_dumps(obj: Any) -> str:
+        validate(obj)
+        return dumps(obj)
+
+    return validate_and_dumps
+
+
+def measure(ctx: BenchmarkContext, prefix: str, kind: str, body: Any) -> None:
+    serializer = MessageSerializer(kind)  # type: ignore
+
+    # The validator may add default values to the body so each contender
+    # gets its own copy
+    ctx.measure_throughput(f"{prefix}/dumps", dumps, [deepcopy(body)])
+    ctx.measure_throughput(
+        f"{prefix}/validate+dumps", create_validate_and_dumps(kind), [deepcopy(body)]
+    )
+    ctx.measure_throughput(f"{prefix}/serializer", serializer, [deepcopy(body)])
+
+
+@benchmark("serializer")
+def run(ctx: BenchmarkContext) -> None:
+    for num_uavs in UAV_COUNTS:
+        body = create_uav_inf_response(num_uavs)
+        measure(ctx, f"serialize/response/UAV-INF/{num_uavs}", "response", body)
+
+    measure(
+        ctx,
+        "serialize/notification/ASYNC-ST",
+        "notification",
+        create_async_st_notification(),
+    )
@@ -0,0 +1,134 @@
+"""Benchmarks for matching device tree updates against the subscriptions of
+clients in `flockwave.spec.subscriptions`.
+
+The workload is a fleet of UAVs with a few devices and channels each, and a
+set of clients with a mix of subscriptions: some clients subscribe to the
+entire tree, some to a few UAVs and some to individual channels. Every
+channel is updated once per tick. The baseline is a scan of all the
+subscriptions of all the clients for every update.
+"""
+
+from random import Random
+from typing import Any
+
+from common import BenchmarkContext, benchmark
+
+from flockwave.spec.subscriptions import DeviceTreeUpdateBatch, SubscriptionIndex
+
+NUM_UAVS = 200
+"""Number of UAVs in the device tree."""
+
+NUM_CLIENTS = 100
+"""Number of clients with subscriptions."""
+
+CHANNELS = (
+    "battery/voltage",
+    "battery/current",
+    "gps/fix",
+    "gps/satellites",
+    "led/color",
+    "motors/rpm",
+    "radio/rssi",
+    "cpu/temperature",
+    "cpu/load",
+    "baro/pressure",
+)
+"""Device and channel names of each UAV."""
+
+
+def create_subscriptions() -> dict[str, list[str]]:
+    """Creates the subscription paths of each client."""
+    rng = Random(42)  # noqa: S311
+    result: dict[str, list[str]] = {}
+    for index in range(NUM_CLIENTS):
+        kind = index % 10
+        if kind == 0:
+            paths = ["/"]
+        elif kind < 5:
+            paths = [f"/{rng.randrange(NUM_UAVS)}" for _ in range(10)]
+        else:
+            paths = [
+                f"/{rng.randrange(NUM_UAVS)}/{rng.choice(CHANNELS)}" for _ in range(50)
+            ]
+        result[f"client-{index}"] = paths
+    return result
+
+
+def get_subscribers_by_scanning(
+    subscriptions: dict[str, list[str]], path: str
+) -> set[str]:
+    return {
+        client
+        for client, paths in subscriptions.items()
+        if any(
+            other == "/" or path == other or path.startswith(other + "/")
+            for other in paths
+        )
+    }
+
+
+def flush_by_scanning(
+    subscriptions: dict[str, list[str]], values: dict[str, Any]
+) -> dict[str, dict[str, Any]]:
+    result: dict[str, dict[str, Any]] = {}
+    for path, value in values.items():
+        for client in get_subscribers_by_scanning(subscriptions, path):
+            body = result.get(client)
+            if body is None:
+                body = result[client] = {"type": "DEV-INF", "values": {}}
+            body["values"][path] = value
+    return result
+
+
+@benchmark("subscriptions")
+def run(ctx: BenchmarkContext) -> None:
+    subscriptions = create_subscriptions()
+    index = SubscriptionIndex()
+    for client, paths in subscriptions.items():
+        for path in paths:
+            index.subscribe(client, path)
+
+    values = {
+        f"/{uav}/{channel}": uav for uav in range(NUM_UAVS) for channel in CHANNELS
+    }
+    paths = list(values)
+
+    def flush_with_index() -> dict[str, dict[str, Any]]:
+        batch = DeviceTreeUpdateBatch(index)
+        batch.update(values)
+        return batch.flush()
+
+    assert flush_with_index() == flush_by_scanning(subscriptions, values)
+
+    ctx.measure_throughput(
+        "subscriptions/match/scan",
+        lambda path: get_subscribers_by_scanning(subscriptions, path),
+        paths[:200],
+    )
+    ctx.measure_throughput("subscriptions/match/index", index.get_subscribers, paths)
+    index._cache.clear()
+    ctx.measure_time(
+        "subscriptions/match/index-uncached",
+        lambda: [index._cache.clear() or index.get_subscribers(p) for p in paths],
+    )
+    ctx.measure_time(
+        "subscriptions/tick/scan", lambda: flush_by_scanning(subscriptions, values)
+    )
+    ctx.measure_time("subscriptions/tick/index", flush_with_index)
+
+    # Subscription changes with a warm cache, followed by a tick that fills
+    # the cache again
+    changes = [
+        (f"client-{i}", f"/{i % NUM_UAVS}/{CHANNELS[i % len(CHANNELS)]}")
+        for i in range(NUM_CLIENTS)
+    ]
+
+    def resubscribe_and_flush() -> dict[str, dict[str, Any]]:
+        for client, path in changes:
+            index.subscribe(client, path)
+        for client, path in changes:
+            index.unsubscribe(client, path)
+        return flush_with_index()
+
+    flush_with_index()
+    ctx.measure_time("subscriptions/resubscribe+tick/index", resubscribe_and_flush)
@@ -0,0 +1,101 @@
+"""Benchmarks for the validation throughput of message bodies, per message
+type.
+
+Message bodies are taken from the examples of the specification. UAV-INF
+responses are also scaled up synthetically to measure how the validation cost
+grows with the number of UAVs in a single message. The same responses are
+wrapped in message envelopes to compare the validation of entire messages
+with the two-stage validation of the envelope followed by the body.
+"""
+
+import json
+from collections import defaultdict
+from typing import Any
+
+from common import EXAMPLES_DIR, BenchmarkContext, benchmark
+
+from flockwave.spec.schema import get_message_schema
+from flockwave.spec.validator import (
+    create_deferred_body_validator,
+    create_dispatching_validator,
+    create_validator_for_schema,
+    validate_envelope,
+)
+
+UAV_COUNTS = (1, 100, 5000)
+"""Numbers of UAVs in the synthetic UAV-INF responses."""
+
+
+def load_example_bodies() -> dict[tuple[str, str], list[Any]]:
+    """Loads the example message bodies, grouped by their kind and type."""
+    result: dict[tuple[str, str], list[Any]] = defaultdict(list)
+    for path in sorted(EXAMPLES_DIR.glob("*.json")):
+        kind = path.name.partition("_")[0]
+        bodies = json.loads(path.read_text())
+        if not isinstance(bodies, list):
+            bodies = [bodies]
+        for body in bodies:
+            result[kind, body["type"]].append(body)
+    return result
+
+
+def create_uav_inf_response(num_uavs: int) -> dict[str, Any]:
+    """Creates a synthetic UAV-INF response containing the status of the given
+    number of UAVs.
+    """
+    status = {}
+    for index in range(num_uavs):
+        uav_id = f"{index:05}"
+        status[uav_id] = {
+            "id": uav_id,
+            "mode": "pos",
+            "position": [519976597 + index, -7406863 - index, 93765],
+            "positionXYZ": [index * 100, index * 50, 10000],
+            "gps": [3, 17],
+            "heading": (index * 10) % 3600,
+            "attitude": [0, 0, 900],
+            "velocity": [2000, 2000, -1000],
+            "velocityXYZ": [2000, 2000, 1000],
+            "timestamp": 1449562661000 + index,
+            "debug": "0BADCAFE",
+            "errors": [17, 41] if index % 10 == 0 else [],
+            "light": 2016,
+            "battery": [124],
+            "rssi": [80],
+        }
+    return {"type": "UAV-INF", "status": status}
+
+
+@benchmark("validation")
+def run(ctx: BenchmarkContext) -> None:
+    validators = {}
+    for (kind, message_type), bodies in load_example_bodies().items():
+        validator = validators.get(kind)
+        if validator is None:
+            validator = validators[kind] = create_dispatching_validator(kind)  # type: ignore
+        ctx.measure_throughput(f"validate/{kind}/{message_type}", validator, bodies)
+
+    validator = create_dispatching_validator("response")
+    for num_uavs in UAV_COUNTS:
+        body = create_uav_inf_response(num_uavs)
+        ctx.measure_throughput(
+            f"validate/response/UAV-INF/{num_uavs}", validator, [body]
+        )
+
+    validator = create_validator_for_schema(get_message_schema())
+    validate_body = create_deferred_body_validator("response")
+    for num_uavs in UAV_COUNTS:
+        message = {
+            "$fw.version": "1.0",
+            "id": "b7e3c1f2-a9d8-4c5e-8f6a-0123456789ab",
+            "refs": "1c0e7b6e-2f3a-4d5b-9c8d-fedcba987654",
+            "body": create_uav_inf_response(num_uavs),
+        }
+        prefix = f"validate/message/UAV-INF/{num_uavs}"
+        ctx.measure_throughput(prefix, validator, [message])
+        ctx.measure_throughput(f"{prefix}/envelope", validate_envelope, [message])
+        ctx.measure_throughput(
+            f"{prefix}/envelope+body",
+            lambda message: validate_body(validate_envelope(message)),
+            [message],
+        )
@@ -0,0 +1,167 @@
+"""Common infrastructure for the benchmarks of the ``flockwave.spec``
+package.
+
+Benchmarks are plain functions registered with the `benchmark()` decorator.
+Each benchmark function receives a `BenchmarkContext` and reports one or more
+measurements through it.
+"""
+
+import os
+import subprocess
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+__all__ = (
+    "BenchmarkContext",
+    "Measurement",
+    "ROOT_DIR",
+    "EXAMPLES_DIR",
+    "benchmark",
+    "get_benchmarks",
+)
+
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+"""Root directory of the repository."""
+
+EXAMPLES_DIR = ROOT_DIR / "doc" / "modules" / "ROOT" / "examples"
+"""Directory containing the example messages of the specification."""
+
+
+@dataclass
+class Measurement:
+    """A single measurement reported by a benchmark."""
+
+    name: str
+    """Unique name of the measurement, e.g. ``validate/UAV-INF/100``."""
+
+    value: float
+    """The measured value."""
+
+    unit: str
+    """Unit of the measured value, e.g. ``s`` or ``msg/s``."""
+
+    higher_is_better: bool
+    """Whether higher values mean better performance."""
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "value": self.value,
+            "unit": self.unit,
+            "higher_is_better": self.higher_is_better,
+        }
+
+
+@dataclass
+class BenchmarkContext:
+    """Object passed to benchmark functions to report their measurements."""
+
+    min_time: float = 0.2
+    """Minimum time to spend on a single throughput measurement, in seconds."""
+
+    repeat: int = 5
+    """Number of repetitions for timing measurements; the best one is kept."""
+
+    measurements: list[Measurement] = field(default_factory=list)
+
+    def report(
+        self, name: str, value: float, unit: str, higher_is_better: bool
+    ) -> None:
+        """Reports a measurement."""
+        self.measurements.append(Measurement(name, value, unit, higher_is_better))
+        print(f"  {name}: {value:.6g} {unit}", file=sys.stderr)
+
+    def measure_throughput(
+        self, name: str, func: Callable[[Any], Any], items: Iterable[Any]
+    ) -> float:
+        """Measures how many items per second the given function can process
+        and reports the result in ``items/s``.
+        """
+        items = list(items)
+        best = 0.0
+        for _ in range(self.repeat):
+            count = 0
+            started_at = perf_counter()
+            while True:
+                for item in items:
+                    func(item)
+                count += len(items)
+                elapsed = perf_counter() - started_at
+                if elapsed >= self.min_time / self.repeat:
+                    break
+            best = max(best, count / elapsed)
+
+        self.report(name, best, "items/s", higher_is_better=True)
+        return best
+
+    def measure_time(self, name: str, func: Callable[[], Any]) -> float:
+        """Measures how long it takes to call the given function and reports
+        the best result in seconds.
+        """
+        best = float("inf")
+        for _ in range(self.repeat):
+            started_at = perf_counter()
+            func()
+            best = min(best, perf_counter() - started_at)
+
+        self.report(name, best, "s", higher_is_better=False)
+        return best
+
+    def measure_time_in_subprocess(self, name: str, setup: str, stmt: str) -> float:
+        """Measures how long it takes to execute the given statement in a fresh
+        Python interpreter after executing the given setup code, and reports
+        the best result in seconds.
+
+        This is used for measuring cold start costs that are otherwise hidden
+        by module imports and memoization in the current process.
+        """
+        code = (
+            "from time import perf_counter\n"
+            f"{setup}\n"
+            "_started_at = perf_counter()\n"
+            f"{stmt}\n"
+            "print(perf_counter() - _started_at)\n"
+        )
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(ROOT_DIR / "src"), env.get("PYTHONPATH")])
+        )
+
+        best = float("inf")
+        for _ in range(self.repeat):
+            output = subprocess.run(  # noqa: S603
+                [sys.executable, "-c", code],
+                check=True,
+                capture_output=True,
+                text=True,
+                cwd=ROOT_DIR,
+                env=env,
+            ).stdout
+            best = min(best, float(output.strip().splitlines()[-1]))
+
+        self.report(name, best, "s", higher_is_better=False)
+        return best
+
+
+BenchmarkFunction = Callable[[BenchmarkContext], None]
+
+_registry: dict[str, BenchmarkFunction] = {}
+
+
+def benchmark(name: str) -> Callable[[BenchmarkFunction], BenchmarkFunction]:
+    """Decorator that registers a benchmark function with the given name."""
+
+    def decorator(func: BenchmarkFunction) -> BenchmarkFunction:
+        _registry[name] = func
+        return func
+
+    return decorator
+
+
+def get_benchmarks() -> dict[str, BenchmarkFunction]:
+    """Returns all the registered benchmark functions, keyed by their names."""
+    return dict(_registry)
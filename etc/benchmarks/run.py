@@ -0,0 +1,189 @@
+"""Runs the benchmarks of the ``flockwave.spec`` package.
+
+Results are printed to the standard output or written to a file as JSON.
+When a baseline result file is given with ``--compare``, the results are
+compared to the baseline and the script exits with a non-zero exit code if
+any of the measurements regressed by more than the given threshold.
+
+Example usage::
+
+    uv run python etc/benchmarks/run.py -o baseline.json
+    # ...make some changes...
+    uv run python etc/benchmarks/run.py -o current.json --compare baseline.json
+"""
+
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+BENCHMARKS_DIR = Path(__file__).parent
+ROOT_DIR = BENCHMARKS_DIR.parent.parent
+
+sys.path.insert(0, str(BENCHMARKS_DIR))
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from common import BenchmarkContext, get_benchmarks  # noqa: E402
+
+FORMAT_VERSION = 1
+"""Version number of the format of the result files."""
+
+
+def load_benchmark_modules() -> None:
+    """Imports all the ``bench_*.py`` modules so they can register their
+    benchmarks.
+    """
+    for path in sorted(BENCHMARKS_DIR.glob("bench_*.py")):
+        import_module(path.stem)
+
+
+def get_metadata() -> dict[str, Any]:
+    """Returns metadata about the environment in which the benchmarks were
+    executed.
+    """
+    import fastjsonschema
+
+    from flockwave.spec.compiled import get_manifest
+    from flockwave.spec.version import __version__
+
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "fastjsonschema": fastjsonschema.VERSION,
+        "compiled_validators": get_manifest() is not None,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def run_benchmarks(
+    names: list[str] | None, *, min_time: float, repeat: int
+) -> dict[str, Any]:
+    """Runs the benchmarks with the given names (or all of them) and returns
+    the results as a JSON object.
+    """
+    ctx = BenchmarkContext(min_time=min_time, repeat=repeat)
+    benchmarks = get_benchmarks()
+    for name in names or sorted(benchmarks):
+        print(f"Running {name} benchmarks...", file=sys.stderr)
+        benchmarks[name](ctx)
+
+    return {
+        "format": FORMAT_VERSION,
+        "metadata": get_metadata(),
+        "results": {m.name: m.to_json() for m in ctx.measurements},
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    """Compares the current results to the baseline, prints a report and
+    returns the names of the measurements that regressed by more than the
+    given relative threshold.
+    """
+    regressions: list[str] = []
+    baseline_results = baseline.get("results", {})
+
+    print(f"{'Measurement':<48} {'Baseline':>12} {'Current':>12} {'Change':>8}")
+    for name, result in current["results"].items():
+        old = baseline_results.get(name)
+        if old is None or not old["value"] or old["unit"] != result["unit"]:
+            continue
+
+        change = result["value"] / old["value"] - 1
+        worse = -change if result["higher_is_better"] else change
+        flag = ""
+        if worse > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif worse < -threshold:
+            flag = "  improved"
+
+        print(
+            f"{name:<48} {old['value']:>12.6g} {result['value']:>12.6g} "
+            f"{change:>+8.1%}{flag}"
+        )
+
+    missing = sorted(set(baseline_results) - set(current["results"]))
+    for name in missing:
+        print(f"{name:<48} missing from the current results")
+
+    return regressions
+
+
+def main() -> int:
+    load_benchmark_modules()
+
+    parser = ArgumentParser(description=__doc__.partition("\n\n")[0])
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="BENCHMARK",
+        help="names of the benchmarks to run; defaults to all of them "
+        f"({', '.join(sorted(get_benchmarks()))})",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, help="write the results to the given file"
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        metavar="BASELINE",
+        help="compare the results to the given baseline result file",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative change that counts as a regression (default: 0.1)",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="minimum time to spend on each throughput measurement, in seconds",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of repetitions of each measurement (default: 5)",
+    )
+    options = parser.parse_args()
+
+    unknown = sorted(set(options.benchmarks) - set(get_benchmarks()))
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+
+    results = run_benchmarks(
+        options.benchmarks, min_time=options.min_time, repeat=options.repeat
+    )
+
+    encoded = json.dumps(results, indent=2) + "\n"
+    if options.output:
+        options.output.write_text(encoded)
+    elif not options.compare:
+        sys.stdout.write(encoded)
+
+    if options.compare:
+        baseline = json.loads(options.compare.read_text())
+        regressions = compare_results(baseline, results, options.threshold)
+        if regressions:
+            print(
+                f"\n{len(regressions)} measurement(s) regressed by more than "
+                f"{options.threshold:.0%}.",
+                file=sys.stderr,
+            )
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Generates ahead-of-time compiled validator modules and a bundle of the JSON
+schemas of the Flockwave protocol into the ``flockwave.spec.compiled``
+package.
+
+Run this script before building the Python package. When invoked with
+``--check``, the script does not generate anything; it only checks whether
+the compiled validators are up-to-date with the schema files and exits with
+a non-zero exit code if they are not.
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+OUTPUT_DIR = ROOT_DIR / "src" / "flockwave" / "spec" / "compiled"
+
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from flockwave.spec.compiled import (  # noqa: E402
+    BUNDLE_RESOURCE_NAME,
+    MANIFEST_MODULE_NAME,
+    get_module_name_for_resource,
+)
+from flockwave.spec.schema import (  # noqa: E402
+    _BODY_SCHEMA_RESOURCES,
+    SCHEMA_PACKAGE,
+    _get_resources_by_message_type,
+    _get_schema_from_resource,
+    get_schema_digest,
+)
+from flockwave.spec.validator import _generate_validator_code  # noqa: E402
+from flockwave.spec.version import __version__  # noqa: E402
+
+HEADER = "# Generated by etc/scripts/compile_validators.py. Do not edit.\n\n"
+SCHEMA_DIR = ROOT_DIR / "src" / SCHEMA_PACKAGE.replace(".", "/")
+
+
+def get_resources_to_compile() -> list[str]:
+    """Returns the resource paths of all the schemas that should have a
+    compiled validator: the top-level schemas and the schemas of the
+    individual message types.
+    """
+    result = {"message.json"}
+    result.update(_BODY_SCHEMA_RESOURCES.values())
+    for paths in _get_resources_by_message_type("message_body.json").values():
+        result.update(paths)
+    return sorted(result)
+
+
+def get_stale_reason() -> str | None:
+    """Returns a human-readable reason why the compiled validators are not
+    up-to-date, or ``None`` if they are up-to-date.
+    """
+    manifest_path = OUTPUT_DIR / f"{MANIFEST_MODULE_NAME}.py"
+    if not manifest_path.exists():
+        return "compiled validators have not been generated yet"
+
+    manifest: dict[str, object] = {}
+    exec(manifest_path.read_text(), manifest)  # noqa: S102
+
+    if manifest.get("VERSION") != __version__:
+        return f"compiled validators belong to version {manifest.get('VERSION')}"
+    if manifest.get("SCHEMA_DIGEST") != get_schema_digest():
+        return "schema files have changed since the validators were compiled"
+    if manifest.get("RESOURCES") != tuple(get_resources_to_compile()):
+        return "the set of schemas to compile has changed"
+
+    try:
+        bundle = json.loads((OUTPUT_DIR / BUNDLE_RESOURCE_NAME).read_bytes())
+    except (OSError, ValueError):
+        return "schema bundle is missing or invalid"
+    if bundle.get("digest") != manifest.get("SCHEMA_DIGEST"):
+        return "schema bundle was not generated with the compiled validators"
+
+    return None
+
+
+def compile_validators() -> None:
+    """Generates the compiled validator modules and the manifest."""
+    for path in OUTPUT_DIR.iterdir():
+        if path.suffix in (".py", ".json") and path.name != "__init__.py":
+            path.unlink()
+
+    resources = get_resources_to_compile()
+    for resource_path in resources:
+        code = _generate_validator_code(_get_schema_from_resource(resource_path))
+        module_name = get_module_name_for_resource(resource_path)
+        (OUTPUT_DIR / f"{module_name}.py").write_text(HEADER + code)
+
+    write_schema_bundle()
+
+    # Manifest is written last so an interrupted run leaves no manifest behind
+    manifest = [
+        f"VERSION = {__version__!r}",
+        f"SCHEMA_DIGEST = {get_schema_digest()!r}",
+        f"RESOURCES = {tuple(resources)!r}",
+    ]
+    (OUTPUT_DIR / f"{MANIFEST_MODULE_NAME}.py").write_text(
+        HEADER + "\n".join(manifest) + "\n"
+    )
+
+    print(f"Compiled {len(resources)} validators into {OUTPUT_DIR}")
+
+
+def write_schema_bundle() -> None:
+    """Generates the JSON file containing the parsed contents of all the JSON
+    schema files, keyed by their resource paths.
+    """
+    schemas = {
+        path.name: json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(SCHEMA_DIR.glob("*.json"))
+    }
+    bundle = {
+        "version": __version__,
+        "digest": get_schema_digest(),
+        "schemas": schemas,
+    }
+    (OUTPUT_DIR / BUNDLE_RESOURCE_NAME).write_text(
+        json.dumps(bundle, separators=(",", ":")), encoding="utf-8"
+    )
+
+
+def main() -> int:
+    parser = ArgumentParser(description=__doc__.partition("\n\n")[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="check whether the compiled validators are up-to-date",
+    )
+    options = parser.parse_args()
+
+    if options.check:
+        reason = get_stale_reason()
+        if reason is not None:
+            print(f"Compiled validators are stale: {reason}.", file=sys.stderr)
+            print(
+                "Run etc/scripts/compile_validators.py to rebuild them.",
+                file=sys.stderr,
+            )
+            return 1
+        print("Compiled validators are up-to-date.")
+    else:
+        compile_validators()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
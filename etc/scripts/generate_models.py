@@ -0,0 +1,1131 @@
+"""Generates Python model classes from the JSON schemas of the Flockwave
+protocol into ``src/flockwave/spec/models.py``.
+
+A class is generated for each object and tuple definition in
+``definitions.json`` and for each message body schema. Each class uses
+``__slots__`` and comes with ``from_json()`` and ``to_json()`` methods. The
+``from_json()`` methods check the types of the values while they build the
+objects. When invoked with ``--check``, the script does not write anything;
+it only checks whether the generated module is up-to-date with the schema
+files and exits with a non-zero exit code if it is not.
+"""
+
+import json
+import keyword
+import re
+import sys
+import textwrap
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+SCHEMA_DIR = ROOT_DIR / "src" / "flockwave" / "spec"
+OUTPUT_FILE = SCHEMA_DIR / "models.py"
+
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from flockwave.spec.schema import (  # noqa: E402
+    _BODY_SCHEMA_RESOURCES,
+    _get_resources_by_message_type,
+)
+
+HEADER = '''\
+# Generated by etc/scripts/generate_models.py. Do not edit.
+# ruff: noqa: C901
+
+"""Model classes for the complex objects and message bodies of the Flockwave
+protocol.
+
+Each class has a ``from_json()`` class method that builds an instance from
+the JSON representation of the object and checks the types of the values
+while doing so, and a ``to_json()`` method that converts the instance back
+to its JSON representation.
+
+``from_json()`` checks the types of the values, the presence of required
+properties, constant and enum values and the absence of unknown properties
+where the schema forbids them. Other constraints of the schema (numeric
+ranges, string patterns and lengths) are not checked; use the validators in
+`flockwave.spec.validator` for a full validation. Unknown properties are
+dropped when the schema allows them.
+
+Optional properties that are missing from the JSON representation are set
+to ``None`` and are omitted from the JSON representation again when the
+instance is converted back. Optional items at the end of tuples are handled
+the same way. When the schema allows ``null`` for an optional property or
+tuple item, a missing value is represented by the private ``_MISSING``
+sentinel instead so explicit ``null`` values survive a round trip.
+"""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+__all__ = (
+    "BODY_CLASSES",
+    "DecodeError",
+    "decode_body",
+{exports}
+)
+
+
+class DecodeError(ValueError):
+    """Exception raised when a JSON object cannot be converted into an instance
+    of a model class.
+    """
+
+    message: str
+    """Description of the problem."""
+
+    path: list[str]
+    """Path of the offending part of the JSON object, in reverse order."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+        self.path = []
+
+    def __str__(self) -> str:
+        return ".".join(["data", *reversed(self.path)]) + " " + self.message
+
+    def within(self, key: Any) -> "DecodeError":
+        """Prepends the given key to the path of the error and returns the
+        error itself.
+        """
+        self.path.append(str(key))
+        return self
+
+
+class _Missing:
+    """Type of the sentinel that represents missing values of optional
+    properties and tuple items where ``None`` is a valid value.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __reduce__(self) -> str:
+        return "_MISSING"
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+_MISSING = _Missing()
+
+
+class _Model:
+    """Base class of the generated model classes."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({args})"
+
+
+def _is_integral_float(value: Any) -> bool:
+    # Integral floats are integers according to the validators
+    return type(value) is float and value.is_integer()
+
+
+def _decode_list(value: Any, decoder: Any) -> list[Any]:
+    if type(value) is not list:
+        raise DecodeError("must be array")
+    result = []
+    try:
+        for item in value:
+            result.append(decoder(item))
+    except DecodeError as ex:
+        raise ex.within(len(result)) from None
+    return result
+
+
+def _decode_map(value: Any, decoder: Any) -> dict[str, Any]:
+    if type(value) is not dict:
+        raise DecodeError("must be object")
+    key = None
+    try:
+        result = {}
+        for key, item in value.items():
+            result[key] = decoder(item)
+        return result
+    except DecodeError as ex:
+        raise ex.within(key) from None
+
+
+def _missing_properties(obj: dict[str, Any], required: frozenset[str]) -> DecodeError:
+    missing = sorted(required - obj.keys())
+    return DecodeError(f"must contain {missing} properties")
+
+
+def _unknown_properties(obj: dict[str, Any], known: frozenset[str]) -> DecodeError:
+    unknown = sorted(obj.keys() - known)
+    return DecodeError(f"must not contain {unknown} properties")
+'''
+
+ACRONYMS = frozenset(
+    ("amsl", "crth", "ecef", "gps", "id", "ned", "rgb", "rssi", "rth", "rtk", "uav")
+)
+"""Words that are written in all capitals in class names when they appear at
+the start of the name of a definition.
+"""
+
+PRIMITIVE_TYPES = {
+    "string": ("str", "type(value) is not str"),
+    "integer": ("int", "type(value) is not int and not _is_integral_float(value)"),
+    "number": ("float", "type(value) is not int and type(value) is not float"),
+    "boolean": ("bool", "type(value) is not bool"),
+    "object": ("dict[str, Any]", "type(value) is not dict"),
+    "array": ("list[Any]", "type(value) is not list"),
+    "null": ("None", "value is not None"),
+}
+"""Python type annotations and conditions that are true for values that do not
+have the given JSON type. Integral floats are integers, just like in the
+validators.
+"""
+
+PYTHON_TYPES = {
+    "string": "str",
+    "integer": "int",
+    "number": "(int, float)",
+    "boolean": "bool",
+    "object": "dict",
+    "array": "list",
+    "null": "type(None)",
+}
+
+
+@dataclass
+class FieldType:
+    """Description of how values of a JSON schema are represented in Python
+    and converted from and to JSON.
+    """
+
+    annotation: str
+    """Python type annotation of the values."""
+
+    checks: list[str] = field(default_factory=list)
+    """Lines of code that check and convert the JSON value in the variable
+    named ``value`` in-place.
+    """
+
+    decoder: str | None = None
+    """Name of a callable that converts a JSON value into its Python
+    representation, or ``None`` if the JSON value is used as is after the
+    checks.
+    """
+
+    encoder: str | None = None
+    """Format string that turns the Python expression in ``{}`` into its JSON
+    representation, or ``None`` if the Python value is the same as the JSON
+    value.
+    """
+
+    nullable: bool = False
+    """Whether ``None`` is a valid JSON value for the field."""
+
+
+@dataclass
+class Field:
+    """A single field of a generated class."""
+
+    key: str | int
+    """Property name or tuple index in the JSON representation."""
+
+    name: str
+    """Name of the attribute in the generated class."""
+
+    type: FieldType
+    required: bool
+    default: Any = None
+    description: str | None = None
+
+
+@dataclass
+class ModelClass:
+    """A generated class."""
+
+    name: str
+    fields: list[Field]
+    is_tuple: bool = False
+    title: str | None = None
+    description: str | None = None
+    closed: bool = False
+    """Whether unknown properties are forbidden."""
+
+    min_items: int = 0
+    """Minimum number of items for tuples."""
+
+    @property
+    def required(self) -> set[str | int]:
+        """Keys of the required fields."""
+        return {f.key for f in self.fields if f.required}
+
+
+class ModelGenerator:
+    """Collects the model classes to generate from the schemas."""
+
+    def __init__(self):
+        self.definitions: dict[str, Any] = load_json("definitions.json")
+        self.classes: dict[str, ModelClass] = {}
+        self.body_classes: dict[str, dict[str | None, list[str]]] = {}
+        self._decoders: dict[str, tuple[str, FieldType]] = {}
+        self._definition_types: dict[str, FieldType] = {}
+        self._enums: dict[tuple[Any, ...], str] = {}
+
+    def add_definitions(self) -> None:
+        for name in self.definitions:
+            self.get_type_of_definition(name)
+
+    def add_message_bodies(self) -> None:
+        for kind, resource in _BODY_SCHEMA_RESOURCES.items():
+            if kind == "message":
+                continue
+
+            by_type = _get_resources_by_message_type(resource)
+            classes = self.body_classes[kind] = {}
+            untyped = []
+            for message_type, paths in sorted(by_type.items()):
+                names = [name for path in paths for name in self.add_message_body(path)]
+                classes[message_type] = names
+                untyped.extend(
+                    name for name in names if "type" not in self.classes[name].required
+                )
+
+            # Some message bodies do not require the type property; these are
+            # tried when the type is missing
+            if untyped:
+                classes[None] = untyped
+
+    def add_message_body(self, resource_path: str) -> list[str]:
+        """Adds the classes of the message body schema in the given resource.
+
+        Schemas that are unions of other message body schemas yield one class
+        for each alternative.
+        """
+        schema = load_json(resource_path)
+        alternatives = schema.get("anyOf") or schema.get("oneOf")
+        if alternatives:
+            return [
+                name
+                for alternative in alternatives
+                for name in self.add_message_body(alternative["$ref"].partition("#")[0])
+            ]
+
+        kind, _, stem = resource_path.removesuffix(".json").partition("_")
+        name = to_pascal_case(stem.lower()) + kind.capitalize()
+        self.add_object_class(name, schema)
+        return [name]
+
+    def get_type_of_definition(self, name: str) -> FieldType:
+        result = self._definition_types.get(name)
+        if result is None:
+            schema = self.definitions[name]
+            class_name = to_class_name(name)
+            if is_tuple_schema(schema):
+                result = self.add_tuple_class(class_name, schema)
+            elif schema.get("type") == "object" and "properties" in schema:
+                result = self.add_object_class(class_name, schema)
+            else:
+                result = self.get_type(schema, class_name)
+            self._definition_types[name] = result
+        return result
+
+    def add_object_class(self, name: str, schema: dict[str, Any]) -> FieldType:
+        result = class_type(name)
+        if name in self.classes:
+            return result
+
+        # Register the class first to support recursive references
+        cls = ModelClass(
+            name,
+            [],
+            title=schema.get("title"),
+            description=schema.get("description") or schema.get("desciption"),
+            closed=schema.get("additionalProperties") is False,
+        )
+        self.classes[name] = cls
+
+        required = set(schema.get("required", ()))
+        names: set[str] = set()
+        for key, subschema in schema.get("properties", {}).items():
+            attr_name = to_attribute_name(key)
+            if attr_name in names:
+                raise ValueError(f"duplicate attribute name {attr_name!r} in {name}")
+            names.add(attr_name)
+
+            field_type = self.get_type(subschema, name + to_pascal_case(key))
+            cls.fields.append(
+                Field(
+                    key,
+                    attr_name,
+                    field_type,
+                    required=key in required,
+                    default=subschema.get("const"),
+                    description=get_description(subschema, self.definitions),
+                )
+            )
+
+        # Required properties that are not declared can have any value
+        properties = schema.get("properties", {})
+        for key in sorted(required - properties.keys()):
+            cls.fields.append(
+                Field(key, to_attribute_name(key), FieldType("Any"), True)
+            )
+
+        return result
+
+    def add_tuple_class(self, name: str, schema: dict[str, Any]) -> FieldType:
+        items = schema["items"]
+        cls = ModelClass(
+            name,
+            [],
+            is_tuple=True,
+            title=schema.get("title"),
+            description=schema.get("description"),
+            min_items=schema.get("minItems", 0),
+        )
+        for index, item in enumerate(items):
+            title = item.get("title") or f"item {index}"
+            cls.fields.append(
+                Field(
+                    index,
+                    to_attribute_name(title.removesuffix(" component")),
+                    self.get_type(item, name + to_pascal_case(title)),
+                    required=index < cls.min_items,
+                    description=item.get("description"),
+                )
+            )
+        self.classes[name] = cls
+        return class_type(name)
+
+    def get_type(self, schema: dict[str, Any], name: str) -> FieldType:  # noqa: C901
+        """Returns the field type of the given schema. New classes are
+        generated with the given name for inline object schemas.
+        """
+        ref = schema.get("$ref")
+        if ref is not None:
+            path, _, pointer = ref.partition("#")
+            if path not in ("", "definitions.json"):
+                raise ValueError(f"unsupported reference: {ref}")
+            return self.get_type_of_definition(pointer.removeprefix("/"))
+
+        if "const" in schema:
+            value = schema["const"]
+            message = f"must be equal to {value!r}"
+            return FieldType(
+                type_annotation_of_value(value),
+                [
+                    f"if value != {to_literal(value)}:",
+                    f"    raise DecodeError({to_literal(message)})",
+                ],
+            )
+
+        if "enum" in schema:
+            values = tuple(schema["enum"])
+            enum_name = self._enums.setdefault(values, f"_ENUM_{len(self._enums)}")
+            return FieldType(
+                type_annotation_of_enum(values),
+                [
+                    f"if value not in {enum_name}:",
+                    f'    raise DecodeError(f"must be one of {{list({enum_name})}}")',
+                ],
+            )
+
+        if "anyOf" in schema or "oneOf" in schema or "type" not in schema:
+            return FieldType("Any")
+
+        types = schema["type"]
+        if isinstance(types, str):
+            types = [types]
+
+        non_null_types = [type for type in types if type != "null"]
+        if len(non_null_types) == 1:
+            result = self.get_type_for_single_type(schema, non_null_types[0], name)
+            if len(types) > 1:
+                result = make_nullable(result)
+            return result
+
+        annotation = " | ".join(PRIMITIVE_TYPES[type][0] for type in types)
+        python_types = " + ".join(
+            PYTHON_TYPES[type]
+            if "(" in PYTHON_TYPES[type]
+            else f"({PYTHON_TYPES[type]},)"
+            for type in types
+        )
+        condition = f"type(value) not in {python_types}"
+        if "integer" in types and "number" not in types:
+            condition += " and not _is_integral_float(value)"
+        return FieldType(
+            annotation,
+            [
+                f"if {condition}:",
+                f"    raise DecodeError({to_literal('must be ' + ' or '.join(types))})",
+            ],
+            nullable="null" in types,
+        )
+
+    def get_type_for_single_type(
+        self, schema: dict[str, Any], type: str, name: str
+    ) -> FieldType:
+        if type == "object":
+            if "properties" in schema:
+                return self.add_object_class(name, schema)
+
+            additional = schema.get("additionalProperties")
+            if isinstance(additional, dict) and additional:
+                item_type = self.get_type(additional, name + "Item")
+                return self.map_type(item_type)
+
+        if type == "array":
+            items = schema.get("items")
+            if isinstance(items, dict) and items:
+                item_type = self.get_type(items, name + "Item")
+                return self.list_type(item_type)
+
+        annotation, condition = PRIMITIVE_TYPES[type]
+        return FieldType(
+            annotation,
+            [
+                f"if {condition}:",
+                f"    raise DecodeError({to_literal('must be ' + type)})",
+            ],
+        )
+
+    def get_decoder(self, field_type: FieldType) -> str:
+        """Returns the name of a callable that checks and converts JSON values
+        according to the given field type, generating a module-level function
+        if needed.
+        """
+        if field_type.decoder is not None and not field_type.checks:
+            return field_type.decoder
+
+        key = repr((field_type.checks, field_type.decoder))
+        entry = self._decoders.get(key)
+        if entry is None:
+            entry = f"_decode_{len(self._decoders)}", field_type
+            self._decoders[key] = entry
+        return entry[0]
+
+    def list_type(self, item_type: FieldType) -> FieldType:
+        decoder = self.get_decoder(item_type)
+        return FieldType(
+            f"list[{item_type.annotation}]",
+            [f"value = _decode_list(value, {decoder})"],
+            encoder=(
+                None
+                if item_type.encoder is None
+                else f"[{apply_encoder(item_type.encoder, 'item')} for item in {{}}]"
+            ),
+        )
+
+    def map_type(self, item_type: FieldType) -> FieldType:
+        decoder = self.get_decoder(item_type)
+        return FieldType(
+            f"dict[str, {item_type.annotation}]",
+            [f"value = _decode_map(value, {decoder})"],
+            encoder=(
+                None
+                if item_type.encoder is None
+                else "{key: %s for key, item in {}.items()}"
+                % apply_encoder(item_type.encoder, "item")
+            ),
+        )
+
+    def render(self) -> str:
+        class_names = sorted(self.classes)
+        exports = "\n".join(f'    "{name}",' for name in class_names)
+        parts = [HEADER.replace("{exports}", exports)]
+
+        parts.append(
+            "\n".join(
+                render_constant(name, values) for values, name in self._enums.items()
+            )
+        )
+
+        for name in class_names:
+            parts.append(render_class(self.classes[name]))
+
+        for decoder_name, field_type in self._decoders.values():
+            parts.append(render_decoder(decoder_name, field_type))
+
+        parts.append(self.render_body_classes())
+        return "\n\n\n".join(part.rstrip("\n") for part in parts) + "\n"
+
+    def render_body_classes(self) -> str:
+        lines = [
+            "BODY_CLASSES: dict[str, dict[str | None, tuple[Any, ...]]] = {",
+        ]
+        for kind, classes in self.body_classes.items():
+            lines.append(f'    "{kind}": {{')
+            for message_type, names in classes.items():
+                key = to_literal(message_type)
+                items = ", ".join(names) + ("," if len(names) == 1 else "")
+                entry = f"        {key}: ({items}),"
+                if len(entry) > 88:
+                    lines.append(f"        {key}: (")
+                    lines.extend(f"            {name}," for name in names)
+                    lines.append("        ),")
+                else:
+                    lines.append(entry)
+            lines.append("    },")
+        lines.append("}")
+        lines.append(
+            '"""Model classes of message bodies, keyed by the kind and the type of\n'
+            "the message body. The ``None`` key lists the classes of message bodies\n"
+            'where the type is optional."""'
+        )
+        lines.append("")
+        lines.append("")
+        lines.append(DECODE_BODY)
+        return "\n".join(lines)
+
+
+DECODE_BODY = '''\
+def decode_body(obj: Any, kind: str) -> Any:
+    """Converts the JSON representation of a message body of the given kind
+    into an instance of the corresponding model class.
+
+    Parameters:
+        obj: the JSON representation of the message body
+        kind: the kind of the message body; one of ``notification``,
+            ``request`` or ``response``
+
+    Returns:
+        an instance of the model class of the message body
+
+    Raises:
+        DecodeError: if the message body does not match the model class of its
+            type or its type is unknown
+    """
+    if type(obj) is not dict:
+        raise DecodeError("must be object")
+
+    message_type = obj.get("type")
+    if message_type is not None and type(message_type) is not str:
+        raise DecodeError("must be string").within("type")
+
+    classes = BODY_CLASSES[kind].get(message_type)
+    if classes is None:
+        raise DecodeError(f"must be a known {kind} type").within("type")
+
+    errors = []
+    for cls in classes:
+        try:
+            return cls.from_json(obj)
+        except DecodeError as ex:
+            errors.append(ex)
+
+    raise errors[0]'''
+
+
+def class_type(name: str) -> FieldType:
+    return FieldType(name, decoder=f"{name}.from_json", encoder="{}.to_json()")
+
+
+def make_nullable(field_type: FieldType) -> FieldType:
+    checks = field_type.checks
+    if field_type.decoder is not None:
+        checks = [*checks, f"value = {field_type.decoder}(value)"]
+
+    encoder = field_type.encoder
+    if encoder is not None:
+        encoder = f"None if {{}} is None else {encoder}"
+        # The encoder refers to the value twice so it must be a simple name
+    return FieldType(
+        f"{field_type.annotation} | None",
+        ["if value is not None:", *(f"    {line}" for line in checks)],
+        encoder=encoder,
+        nullable=True,
+    )
+
+
+def uses_missing(f: Field) -> bool:
+    """Returns whether missing values of the given field are represented by
+    the ``_MISSING`` sentinel because ``None`` is a valid value of the field.
+    """
+    return not f.required and f.type.nullable
+
+
+def render_class(cls: ModelClass) -> str:
+    lines = [f"class {cls.name}(_Model):"]
+    docstring = render_docstring(cls.title, cls.description, indent=4)
+    if docstring:
+        lines.extend(docstring)
+        lines.append("")
+
+    slots = ", ".join(f'"{f.name}"' for f in cls.fields)
+    slot_line = f"    __slots__ = ({slots}{',' if len(cls.fields) == 1 else ''})"
+    if len(slot_line) > 88:
+        lines.append("    __slots__ = (")
+        lines.extend(f'        "{f.name}",' for f in cls.fields)
+        lines.append("    )")
+    else:
+        lines.append(slot_line)
+    lines.append("")
+
+    for f in cls.fields:
+        annotation = f.type.annotation
+        if not f.required and not annotation.endswith("| None"):
+            annotation += " | None"
+        if uses_missing(f):
+            annotation += " | _Missing"
+        lines.append(f"    {f.name}: {annotation}")
+        if f.description:
+            lines.extend(render_docstring(None, f.description, indent=4))
+        lines.append("")
+
+    if cls.is_tuple:
+        lines.append(f"    MIN_ITEMS: ClassVar[int] = {cls.min_items}")
+        lines.append("")
+    else:
+        required = sorted(str(f.key) for f in cls.fields if f.required)
+        known = sorted(str(f.key) for f in cls.fields)
+        lines.extend(render_frozenset("REQUIRED", required))
+        if cls.closed:
+            lines.extend(render_frozenset("KNOWN", known))
+        lines.append("")
+
+    lines.extend(render_init(cls))
+    lines.append("")
+    if cls.is_tuple:
+        lines.extend(render_tuple_from_json(cls))
+        lines.append("")
+        lines.extend(render_tuple_to_json(cls))
+    else:
+        lines.extend(render_object_from_json(cls))
+        lines.append("")
+        lines.extend(render_object_to_json(cls))
+    return "\n".join(lines)
+
+
+def render_constant(name: str, values: tuple[Any, ...]) -> str:
+    line = f"{name} = {to_literal(values)}"
+    if len(line) <= 88:
+        return line
+    items = "".join(f"    {to_literal(value)},\n" for value in values)
+    return f"{name} = (\n{items})"
+
+
+def render_frozenset(name: str, items: list[str]) -> list[str]:
+    line = f"    {name}: ClassVar[frozenset[str]] = frozenset({to_literal(items)})"
+    if len(line) <= 88:
+        return [line]
+
+    lines = [f"    {name}: ClassVar[frozenset[str]] = frozenset("]
+    inner = f"        {to_literal(items)}"
+    if len(inner) <= 88:
+        lines.append(inner)
+    else:
+        lines.append("        [")
+        lines.extend(f"            {to_literal(item)}," for item in items)
+        lines.append("        ]")
+    lines.append("    )")
+    return lines
+
+
+def render_init(cls: ModelClass) -> list[str]:
+    ordered = [f for f in cls.fields if f.required and f.default is None]
+    ordered += [f for f in cls.fields if not f.required or f.default is not None]
+
+    params = []
+    for f in ordered:
+        annotation = f.type.annotation
+        if f.default is not None:
+            params.append(f"{f.name}: {annotation} = {to_literal(f.default)}")
+        elif f.required:
+            params.append(f"{f.name}: {annotation}")
+        elif uses_missing(f):
+            params.append(f"{f.name}: {annotation} | _Missing = _MISSING")
+        else:
+            if not annotation.endswith("| None"):
+                annotation += " | None"
+            params.append(f"{f.name}: {annotation} = None")
+
+    lines = []
+    signature = f"    def __init__(self, {', '.join(params)}) -> None:"
+    if not params:
+        lines.append("    def __init__(self) -> None:")
+    elif len(signature) <= 88:
+        lines.append(signature)
+    else:
+        lines.append("    def __init__(")
+        lines.append("        self,")
+        lines.extend(f"        {param}," for param in params)
+        lines.append("    ) -> None:")
+
+    if cls.fields:
+        lines.extend(f"        self.{f.name} = {f.name}" for f in cls.fields)
+    else:
+        lines.append("        pass")
+    return lines
+
+
+def render_checks(f: Field, indent: int) -> list[str]:
+    prefix = " " * indent
+    lines = [prefix + line for line in f.type.checks]
+    if f.type.decoder is not None:
+        lines.append(f"{prefix}value = {f.type.decoder}(value)")
+    return lines
+
+
+def render_missing_checks(f: Field, indent: int) -> list[str]:
+    """Renders the checks of a field that uses the ``_MISSING`` sentinel for
+    missing values, skipping them when the value is missing.
+    """
+    prefix = " " * indent
+    checks = render_checks(f, indent + 4)
+    if not checks:
+        return []
+    if checks[0].strip() == "if value is not None:":
+        # Merge the null check of the nullable type with the sentinel check
+        return [f"{prefix}if value is not None and value is not _MISSING:"] + [
+            line[4:] for line in checks[1:]
+        ]
+    return [f"{prefix}if value is not _MISSING:", *checks]
+
+
+def render_object_from_json(cls: ModelClass) -> list[str]:
+    lines = [
+        "    @classmethod",
+        f"    def from_json(cls, obj: Any) -> {cls.name}:",
+        '        """Creates an instance from its JSON representation."""',
+        "        if type(obj) is not dict:",
+        '            raise DecodeError("must be object")',
+    ]
+    if any(f.required for f in cls.fields):
+        lines.append("        if not cls.REQUIRED <= obj.keys():")
+        lines.append("            raise _missing_properties(obj, cls.REQUIRED)")
+    if cls.closed:
+        lines.append("        if not obj.keys() <= cls.KNOWN:")
+        lines.append("            raise _unknown_properties(obj, cls.KNOWN)")
+
+    lines.append("        self = object.__new__(cls)")
+    if not cls.fields:
+        lines.append("        return self")
+        return lines
+
+    lines.append('        key = ""')
+    lines.append("        try:")
+    for f in cls.fields:
+        lines.append(f'            key = "{f.key}"')
+        checks = render_checks(f, 16)
+        if f.required:
+            lines.append(f'            value = obj["{f.key}"]')
+            lines.extend(line[4:] for line in checks)
+        elif uses_missing(f):
+            lines.append(f'            value = obj.get("{f.key}", _MISSING)')
+            lines.extend(render_missing_checks(f, 12))
+        else:
+            lines.append(f'            value = obj.get("{f.key}")')
+            if checks:
+                if f.type.nullable:
+                    lines.extend(line[4:] for line in checks)
+                else:
+                    lines.append("            if value is not None:")
+                    lines.extend(checks)
+                    lines.append(f'            elif "{f.key}" in obj:')
+                    lines.append(
+                        '                raise DecodeError("must not be null")'
+                    )
+        lines.append(f"            self.{f.name} = value")
+
+    lines.append("        except DecodeError as ex:")
+    lines.append("            raise ex.within(key) from None")
+    lines.append("        return self")
+    return lines
+
+
+def render_object_to_json(cls: ModelClass) -> list[str]:
+    lines = [
+        "    def to_json(self) -> dict[str, Any]:",
+        '        """Returns the JSON representation of this instance."""',
+    ]
+    required = [f for f in cls.fields if f.required]
+    optional = [f for f in cls.fields if not f.required]
+
+    items = []
+    for f in required:
+        items.append(f'"{f.key}": {encode_expr(f, f"self.{f.name}")}')
+
+    if not optional:
+        lines.extend(render_dict_literal("        return ", items))
+        return lines
+
+    lines.extend(render_dict_literal("        result: dict[str, Any] = ", items))
+    for f in optional:
+        lines.append(f"        value = self.{f.name}")
+        if uses_missing(f):
+            lines.append("        if value is not _MISSING:")
+        else:
+            lines.append("        if value is not None:")
+        line = f'            result["{f.key}"] = {encode_expr(f, "value")}'
+        if len(line) > 88:
+            # Encoders that do not fit on a single line are comprehensions
+            prefix, _, expr = line.partition(" = ")
+            inner = expr[1:-1]
+            line = f"{prefix} = {expr[0]}\n{' ' * 16}{inner}\n{' ' * 12}{expr[-1]}"
+        lines.append(line)
+    lines.append("        return result")
+    return lines
+
+
+def render_dict_literal(prefix: str, items: list[str]) -> list[str]:
+    line = prefix + "{" + ", ".join(items) + "}"
+    if len(line) <= 88:
+        return [line]
+    lines = [prefix + "{"]
+    lines.extend(f"            {item}," for item in items)
+    lines.append("        }")
+    return lines
+
+
+def render_tuple_from_json(cls: ModelClass) -> list[str]:
+    num_fields = len(cls.fields)
+    lines = [
+        "    @classmethod",
+        f"    def from_json(cls, obj: Any) -> {cls.name}:",
+        '        """Creates an instance from its JSON representation."""',
+        "        if type(obj) is not list:",
+        '            raise DecodeError("must be array")',
+        "        length = len(obj)",
+        "        if length < cls.MIN_ITEMS:",
+        '            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")',
+        "        self = object.__new__(cls)",
+        "        key = 0",
+        "        try:",
+    ]
+    for f in cls.fields:
+        lines.append(f"            key = {f.key}")
+        checks = render_checks(f, 16)
+        if f.required:
+            lines.append(f"            value = obj[{f.key}]")
+            lines.extend(line[4:] for line in checks)
+        elif uses_missing(f):
+            lines.append(
+                f"            value = obj[{f.key}] if length > {f.key} else _MISSING"
+            )
+            lines.extend(render_missing_checks(f, 12))
+        else:
+            lines.append(
+                f"            value = obj[{f.key}] if length > {f.key} else None"
+            )
+            if checks:
+                if f.type.nullable:
+                    lines.extend(line[4:] for line in checks)
+                else:
+                    lines.append("            if value is not None:")
+                    lines.extend(checks)
+        lines.append(f"            self.{f.name} = value")
+    lines.append("        except DecodeError as ex:")
+    lines.append("            raise ex.within(key) from None")
+    if num_fields:
+        lines.append("        return self")
+    return lines
+
+
+def render_tuple_to_json(cls: ModelClass) -> list[str]:
+    lines = [
+        "    def to_json(self) -> list[Any]:",
+        '        """Returns the JSON representation of this instance."""',
+    ]
+    items = [encode_expr(f, f"self.{f.name}") for f in cls.fields]
+    line = f"        result = [{', '.join(items)}]"
+    if len(line) <= 88:
+        lines.append(line)
+    else:
+        lines.append("        result = [")
+        lines.extend(f"            {item}," for item in items)
+        lines.append("        ]")
+
+    # Optional items are either all nullable or all non-nullable in the
+    # schemas; the former use the _MISSING sentinel for missing values
+    optional = [f for f in cls.fields if not f.required]
+    with_missing = [f for f in optional if uses_missing(f)]
+    if with_missing and len(with_missing) < len(optional):
+        raise ValueError(f"{cls.name} mixes nullable and non-nullable items")
+
+    if optional:
+        sentinel = "_MISSING" if with_missing else "None"
+        lines.append(
+            f"        while len(result) > {cls.min_items} and result[-1] is {sentinel}:"
+        )
+        lines.append("            result.pop()")
+    if with_missing:
+        # Missing items before the last present item are sent as nulls
+        lines.append(
+            "        return [None if item is _MISSING else item for item in result]"
+        )
+    else:
+        lines.append("        return result")
+    return lines
+
+
+def render_decoder(name: str, field_type: FieldType) -> str:
+    lines = [f"def {name}(value: Any) -> {field_type.annotation}:"]
+    lines.extend(f"    {line}" for line in field_type.checks)
+    if field_type.decoder is not None:
+        lines.append(f"    return {field_type.decoder}(value)")
+    else:
+        lines.append("    return value")
+    return "\n".join(lines)
+
+
+def render_docstring(title: str | None, description: str | None, indent: int):
+    prefix = " " * indent
+    paragraphs = []
+    if title:
+        paragraphs.append(title.rstrip(".") + ".")
+    if description and description != title:
+        description = description.strip()
+        if not description.endswith("."):
+            description += "."
+        paragraphs.append(description)
+    if not paragraphs:
+        return []
+
+    text = "\n\n".join(paragraphs).replace("\\", "\\\\").replace('"""', "'''")
+    width = 88 - indent
+    wrapped = []
+    for paragraph in text.split("\n\n"):
+        wrapped.append(textwrap.fill(paragraph, width=width - 3))
+
+    body = "\n\n".join(wrapped)
+    if "\n" not in body and len(body) + 6 <= width:
+        return [f'{prefix}"""{body}"""']
+
+    lines = body.split("\n")
+    result = [f'{prefix}"""{lines[0]}']
+    result.extend(f"{prefix}{line}" if line else "" for line in lines[1:])
+    result.append(f'{prefix}"""')
+    return result
+
+
+def encode_expr(f: Field, expr: str) -> str:
+    encoder = f.type.encoder
+    if encoder is None:
+        return expr
+    if f.required and not f.type.nullable:
+        return apply_encoder(encoder, expr)
+    if f.type.nullable and encoder.startswith("None if"):
+        return apply_encoder(encoder, expr)
+    if f.required:
+        return f"None if {expr} is None else {apply_encoder(encoder, expr)}"
+    return apply_encoder(encoder, expr)
+
+
+def apply_encoder(encoder: str, expr: str) -> str:
+    """Substitutes the given Python expression into the placeholder of an
+    encoder.
+    """
+    return encoder.replace("{}", expr)
+
+
+def get_description(schema: dict[str, Any], definitions: dict[str, Any]) -> str | None:
+    result = schema.get("description") or schema.get("title")
+    if result is None and "$ref" in schema:
+        name = schema["$ref"].partition("#")[2].removeprefix("/")
+        target = definitions.get(name, {})
+        result = target.get("description") or target.get("title")
+    return result
+
+
+def is_tuple_schema(schema: dict[str, Any]) -> bool:
+    return schema.get("type") == "array" and isinstance(schema.get("items"), list)
+
+
+def load_json(resource_path: str) -> Any:
+    return json.loads((SCHEMA_DIR / resource_path).read_text(encoding="utf-8"))
+
+
+def to_attribute_name(key: str) -> str:
+    name = re.sub(r"[^0-9A-Za-z]+", "_", key)
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    name = name.strip("_").lower() or "value"
+    if name[0].isdigit():
+        name = "_" + name
+    if keyword.iskeyword(name):
+        name += "_"
+    return name
+
+
+def to_class_name(name: str) -> str:
+    match = re.match(r"[a-z]+", name)
+    if match and match.group(0) in ACRONYMS:
+        return match.group(0).upper() + name[match.end() :]
+    return name[0].upper() + name[1:]
+
+
+def to_pascal_case(name: str) -> str:
+    words = re.split(r"[^0-9A-Za-z]+", name)
+    return "".join(word[0].upper() + word[1:] for word in words if word)
+
+
+def to_literal(value: Any) -> str:
+    """Returns the Python literal of the given JSON value, using double quotes
+    for strings.
+    """
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (list, tuple)):
+        items = ", ".join(to_literal(item) for item in value)
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    return repr(value)
+
+
+def type_annotation_of_enum(values: tuple[Any, ...]) -> str:
+    annotations = sorted({type_annotation_of_value(value) for value in values})
+    return " | ".join(annotations)
+
+
+def type_annotation_of_value(value: Any) -> str:
+    if value is None:
+        return "None"
+    return type(value).__name__
+
+
+def generate() -> str:
+    """Generates the source code of the module containing the model classes."""
+    generator = ModelGenerator()
+    generator.add_definitions()
+    generator.add_message_bodies()
+    return generator.render()
+
+
+def main() -> int:
+    parser = ArgumentParser(description=__doc__.partition("\n\n")[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="check whether the generated module is up-to-date",
+    )
+    options = parser.parse_args()
+
+    code = generate()
+    if options.check:
+        if not OUTPUT_FILE.exists() or OUTPUT_FILE.read_text() != code:
+            print(f"{OUTPUT_FILE} is stale.", file=sys.stderr)
+            print("Run etc/scripts/generate_models.py to rebuild it.", file=sys.stderr)
+            return 1
+        print(f"{OUTPUT_FILE} is up-to-date.")
+    else:
+        OUTPUT_FILE.write_text(code)
+        print(f"Generated {OUTPUT_FILE}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""Validation of messages from asyncio code without blocking the event loop.
+
+The validators of `flockwave.spec.validator` are synchronous and their cost
+grows with the size of the message being validated. Validating a large
+message, e.g. a drone show configuration or a log download, directly in a
+coroutine would block the event loop for the entire duration of the
+validation. `AsyncValidator` validates small messages inline, where the
+overhead of switching threads would dominate, and sends large messages (or
+messages of selected types) to a thread or process pool.
+
+The number of messages waiting for or undergoing validation in the pool is
+bounded; callers that would exceed the bound wait until a slot becomes free,
+which propagates backpressure to the producers of the messages. Cancelling
+a call that is waiting for a validation in the pool removes the job from the
+pool if it has not started yet.
+
+Requires the ``fastjsonschema`` module. You can install this with the
+``validation`` extra.
+"""
+
+from asyncio import Semaphore, get_running_loop, wrap_future
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
+
+from flockwave.spec.schema import MessageBodyKind, get_message_types
+
+from .validator import (
+    Validator,
+    _get_inner_validator_for_body,
+    create_dispatching_validator,
+)
+
+__all__ = (
+    "AsyncValidator",
+    "DEFAULT_MAX_PENDING",
+    "DEFAULT_OFFLOADED_TYPES",
+    "DEFAULT_SIZE_THRESHOLD",
+)
+
+
+DEFAULT_MAX_PENDING = 16
+"""Default number of messages that may wait for or undergo validation in the
+worker pool at the same time.
+"""
+
+DEFAULT_OFFLOADED_TYPES = frozenset(
+    ("LOG-DATA", "SHOW-CFG", "SHOW-CRTH-PLAN", "SHOW-SETCFG")
+)
+"""Default message types that are always validated in the worker pool
+because their bodies may contain entire drone show configurations, encoded
+show files or log contents.
+"""
+
+DEFAULT_SIZE_THRESHOLD = 64 * 1024
+"""Default size of the encoded message, in bytes, above which the message is
+validated in the worker pool.
+"""
+
+_worker_validator: Validator | None = None
+"""Dispatching validator of the current worker process when validating in a
+process pool.
+"""
+
+
+class AsyncValidator:
+    """Validator for message bodies that can be awaited from asyncio code.
+
+    Messages are validated inline if they are small and their type is not
+    among the offloaded types. All other messages are validated in a worker
+    pool. Validators for the offloaded types are compiled ahead of time, in
+    the constructor for thread pools and in the initializer of the worker
+    processes for process pools.
+
+    The validator owns the worker pool that it creates and shuts it down in
+    `close()`; use it as an async context manager to make sure this happens.
+    Executors passed in by the caller are left running.
+    """
+
+    def __init__(
+        self,
+        kind: MessageBodyKind = "message",
+        *,
+        executor: Literal["thread", "process"] | Executor = "thread",
+        max_workers: int | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        offloaded_types: Iterable[str] = DEFAULT_OFFLOADED_TYPES,
+        size_threshold: int | None = DEFAULT_SIZE_THRESHOLD,
+    ):
+        """Constructor.
+
+        Parameters:
+            kind: the kind of message bodies that the validator will receive
+            executor: the executor to offload validations to, or ``"thread"``
+                or ``"process"`` to create a thread or process pool owned by
+                the validator. Custom process pools must be initialized with
+                `AsyncValidator.initialize_worker()`.
+            max_workers: the number of workers in the pool created by the
+                validator; ignored for custom executors
+            max_pending: the maximum number of messages that may wait for or
+                undergo validation in the pool at the same time
+            offloaded_types: message types that are always validated in the
+                pool, irrespectively of their size
+            size_threshold: size of the encoded message in bytes, above which
+                it is validated in the pool; ``None`` means that only the
+                message type is considered
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive")
+
+        self._kind = kind
+        self._offloaded_types = frozenset(offloaded_types)
+        self._size_threshold = size_threshold
+        self._max_pending = max_pending
+        self._pending = 0
+        self._slots: Semaphore | None = None
+
+        # Types that are not known for this kind would all share the (costly)
+        # validator of all message bodies so they are not compiled up front
+        precompiled = sorted(self._offloaded_types & set(get_message_types(kind)))
+        self._validator = create_dispatching_validator(kind)
+        for message_type in precompiled:
+            _get_inner_validator_for_body(message_type, kind)
+
+        self._owns_executor = isinstance(executor, str)
+        if executor == "thread":
+            self._executor: Executor = ThreadPoolExecutor(
+                max_workers, thread_name_prefix="flockwave.spec.validator"
+            )
+            self._process_pool = False
+        elif executor == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers,
+                initializer=self.initialize_worker,
+                initargs=(kind, tuple(precompiled)),
+            )
+            self._process_pool = True
+        elif isinstance(executor, Executor):
+            self._executor = executor
+            self._process_pool = isinstance(executor, ProcessPoolExecutor)
+        else:
+            raise ValueError(f"invalid executor: {executor!r}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, tb) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """Number of messages that are waiting for or undergoing validation in
+        the worker pool.
+        """
+        return self._pending
+
+    def close(self) -> None:
+        """Shuts down the worker pool if it is owned by the validator. Jobs in
+        the pool that have not started yet are cancelled.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def should_offload(self, obj: Any, size: int | None = None) -> bool:
+        """Returns whether the given message body would be validated in the
+        worker pool.
+
+        Parameters:
+            obj: the message body
+            size: the size of the encoded message in bytes, if known
+        """
+        if (
+            size is not None
+            and self._size_threshold is not None
+            and size > self._size_threshold
+        ):
+            return True
+        message_type = obj.get("type") if isinstance(obj, dict) else None
+        return message_type in self._offloaded_types
+
+    async def validate(self, obj: Any, size: int | None = None) -> None:
+        """Validates a message body.
+
+        Parameters:
+            obj: the message body to validate. Bodies validated in a process
+                pool are validated on a copy; default values filled in by the
+                schema are not added to the original body.
+            size: the size of the encoded message in bytes, if known. The
+                size is used to decide whether the message should be
+                validated inline; messages with unknown sizes are validated
+                inline unless their type is among the offloaded types.
+
+        Raises:
+            ValidationError: if the message body is not valid
+        """
+        if not self.should_offload(obj, size):
+            self._validator(obj)
+            return
+
+        loop = get_running_loop()
+        if self._slots is None:
+            self._slots = Semaphore(self._max_pending)
+        slots = self._slots
+
+        await slots.acquire()
+        self._pending += 1
+
+        def release(_future: Any) -> None:
+            self._pending -= 1
+            slots.release()
+
+        try:
+            if self._process_pool:
+                future = self._executor.submit(_validate_in_worker, obj)
+            else:
+                future = self._executor.submit(self._validator, obj)
+        except BaseException:
+            release(None)
+            raise
+
+        # The slot is released when the job is finished or cancelled in the
+        # pool, not when the caller stops waiting for it, so the bound on the
+        # number of pending jobs holds even if callers are cancelled
+        future.add_done_callback(
+            lambda future: loop.call_soon_threadsafe(release, future)
+        )
+        await wrap_future(future)
+
+    @staticmethod
+    def initialize_worker(
+        kind: MessageBodyKind, message_types: Iterable[str] = ()
+    ) -> None:
+        """Initializes a worker process of a process pool used for validation
+        by compiling the validators of the given message types.
+
+        Parameters:
+            kind: the kind of message bodies that the worker will receive
+            message_types: the message types whose validators to compile;
+                types that are not known for the given kind are ignored
+        """
+        global _worker_validator
+
+        known_types = set(get_message_types(kind))
+        _worker_validator = create_dispatching_validator(kind)
+        for message_type in message_types:
+            if message_type in known_types:
+                _get_inner_validator_for_body(message_type, kind)
+
+
+def _validate_in_worker(obj: Any) -> None:
+    """Validates a message body in a worker process of a process pool."""
+    if _worker_validator is None:
+        raise RuntimeError("worker process was not initialized")
+    _worker_validator(obj)
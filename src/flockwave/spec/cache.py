@@ -0,0 +1,184 @@
+"""Persistent on-disk cache for the resolved JSON schemas and the compiled
+code of the generated validators.
+
+The cache is opt-in. It is enabled either by calling `enable_cache()` or by
+setting the ``FLOCKWAVE_SPEC_CACHE_DIR`` environment variable to the path of
+the cache directory. Entries are stored in a subdirectory whose name is
+derived from the version of the package and the digest of the schema files,
+so a cache directory may be shared between different versions of the package
+and modified schema files never yield stale entries.
+
+Writes are atomic: each entry is written into a temporary file first and then
+renamed to its final name, so concurrently starting processes never see
+partially written entries. Entries that cannot be parsed are treated as
+missing.
+
+Note that the cache stores Python bytecode that is executed when a validator
+is loaded from the cache, so the cache directory must be writable by trusted
+users only.
+"""
+
+import json
+import os
+from contextlib import suppress
+from pathlib import Path
+from shutil import rmtree
+from tempfile import NamedTemporaryFile
+from typing import Any
+from urllib.parse import quote
+
+__all__ = (
+    "CACHE_DIR_ENV_VAR",
+    "DiskCache",
+    "clear_cache",
+    "disable_cache",
+    "enable_cache",
+    "get_cache_root",
+)
+
+
+CACHE_DIR_ENV_VAR = "FLOCKWAVE_SPEC_CACHE_DIR"
+"""Name of the environment variable that enables the cache when set."""
+
+_UNSET = object()
+_cache_root: Any = _UNSET
+"""Root directory of the cache as configured with `enable_cache()` or
+`disable_cache()`, or `_UNSET` if it should be taken from the environment.
+"""
+
+
+class DiskCache:
+    """Simple key-value store that keeps its entries in files in a single
+    directory.
+    """
+
+    _path: Path
+
+    def __init__(self, path: str | Path):
+        """Constructor.
+
+        Parameters:
+            path: the directory where the entries are stored. It is created
+                on demand when the first entry is written.
+        """
+        self._path = Path(path)
+
+    @property
+    def path(self) -> Path:
+        """The directory where the entries are stored."""
+        return self._path
+
+    def clear(self) -> None:
+        """Removes all the entries from the cache."""
+        rmtree(self._path, ignore_errors=True)
+
+    def get_bytes(self, key: str, suffix: str = ".bin") -> bytes | None:
+        """Returns the raw data stored in the cache with the given key, or
+        ``None`` if there is no such entry.
+        """
+        try:
+            return self._get_path_for_key(key, suffix).read_bytes()
+        except OSError:
+            return None
+
+    def get_json(self, key: str) -> Any:
+        """Returns the JSON object stored in the cache with the given key,
+        or ``None`` if there is no such entry or it cannot be parsed.
+        """
+        data = self.get_text(key, ".json")
+        if data is not None:
+            try:
+                return json.loads(data)
+            except ValueError:
+                pass
+        return None
+
+    def get_text(self, key: str, suffix: str = ".txt") -> str | None:
+        """Returns the string stored in the cache with the given key, or
+        ``None`` if there is no such entry.
+        """
+        try:
+            return self._get_path_for_key(key, suffix).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def put_bytes(self, key: str, value: bytes, suffix: str = ".bin") -> None:
+        """Stores raw data in the cache with the given key.
+
+        Errors while writing the cache are silently ignored; the cache is
+        an optimization only.
+        """
+        path = self._get_path_for_key(key, suffix)
+        tmp_path: str | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                "wb", dir=path.parent, prefix=".tmp-", delete=False
+            ) as fp:
+                tmp_path = fp.name
+                fp.write(value)
+            os.replace(tmp_path, path)
+        except OSError:
+            if tmp_path is not None:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+
+    def put_json(self, key: str, value: Any) -> None:
+        """Stores a JSON object in the cache with the given key."""
+        self.put_text(key, json.dumps(value, separators=(",", ":")), ".json")
+
+    def put_text(self, key: str, value: str, suffix: str = ".txt") -> None:
+        """Stores a string in the cache with the given key.
+
+        Errors while writing the cache are silently ignored; the cache is
+        an optimization only.
+        """
+        self.put_bytes(key, value.encode("utf-8"), suffix)
+
+    def _get_path_for_key(self, key: str, suffix: str) -> Path:
+        return self._path / (quote(key, safe="") + suffix)
+
+
+def clear_cache() -> None:
+    """Removes the entire cache directory, including the entries of other
+    versions of the package. Does nothing if the cache is disabled.
+    """
+    root = get_cache_root()
+    if root is not None:
+        rmtree(root, ignore_errors=True)
+
+
+def disable_cache() -> None:
+    """Disables the on-disk cache, even if the ``FLOCKWAVE_SPEC_CACHE_DIR``
+    environment variable is set.
+    """
+    global _cache_root
+    _cache_root = None
+
+
+def enable_cache(path: str | Path | None = None) -> None:
+    """Enables the on-disk cache.
+
+    Parameters:
+        path: the root directory of the cache. ``None`` means to use a
+            ``flockwave-spec`` directory in the cache directory of the user
+            (``$XDG_CACHE_HOME`` or ``~/.cache``).
+    """
+    global _cache_root
+
+    if path is None:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        path = Path(base) / "flockwave-spec"
+
+    _cache_root = Path(path)
+
+
+def get_cache_root() -> Path | None:
+    """Returns the root directory of the on-disk cache, or ``None`` if the
+    cache is disabled.
+    """
+    if _cache_root is _UNSET:
+        path = os.environ.get(CACHE_DIR_ENV_VAR)
+        return Path(path) if path else None
+    else:
+        return _cache_root
@@ -1,60 +1,175 @@
 """Command-line schema validator script.
 
 This script checks whether a given JSON file contains a valid Flockwave
-message.
+message. It can also generate synthetic Flockwave messages for load testing.
 """
 
 import json
 import os
+import re
 import sys
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from io import BytesIO
+from itertools import chain, islice
+from multiprocessing import get_context
 from pathlib import Path
+from time import perf_counter
+from typing import BinaryIO, ContextManager
 
 import click
 
-from flockwave.spec.schema import get_message_body_schema
+from .generate import GeneratorOptions, MessageGenerator
+from .schema import get_message_types
+from .stream import JSONStreamReader
+from .validator import ValidationError, Validator, create_dispatching_validator
 
-from .validator import ValidationError, Validator, create_validator_for_schema
+FailureHandler = Callable[[int, int, str], None]
+"""Type specification for functions that are called with the line number,
+the column number and the description of a failure while checking a file.
+"""
+
+
+@dataclass
+class CheckResult:
+    """Summary of checking the validity of the JSON objects in a file."""
+
+    num_objects: int = 0
+    """Number of JSON objects that were checked, including syntax errors."""
+
+    num_failures: int = 0
+    """Number of JSON objects that were invalid, including syntax errors."""
+
+    num_bytes: int = 0
+    """Number of bytes read from the file."""
+
+    def update(self, other: "CheckResult") -> None:
+        """Adds the counters of another result to this one."""
+        self.num_objects += other.num_objects
+        self.num_failures += other.num_failures
+        self.num_bytes += other.num_bytes
 
 
 def check_validity(
     filename: str,
     validator: Validator,
     allow_multiple: bool = True,
-) -> int:
-    """Check the validity of a JSON object found in a file-like object.
+    on_failure: FailureHandler | None = None,
+) -> CheckResult:
+    """Check the validity of the JSON objects found in a file.
+
+    The file may contain a single JSON object, newline-delimited JSON objects
+    or concatenated JSON objects. The file is parsed incrementally so its size
+    is not limited by the available memory.
 
     Parameters:
-        filename: the file containing the JSON object. Can be
+        filename: the file containing the JSON objects. Can be
             anything that ``click.open_file()`` can handle, but typically
-            it is a string.
-        validator: the validator that is called to determine whether the JSON
+            it is a string; ``-`` denotes the standard input.
+        validator: the validator that is called to determine whether a JSON
             object is valid.
         allow_multiple: when ``True`` and the input file contains
             an array, each item of the array will be validated against the
             schema separately. When ``False``, the entire array will be
             validated in such cases.
+        on_failure: function to call with the line number, the column number
+            and the description of the problem for each invalid object or
+            syntax error in the file
 
     Returns:
-        int: the number of objects that the input file contained
+        the number of objects and failures found in the file and the number
+        of bytes read
     """
     with click.open_file(filename, "rb") as fp:
-        objs = json.load(fp)
+        return check_stream_validity(fp, validator, allow_multiple, on_failure)
+
+
+def check_stream_validity(
+    fp: BinaryIO,
+    validator: Validator,
+    allow_multiple: bool = True,
+    on_failure: FailureHandler | None = None,
+) -> CheckResult:
+    """Check the validity of the JSON objects found in a binary stream.
+
+    See `check_validity()` for the description of the parameters and the
+    return value.
+    """
+    result = CheckResult()
+    reader = JSONStreamReader(fp)
+
+    for item in reader:
+        if item.error is not None:
+            result.num_objects += 1
+            result.num_failures += 1
+            if on_failure:
+                on_failure(item.line, item.column, item.error)
+            continue
+
+        if allow_multiple and isinstance(item.value, list):
+            objs = item.value
+            prefix = "item #{index}: "
+        else:
+            objs = [item.value]
+            prefix = ""
 
-    if not allow_multiple or not isinstance(objs, list):
-        objs = [objs]
+        for index, obj in enumerate(objs):
+            result.num_objects += 1
+            try:
+                validator(obj)
+            except ValidationError as ex:
+                result.num_failures += 1
+                if on_failure:
+                    message = prefix.format(index=index) + str(ex)
+                    on_failure(item.line, item.column, message)
 
-    for obj in objs:
-        validator(obj)
+    result.num_bytes = reader.bytes_read
+    return result
 
-    return len(objs)
+
+class _GroupWithDefaultCommand(click.Group):
+    """Command group that invokes the ``validate`` command when the first
+    argument is not the name of a command, so the script keeps on working
+    when invoked without a command name.
+    """
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if not args or (args[0] not in self.commands and args[0] != "--help"):
+            args = ["validate", *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_GroupWithDefaultCommand)
+def cli() -> None:
+    """Validates Flockwave messages or generates synthetic ones. Runs the
+    ``validate`` command when no command is given.
+    """
+    pass
 
 
-@click.command()
-@click.argument("name", nargs=-1, type=click.Path(exists=True))
-def validate(name: Sequence[str] | None = None) -> None:
-    """Validates the JSON message stored in the file with the given NAME to see
-    if it is a valid Flockwave message. When omitted, the script will validate
+@cli.command()
+@click.argument("name", nargs=-1, type=click.Path(exists=True, allow_dash=True))
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    help=(
+        "Number of worker processes to validate with; 0 means one per CPU "
+        "core. Only inputs of at least 32 MiB of newline-delimited or "
+        "concatenated messages are split into chunks; smaller inputs are "
+        "validated in a single process as starting the workers would cost "
+        "more than it saves."
+    ),
+)
+def validate(name: Sequence[str] | None = None, jobs: int = 1) -> None:
+    """Validates the JSON messages stored in the files with the given NAME to
+    see if they are valid Flockwave messages. Files may contain a single
+    message or a stream of newline-delimited or concatenated messages; ``-``
+    reads from the standard input. When omitted, the script will validate
     all ``.json`` files found in ``doc/modules/ROOT/examples``.
     """
     own_path = sys.modules[__name__].__file__
@@ -73,30 +188,474 @@ def validate(name: Sequence[str] | None = None) -> None:
     else:
         compact_output = False
 
-    schema = get_message_body_schema()
-    validator = create_validator_for_schema(schema)
-
-    for fn in name:
-        try:
-            num_objs = check_validity(fn, validator)
-        except ValidationError:
-            fn = click.format_filename(fn)
-            click.echo(f"{fn} is not a valid Flockwave message.")
-            click.echo("")
-            raise
-
-        if not compact_output:
-            fn = click.format_filename(fn)
-            if num_objs == 1:
-                click.echo(f"{fn} is a valid Flockwave message.")
-            elif num_objs > 1:
-                click.echo(f"{fn} contains valid Flockwave messages.")
-            else:
-                click.echo(f"{fn} contains no objects at all.")
+    display_names = [
+        "<stdin>" if fn == "-" else click.format_filename(fn) for fn in name
+    ]
+    total = CheckResult()
+    file_result = CheckResult()
+    line_offset = 0
+    started_at = perf_counter()
+
+    jobs = jobs or os.cpu_count() or 1
+    units = _plan_work_units(name, jobs)
+    for work in _run_work_units(units, jobs):
+        display_name = display_names[work.file_index]
+        for line, column, message in work.failures:
+            click.echo(f"{display_name}:{line + line_offset}:{column}: {message}")
+
+        file_result.update(work.result)
+        line_offset += work.num_lines
+
+        if work.is_last:
+            total.update(file_result)
+            if file_result.num_failures or not compact_output:
+                _print_summary(display_name, file_result)
+            file_result = CheckResult()
+            line_offset = 0
+
+    _print_throughput(total, perf_counter() - started_at)
+
+    if total.num_failures:
+        click.echo(
+            f"{total.num_failures} of {total.num_objects} tested messages were invalid."
+        )
+        sys.exit(1)
 
     if compact_output:
         click.echo("All tested messages were valid.")
 
 
+_CHUNK_SIZE = 16 * 1024 * 1024
+"""Minimum size of the chunks that large inputs are split into, in bytes.
+
+Validation runs at a few megabytes per second, so a chunk takes several
+seconds to check; this keeps the cost of starting the workers and passing
+the results around small compared to the work done in each chunk.
+"""
+
+_WARM_UP_SIZE = 1024 * 1024
+"""Number of bytes from the start of the input that are validated in the main
+process before the workers are started so the workers inherit the validators
+of the message types that are seen there instead of compiling them again.
+"""
+
+_BOUNDARY = re.compile(rb"[\]}][ \t\r\n]*\n[\[{]")
+"""Regular expression matching the places where inputs may be split into
+chunks: the end of a JSON object or array, followed by whitespace and a
+newline that starts another JSON object or array. Inputs are split right
+after the newline.
+
+Values within a single JSON document are separated by commas and JSON strings
+cannot contain raw newlines, so this never matches inside a document, not
+even when it is pretty-printed with nested objects or arrays at the start of
+a line.
+"""
+
+
+_BOUNDARY_OVERLAP = 64
+"""Number of bytes that are searched again for boundaries when the search
+continues in the next block of an input. Boundaries with a longer run of
+whitespace in the middle may be missed when they span two blocks; the input
+is then split at a later boundary instead.
+"""
+
+
+@dataclass(frozen=True)
+class _WorkUnit:
+    """A part of an input file that can be checked independently."""
+
+    file_index: int
+    """Index of the input file that the unit belongs to."""
+
+    filename: str
+    """Name of the input file."""
+
+    start: int = 0
+    """Offset of the first byte of the unit in the file."""
+
+    end: int | None = None
+    """Offset of the byte after the unit in the file; ``None`` means the end
+    of the file.
+    """
+
+    data: bytes | None = None
+    """The contents of the unit if it was read already (e.g., from the standard
+    input); ``None`` means that it has to be read from the file.
+    """
+
+    is_last: bool = True
+    """Whether this is the last unit of the file."""
+
+
+@dataclass
+class _WorkResult:
+    """Outcome of checking a single work unit."""
+
+    file_index: int
+    is_last: bool
+    result: CheckResult
+    failures: list[tuple[int, int, str]]
+    """Failures in the unit, with line numbers relative to the unit."""
+
+    num_lines: int
+    """Number of newline characters in the unit."""
+
+
+_worker_validator: Validator | None = None
+"""Validator used by `_check_work_unit()`; created once per process."""
+
+
+def _check_work_unit(unit: _WorkUnit) -> _WorkResult:
+    """Checks the validity of the JSON objects in a single work unit."""
+    global _worker_validator
+
+    if _worker_validator is None:
+        _worker_validator = create_dispatching_validator()
+
+    failures: list[tuple[int, int, str]] = []
+
+    def on_failure(line: int, column: int, message: str) -> None:
+        failures.append((line, column, message))
+
+    if unit.data is not None:
+        fp = BytesIO(unit.data)
+        result = check_stream_validity(fp, _worker_validator, on_failure=on_failure)
+        num_lines = unit.data.count(b"\n")
+    else:
+        with _open_input(unit.filename) as raw_fp:
+            fp = _RangeReader(raw_fp, unit.start, unit.end)
+            result = check_stream_validity(
+                fp,  # type: ignore
+                _worker_validator,
+                on_failure=on_failure,
+            )
+            num_lines = fp.num_lines
+
+    return _WorkResult(unit.file_index, unit.is_last, result, failures, num_lines)
+
+
+def _open_input(filename: str) -> ContextManager[BinaryIO]:
+    """Opens the given input file in binary mode; ``-`` denotes the standard
+    input, which is left open when the context exits.
+    """
+    if filename == "-":
+        return nullcontext(sys.stdin.buffer)
+    else:
+        return open(filename, "rb")
+
+
+def _plan_work_units(filenames: Sequence[str], jobs: int = 1) -> Iterator[_WorkUnit]:
+    """Splits the given input files into work units that can be checked
+    independently by the given number of worker processes. Files are not
+    split at all when there is a single worker.
+    """
+    for index, filename in enumerate(filenames):
+        if jobs <= 1:
+            yield _WorkUnit(index, filename)
+        elif filename == "-":
+            yield from _split_stream(index, sys.stdin.buffer)
+        else:
+            yield from _split_file(index, filename, jobs)
+
+
+def _run_work_units(units: Iterable[_WorkUnit], jobs: int) -> Iterator[_WorkResult]:
+    """Checks the given work units, either in the current process or in a pool
+    of worker processes, and yields the results in the order of the units.
+    """
+    units = iter(units)
+    head = list(islice(units, 2))
+    if jobs <= 1 or len(head) < 2:
+        # Nothing to parallelize
+        yield from map(_check_work_unit, chain(head, units))
+        return
+
+    _warm_up(head[0])
+    mp_context = get_context("fork") if sys.platform == "linux" else None
+
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as executor:
+        pending: deque[Future[_WorkResult]] = deque()
+        for unit in chain(head, units):
+            pending.append(executor.submit(_check_work_unit, unit))
+            # Limit the number of units in flight to keep memory usage bounded
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _warm_up(unit: _WorkUnit) -> None:
+    """Validates the first `_WARM_UP_SIZE` bytes of the given work unit in the
+    current process and discards the results, compiling the validators of the
+    message types that appear there.
+    """
+    global _worker_validator
+
+    if unit.data is not None:
+        data = unit.data[:_WARM_UP_SIZE]
+    else:
+        with open(unit.filename, "rb") as fp:
+            fp.seek(unit.start)
+            data = fp.read(_WARM_UP_SIZE)
+
+    boundaries = list(_BOUNDARY.finditer(data))
+    if boundaries:
+        if _worker_validator is None:
+            _worker_validator = create_dispatching_validator()
+        fp = BytesIO(data[: boundaries[-1].end() - 1])
+        check_stream_validity(fp, _worker_validator, on_failure=lambda *args: None)
+
+
+def _split_file(file_index: int, filename: str, jobs: int) -> Iterator[_WorkUnit]:
+    """Splits the given input file into at most the given number of work
+    units of approximately equal size, but at least `_CHUNK_SIZE` bytes each.
+    """
+    size = os.path.getsize(filename)
+    chunk_size = max(_CHUNK_SIZE, -(-size // jobs))
+
+    with open(filename, "rb") as fp:
+        if size < 2 * _CHUNK_SIZE or fp.read(1024).lstrip().startswith(b"["):
+            # Small file or a single JSON array; not worth splitting or
+            # cannot be split
+            yield _WorkUnit(file_index, filename)
+            return
+
+        start = 0
+        while start < size:
+            end = _find_boundary(fp, start + chunk_size)
+            yield _WorkUnit(file_index, filename, start, end, is_last=end is None)
+            if end is None:
+                break
+            start = end
+
+
+def _split_stream(file_index: int, fp: BinaryIO) -> Iterator[_WorkUnit]:
+    """Splits the given input stream into work units of approximately
+    `_CHUNK_SIZE` bytes each.
+    """
+    buffer = b""
+    can_split = None
+    eof = False
+
+    while not eof:
+        chunk = fp.read(_CHUNK_SIZE)
+        eof = not chunk
+        buffer += chunk
+
+        if can_split is None and buffer.strip():
+            can_split = not buffer.lstrip().startswith(b"[")
+
+        boundary = -1
+        if can_split and not eof:
+            for match in _BOUNDARY.finditer(
+                buffer, max(len(buffer) - len(chunk) - _BOUNDARY_OVERLAP, 0)
+            ):
+                boundary = match.end() - 1
+
+        if boundary > 0:
+            yield _WorkUnit(file_index, "-", data=buffer[:boundary], is_last=False)
+            buffer = buffer[boundary:]
+
+    yield _WorkUnit(file_index, "-", data=buffer)
+
+
+def _find_boundary(fp: BinaryIO, offset: int) -> int | None:
+    """Finds the first place in the given file at or after the given offset
+    where the file can be split into chunks.
+
+    Returns:
+        the offset of the boundary or ``None`` if there is no boundary after
+        the given offset
+    """
+    fp.seek(max(offset - _BOUNDARY_OVERLAP, 0))
+    position = fp.tell()
+    while True:
+        block = fp.read(1024 * 1024)
+        for match in _BOUNDARY.finditer(block):
+            if position + match.end() - 1 >= offset:
+                return position + match.end() - 1
+
+        if len(block) <= _BOUNDARY_OVERLAP:
+            return None
+
+        # Keep the last few bytes in case a boundary spans two blocks
+        position += len(block) - _BOUNDARY_OVERLAP
+        fp.seek(position)
+
+
+class _RangeReader:
+    """Binary file-like object that reads a given range of bytes from an
+    underlying file and counts the newline characters it has read.
+    """
+
+    def __init__(self, fp: BinaryIO, start: int, end: int | None):
+        self._fp = fp
+        self._remaining = end - start if end is not None else None
+        self.num_lines = 0
+        if start:
+            fp.seek(start)
+
+    def read(self, size: int = -1) -> bytes:
+        if self._remaining is not None:
+            if size < 0 or size > self._remaining:
+                size = self._remaining
+            if size == 0:
+                return b""
+
+        data = self._fp.read(size)
+        if self._remaining is not None:
+            self._remaining -= len(data)
+        self.num_lines += data.count(b"\n")
+        return data
+
+
+def _print_summary(display_name: str, result: CheckResult) -> None:
+    """Prints a one-line summary of checking the validity of a single file."""
+    num_objs = result.num_objects
+    if result.num_failures:
+        if num_objs == 1:
+            click.echo(f"{display_name} is not a valid Flockwave message.")
+        else:
+            click.echo(
+                f"{display_name} contains {result.num_failures} invalid "
+                f"Flockwave message(s)."
+            )
+    elif num_objs == 1:
+        click.echo(f"{display_name} is a valid Flockwave message.")
+    elif num_objs > 1:
+        click.echo(f"{display_name} contains valid Flockwave messages.")
+    else:
+        click.echo(f"{display_name} contains no objects at all.")
+
+
+def _print_throughput(result: CheckResult, duration: float) -> None:
+    """Prints throughput statistics of a validation run to the standard
+    error stream.
+    """
+    duration = max(duration, 1e-9)
+    megabytes = result.num_bytes / 1e6
+    click.echo(
+        f"Checked {result.num_objects} message(s), {megabytes:.2f} MB in "
+        f"{duration:.2f}s ({result.num_objects / duration:.0f} messages/s, "
+        f"{megabytes / duration:.2f} MB/s)",
+        err=True,
+    )
+
+
+@cli.command()
+@click.argument("types", nargs=-1, metavar="[TYPE]...")
+@click.option(
+    "-k",
+    "--kind",
+    type=click.Choice(["message", "notification", "request", "response"]),
+    default="message",
+    help="Kind of message bodies to generate.",
+)
+@click.option(
+    "-n",
+    "--count",
+    type=click.IntRange(min=0),
+    default=1000,
+    help="Number of messages to generate; 0 means to generate indefinitely.",
+)
+@click.option("-s", "--seed", type=int, help="Seed of the random number generator.")
+@click.option(
+    "--size",
+    "sizes",
+    multiple=True,
+    metavar="NAME=N",
+    help=(
+        "Exact size of arrays, maps and strings in properties with the given "
+        "name, e.g. status=5000 for UAV-INF responses with 5000 UAVs. May be "
+        "given multiple times."
+    ),
+)
+@click.option(
+    "--max-items",
+    type=click.IntRange(min=0),
+    default=GeneratorOptions.max_items,
+    help="Maximum number of items in arrays and maps of unconstrained size.",
+)
+@click.option(
+    "--invalid",
+    "invalid_ratio",
+    type=click.FloatRange(0, 1),
+    default=0.0,
+    help="Ratio of messages that should violate the schema of their type.",
+)
+@click.option(
+    "--envelope/--no-envelope",
+    default=False,
+    help="Whether to wrap message bodies in full Flockwave messages.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="Output file; defaults to the standard output.",
+)
+def generate(
+    types: Sequence[str],
+    kind: str,
+    count: int,
+    seed: int | None,
+    sizes: Sequence[str],
+    max_items: int,
+    invalid_ratio: float,
+    envelope: bool,
+    output,
+) -> None:
+    """Generates synthetic Flockwave messages with the given TYPEs as
+    newline-delimited JSON. When no type is given, messages are generated with
+    all the types of the given kind.
+    """
+    known_types = set(get_message_types(kind))  # type: ignore
+    unknown_types = [type for type in types if type not in known_types]
+    if unknown_types:
+        raise click.BadParameter(
+            f"unknown {kind} type(s): {', '.join(unknown_types)}",
+            param_hint="TYPE",
+        )
+
+    options = GeneratorOptions(max_items=max_items, sizes=_parse_sizes(sizes))
+    generator = MessageGenerator(kind, seed=seed, options=options)  # type: ignore
+    items = generator.iter_bodies(
+        types or None,
+        count=count or None,
+        invalid_ratio=invalid_ratio,
+        envelope=envelope,
+    )
+
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    batch: list[str] = []
+    for item in items:
+        batch.append(encode(item))
+        if len(batch) >= _GENERATE_BATCH_SIZE:
+            batch.append("")
+            output.write("\n".join(batch))
+            batch.clear()
+
+    if batch:
+        batch.append("")
+        output.write("\n".join(batch))
+
+
+_GENERATE_BATCH_SIZE = 256
+"""Number of generated messages to write to the output at once."""
+
+
+def _parse_sizes(sizes: Sequence[str]) -> dict[str, int]:
+    """Parses the ``NAME=N`` specifications of the ``--size`` option."""
+    result: dict[str, int] = {}
+    for spec in sizes:
+        name, sep, value = spec.partition("=")
+        if not sep or not name or not value.isdigit():
+            raise click.BadParameter(
+                f"expected NAME=N, got {spec!r}", param_hint="--size"
+            )
+        result[name] = int(value)
+    return result
+
+
 if __name__ == "__main__":
-    validate()
+    cli()
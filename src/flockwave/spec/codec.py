@@ -0,0 +1,270 @@
+"""Compact binary encoding of Flockwave messages.
+
+Messages are encoded with MessagePack, and the names of the properties that
+appear in the JSON schemas of the specification (``$fw.version``, ``body``,
+``type``, the keys of UAV status objects and so on) are replaced with small
+integer tags. All other keys, such as UAV IDs in the keys of status maps,
+are encoded as strings. JSON objects cannot have integer keys, so decoding
+is unambiguous and the decoded message is always equal to the original
+JSON message.
+
+The tags are derived from the schema files of the specification, so both
+ends of a connection must use the same version of the specification. Each
+encoded message starts with a short header that identifies the tag table
+that was used for encoding it; decoding fails if the header does not match
+the tag table of the decoder.
+
+Requires the ``msgpack`` module. You can install this with the ``codec``
+extra.
+"""
+
+from hashlib import sha256
+from importlib.resources import files
+from typing import Any
+
+import msgpack
+
+from flockwave.spec.schema import SCHEMA_PACKAGE, _get_json_object_from_resource
+
+from .memoize import memoized
+
+__all__ = (
+    "CodecError",
+    "FORMAT_VERSION",
+    "decode",
+    "encode",
+    "get_tag_table",
+    "get_tag_table_id",
+)
+
+
+FORMAT_VERSION = 1
+"""Version number of the binary format, stored in the first byte of each
+encoded message.
+"""
+
+_HEADER_LENGTH = 3
+"""Length of the header of encoded messages, in bytes: the format version
+followed by the ID of the tag table.
+"""
+
+_PRIORITY_RESOURCES = ("message.json", "definitions.json")
+"""Schema resources whose property names receive the lowest tags. Tags below
+128 take a single byte in the encoded messages.
+"""
+
+_PRIORITY_DEFINITIONS = ("uavStatusInfo",)
+"""Definitions whose property names are tagged before all other definitions,
+because they dominate the traffic of a typical Flockwave server.
+"""
+
+
+class CodecError(RuntimeError):
+    """Exception thrown when a message cannot be encoded or decoded."""
+
+    pass
+
+
+@memoized
+def get_tag_table() -> tuple[str, ...]:
+    """Returns the property names that are replaced with integer tags in
+    encoded messages. The tag of each property name is its index in the
+    returned tuple.
+
+    The table is derived from the schema files of the specification: it
+    contains the property names of the envelope of messages first, followed by
+    the property names of the complex objects and then those of the message
+    bodies.
+
+    This function is memoized.
+    """
+    names: dict[str, None] = {}
+
+    definitions = _get_json_object_from_resource("definitions.json")
+    for name in _PRIORITY_DEFINITIONS:
+        _collect_property_names(definitions[name], names)
+
+    others = sorted(
+        resource.name
+        for resource in files(SCHEMA_PACKAGE).iterdir()
+        if resource.name.endswith(".json") and resource.name not in _PRIORITY_RESOURCES
+    )
+    for resource_path in (*_PRIORITY_RESOURCES, *others):
+        _collect_property_names(_get_json_object_from_resource(resource_path), names)
+
+    return tuple(names)
+
+
+@memoized
+def get_tag_table_id() -> bytes:
+    """Returns a two-byte identifier of the tag table returned by
+    `get_tag_table()`. The identifier is stored in the header of each encoded
+    message.
+
+    This function is memoized.
+    """
+    return sha256("\0".join(get_tag_table()).encode("utf-8")).digest()[:2]
+
+
+def encode(message: Any) -> bytes:
+    """Encodes a JSON message into its compact binary representation.
+
+    Parameters:
+        message: the message to encode; any JSON value is accepted, but the
+            encoding is most compact for messages that conform to the
+            ``message.json`` schema
+
+    Returns:
+        the encoded message
+
+    Raises:
+        CodecError: if the message is not a valid JSON value or cannot be
+            represented in the binary format (e.g., it contains integers that
+            do not fit in 64 bits)
+    """
+    return _get_header() + _get_encoder()(message)
+
+
+def decode(data: bytes) -> Any:
+    """Decodes a message from its compact binary representation.
+
+    Parameters:
+        data: the encoded message
+
+    Returns:
+        the JSON representation of the message
+
+    Raises:
+        CodecError: if the message is not a valid encoded message or it was
+            encoded with a different tag table
+    """
+    if data[:_HEADER_LENGTH] != _get_header():
+        if data[:1] != _get_header()[:1]:
+            raise CodecError("unsupported message format")
+        else:
+            raise CodecError(
+                "message was encoded with a different version of the specification"
+            )
+
+    try:
+        return msgpack.unpackb(
+            memoryview(data)[_HEADER_LENGTH:],
+            object_pairs_hook=_get_object_pairs_hook(),
+            strict_map_key=False,
+        )
+    except CodecError:
+        raise
+    except Exception as ex:
+        raise CodecError(f"invalid encoded message: {ex}") from None
+
+
+def _collect_property_names(obj: Any, names: dict[str, None]) -> None:
+    """Collects the names of the properties declared in the given JSON schema
+    and all its subschemas into the given dictionary, in the order of their
+    first appearance.
+    """
+    if isinstance(obj, dict):
+        properties = obj.get("properties")
+        if isinstance(properties, dict):
+            for name in properties:
+                names.setdefault(name, None)
+        for value in obj.values():
+            _collect_property_names(value, names)
+    elif isinstance(obj, list):
+        for value in obj:
+            _collect_property_names(value, names)
+
+
+@memoized
+def _get_header() -> bytes:
+    """Returns the header of encoded messages.
+
+    This function is memoized.
+    """
+    return bytes((FORMAT_VERSION,)) + get_tag_table_id()
+
+
+class _Encoder:
+    """Encoder that turns JSON values into MessagePack, replacing the known
+    property names with their tags.
+    """
+
+    def __init__(self, tag_table: tuple[str, ...]):
+        self._get_tag = {name: tag for tag, name in enumerate(tag_table)}.get
+        self._pack = msgpack.Packer(autoreset=True).pack
+
+    def __call__(self, message: Any) -> bytes:
+        message_type = type(message)
+        if message_type is dict:
+            message = self._replace_keys(message)
+        elif message_type is list:
+            message = self._replace_keys_in_list(message)
+
+        try:
+            return self._pack(message)
+        except Exception as ex:
+            raise CodecError(f"cannot encode message: {ex}") from None
+
+    def _replace_keys(self, value: dict[Any, Any]) -> dict[Any, Any]:
+        get_tag = self._get_tag
+        result = {}
+        for key, item in value.items():
+            tag = get_tag(key)
+            if tag is None:
+                if type(key) is not str:
+                    raise CodecError(f"object keys must be strings, got {key!r}")
+                tag = key
+            item_type = type(item)
+            if item_type is dict:
+                item = self._replace_keys(item)
+            elif item_type is list:
+                item = self._replace_keys_in_list(item)
+            result[tag] = item
+        return result
+
+    def _replace_keys_in_list(self, value: list[Any]) -> list[Any]:
+        # Lists without objects in them (e.g., coordinates) are not copied
+        result = value
+        for index, item in enumerate(value):
+            item_type = type(item)
+            if item_type is dict:
+                item = self._replace_keys(item)
+            elif item_type is list:
+                item = self._replace_keys_in_list(item)
+            else:
+                continue
+            if result is value:
+                result = list(value)
+            result[index] = item
+        return result
+
+
+@memoized
+def _get_encoder() -> _Encoder:
+    """Returns the encoder that turns JSON values into MessagePack using the
+    current tag table.
+
+    This function is memoized.
+    """
+    return _Encoder(get_tag_table())
+
+
+@memoized
+def _get_object_pairs_hook():
+    """Returns the hook function that is used by the MessagePack decoder to
+    construct objects, replacing the tags with the corresponding property
+    names.
+
+    This function is memoized.
+    """
+    names = dict(enumerate(get_tag_table()))
+
+    def object_pairs_hook(pairs: list[tuple[Any, Any]]) -> dict[str, Any]:
+        try:
+            return {
+                names[key] if type(key) is int else key: value for key, value in pairs
+            }
+        except KeyError:
+            raise CodecError("unknown tag in encoded message") from None
+
+    return object_pairs_hook
@@ -0,0 +1,734 @@
+"""Columnar decoding of UAV-INF responses into NumPy arrays, and encoding of
+NumPy arrays into UAV-INF responses.
+
+Dashboards and analytics tools typically turn the status map of UAV-INF
+responses into arrays right after receiving them. `decode_uav_inf()` does
+this in one step: it walks the status objects once, collects the numeric
+fields of ``definitions.json#/uavStatusInfo`` into plain lists and then
+converts them into typed NumPy arrays, one per field. `decode_uav_inf_stream()`
+does the same for a sequence of UAV-INF responses, stacking the status
+objects of all the responses into a single table.
+
+Optional fields that are missing from a status object (or that are ``null``)
+are stored as zeros in the arrays, and the corresponding entries of the
+mask of the column (see `FleetStatus.masks`) are set to ``False``.
+
+The type and range checks that the schema declares for the decoded fields
+(e.g., latitudes between -90 and 90 degrees, headings below 3600, colors
+fitting into 16 bits) are evaluated on whole columns at once instead of
+object by object. The bounds are taken from the schema itself. Values of
+fields that the schema does not bound must fit into the integer type of
+their column. Fields that are not decoded into columns are not checked;
+use the validators of `flockwave.spec.validator` if you need full schema
+validation.
+
+In the other direction, `encode_uav_inf()` takes the state of a fleet as
+arrays in physical units (degrees, meters, volts and so on), converts them
+into the representations of the schema in bulk and writes the JSON text of
+the UAV-INF response directly, without building a status object for each
+UAV first. The converted values are range-checked column by column, so the
+resulting response conforms to the schema without a separate validation
+pass.
+
+Requires the ``numpy`` module. You can install this with the ``columnar``
+extra.
+"""
+
+import json
+import operator
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+from flockwave.spec.schema import _get_json_object_from_resource
+
+from .memoize import memoized
+
+__all__ = (
+    "COLUMNS",
+    "ColumnarDecodeError",
+    "ColumnarEncodeError",
+    "FleetStatus",
+    "decode_uav_inf",
+    "decode_uav_inf_stream",
+    "encode_uav_inf",
+)
+
+
+_COLUMN_SPECS: tuple[tuple[str, str, tuple[Any, ...]], ...] = (
+    ("latitude", "int32", ("gpsCoordinate", "items", 0)),
+    ("longitude", "int32", ("gpsCoordinate", "items", 1)),
+    ("amsl", "int32", ("gpsCoordinate", "items", 2)),
+    ("ahl", "int32", ("gpsCoordinate", "items", 3)),
+    ("agl", "int32", ("gpsCoordinate", "items", 4)),
+    ("heading", "int16", ("uavStatusInfo", "properties", "heading")),
+    ("battery_voltage", "int32", ("batteryInfo", "items", 0)),
+    ("battery_percentage", "int8", ("batteryInfo", "items", 1)),
+    ("battery_charging", "bool", ("batteryInfo", "items", 2)),
+    ("light", "uint16", ("colorRGB565",)),
+    ("timestamp", "float64", ("uavStatusInfo", "properties", "timestamp")),
+)
+"""Names of the columns decoded from the status objects, the NumPy data types
+of the columns and the paths of the corresponding schemas within
+``definitions.json``.
+"""
+
+_RSSI_SPEC = ("rssi", "int8", ("rssi", "items"))
+"""Name, data type and schema path of the RSSI column, which is the only
+two-dimensional column.
+"""
+
+COLUMNS = tuple(name for name, _, _ in _COLUMN_SPECS) + (_RSSI_SPEC[0],)
+"""Names of the columns of a `FleetStatus` object."""
+
+_SOURCES: dict[str, tuple[str, int | None]] = {
+    "latitude": ("position", 0),
+    "longitude": ("position", 1),
+    "amsl": ("position", 2),
+    "ahl": ("position", 3),
+    "agl": ("position", 4),
+    "heading": ("heading", None),
+    "battery_voltage": ("battery", 0),
+    "battery_percentage": ("battery", 1),
+    "battery_charging": ("battery", 2),
+    "light": ("light", None),
+    "timestamp": ("timestamp", None),
+}
+"""Mapping from column names to the property of the status objects that the
+column is decoded from, and the index of the item within the property if the
+property is an array.
+"""
+
+_BATTERY_COLUMNS = ("battery_voltage", "battery_percentage")
+"""Columns whose values make up the ``battery`` property, in order."""
+
+_KINDS = {"b": "boolean", "f": "number", "i": "integer", "u": "integer"}
+"""Names of the JSON types corresponding to NumPy data type kinds."""
+
+
+class ColumnarDecodeError(RuntimeError):
+    """Exception thrown when a UAV-INF response cannot be decoded into
+    columns because it does not conform to the schema.
+    """
+
+    pass
+
+
+class ColumnarEncodeError(RuntimeError):
+    """Exception thrown when the state of a fleet cannot be encoded into a
+    UAV-INF response.
+    """
+
+    pass
+
+
+class FleetStatus:
+    """Columnar representation of the status objects of one or more UAV-INF
+    responses.
+
+    Each row of the table corresponds to a single status object. Columns are
+    available as attributes named after the entries of `COLUMNS`:
+
+    - ``latitude``, ``longitude``: coordinates in 1e-7 degrees (int32)
+    - ``amsl``, ``ahl``, ``agl``: altitudes in millimeters (int32)
+    - ``heading``: heading in 1/10th of degrees (int16)
+    - ``battery_voltage``: battery voltage in 1/10th of volts (int32)
+    - ``battery_percentage``: state of charge in percents (int8)
+    - ``battery_charging``: whether the battery is charging (bool)
+    - ``light``: color of the light in RGB565 representation (uint16)
+    - ``timestamp``: timestamp of the status object (float64)
+    - ``rssi``: RSSI values, one column per channel (two-dimensional int8
+      array; rows with fewer channels are padded with zeros)
+    """
+
+    ids: list[str]
+    """Keys of the status objects in the status maps, one for each row."""
+
+    index: dict[str, int]
+    """Mapping from object IDs to the index of the last row that belongs to
+    the object.
+    """
+
+    batch: np.ndarray
+    """Index of the UAV-INF response that each row was decoded from."""
+
+    masks: dict[str, np.ndarray]
+    """Mapping from column names to boolean arrays of the same shape as the
+    column, indicating which entries of the column hold an actual value.
+    The ``timestamp`` column is mandatory and has no mask.
+    """
+
+    latitude: np.ndarray
+    longitude: np.ndarray
+    amsl: np.ndarray
+    ahl: np.ndarray
+    agl: np.ndarray
+    heading: np.ndarray
+    battery_voltage: np.ndarray
+    battery_percentage: np.ndarray
+    battery_charging: np.ndarray
+    light: np.ndarray
+    timestamp: np.ndarray
+    rssi: np.ndarray
+
+    def __init__(
+        self,
+        ids: list[str],
+        batch: np.ndarray,
+        columns: dict[str, np.ndarray],
+        masks: dict[str, np.ndarray],
+    ):
+        """Constructor.
+
+        Parameters:
+            ids: keys of the status objects, one for each row
+            batch: index of the UAV-INF response of each row
+            columns: mapping from column names to the columns
+            masks: mapping from column names to the masks of the columns
+        """
+        self.ids = ids
+        self.index = {uav_id: row for row, uav_id in enumerate(ids)}
+        self.batch = batch
+        self.masks = masks
+        for name in COLUMNS:
+            setattr(self, name, columns[name])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} with {len(self)} rows>"
+
+
+def decode_uav_inf(body: dict[str, Any]) -> FleetStatus:
+    """Decodes the status map of a single UAV-INF response into columns.
+
+    Parameters:
+        body: the body of the UAV-INF response
+
+    Returns:
+        the columnar representation of the status objects, in the order they
+        appear in the status map
+
+    Raises:
+        ColumnarDecodeError: if the response does not conform to the schema
+    """
+    return decode_uav_inf_stream((body,))
+
+
+def decode_uav_inf_stream(bodies: Iterable[dict[str, Any]]) -> FleetStatus:
+    """Decodes the status maps of a sequence of UAV-INF responses into a
+    single table of columns.
+
+    Parameters:
+        bodies: the bodies of the UAV-INF responses
+
+    Returns:
+        the columnar representation of the status objects of all the
+        responses, in the order they appear in the status maps. The
+        ``batch`` array of the result tells which response each row
+        belongs to.
+
+    Raises:
+        ColumnarDecodeError: if one of the responses does not conform to the
+            schema
+    """
+    builder = _FleetStatusBuilder()
+    for body in bodies:
+        if not isinstance(body, dict):
+            raise ColumnarDecodeError("message body must be an object")
+        status = body.get("status")
+        if status is None:
+            status = {}
+        elif not isinstance(status, dict):
+            raise ColumnarDecodeError("status must be an object")
+        builder.add_batch(status)
+    return builder.build()
+
+
+def encode_uav_inf(
+    ids: Sequence[str],
+    *,
+    timestamp: Any,
+    mode: str | Sequence[str] | None = None,
+    position: Any = None,
+    heading: Any = None,
+    velocity: Any = None,
+    battery_voltage: Any = None,
+    battery_percentage: Any = None,
+    light: Any = None,
+    errors: Sequence[Sequence[int]] | None = None,
+) -> str:
+    """Encodes the state of a fleet, given as arrays with one row per UAV, into
+    the JSON text of a UAV-INF response.
+
+    The values are given in the units that are natural for simulators and
+    converted in bulk into the units and representations of the schema.
+    Scalars are broadcast to all the UAVs. The converted values are checked
+    against the ranges declared by the schema column by column, so the
+    returned response conforms to the schema without running it through the
+    validator.
+
+    Parameters:
+        ids: the IDs of the UAVs
+        timestamp: the timestamps of the status objects, in milliseconds
+        mode: the flight modes of the UAVs
+        position: latitudes and longitudes in degrees and optionally altitudes
+            above mean sea level in meters, as an array with two or three
+            columns. ``NaN`` altitudes are encoded as ``null``.
+        heading: headings in degrees; they are normalized into [0; 360)
+        velocity: north, east and down velocity components in m/s, as an
+            array with three columns
+        battery_voltage: battery voltages in volts
+        battery_percentage: states of charge of the batteries in percents;
+            may be given only if `battery_voltage` is given
+        light: colors of the lights as red, green and blue components in the
+            range [0; 255], as an array with three columns
+        errors: lists of error codes, one for each UAV
+
+    Returns:
+        the JSON text of the UAV-INF response
+
+    Raises:
+        ColumnarEncodeError: if the arrays have inconsistent shapes or the
+            converted values would not conform to the schema
+    """
+    num_uavs = len(ids)
+    writer = _StatusWriter(num_uavs)
+    writer.add_ids(ids)
+    if mode is not None:
+        writer.add_strings("mode", mode)
+    if position is not None:
+        writer.add_position(position)
+    if heading is not None:
+        values = _to_fixed_point("heading", heading, 10, (num_uavs,)) % 3600
+        writer.add_field("heading", "%s", [values])
+    if velocity is not None:
+        values = _to_fixed_point("velocity", velocity, 1000, (num_uavs, 3))
+        writer.add_field("velocity", "[%s,%s,%s]", list(values.T))
+    writer.add_field("timestamp", "%s", [_to_timestamps(timestamp, num_uavs)])
+    if battery_voltage is not None:
+        writer.add_battery(battery_voltage, battery_percentage)
+    elif battery_percentage is not None:
+        raise ColumnarEncodeError("battery_percentage requires battery_voltage")
+    if light is not None:
+        writer.add_field("light", "%s", [_to_rgb565(light, num_uavs)])
+    if errors is not None:
+        writer.add_errors(errors)
+    return writer.finish()
+
+
+@memoized
+def _get_column_bounds() -> dict[str, tuple[float, float]]:
+    """Returns the inclusive lower and upper bounds of the values of each
+    column, as declared by the schema and limited by the data type of the
+    column.
+
+    This function is memoized.
+    """
+    definitions = _get_json_object_from_resource("definitions.json")
+    result = {}
+    for name, dtype, path in _COLUMN_SPECS + (_RSSI_SPEC,):
+        schema = definitions
+        for key in path:
+            schema = schema[key]
+        result[name] = _get_bounds(schema, np.dtype(dtype))
+    return result
+
+
+def _get_bounds(schema: dict[str, Any], dtype: np.dtype) -> tuple[float, float]:
+    """Returns the inclusive lower and upper bounds of the values of a column
+    with the given schema and data type.
+    """
+    if dtype.kind in "iu":
+        info = np.iinfo(dtype)
+        low, high = int(info.min), int(info.max)
+        if "minimum" in schema:
+            low = max(low, schema["minimum"])
+        if "exclusiveMinimum" in schema:
+            low = max(low, schema["exclusiveMinimum"] + 1)
+        if "maximum" in schema:
+            high = min(high, schema["maximum"])
+        if "exclusiveMaximum" in schema:
+            high = min(high, schema["exclusiveMaximum"] - 1)
+        return low, high
+    else:
+        return -np.inf, np.inf
+
+
+class _FleetStatusBuilder:
+    """Helper object that collects status objects and then converts them into
+    NumPy arrays column by column.
+    """
+
+    def __init__(self):
+        self._ids: list[str] = []
+        self._batch: list[int] = []
+        self._items: list[dict[str, Any]] = []
+        self._num_batches = 0
+
+    def add_batch(self, status: dict[str, Any]) -> None:
+        """Adds the status objects of a single status map to the table."""
+        for uav_id, item in status.items():
+            if not isinstance(item, dict):
+                raise ColumnarDecodeError(f"status of {uav_id!r} must be an object")
+            if "timestamp" not in item:
+                raise ColumnarDecodeError(f"status of {uav_id!r} has no timestamp")
+
+        self._ids.extend(status)
+        self._items.extend(status.values())
+        self._batch.extend([self._num_batches] * len(status))
+        self._num_batches += 1
+
+    def build(self) -> FleetStatus:
+        """Converts the collected status objects into a `FleetStatus` object."""
+        columns = {}
+        masks = {}
+        bounds = _get_column_bounds()
+        arrays = {
+            name: self._get_arrays(name) for name in ("position", "battery", "rssi")
+        }
+
+        for name, dtype, _ in _COLUMN_SPECS:
+            prop, index = _SOURCES[name]
+            if index is None:
+                values = [item.get(prop) for item in self._items]
+            else:
+                values = [
+                    item[index] if len(item) > index else None for item in arrays[prop]
+                ]
+
+            # Replace missing values with zeros of the right type and record
+            # where they were
+            mask = np.array([value is not None for value in values], dtype=bool)
+            if not mask.all():
+                fill = np.zeros(1, dtype=dtype)[0].item()
+                values = [fill if value is None else value for value in values]
+
+            array = self._to_array(name, values, dtype)
+            low, high = bounds[name]
+            self._check_range(name, array, mask, low, high)
+            columns[name] = array.astype(dtype, copy=False)
+            if name != "timestamp":
+                masks[name] = mask
+
+        name, dtype, _ = _RSSI_SPEC
+        columns[name], masks[name] = self._build_rssi(
+            arrays[name], np.dtype(dtype), bounds[name]
+        )
+
+        batch = np.array(self._batch, dtype=np.int32)
+        return FleetStatus(self._ids, batch, columns, masks)
+
+    def _get_arrays(self, prop: str) -> list[list[Any]]:
+        """Returns the values of an array-valued property of the status
+        objects, using empty arrays for objects where the property is missing.
+        """
+        result = [item.get(prop) for item in self._items]
+        result = [[] if value is None else value for value in result]
+        for row, value in enumerate(result):
+            if type(value) is not list:
+                raise ColumnarDecodeError(
+                    f"{prop} of {self._ids[row]!r} must be array, "
+                    f"got {type(value).__name__}"
+                )
+        return result
+
+    def _build_rssi(
+        self, rows: list[list[Any]], dtype: np.dtype, bounds: tuple[float, float]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Builds the two-dimensional RSSI column and its mask."""
+        lengths = np.fromiter(map(len, rows), dtype=np.intp, count=len(rows))
+        width = int(lengths.max()) if len(rows) else 0
+        flat = [item for row in rows for item in row]
+        values = self._to_array("rssi", flat, dtype)
+
+        # Scatter the flattened values into a padded matrix; the column index
+        # of each value is its offset from the start of its own row
+        row_indices = np.repeat(np.arange(len(rows)), lengths)
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        col_indices = np.arange(len(flat)) - starts
+
+        self._check_range("rssi", values, None, *bounds, rows=row_indices)
+
+        column = np.zeros((len(rows), width), dtype=dtype)
+        mask = np.zeros((len(rows), width), dtype=bool)
+        column[row_indices, col_indices] = values
+        mask[row_indices, col_indices] = True
+        return column, mask
+
+    def _to_array(self, name: str, values: list[Any], dtype: Any) -> np.ndarray:
+        """Converts the collected values of a column into a NumPy array,
+        checking whether all the values have the type declared by the schema.
+        """
+        expected = _KINDS[np.dtype(dtype).kind]
+        if not values:
+            return np.zeros(0, dtype=dtype)
+
+        try:
+            array = np.array(values)
+        except (OverflowError, ValueError):
+            array = np.array(values, dtype=object)
+
+        kind = array.dtype.kind
+        if array.ndim != 1:
+            valid = False
+        elif expected == "boolean":
+            valid = kind == "b"
+        elif expected == "integer":
+            valid = kind in "iu"
+        else:
+            valid = kind in "iuf"
+        if valid and expected != "boolean":
+            # NumPy silently converts booleans mixed with numbers to 0 and 1
+            valid = bool not in set(map(type, values))
+        if not valid:
+            self._raise_type_error(name, values, expected)
+        return array
+
+    def _check_range(
+        self,
+        name: str,
+        values: np.ndarray,
+        mask: np.ndarray | None,
+        low: float,
+        high: float,
+        *,
+        rows: np.ndarray | None = None,
+    ) -> None:
+        """Checks whether all the values of a column that are not masked out
+        are within the given inclusive bounds.
+        """
+        if values.dtype.kind == "b":
+            return
+
+        invalid = (values < low) | (values > high)
+        if mask is not None:
+            invalid &= mask
+        if invalid.any():
+            index = int(np.argmax(invalid))
+            row = int(rows[index]) if rows is not None else index
+            raise ColumnarDecodeError(
+                f"{name} of {self._ids[row]!r} must be between {low} and {high}, "
+                f"got {values[index]}"
+            )
+
+    def _raise_type_error(self, name: str, values: list[Any], expected: str) -> None:
+        """Finds the first value of a column that does not have the expected
+        type and raises an appropriate exception.
+        """
+        if name == "rssi":
+            arrays = self._get_arrays("rssi")
+            rows = [i for i, row in enumerate(arrays) for _ in row]
+        else:
+            rows = range(len(values))
+
+        for index, value in enumerate(values):
+            if not _is_json_type(value, expected):
+                uav_id = self._ids[rows[index]]
+                raise ColumnarDecodeError(
+                    f"{name} of {uav_id!r} must be {expected}, got {value!r}"
+                )
+
+        # All the values have the right type, but some of them are too large
+        # for NumPy
+        raise ColumnarDecodeError(f"{name} contains values that are out of range")
+
+
+def _is_json_type(value: Any, expected: str) -> bool:
+    """Returns whether a value is of the given JSON type."""
+    if isinstance(value, bool):
+        return expected == "boolean"
+    elif isinstance(value, int):
+        return expected != "boolean"
+    elif isinstance(value, float):
+        return expected == "number"
+    else:
+        return False
+
+
+class _StatusWriter:
+    """Helper object that writes the JSON text of the status objects of a
+    UAV-INF response.
+
+    The text of each status object is produced by a single ``%`` formatting
+    operation; the format string is assembled from the fields added to the
+    writer, and the values of each field are stored as lists of Python
+    objects whose ``str()`` representation is valid JSON.
+    """
+
+    def __init__(self, num_uavs: int):
+        self._num_uavs = num_uavs
+        self._parts: list[str] = []
+        self._columns: list[list[Any]] = []
+
+    def add_field(self, name: str, template: str, columns: list[Any]) -> None:
+        """Adds a field to the status objects.
+
+        Parameters:
+            name: the name of the field
+            template: format string of the value of the field, with one ``%s``
+                placeholder for each column
+            columns: the columns holding the values of the placeholders; NumPy
+                arrays are converted into lists of Python objects
+        """
+        self._parts.append(f',"{name}":{template}')
+        for column in columns:
+            if isinstance(column, np.ndarray):
+                column = column.tolist()
+            self._columns.append(column)
+
+    def add_ids(self, ids: Sequence[str]) -> None:
+        for uav_id in ids:
+            if not isinstance(uav_id, str) or not 0 < len(uav_id) <= 64:
+                raise ColumnarEncodeError(f"invalid UAV ID: {uav_id!r}")
+            if "/" in uav_id:
+                raise ColumnarEncodeError(f"UAV ID must not contain '/': {uav_id!r}")
+        if len(set(ids)) != len(ids):
+            raise ColumnarEncodeError("UAV IDs must be unique")
+
+        encoded = [json.dumps(uav_id) for uav_id in ids]
+        self._parts.append("%s:{" + '"id":%s')
+        self._columns.extend((encoded, encoded))
+
+    def add_strings(self, name: str, values: str | Sequence[str]) -> None:
+        if isinstance(values, str):
+            values = [values] * self._num_uavs
+        elif len(values) != self._num_uavs:
+            raise ColumnarEncodeError(f"{name} must have {self._num_uavs} items")
+
+        encoded: dict[str, str] = {}
+        for value in values:
+            if value not in encoded:
+                if not isinstance(value, str):
+                    raise ColumnarEncodeError(f"{name} must be string, got {value!r}")
+                encoded[value] = json.dumps(value)
+        self.add_field(name, "%s", [[encoded[value] for value in values]])
+
+    def add_position(self, position: Any) -> None:
+        array = np.asarray(position, dtype=np.float64)
+        if array.ndim != 2 or array.shape[1] not in (2, 3):
+            raise ColumnarEncodeError("position must have two or three columns")
+        _check_shape("position", array, (self._num_uavs, array.shape[1]))
+
+        bounds = _get_column_bounds()
+        columns: list[Any] = []
+        for index, name in enumerate(("latitude", "longitude")):
+            values = _to_fixed_point(name, array[:, index], 1e7)
+            _check_bounds(name, values, bounds[name])
+            columns.append(values)
+
+        if array.shape[1] > 2:
+            missing = np.isnan(array[:, 2])
+            values = _to_fixed_point("amsl", np.where(missing, 0, array[:, 2]), 1000)
+            _check_bounds("amsl", values, bounds["amsl"])
+            amsl: list[Any] = values.tolist()
+            for row in np.flatnonzero(missing).tolist():
+                amsl[row] = "null"
+            columns.append(amsl)
+
+        template = ",".join(["%s"] * len(columns))
+        self.add_field("position", f"[{template}]", columns)
+
+    def add_battery(self, voltage: Any, percentage: Any) -> None:
+        bounds = _get_column_bounds()
+        columns = [_to_fixed_point("battery_voltage", voltage, 10, (self._num_uavs,))]
+        if percentage is not None:
+            columns.append(
+                _to_fixed_point("battery_percentage", percentage, 1, (self._num_uavs,))
+            )
+        for name, values in zip(_BATTERY_COLUMNS, columns, strict=False):
+            _check_bounds(name, values, bounds[name])
+
+        template = ",".join(["%s"] * len(columns))
+        self.add_field("battery", f"[{template}]", columns)
+
+    def add_errors(self, errors: Sequence[Sequence[int]]) -> None:
+        if len(errors) != self._num_uavs:
+            raise ColumnarEncodeError(f"errors must have {self._num_uavs} items")
+        try:
+            encoded = [
+                "[" + ",".join([str(operator.index(code)) for code in codes]) + "]"
+                for codes in errors
+            ]
+        except TypeError:
+            raise ColumnarEncodeError("error codes must be integers") from None
+        self.add_field("errors", "%s", [encoded])
+
+    def finish(self) -> str:
+        """Returns the JSON text of the UAV-INF response."""
+        template = "".join(self._parts) + "}"
+        status = ",".join([template % row for row in zip(*self._columns, strict=True)])
+        return '{"type":"UAV-INF","status":{' + status + "}}"
+
+
+def _check_shape(name: str, array: np.ndarray, shape: tuple[int, ...]) -> None:
+    if array.shape != shape:
+        raise ColumnarEncodeError(
+            f"{name} must have shape {shape}, got {tuple(array.shape)}"
+        )
+
+
+def _check_bounds(name: str, values: np.ndarray, bounds: tuple[float, float]) -> None:
+    low, high = bounds
+    invalid = (values < low) | (values > high)
+    if invalid.any():
+        row = int(np.argmax(invalid))
+        raise ColumnarEncodeError(
+            f"{name} of row {row} must be between {low} and {high} after "
+            f"conversion, got {values[row]}"
+        )
+
+
+def _to_fixed_point(
+    name: str, values: Any, scale: float, shape: tuple[int, ...] | None = None
+) -> np.ndarray:
+    """Converts an array of values into integers after multiplying them with
+    the given scale, rounding to the nearest integer.
+
+    Parameters:
+        name: name of the field, used in error messages
+        values: the values to convert; scalars are broadcast to the given
+            shape
+        scale: the scale to multiply the values with
+        shape: the expected shape of the array; ``None`` if it has been
+            checked already
+    """
+    array = np.asarray(values, dtype=np.float64)
+    if shape is not None:
+        if array.ndim == 0:
+            array = np.broadcast_to(array, shape)
+        _check_shape(name, array, shape)
+    if not np.isfinite(array).all():
+        raise ColumnarEncodeError(f"{name} must be finite")
+    return np.rint(array * scale).astype(np.int64)
+
+
+def _to_timestamps(values: Any, num_uavs: int) -> np.ndarray:
+    """Converts the timestamps to an array of integers if they are all
+    integers, or to an array of floats otherwise.
+    """
+    array = np.asarray(values)
+    if array.ndim == 0:
+        array = np.broadcast_to(array, (num_uavs,))
+    _check_shape("timestamp", array, (num_uavs,))
+    if array.dtype.kind in "iu":
+        return array
+    elif array.dtype.kind != "f" or not np.isfinite(array).all():
+        raise ColumnarEncodeError("timestamp must be finite numbers")
+    else:
+        return array
+
+
+def _to_rgb565(values: Any, num_uavs: int) -> np.ndarray:
+    """Converts an array of RGB colors with components in [0; 255] into the
+    RGB565 representation.
+    """
+    array = np.asarray(values)
+    _check_shape("light", array, (num_uavs, 3))
+    if array.dtype.kind not in "iu" or ((array < 0) | (array > 255)).any():
+        raise ColumnarEncodeError("light must contain integers between 0 and 255")
+    array = array.astype(np.uint16)
+    red, green, blue = array[:, 0], array[:, 1], array[:, 2]
+    return ((red >> 3) << 11) | ((green >> 2) << 5) | (blue >> 3)
@@ -0,0 +1,143 @@
+"""Ahead-of-time compiled validators and a bundle of the JSON schemas of the
+Flockwave protocol.
+
+The modules in this package are generated by
+``etc/scripts/compile_validators.py`` with the code generator of
+``fastjsonschema``. They are not stored in the source repository; they are
+built right before packaging and shipped in the distribution only. Each
+generated module contains a single ``validate()`` function for the schema
+resource that the module is named after, and a manifest module records the
+package version and the digest of the schema files that the validators were
+generated from.
+
+The digest is recorded at build time and it is not compared with the
+installed schema files at runtime as that would require reading all of them
+in every process. Artifacts that belong to the installed version of the
+package are trusted; ``etc/scripts/compile_validators.py --check`` and the
+test suite check whether they are up-to-date with the schema files.
+
+The bundle is a single JSON file that contains the parsed contents of all the
+JSON schema files, keyed by their resource paths, so the schemas can be
+loaded with a single read instead of reading each schema file separately.
+This is faster in general, and especially when the package is installed as a
+zip file or frozen into an executable. JSON references in the bundled schemas
+are not resolved; they are resolved when the schemas are loaded, as for the
+schema files themselves.
+"""
+
+import json
+from collections.abc import Callable
+from importlib import import_module
+from importlib.resources import files
+from types import ModuleType
+from typing import Any
+
+from flockwave.spec.memoize import memoized
+from flockwave.spec.version import __version__
+
+__all__ = (
+    "get_compiled_validator",
+    "get_manifest",
+    "get_module_name_for_resource",
+    "get_schema_bundle",
+)
+
+
+BUNDLE_RESOURCE_NAME = "_bundle.json"
+"""Name of the generated resource in this package that contains the bundled
+schema files.
+"""
+
+MANIFEST_MODULE_NAME = "_manifest"
+"""Name of the generated manifest module in this package."""
+
+
+def get_compiled_validator(resource_path: str) -> Callable[[Any], Any] | None:
+    """Returns the ahead-of-time compiled validator function for the schema
+    in the given resource, if there is one.
+
+    The returned function raises ``fastjsonschema.JsonSchemaValueException``
+    when the object it receives does not match the schema.
+
+    Parameters:
+        resource_path: path of the JSON file containing the schema, relative
+            to the ``flockwave.spec`` package
+
+    Returns:
+        the compiled validator function or ``None`` if there is no compiled
+        validator for the given resource or the compiled validators belong to
+        a different version of the package
+    """
+    manifest = get_manifest()
+    if manifest is None or resource_path not in manifest.RESOURCES:
+        return None
+
+    module_name = get_module_name_for_resource(resource_path)
+    return import_module(f"{__name__}.{module_name}").validate
+
+
+@memoized
+def get_manifest() -> ModuleType | None:
+    """Returns the manifest module of the compiled validators.
+
+    This function is memoized.
+
+    Returns:
+        the manifest module or ``None`` if the validators have not been
+        compiled or they were compiled for a different version of the package
+    """
+    try:
+        manifest = import_module(f"{__name__}.{MANIFEST_MODULE_NAME}")
+    except ImportError:
+        return None
+
+    if getattr(manifest, "VERSION", None) != __version__:
+        return None
+    if not isinstance(getattr(manifest, "SCHEMA_DIGEST", None), str):
+        return None
+    return manifest
+
+
+@memoized
+def get_schema_bundle() -> dict[str, Any] | None:
+    """Returns the bundled contents of the JSON schema files.
+
+    This function is memoized.
+
+    Returns:
+        a dictionary mapping the resource paths of the schema files to their
+        parsed contents, or ``None`` if the bundle has not been generated or
+        it was not generated in the same build as the compiled validators of
+        the installed version of the package
+    """
+    manifest = get_manifest()
+    if manifest is None:
+        return None
+
+    try:
+        data = files(__name__).joinpath(BUNDLE_RESOURCE_NAME).read_bytes()
+        bundle = json.loads(data)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(bundle, dict) or bundle.get("version") != __version__:
+        return None
+    if bundle.get("digest") != manifest.SCHEMA_DIGEST:
+        return None
+
+    return bundle.get("schemas")
+
+
+def get_module_name_for_resource(resource_path: str) -> str:
+    """Returns the name of the module in this package that contains the
+    compiled validator for the schema in the given resource.
+
+    Parameters:
+        resource_path: path of the JSON file containing the schema, relative
+            to the ``flockwave.spec`` package
+
+    Returns:
+        the name of the module, without the package name
+    """
+    name = resource_path.removesuffix(".json")
+    return "".join(char if char.isalnum() else "_" for char in name)
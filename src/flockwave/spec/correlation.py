@@ -0,0 +1,646 @@
+"""Correlation of requests with their responses and of asynchronous command
+executions with their notifications.
+
+Every message in the Flockwave protocol has an ``id``; responses refer to the
+request they respond to with ``refs``. Responses to commands that are
+executed asynchronously contain a ``receipt`` map from object IDs to receipt
+IDs, and the progress and the outcome of these executions are reported
+later in ``ASYNC-ST``, ``ASYNC-RESP`` and ``ASYNC-TIMEOUT`` notifications that
+refer to the receipts. `CorrelationTable` keeps track of the requests that
+are waiting for a response and of the receipts that are waiting for their
+outcome, with constant-time lookups in both directions.
+
+Timeouts are managed by a single hierarchical `TimerWheel` instead of one
+timer per request, so adding or removing a request does not involve a heap
+or the event loop at all. The table does no I/O and does not read the clock
+on its own unless asked to; it is driven by calling `CorrelationTable.expire()`
+periodically, e.g. from `CorrelationTable.run_expiry()` in an asyncio task.
+The total number of requests and receipts in the table is bounded.
+"""
+
+from asyncio import sleep
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from math import ceil, floor
+from time import monotonic
+from typing import Any, Generic, Literal, NamedTuple, TypeVar
+
+__all__ = (
+    "CorrelationTable",
+    "CorrelationTableFullError",
+    "DEFAULT_MAX_PENDING",
+    "DEFAULT_RECEIPT_TIMEOUT",
+    "DEFAULT_RESOLUTION",
+    "DEFAULT_TIMEOUT",
+    "ExpiredItems",
+    "PendingRequest",
+    "Receipt",
+    "ReceiptState",
+    "TimerWheel",
+)
+
+
+DEFAULT_MAX_PENDING = 1000000
+"""Default maximum number of requests and receipts in a correlation table."""
+
+DEFAULT_RECEIPT_TIMEOUT = 300.0
+"""Default number of seconds to wait for the outcome of an asynchronous
+command execution after its receipt or its last progress report.
+"""
+
+DEFAULT_RESOLUTION = 0.1
+"""Default resolution of timeouts, in seconds."""
+
+DEFAULT_TIMEOUT = 30.0
+"""Default number of seconds to wait for the response to a request."""
+
+K = TypeVar("K", bound=Hashable)
+
+ReceiptState = Literal["pending", "completed", "failed", "timed_out"]
+"""Type alias for the states of an asynchronous command execution."""
+
+
+class CorrelationTableFullError(RuntimeError):
+    """Error raised when a request is added to a correlation table that is
+    already full.
+    """
+
+    pass
+
+
+class TimerWheel(Generic[K]):
+    """Hierarchical timing wheel that keeps track of the deadlines of a large
+    number of keys.
+
+    Time is divided into ticks of a given resolution. The wheel consists of
+    multiple levels of slots; the slots of the first level correspond to
+    single ticks, and each slot of a higher level covers all the slots of the
+    level below it. Keys are placed in the slot of the lowest level that
+    covers their deadline and are moved to lower levels as time passes, so
+    scheduling and cancelling a key takes constant time, and advancing the
+    wheel costs time proportional to the number of elapsed ticks and expired
+    keys only.
+
+    Deadlines are rounded up to the next tick; keys never expire early.
+    """
+
+    __slots__ = (
+        "_bits",
+        "_deadlines",
+        "_levels",
+        "_mask",
+        "_resolution",
+        "_slots",
+        "_span",
+        "_tick",
+        "_where",
+    )
+
+    def __init__(
+        self,
+        resolution: float = DEFAULT_RESOLUTION,
+        *,
+        slots: int = 256,
+        levels: int = 4,
+        now: float = 0.0,
+    ):
+        """Constructor.
+
+        Parameters:
+            resolution: the length of a single tick, in seconds
+            slots: number of slots on each level of the wheel; must be a
+                power of two
+            levels: number of levels in the wheel. Deadlines farther in the
+                future than ``slots ** levels`` ticks are supported but they
+                are moved around in the wheel more often
+            now: the current time
+        """
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError("number of slots must be a power of two")
+        if levels < 1:
+            raise ValueError("number of levels must be positive")
+
+        self._resolution = resolution
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._levels = levels
+        self._span = slots**levels
+        self._slots: list[list[dict[K, None]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._deadlines: dict[K, int] = {}
+        self._where: dict[K, dict[K, None]] = {}
+        self._tick = floor(now / resolution)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._where
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    @property
+    def resolution(self) -> float:
+        """The length of a single tick, in seconds."""
+        return self._resolution
+
+    @property
+    def time(self) -> float:
+        """The time that the wheel was last advanced to, rounded down to the
+        resolution of the wheel.
+        """
+        return self._tick * self._resolution
+
+    def schedule(self, key: K, deadline: float) -> None:
+        """Schedules the given key to expire at the given deadline. Keys that
+        are already scheduled are rescheduled.
+
+        Deadlines that have already passed expire at the next tick.
+        """
+        slot = self._where.get(key)
+        if slot is not None:
+            del slot[key]
+        tick = ceil(deadline / self._resolution)
+        if tick <= self._tick:
+            tick = self._tick + 1
+        self._deadlines[key] = tick
+        self._insert(key, tick)
+
+    def cancel(self, key: K) -> bool:
+        """Cancels the deadline of the given key.
+
+        Returns:
+            whether the key was scheduled
+        """
+        slot = self._where.pop(key, None)
+        if slot is None:
+            return False
+        del slot[key]
+        del self._deadlines[key]
+        return True
+
+    def advance(self, now: float) -> list[K]:
+        """Advances the wheel to the given time.
+
+        Returns:
+            the keys whose deadlines have passed, in the order of their
+            deadlines
+        """
+        target = floor(now / self._resolution)
+        expired: list[K] = []
+        mask = self._mask
+        first_level = self._slots[0]
+        where = self._where
+        deadlines = self._deadlines
+
+        while self._tick < target and where:
+            tick = self._tick + 1
+            index = tick & mask
+            if index and not first_level[index] and not any(first_level[index:]):
+                # Nothing expires until the next cascade; skip to it
+                self._tick = min(target, tick | mask)
+                continue
+
+            self._tick = tick
+            if not index:
+                self._cascade(tick)
+            slot = first_level[index]
+            if slot:
+                first_level[index] = {}
+                for key in slot:
+                    if deadlines[key] > tick:
+                        # Deadline was beyond the span of the wheel
+                        self._insert(key, deadlines[key])
+                    else:
+                        del where[key]
+                        del deadlines[key]
+                        expired.append(key)
+
+        if self._tick < target:
+            self._tick = target
+        return expired
+
+    def _cascade(self, tick: int) -> None:
+        """Moves the keys in the slots of the higher levels that start at the
+        given tick to the lower levels.
+        """
+        shift = self._bits
+        for level in range(1, self._levels):
+            slots = self._slots[level]
+            index = (tick >> shift) & self._mask
+            slot = slots[index]
+            if slot:
+                slots[index] = {}
+                for key in slot:
+                    self._insert(key, self._deadlines[key])
+            if index:
+                break
+            shift += self._bits
+
+    def _insert(self, key: K, tick: int) -> None:
+        """Places the given key in the slot that covers the given tick."""
+        delta = tick - self._tick
+        if delta >= self._span:
+            # Placed in the last slot that the wheel can represent; it will
+            # be moved to the right place when that slot is cascaded
+            delta = self._span - 1
+            tick = self._tick + delta
+
+        bits = self._bits
+        if delta >> bits:
+            level = (delta.bit_length() - 1) // bits
+            shift = level * bits
+        else:
+            level = shift = 0
+
+        slot = self._slots[level][(tick >> shift) & self._mask]
+        slot[key] = None
+        self._where[key] = slot
+
+
+class PendingRequest:
+    """A request that was sent and that is waiting for a response, or that
+    has been matched with its response.
+    """
+
+    __slots__ = ("id", "context", "deadline", "response", "receipts")
+
+    id: str
+    """The ID of the request message."""
+
+    context: Any
+    """Arbitrary object attached to the request by the caller."""
+
+    deadline: float
+    """The time when the request times out if there is no response."""
+
+    response: Mapping[str, Any] | None
+    """The response message, or ``None`` if the request has not been answered
+    yet.
+    """
+
+    receipts: dict[str, str]
+    """Mapping from object IDs to the receipt IDs of the asynchronous command
+    executions that were started by the request.
+    """
+
+    def __init__(self, id: str, deadline: float, context: Any = None):
+        self.id = id
+        self.context = context
+        self.deadline = deadline
+        self.response = None
+        self.receipts = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} id={self.id!r}>"
+
+
+class Receipt:
+    """An asynchronous command execution on a single object, identified by
+    the receipt ID that the response of its request contained.
+    """
+
+    __slots__ = (
+        "id",
+        "object_id",
+        "request",
+        "deadline",
+        "state",
+        "progress",
+        "suspended",
+        "result",
+        "error",
+    )
+
+    id: str
+    """The ID of the receipt."""
+
+    object_id: str
+    """The ID of the object that executes the command."""
+
+    request: PendingRequest
+    """The request that started the command execution."""
+
+    deadline: float
+    """The time when the command execution times out if there is no progress
+    report or outcome for it.
+    """
+
+    state: ReceiptState
+    """The state of the command execution."""
+
+    progress: Any
+    """The last progress report of the command execution from an ``ASYNC-ST``
+    notification, or ``None`` if there was no such report yet.
+    """
+
+    suspended: bool
+    """Whether the command execution was reported as suspended in the last
+    ``ASYNC-ST`` notification.
+    """
+
+    result: Any
+    """The result of the command execution from its ``ASYNC-RESP``
+    notification.
+    """
+
+    error: Any
+    """The error of the command execution from its ``ASYNC-RESP``
+    notification.
+    """
+
+    def __init__(
+        self, id: str, object_id: str, request: PendingRequest, deadline: float
+    ):
+        self.id = id
+        self.object_id = object_id
+        self.request = request
+        self.deadline = deadline
+        self.state = "pending"
+        self.progress = None
+        self.suspended = False
+        self.result = None
+        self.error = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} id={self.id!r} state={self.state!r}>"
+
+
+class ExpiredItems(NamedTuple):
+    """Requests and receipts that timed out during a call to
+    `CorrelationTable.expire()`.
+    """
+
+    requests: list[PendingRequest]
+    receipts: list[Receipt]
+
+    def __bool__(self) -> bool:
+        return bool(self.requests or self.receipts)
+
+
+class CorrelationTable:
+    """Table that matches responses to the requests they respond to, and
+    notifications about asynchronous command executions to the receipts of
+    the executions.
+
+    Requests and receipts are removed from the table when they are matched
+    with their response or outcome, or when they time out. Receipts are
+    added to the table when the response that contains them is matched.
+    """
+
+    num_dropped_receipts: int
+    """Number of receipts that were not tracked because the table was full
+    when the response containing them was matched.
+    """
+
+    num_unmatched: int
+    """Number of responses and notifications that did not match any request
+    or receipt in the table, e.g. because they arrived after a timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        receipt_timeout: float = DEFAULT_RECEIPT_TIMEOUT,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        resolution: float = DEFAULT_RESOLUTION,
+        clock: Callable[[], float] = monotonic,
+    ):
+        """Constructor.
+
+        Parameters:
+            timeout: default number of seconds to wait for the response to a
+                request
+            receipt_timeout: number of seconds to wait for the outcome of an
+                asynchronous command execution after its receipt or its last
+                progress report
+            max_pending: maximum number of requests and receipts in the table
+            resolution: resolution of the timeouts, in seconds
+            clock: function that returns the current time, in seconds
+        """
+        self._timeout = timeout
+        self._receipt_timeout = receipt_timeout
+        self._max_pending = max_pending
+        self._clock = clock
+        self._requests: dict[str, PendingRequest] = {}
+        self._receipts: dict[str, Receipt] = {}
+        self._wheel: TimerWheel[PendingRequest | Receipt] = TimerWheel(
+            resolution, now=clock()
+        )
+        self.num_dropped_receipts = 0
+        self.num_unmatched = 0
+
+    def __len__(self) -> int:
+        return len(self._requests) + len(self._receipts)
+
+    @property
+    def num_pending_requests(self) -> int:
+        """Number of requests that are waiting for their responses."""
+        return len(self._requests)
+
+    @property
+    def num_pending_receipts(self) -> int:
+        """Number of receipts that are waiting for their outcomes."""
+        return len(self._receipts)
+
+    def add_request(
+        self, id: str, *, timeout: float | None = None, context: Any = None
+    ) -> PendingRequest:
+        """Registers a request that is waiting for a response.
+
+        Parameters:
+            id: the ID of the request message
+            timeout: number of seconds to wait for the response; ``None``
+                means the default timeout of the table
+            context: arbitrary object to attach to the request
+
+        Returns:
+            the registered request
+
+        Raises:
+            ValueError: if there is already a pending request with the same ID
+            CorrelationTableFullError: if the table is full
+        """
+        requests = self._requests
+        if id in requests:
+            raise ValueError(f"request {id!r} is already pending")
+        if len(requests) + len(self._receipts) >= self._max_pending:
+            raise CorrelationTableFullError(
+                f"too many pending requests and receipts ({self._max_pending})"
+            )
+
+        deadline = self._clock() + (self._timeout if timeout is None else timeout)
+        request = PendingRequest(id, deadline, context)
+        requests[id] = request
+        self._wheel.schedule(request, deadline)
+        return request
+
+    def cancel_request(self, id: str) -> PendingRequest | None:
+        """Removes the pending request with the given ID from the table.
+
+        Returns:
+            the removed request, or ``None`` if there was no such request
+        """
+        request = self._requests.pop(id, None)
+        if request is not None:
+            self._wheel.cancel(request)
+        return request
+
+    def get_request(self, id: str) -> PendingRequest | None:
+        """Returns the pending request with the given ID, or ``None`` if there
+        is no such request.
+        """
+        return self._requests.get(id)
+
+    def get_receipt(self, id: str) -> Receipt | None:
+        """Returns the pending receipt with the given ID, or ``None`` if there
+        is no such receipt.
+        """
+        return self._receipts.get(id)
+
+    def match_response(self, message: Mapping[str, Any]) -> PendingRequest | None:
+        """Matches a response message with the request it refers to and removes
+        the request from the table.
+
+        If the body of the response contains a ``receipt`` map, the receipts
+        in the map are added to the table and to the ``receipts`` of the
+        request.
+
+        Parameters:
+            message: the full response message, including its envelope
+
+        Returns:
+            the request that the message responds to, or ``None`` if the
+            message does not refer to a pending request
+        """
+        request = self._requests.pop(message.get("refs"), None)  # type: ignore
+        if request is None:
+            self.num_unmatched += 1
+            return None
+
+        self._wheel.cancel(request)
+        request.response = message
+        body = message.get("body")
+        if isinstance(body, dict):
+            receipts = body.get("receipt")
+            if receipts:
+                self._add_receipts(request, receipts)
+        return request
+
+    def match_notification(self, body: Mapping[str, Any]) -> list[Receipt]:
+        """Processes the body of an ``ASYNC-ST``, ``ASYNC-RESP`` or
+        ``ASYNC-TIMEOUT`` notification and updates the receipts it refers to.
+
+        Receipts whose command executions have finished or timed out are
+        removed from the table. A progress report in an ``ASYNC-ST``
+        notification restarts the timeout of its receipt. Notifications of
+        other types are ignored.
+
+        Returns:
+            the receipts that the notification refers to
+        """
+        message_type = body.get("type")
+        if message_type == "ASYNC-RESP":
+            receipt = self._pop_receipt(body.get("id"))
+            if receipt is None:
+                return []
+            if "error" in body:
+                receipt.state = "failed"
+                receipt.error = body["error"]
+            else:
+                receipt.state = "completed"
+            receipt.result = body.get("result")
+            return [receipt]
+
+        elif message_type == "ASYNC-ST":
+            receipt = self._receipts.get(body.get("id"))  # type: ignore
+            if receipt is None:
+                self.num_unmatched += 1
+                return []
+            receipt.progress = body.get("progress")
+            receipt.suspended = bool(body.get("suspended"))
+            receipt.deadline = self._clock() + self._receipt_timeout
+            self._wheel.schedule(receipt, receipt.deadline)
+            return [receipt]
+
+        elif message_type == "ASYNC-TIMEOUT":
+            result = []
+            for id in body.get("ids", ()):
+                receipt = self._pop_receipt(id)
+                if receipt is not None:
+                    receipt.state = "timed_out"
+                    result.append(receipt)
+            return result
+
+        return []
+
+    def expire(self, now: float | None = None) -> ExpiredItems:
+        """Removes the requests and receipts whose deadlines have passed from
+        the table.
+
+        Parameters:
+            now: the current time; ``None`` means the time returned by the
+                clock of the table
+
+        Returns:
+            the requests and receipts that timed out
+        """
+        expired = self._wheel.advance(self._clock() if now is None else now)
+        result = ExpiredItems([], [])
+        for item in expired:
+            if isinstance(item, Receipt):
+                item.state = "timed_out"
+                del self._receipts[item.id]
+                result.receipts.append(item)
+            else:
+                del self._requests[item.id]
+                result.requests.append(item)
+        return result
+
+    async def run_expiry(self, callback: Callable[[ExpiredItems], Any]) -> None:
+        """Calls `expire()` periodically, with the resolution of the timeouts,
+        and calls the given callback with the requests and receipts that timed
+        out. Runs until cancelled.
+
+        Parameters:
+            callback: function to call when some requests or receipts timed out
+        """
+        while True:
+            await sleep(self._wheel.resolution)
+            expired = self.expire()
+            if expired:
+                callback(expired)
+
+    def _add_receipts(
+        self, request: PendingRequest, receipts: Mapping[str, str]
+    ) -> None:
+        """Adds the receipts from the ``receipt`` map of a response to the
+        table.
+        """
+        request.receipts.update(receipts)
+
+        deadline = self._clock() + self._receipt_timeout
+        capacity = self._max_pending - len(self)
+        items: Iterable[tuple[str, str]] = receipts.items()
+        if len(receipts) > capacity:
+            self.num_dropped_receipts += len(receipts) - max(capacity, 0)
+            items = list(items)[: max(capacity, 0)]
+
+        schedule = self._wheel.schedule
+        for object_id, id in items:
+            receipt = Receipt(id, object_id, request, deadline)
+            previous = self._receipts.get(id)
+            if previous is not None:
+                self._wheel.cancel(previous)
+            self._receipts[id] = receipt
+            schedule(receipt, deadline)
+
+    def _pop_receipt(self, id: Any) -> Receipt | None:
+        """Removes the receipt with the given ID from the table."""
+        receipt = self._receipts.pop(id, None)
+        if receipt is None:
+            self.num_unmatched += 1
+        else:
+            self._wheel.cancel(receipt)
+        return receipt
@@ -0,0 +1,504 @@
+"""Delta encoding of status updates against the previously sent snapshot.
+
+UAV-INF and DEV-INF responses are typically sent at a high rate, and most of
+their content does not change from one update to the next. `DeltaEncoder`
+keeps track of the last status of each UAV (or the last value of each device
+channel) and turns each message body into a *delta frame* that contains only
+what has changed since the previous frame. `DeltaDecoder` keeps the same
+state on the receiving side and expands each delta frame back to the original
+message body, which is valid against the schema of the message type.
+
+Delta frames are JSON objects with the following properties:
+
+- ``seq``: sequence number of the frame, incremented by one for each frame
+- ``keyframe``: ``true`` if the frame does not depend on earlier frames;
+  omitted otherwise
+- ``type``: the type of the original message body
+- ``ids``: keys of the status (UAV-INF) or value (DEV-INF) map of the
+  original message body, in order, or ``null`` if the message body has no
+  such map; omitted if they are the same as in the previous frame
+- ``changed``: mapping from keys to the changes since the previous frame.
+  For UAV-INF, the changes are the properties of the UAV status that have
+  been added or modified. For DEV-INF, the changes are the new values
+  themselves. Keys without changes are omitted.
+- ``diff``: mapping from UAV IDs to the properties of the UAV status whose
+  new value is an integer (or an array of integers) and whose old value was
+  an integer (or an array of integers of the same length). The differences
+  between the new and the old values are sent instead of the new values, as
+  they are typically much shorter for slowly changing values like positions
+  or timestamps. Properties listed here do not appear in ``changed``.
+- ``removed``: mapping from UAV IDs to the names of the properties that have
+  been removed from the status of the UAV since the previous frame; omitted
+  if nothing was removed
+- ``rest``: the remaining properties of the original message body (e.g.,
+  ``error``), sent in full; omitted if there are none
+
+Frames have to be decoded in the order they were encoded. When a frame is
+lost, the decoder raises `ResyncRequired` for all subsequent frames until
+the next keyframe arrives. Encoders send keyframes periodically, and the
+receiver may ask the sender to call `DeltaEncoder.request_keyframe()` to
+recover sooner.
+
+Values in the message bodies passed to the encoder are copied into the state
+of the encoder so the caller is free to modify them in-place afterwards.
+Message bodies returned by the decoder share values with the state of the
+decoder; they must not be modified in-place.
+"""
+
+from typing import Any
+
+__all__ = (
+    "DEFAULT_KEYFRAME_INTERVAL",
+    "DeltaDecoder",
+    "DeltaEncoder",
+    "DeltaError",
+    "DeltaFrame",
+    "ResyncRequired",
+    "SUPPORTED_MESSAGE_TYPES",
+)
+
+
+_MISSING = object()
+"""Marker object for missing properties."""
+
+DeltaFrame = dict[str, Any]
+"""Type alias for delta frames."""
+
+DEFAULT_KEYFRAME_INTERVAL = 100
+"""Default number of frames between keyframes."""
+
+_MAP_PROPERTIES: dict[str, tuple[str, bool]] = {
+    "UAV-INF": ("status", True),
+    "DEV-INF": ("values", False),
+}
+"""Mapping from supported message types to the name of the property holding
+the map that is delta-encoded, and whether the values of the map are objects
+that are delta-encoded property by property.
+"""
+
+SUPPORTED_MESSAGE_TYPES = frozenset(_MAP_PROPERTIES)
+"""Message types that can be delta-encoded."""
+
+
+class DeltaError(RuntimeError):
+    """Exception thrown when a message body cannot be delta-encoded or a delta
+    frame cannot be decoded.
+    """
+
+    pass
+
+
+class ResyncRequired(DeltaError):
+    """Exception thrown by the decoder when a delta frame cannot be decoded
+    because an earlier frame is missing. The decoder recovers when the next
+    keyframe arrives.
+    """
+
+    pass
+
+
+class DeltaEncoder:
+    """Encoder that turns message bodies into delta frames, keeping track of
+    the last state sent for each UAV or device channel.
+    """
+
+    keyframe_interval: int
+    """Number of frames between keyframes; zero means that keyframes are sent
+    only when requested explicitly.
+    """
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        """Constructor.
+
+        Parameters:
+            keyframe_interval: number of frames between keyframes; zero means
+                that keyframes are sent only when requested explicitly with
+                `request_keyframe()`
+        """
+        self.keyframe_interval = keyframe_interval
+        self._seq = 0
+        self._frames_since_keyframe = 0
+        self._keyframe_requested = True
+        self._message_type: str | None = None
+        self._ids: list[str] | None = []
+        self._state: dict[str, Any] = {}
+
+    def encode(self, body: dict[str, Any]) -> DeltaFrame:
+        """Encodes a message body into a delta frame and updates the state of
+        the encoder.
+
+        Parameters:
+            body: the message body to encode; its type must be one of the types
+                in `SUPPORTED_MESSAGE_TYPES`
+
+        Returns:
+            the delta frame
+
+        Raises:
+            DeltaError: if the message body cannot be delta-encoded
+        """
+        message_type = body.get("type")
+        spec = _MAP_PROPERTIES.get(message_type)  # type: ignore
+        if spec is None:
+            raise DeltaError(f"unsupported message type: {message_type!r}")
+
+        map_property, by_property = spec
+        items = body.get(map_property)
+        if items is not None and not isinstance(items, dict):
+            raise DeltaError(f"{map_property!r} must be an object")
+
+        if message_type != self._message_type:
+            # All the state is specific to the message type
+            self._message_type = message_type
+            self._keyframe_requested = True
+
+        keyframe = self._keyframe_requested or (
+            self.keyframe_interval > 0
+            and self._frames_since_keyframe >= self.keyframe_interval
+        )
+        if keyframe:
+            self._state.clear()
+            self._ids = []
+            self._frames_since_keyframe = 0
+
+        self._seq += 1
+        frame: DeltaFrame = {"seq": self._seq}
+        if keyframe:
+            frame["keyframe"] = True
+        frame["type"] = message_type
+
+        try:
+            self._encode_items(items, by_property, frame)
+        except Exception:
+            # State is now inconsistent with the decoder
+            self._keyframe_requested = True
+            raise
+
+        rest = {
+            key: value
+            for key, value in body.items()
+            if key != "type" and key != map_property
+        }
+        if rest:
+            frame["rest"] = rest
+
+        self._keyframe_requested = False
+        self._frames_since_keyframe += 1
+        return frame
+
+    def request_keyframe(self) -> None:
+        """Requests the encoder to send a keyframe next time, e.g., because the
+        receiver has lost a frame and needs to resynchronize.
+        """
+        self._keyframe_requested = True
+
+    def reset(self) -> None:
+        """Forgets the entire state of the encoder. The next frame will be a
+        keyframe.
+        """
+        self._state.clear()
+        self._ids = []
+        self._message_type = None
+        self._keyframe_requested = True
+
+    def _encode_items(
+        self, items: dict[str, Any] | None, by_property: bool, frame: DeltaFrame
+    ) -> None:
+        """Encodes the changes in the map that is delta-encoded into the given
+        frame.
+        """
+        ids = None if items is None else list(items)
+        if ids != self._ids:
+            frame["ids"] = self._ids = ids
+
+        if items is None:
+            pass
+        elif by_property:
+            self._encode_objects(items, frame)
+        else:
+            self._encode_values(items, frame)
+
+    def _encode_objects(self, items: dict[str, Any], frame: DeltaFrame) -> None:
+        """Encodes the changes in a map of objects property by property."""
+        state = self._state
+        changed: dict[str, Any] = {}
+        increments: dict[str, Any] = {}
+        removed: dict[str, list[str]] = {}
+
+        for key, item in items.items():
+            if not isinstance(item, dict):
+                raise DeltaError(f"value of {key!r} must be an object")
+
+            previous = state.get(key)
+            if previous is None:
+                previous = state[key] = {}
+
+            changes, diffs = _update_object(previous, item)
+            if changes:
+                changed[key] = changes
+            if diffs:
+                increments[key] = diffs
+
+            gone = _remove_missing_properties(previous, item)
+            if gone:
+                removed[key] = gone
+
+        if changed:
+            frame["changed"] = changed
+        if increments:
+            frame["diff"] = increments
+        if removed:
+            frame["removed"] = removed
+
+    def _encode_values(self, items: dict[str, Any], frame: DeltaFrame) -> None:
+        """Encodes the changes in a map of arbitrary values, sending each
+        changed value in full.
+        """
+        state = self._state
+        changed = {}
+        for key, value in items.items():
+            if key not in state or not _is_same_json(state[key], value):
+                state[key] = changed[key] = _copy_json(value)
+        if changed:
+            frame["changed"] = changed
+
+
+class DeltaDecoder:
+    """Decoder that expands delta frames produced by `DeltaEncoder` into the
+    original message bodies.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._seq: int | None = None
+        self._message_type: str | None = None
+        self._ids: list[str] | None = []
+        self._state: dict[str, Any] = {}
+
+    @property
+    def needs_resync(self) -> bool:
+        """Whether the decoder is waiting for a keyframe because it has not
+        received one yet or it has detected a lost frame.
+        """
+        return self._seq is None
+
+    def decode(self, frame: DeltaFrame) -> dict[str, Any]:
+        """Decodes a delta frame into the message body that it was encoded
+        from, and updates the state of the decoder.
+
+        Parameters:
+            frame: the delta frame to decode
+
+        Returns:
+            the decoded message body
+
+        Raises:
+            ResyncRequired: if the frame depends on an earlier frame that was
+                not received by the decoder. The decoder will not accept
+                delta frames until the next keyframe.
+            DeltaError: if the frame is malformed
+        """
+        try:
+            seq = frame["seq"]
+            message_type = frame["type"]
+            map_property, by_property = _MAP_PROPERTIES[message_type]
+        except (KeyError, TypeError):
+            raise DeltaError("malformed delta frame") from None
+
+        if frame.get("keyframe"):
+            self._message_type = message_type
+            self._ids = []
+            self._state.clear()
+        elif (
+            self._seq is None
+            or seq != self._seq + 1
+            or message_type != self._message_type
+        ):
+            self._seq = None
+            raise ResyncRequired("delta frame received without its predecessor")
+
+        if "ids" in frame:
+            self._ids = frame["ids"]
+
+        try:
+            if by_property:
+                self._apply_object_changes(frame)
+            else:
+                self._state.update(frame.get("changed", {}))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            self._seq = None
+            raise DeltaError("malformed delta frame") from None
+
+        body: dict[str, Any] = {"type": message_type}
+        if self._ids is not None:
+            body[map_property] = self._collect_items(dict if by_property else None)
+
+        self._seq = seq
+        rest = frame.get("rest")
+        if rest:
+            body.update(rest)
+        return body
+
+    def reset(self) -> None:
+        """Forgets the entire state of the decoder. The decoder will not accept
+        delta frames until the next keyframe.
+        """
+        self._seq = None
+        self._message_type = None
+        self._ids = []
+        self._state.clear()
+
+    def _apply_object_changes(self, frame: DeltaFrame) -> None:
+        state = self._state
+        for key, changes in frame.get("changed", {}).items():
+            previous = state.get(key)
+            if previous is None:
+                state[key] = dict(changes)
+            else:
+                previous.update(changes)
+
+        for key, diffs in frame.get("diff", {}).items():
+            previous = state[key]
+            for name, diff in diffs.items():
+                previous[name] = _apply_diff(previous[name], diff)
+
+        for key, names in frame.get("removed", {}).items():
+            previous = state.get(key)
+            if previous is not None:
+                for name in names:
+                    previous.pop(name, None)
+
+    def _collect_items(self, copy: Any) -> dict[str, Any]:
+        """Collects the current state of the items listed in the last received
+        ``ids`` property of the frames.
+        """
+        state = self._state
+        assert self._ids is not None
+        try:
+            if copy is None:
+                return {key: state[key] for key in self._ids}
+            else:
+                return {key: copy(state[key]) for key in self._ids}
+        except KeyError as ex:
+            self._seq = None
+            raise ResyncRequired(f"no state for {ex.args[0]!r}") from None
+
+
+def _update_object(
+    previous: dict[str, Any], item: dict[str, Any]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Updates the previous state of an object with the properties of its new
+    state.
+
+    Returns:
+        the new values of the properties that have been added or modified,
+        and the differences for the integer properties (and the arrays of
+        integers) that have been modified
+    """
+    changes = {}
+    diffs = {}
+    for name, value in item.items():
+        old_value = previous.get(name, _MISSING)
+        if old_value == value and _is_same_json(old_value, value):
+            continue
+
+        value_type = type(value)
+        if value_type is int and type(old_value) is int:
+            diffs[name] = value - old_value
+            previous[name] = value
+        elif value_type is list and type(old_value) is list:
+            diff = _get_int_array_diff(old_value, value)
+            if diff is None:
+                previous[name] = changes[name] = _copy_json(value)
+            else:
+                diffs[name] = diff
+                previous[name] = list(value)
+        else:
+            previous[name] = changes[name] = _copy_json(value)
+    return changes, diffs
+
+
+def _remove_missing_properties(
+    previous: dict[str, Any], item: dict[str, Any]
+) -> list[str] | None:
+    """Removes the properties from the previous state of an object that are
+    missing from its new state, assuming that the previous state was already
+    updated with `_update_object()`.
+
+    Returns:
+        the names of the removed properties, or ``None`` if nothing was removed
+    """
+    # previous has all the keys of item now, plus the removed ones
+    if len(previous) <= len(item):
+        return None
+
+    gone = [name for name in previous if name not in item]
+    for name in gone:
+        del previous[name]
+    return gone
+
+
+def _get_int_array_diff(old: list[Any], new: list[Any]) -> list[int] | None:
+    """Returns the item-wise difference of two arrays of integers, or ``None``
+    if the arrays have different lengths or not all their items are integers.
+    """
+    if len(old) != len(new):
+        return None
+    for item in old:
+        if type(item) is not int:
+            return None
+    for item in new:
+        if type(item) is not int:
+            return None
+    return [b - a for a, b in zip(old, new, strict=True)]
+
+
+def _apply_diff(old: Any, diff: Any) -> Any:
+    """Applies a difference returned by `_update_object()` to the old value of
+    a property.
+    """
+    if type(diff) is list:
+        if type(old) is not list or len(old) != len(diff):
+            raise ValueError("array length mismatch")
+        return [a + b for a, b in zip(old, diff, strict=True)]
+    elif type(old) is int and type(diff) is int:
+        return old + diff
+    else:
+        raise ValueError("invalid difference")
+
+
+def _is_same_json(old: Any, new: Any) -> bool:
+    """Returns whether two JSON values are the same, including the types of
+    the values. Unlike ``==``, this function distinguishes ``1``, ``1.0`` and
+    ``True`` from each other, even when they are nested in containers.
+    """
+    value_type = type(old)
+    if value_type is not type(new):
+        return False
+    if value_type is list:
+        return len(old) == len(new) and all(
+            _is_same_json(a, b) for a, b in zip(old, new, strict=True)
+        )
+    if value_type is dict:
+        return old.keys() == new.keys() and all(
+            _is_same_json(item, new[key]) for key, item in old.items()
+        )
+    return old == new
+
+
+def _copy_json(value: Any) -> Any:
+    """Creates a copy of a JSON value that does not share mutable containers
+    with the original value.
+    """
+    value_type = type(value)
+    if value_type is list:
+        return [
+            _copy_json(item) if type(item) in (list, dict) else item for item in value
+        ]
+    elif value_type is dict:
+        return {
+            key: _copy_json(item) if type(item) in (list, dict) else item
+            for key, item in value.items()
+        }
+    else:
+        return value
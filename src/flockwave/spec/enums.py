@@ -0,0 +1,236 @@
+"""Registry of the Python enums that correspond to the string enums in the
+complex objects of the Flockwave specification.
+
+Enum classes are built lazily from ``definitions.json`` when they are first
+requested and are memoized afterwards, so the same name always refers to the
+same class. Top-level definitions are registered under their own name (e.g.,
+``deviceClass``); enums in the properties of object definitions are
+registered under the name of the object and the property, separated by a dot
+(e.g., ``timeAxisScheduleSegment.type``). Enums that appear only as one of
+the alternatives of an ``anyOf`` clause are not registered.
+
+The enum classes can also be imported from this module by their class names,
+e.g. ``from flockwave.spec.enums import DeviceClass``; this is also what
+makes their members picklable.
+
+The members of the enums are also strings so they can be compared to and
+encoded like the raw values in the messages. Code that converts incoming
+strings into members in a hot loop should use the lookup tables of
+`get_enum_table()` instead of calling the enum class itself.
+"""
+
+from collections.abc import Iterable, Sequence
+from enum import Enum
+from typing import Any
+
+from .memoize import memoized
+from .schema import _get_json_object_from_resource
+
+__all__ = (
+    "EnumTable",
+    "SchemaEnum",
+    "get_enum",
+    "get_enum_names",
+    "get_enum_table",
+)
+
+
+class SchemaEnum(str, Enum):
+    """Base class of the enums built from the specification. The name and the
+    value of each member is the string from the schema.
+    """
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class EnumTable:
+    """Precomputed lookup tables for a single enum of the specification.
+
+    The ordinal of a member is its index in the ``enum`` list of the schema.
+    Ordinals are small non-negative integers that can be used for compact
+    storage of enum values, e.g. in NumPy arrays.
+    """
+
+    __slots__ = ("enum", "members", "values", "by_value", "ordinals")
+
+    enum: type[SchemaEnum]
+    """The enum class."""
+
+    members: tuple[SchemaEnum, ...]
+    """The members of the enum, indexed by their ordinals."""
+
+    values: tuple[str, ...]
+    """The values of the enum, indexed by their ordinals."""
+
+    by_value: dict[str, SchemaEnum]
+    """Mapping from the values of the enum to the corresponding members."""
+
+    ordinals: dict[str, int]
+    """Mapping from the values of the enum to their ordinals. Members are
+    strings so they can also be used as keys.
+    """
+
+    def __init__(self, enum: type[SchemaEnum]):
+        """Constructor.
+
+        Parameters:
+            enum: the enum class to build the lookup tables for
+        """
+        self.enum = enum
+        self.members = tuple(enum)
+        self.values = tuple(member.value for member in self.members)
+        self.by_value = dict(zip(self.values, self.members, strict=True))
+        self.ordinals = {value: index for index, value in enumerate(self.values)}
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} for {self.enum.__name__}>"
+
+    def get(self, value: Any, default: Any = None) -> Any:
+        """Returns the member corresponding to the given value, or the given
+        default value if there is no such member.
+        """
+        return self.by_value.get(value, default)
+
+    def to_members(self, values: Iterable[str]) -> list[SchemaEnum]:
+        """Converts the given values into members of the enum.
+
+        Raises:
+            ValueError: if one of the values is not a valid value of the enum
+        """
+        try:
+            return [self.by_value[value] for value in values]
+        except KeyError as ex:
+            raise ValueError(
+                f"{ex.args[0]!r} is not a valid {self.enum.__name__}"
+            ) from None
+
+    def to_ordinals(self, values: Iterable[str], missing: int = -1) -> list[int]:
+        """Converts the given values into ordinals.
+
+        Parameters:
+            values: the values to convert
+            missing: the ordinal to use for values that are not valid values
+                of the enum
+
+        Returns:
+            the ordinals of the values
+        """
+        get = self.ordinals.get
+        return [get(value, missing) for value in values]
+
+    def from_ordinals(self, ordinals: Iterable[int]) -> list[SchemaEnum | None]:
+        """Converts the given ordinals back into members of the enum. Negative
+        ordinals are converted into ``None``.
+
+        Raises:
+            IndexError: if one of the ordinals is too large
+        """
+        members = self.members
+        return [members[index] if index >= 0 else None for index in ordinals]
+
+
+def get_enum_names() -> list[str]:
+    """Returns the names of all the enums in the registry, in the order they
+    appear in the specification.
+    """
+    return list(_get_enum_values())
+
+
+@memoized
+def get_enum(name: str) -> type[SchemaEnum]:
+    """Returns the Python enum class for the enum with the given name from the
+    specification.
+
+    The name of the class is the name of the enum in camel case, with the
+    first letter capitalized and the dot removed (e.g., ``DeviceClass`` or
+    ``TimeAxisScheduleSegmentType``).
+
+    Parameters:
+        name: the name of the enum, e.g. ``deviceClass`` or
+            ``timeAxisScheduleSegment.type``
+
+    Returns:
+        the enum class; the same class is returned for the same name
+
+    Raises:
+        KeyError: if there is no enum with the given name
+    """
+    values = _get_enum_values()[name]
+    return SchemaEnum(  # type: ignore
+        _get_class_name(name), [(value, value) for value in values], module=__name__
+    )
+
+
+@memoized
+def get_enum_table(name: str) -> EnumTable:
+    """Returns the precomputed lookup tables for the enum with the given name
+    from the specification.
+
+    Parameters:
+        name: the name of the enum, e.g. ``deviceClass`` or
+            ``timeAxisScheduleSegment.type``
+
+    Raises:
+        KeyError: if there is no enum with the given name
+    """
+    return EnumTable(get_enum(name))
+
+
+def __getattr__(name: str) -> Any:
+    enum_name = _get_enum_names_by_class_name().get(name)
+    if enum_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return get_enum(enum_name)
+
+
+def _get_class_name(name: str) -> str:
+    """Returns the name of the Python enum class for the enum with the given
+    name from the specification.
+    """
+    return "".join(part[:1].upper() + part[1:] for part in name.split("."))
+
+
+@memoized
+def _get_enum_names_by_class_name() -> dict[str, str]:
+    """Returns a mapping from the names of the Python enum classes to the names
+    of the corresponding enums in the specification.
+    """
+    return {_get_class_name(name): name for name in _get_enum_values()}
+
+
+@memoized
+def _get_enum_values() -> dict[str, Sequence[str]]:
+    """Collects the values of all the string enums in the complex objects of
+    the specification, keyed by the names of the enums.
+    """
+    result: dict[str, Sequence[str]] = {}
+    for name, schema in _get_json_object_from_resource("definitions.json").items():
+        values = _get_string_enum_values(schema)
+        if values is not None:
+            result[name] = values
+        elif schema.get("type") == "object":
+            for key, prop in schema.get("properties", {}).items():
+                if prop.get("type") == "array":
+                    prop = prop.get("items", {})
+                values = _get_string_enum_values(prop)
+                if values is not None:
+                    result[f"{name}.{key}"] = values
+    return result
+
+
+def _get_string_enum_values(schema: Any) -> Sequence[str] | None:
+    """Returns the values of the given schema if it describes an enum of
+    strings, or ``None`` otherwise.
+    """
+    if not isinstance(schema, dict) or schema.get("type") != "string":
+        return None
+    values = schema.get("enum")
+    if not isinstance(values, list) or not values:
+        return None
+    if not all(isinstance(value, str) for value in values):
+        return None
+    return tuple(values)
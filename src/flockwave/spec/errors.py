@@ -1,8 +1,34 @@
-"""Error classes specific to the Flockwave model."""
+"""Error classes specific to the Flockwave model.
 
+Besides the `FlockwaveErrorCode` enum, this module provides functions for
+processing the error lists of many UAVs at once without creating an enum
+member for every error code. Error codes are bytes, so the abbreviation,
+description and severity of each code are precomputed into 256-entry lookup
+tables, and the error list of a single UAV can be represented as a 256-bit
+bitset (a plain Python integer where bit N is set if error code N is
+present). The severity class of an error code depends on its range only
+(see `ErrorSeverity`), so the worst severity in a bitset is determined by its
+highest set bit.
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
 from enum import IntEnum
+from itertools import chain
+from typing import Any
 
-__all__ = ("FlockwaveErrorCode",)
+__all__ = (
+    "ErrorSeverity",
+    "FlockwaveErrorCode",
+    "count_uavs_per_error_code",
+    "get_error_abbreviation",
+    "get_error_bitset",
+    "get_error_codes_from_bitset",
+    "get_error_description",
+    "get_error_severity",
+    "get_worst_severity_from_bitset",
+    "get_worst_severity_per_uav",
+)
 
 
 #: Dictionary mapping Flockwave error codes to more-or-less human-readable
@@ -152,6 +178,38 @@ _error_code_to_description = {
 }
 
 
+class ErrorSeverity(IntEnum):
+    """Severity classes of Flockwave error codes, in increasing order of
+    severity.
+    """
+
+    INFO = 0
+    """Informational messages; error codes below 64."""
+
+    WARNING = 1
+    """Warnings; error codes between 64 and 127."""
+
+    ERROR = 2
+    """Errors; error codes between 128 and 191."""
+
+    CRITICAL = 3
+    """Critical errors; error codes from 192 and above."""
+
+
+#: Abbreviation of each error code between 0 and 255
+_abbreviations = tuple(
+    _error_code_to_abbreviation.get(code) or f"E{code}" for code in range(256)
+)
+
+#: Description of each error code between 0 and 255
+_descriptions = tuple(
+    _error_code_to_description.get(code) or f"Error {code}" for code in range(256)
+)
+
+#: Severity class of each error code between 0 and 255
+_severities = tuple(ErrorSeverity(code >> 6) for code in range(256))
+
+
 class FlockwaveErrorCode(IntEnum):
     """Error codes defined in the Flockwave protocol."""
 
@@ -234,9 +292,155 @@ class FlockwaveErrorCode(IntEnum):
         human-readable, but requires less space on the screen than the full
         description of the error.
         """
-        return _error_code_to_abbreviation.get(self) or f"E{self}"
+        return _abbreviations[self]
 
     @property
     def description(self) -> str:
         """Returns a human-readable description of the error code."""
-        return _error_code_to_description.get(self) or f"Error {self}"
+        return _descriptions[self]
+
+    @property
+    def severity(self) -> ErrorSeverity:
+        """Returns the severity class of the error code."""
+        return _severities[self]
+
+
+def get_error_abbreviation(code: int) -> str:
+    """Returns a short abbreviation of an arbitrary error code, without
+    converting it into a `FlockwaveErrorCode` first.
+
+    Parameters:
+        code: the error code
+
+    Returns:
+        the abbreviation of the error code
+    """
+    return _abbreviations[code] if 0 <= code < 256 else f"E{code}"
+
+
+def get_error_description(code: int) -> str:
+    """Returns a human-readable description of an arbitrary error code,
+    without converting it into a `FlockwaveErrorCode` first.
+
+    Parameters:
+        code: the error code
+
+    Returns:
+        the description of the error code
+    """
+    return _descriptions[code] if 0 <= code < 256 else f"Error {code}"
+
+
+def get_error_severity(code: int) -> ErrorSeverity:
+    """Returns the severity class of an arbitrary error code, without
+    converting it into a `FlockwaveErrorCode` first.
+
+    Codes below zero are treated as informational messages and codes above
+    255 as critical errors.
+
+    Parameters:
+        code: the error code
+
+    Returns:
+        the severity class of the error code
+    """
+    return _severities[min(max(code, 0), 255)]
+
+
+def get_error_bitset(codes: Iterable[int]) -> int:
+    """Converts a list of error codes into a 256-bit bitset.
+
+    Parameters:
+        codes: the error codes, each between 0 and 255
+
+    Returns:
+        an integer where bit N is set if and only if error code N is in the
+        list
+
+    Raises:
+        ValueError: if one of the error codes is outside the valid range
+    """
+    result = 0
+    for code in codes:
+        if not 0 <= code < 256:
+            raise ValueError(f"error code out of range: {code!r}")
+        result |= 1 << code
+    return result
+
+
+def get_error_codes_from_bitset(bitset: int) -> list[int]:
+    """Converts a bitset created by `get_error_bitset()` back into a list of
+    error codes.
+
+    Parameters:
+        bitset: the bitset to convert
+
+    Returns:
+        the error codes in the bitset, in increasing order
+    """
+    result = []
+    while bitset:
+        lowest = bitset & -bitset
+        result.append(lowest.bit_length() - 1)
+        bitset ^= lowest
+    return result
+
+
+def get_worst_severity_from_bitset(bitset: int) -> ErrorSeverity | None:
+    """Returns the severity class of the most severe error code in a bitset
+    created by `get_error_bitset()`.
+
+    Parameters:
+        bitset: the bitset to evaluate
+
+    Returns:
+        the worst severity class in the bitset, or ``None`` if the bitset is
+        empty
+    """
+    return _severities[bitset.bit_length() - 1] if bitset else None
+
+
+def get_worst_severity_per_uav(
+    status: Mapping[str, Any],
+) -> dict[str, ErrorSeverity | None]:
+    """Returns the severity class of the most severe error code of each UAV
+    in the status map of a UAV-INF response.
+
+    Parameters:
+        status: the status map of a UAV-INF response, mapping UAV IDs to
+            status objects
+
+    Returns:
+        mapping from UAV IDs to the worst severity class of the errors of the
+        UAV, or ``None`` if the UAV has no errors
+    """
+    severities = _severities
+    result: dict[str, ErrorSeverity | None] = {}
+    for uav_id, item in status.items():
+        errors = item.get("errors")
+        if errors:
+            code = max(errors)
+            if 0 <= code < 256:
+                result[uav_id] = severities[code]
+            else:
+                result[uav_id] = get_error_severity(code)
+        else:
+            result[uav_id] = None
+    return result
+
+
+def count_uavs_per_error_code(status: Mapping[str, Any]) -> Counter[int]:
+    """Counts how many UAVs report each error code in the status map of a
+    UAV-INF response. Error codes listed multiple times for the same UAV are
+    counted once.
+
+    Parameters:
+        status: the status map of a UAV-INF response, mapping UAV IDs to
+            status objects
+
+    Returns:
+        mapping from error codes to the number of UAVs reporting them; codes
+        that no UAV reports are not included
+    """
+    error_lists = [item.get("errors") for item in status.values()]
+    return Counter(chain.from_iterable(map(set, filter(None, error_lists))))
@@ -0,0 +1,681 @@
+"""Generator of synthetic Flockwave messages from the JSON schemas of the
+protocol.
+
+The generator walks the resolved JSON schema of each message type once and
+turns it into a tree of small generator functions, so producing a single
+message body is cheap and does not involve interpreting the schema again.
+The generated message bodies are valid according to the schemas unless the
+caller explicitly asks for invalid variants. They are meant to be used for
+load testing servers and clients that speak the Flockwave protocol.
+"""
+
+import re
+import string
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from math import ceil, floor
+from random import Random
+from typing import Any
+
+from jsonref import JsonRef
+
+from .schema import (
+    MessageBodyKind,
+    Schema,
+    get_message_body_schema_for_type,
+    get_message_types,
+)
+
+try:
+    from re import _parser as sre_parse  # type: ignore
+except ImportError:
+    import sre_parse  # type: ignore
+
+__all__ = ("GeneratorOptions", "MessageGenerator")
+
+
+Generator = Callable[[Random], Any]
+"""Type specification for functions that generate a random value with the
+help of a random number generator.
+"""
+
+
+@dataclass(frozen=True)
+class GeneratorOptions:
+    """Options that control the size of the generated message bodies."""
+
+    max_items: int = 3
+    """Maximum number of items to generate in arrays and in objects that map
+    arbitrary keys to values when the schema itself does not limit their size.
+    """
+
+    max_string_length: int = 12
+    """Maximum length of strings without a pattern when the schema itself does
+    not limit their length.
+    """
+
+    optional_probability: float = 0.5
+    """Probability of including an optional property in a generated object."""
+
+    sizes: Mapping[str, int] = field(default_factory=dict)
+    """Exact sizes of arrays, maps and strings stored in properties with the
+    given names, overriding all the other size-related options. For instance,
+    ``{"status": 5000}`` yields ``UAV-INF`` responses with the status of
+    5000 UAVs and ``{"body": 100000}`` yields ``LOG-DATA`` responses with
+    long flight logs.
+    """
+
+
+class MessageGenerator:
+    """Generator of synthetic Flockwave message bodies and messages.
+
+    Generators are compiled lazily for each message type, when a message body
+    of the given type is requested for the first time.
+    """
+
+    _kind: MessageBodyKind
+    _options: GeneratorOptions
+    _rng: Random
+    _generators: dict[str, Generator]
+    _compiled: dict[tuple[int, str | None], tuple[Schema, Generator]]
+
+    def __init__(
+        self,
+        kind: MessageBodyKind = "message",
+        *,
+        seed: int | None = None,
+        options: GeneratorOptions | None = None,
+    ):
+        """Constructor.
+
+        Parameters:
+            kind: the kind of message bodies to generate. Message types that
+                have both a request and a response schema yield requests and
+                responses randomly when the kind is ``message``.
+            seed: seed of the random number generator; generators with the
+                same seed and options produce the same sequence of messages
+            options: options that control the size of the generated bodies
+        """
+        self._kind = kind
+        self._options = options or GeneratorOptions()
+        self._rng = Random(seed)  # noqa: S311
+        self._generators = {}
+        self._compiled = {}
+
+    @property
+    def message_types(self) -> list[str]:
+        """The message types that this generator can produce."""
+        return get_message_types(self._kind)
+
+    def generate_body(self, message_type: str, *, invalid: bool = False) -> Any:
+        """Generates a single message body with the given type.
+
+        Parameters:
+            message_type: the type of the message body
+            invalid: whether to generate a body that violates the schema of
+                the message type
+
+        Returns:
+            the generated message body
+
+        Raises:
+            KeyError: if there is no such message type for the kind of this
+                generator
+        """
+        generator = self._generators.get(message_type)
+        if generator is None:
+            schema = get_message_body_schema_for_type(message_type, self._kind)
+            generator = self._compile(schema)
+            self._generators[message_type] = generator
+
+        body = generator(self._rng)
+        if invalid:
+            schema = get_message_body_schema_for_type(message_type, self._kind)
+            _make_invalid(body, schema, self._rng)
+        return body
+
+    def generate_message(self, message_type: str, *, invalid: bool = False) -> Any:
+        """Generates a single message with the given type, i.e. a message body
+        wrapped in the envelope that contains the version number of the
+        protocol and the ID of the message.
+
+        Parameters:
+            message_type: the type of the message body
+            invalid: whether to generate a body that violates the schema of
+                the message type
+
+        Returns:
+            the generated message
+        """
+        return {
+            "$fw.version": "1.0",
+            "id": f"{self._rng.getrandbits(128):032x}",
+            "body": self.generate_body(message_type, invalid=invalid),
+        }
+
+    def iter_bodies(
+        self,
+        message_types: Iterable[str] | None = None,
+        *,
+        count: int | None = None,
+        invalid_ratio: float = 0.0,
+        envelope: bool = False,
+    ) -> Iterator[Any]:
+        """Generates message bodies or messages with randomly chosen types.
+
+        Parameters:
+            message_types: the message types to choose from; ``None`` means
+                all the message types that the generator can produce
+            count: the number of items to generate; ``None`` means to
+                generate items indefinitely
+            invalid_ratio: probability of generating an item that violates
+                the schema of its message type
+            envelope: whether to wrap the bodies in message envelopes
+
+        Yields:
+            the generated message bodies or messages
+        """
+        types = list(message_types or self.message_types)
+        if not types:
+            return
+
+        generate = self.generate_message if envelope else self.generate_body
+        choice, random = self._rng.choice, self._rng.random
+
+        index = 0
+        while count is None or index < count:
+            yield generate(choice(types), invalid=random() < invalid_ratio)
+            index += 1
+
+    def _compile(self, schema: Schema, name: str | None = None) -> Generator:
+        """Compiles the given JSON schema into a generator function.
+
+        Parameters:
+            schema: the schema to compile
+            name: name of the property that the schema belongs to; used for
+                looking up explicit sizes from the options
+        """
+        schema = _unwrap(schema)
+        if name not in self._options.sizes:
+            name = None
+
+        # Schemas are keyed by their identity. The cache holds a reference to
+        # each schema so their IDs cannot be reused for other objects.
+        key = id(schema), name
+        entry = self._compiled.get(key)
+        if entry is None:
+            # Placeholder to support recursive schemas
+            cell: list[Generator] = []
+            self._compiled[key] = schema, lambda rng: cell[0](rng)
+            generator = self._compile_uncached(schema, name)
+            cell.append(generator)
+            self._compiled[key] = schema, generator
+        else:
+            generator = entry[1]
+
+        return generator
+
+    def _compile_uncached(self, schema: Schema, name: str | None) -> Generator:
+        if "const" in schema:
+            value = schema["const"]
+            return lambda rng: value
+
+        if "enum" in schema:
+            values = list(schema["enum"])
+            return lambda rng: rng.choice(values)
+
+        branches = schema.get("anyOf") or schema.get("oneOf")
+        if branches:
+            generators = [self._compile(branch, name) for branch in branches]
+            return lambda rng: rng.choice(generators)(rng)
+
+        types = schema.get("type")
+        if types is None:
+            types = ["object"] if "properties" in schema else ["string", "integer"]
+        elif isinstance(types, str):
+            types = [types]
+
+        generators = [self._compile_type(schema, type, name) for type in types]
+        if len(generators) == 1:
+            return generators[0]
+
+        # Prefer non-null values if null is only one of the options
+        if "null" in types:
+            null_index = types.index("null")
+            del generators[null_index]
+
+            def generator(rng: Random) -> Any:
+                return rng.choice(generators)(rng) if rng.random() >= 0.1 else None
+
+            return generator
+
+        return lambda rng: rng.choice(generators)(rng)
+
+    def _compile_type(self, schema: Schema, type: str, name: str | None) -> Generator:
+        if type == "object":
+            return self._compile_object(schema, name)
+        elif type == "array":
+            return self._compile_array(schema, name)
+        elif type == "string":
+            return self._compile_string(schema, name)
+        elif type in ("integer", "number"):
+            return _compile_number(schema, integer=type == "integer")
+        elif type == "boolean":
+            return lambda rng: rng.random() < 0.5
+        elif type == "null":
+            return lambda rng: None
+        else:
+            raise ValueError(f"unsupported type in schema: {type!r}")
+
+    def _compile_array(self, schema: Schema, name: str | None) -> Generator:
+        min_items = schema.get("minItems", 0)
+        max_items = schema.get("maxItems")
+        items = _unwrap(schema.get("items", {}))
+
+        if isinstance(items, list):
+            # Tuple validation; generate a prefix of the tuple
+            generators = [self._compile(item) for item in items]
+            upper = len(generators) if max_items is None else max_items
+            upper = max(min(upper, len(generators)), min_items)
+
+            def generate_tuple(rng: Random) -> list[Any]:
+                size = rng.randint(min_items, upper)
+                return [gen(rng) for gen in generators[:size]]
+
+            return generate_tuple
+
+        size_range = self._get_size_range(min_items, max_items, name)
+        generate_item = self._compile(items)
+
+        if schema.get("uniqueItems"):
+
+            def generate_unique(rng: Random) -> list[Any]:
+                size = rng.randint(*size_range)
+                result: list[Any] = []
+                for _ in range(size * 4):
+                    item = generate_item(rng)
+                    if item not in result:
+                        result.append(item)
+                        if len(result) >= size:
+                            break
+                return result
+
+            return generate_unique
+
+        def generate_list(rng: Random) -> list[Any]:
+            size = rng.randint(*size_range)
+            return [generate_item(rng) for _ in range(size)]
+
+        return generate_list
+
+    def _compile_object(self, schema: Schema, name: str | None) -> Generator:
+        required = set(schema.get("required", ()))
+        declared = _unwrap(schema.get("properties", {}))
+        properties = [
+            (key, key in required, self._compile(subschema, key))
+            for key, subschema in declared.items()
+        ]
+        min_properties = schema.get("minProperties", 0)
+        probability = self._options.optional_probability
+
+        additional = _unwrap(schema.get("additionalProperties", True))
+
+        # Required properties that are not declared may hold any value that
+        # is allowed for additional properties
+        if additional is not False:
+            additional_schema = additional if isinstance(additional, dict) else {}
+            properties.extend(
+                (key, True, self._compile(additional_schema, key))
+                for key in sorted(required - declared.keys())
+            )
+
+        generate_map = (
+            self._compile_map(additional, name)
+            if isinstance(additional, dict) and additional
+            else None
+        )
+
+        def generator(rng: Random) -> dict[str, Any]:
+            result = {}
+            random = rng.random
+            for key, is_required, generate in properties:
+                if is_required or random() < probability:
+                    result[key] = generate(rng)
+
+            if len(result) < min_properties:
+                for key, _, generate in properties:
+                    if key not in result:
+                        result[key] = generate(rng)
+                        if len(result) >= min_properties:
+                            break
+
+            if generate_map is not None:
+                result.update(generate_map(rng))
+
+            return result
+
+        return generator
+
+    def _compile_map(self, schema: Schema, name: str | None) -> Generator:
+        """Compiles a generator for objects that map arbitrary keys to values
+        conforming to the given schema.
+
+        Keys are generated as sequential, zero-padded numeric IDs. When the
+        values are objects with an ``id`` property that can hold the key, the
+        ID in the value is set to the key to mimic the objects of the
+        protocol that are keyed by their IDs, like the status of the UAVs in
+        ``UAV-INF`` responses.
+        """
+        size_range = self._get_size_range(0, None, name)
+        generate_value = self._compile(schema)
+        width = len(str(size_range[1]))
+        sync_id = _can_hold_numeric_id(schema)
+
+        def generator(rng: Random) -> dict[str, Any]:
+            size = rng.randint(*size_range)
+            result = {}
+            for index in range(1, size + 1):
+                key = str(index).zfill(width)
+                value = generate_value(rng)
+                if sync_id and isinstance(value, dict) and "id" in value:
+                    value["id"] = key
+                result[key] = value
+            return result
+
+        return generator
+
+    def _compile_string(self, schema: Schema, name: str | None) -> Generator:
+        format = schema.get("format")
+        if format == "date-time":
+            return lambda rng: _random_datetime(rng).isoformat()
+        elif format == "date":
+            return lambda rng: _random_datetime(rng).date().isoformat()
+
+        min_length = schema.get("minLength", 0)
+        max_length = schema.get("maxLength")
+
+        pattern = schema.get("pattern")
+        if pattern is not None:
+            return _compile_pattern(pattern, min_length, max_length)
+
+        if name is not None:
+            size = self._options.sizes[name]
+            lower, upper = size, size
+        else:
+            upper = min_length + self._options.max_string_length
+            if max_length is not None:
+                upper = min(upper, max_length)
+            lower = max(min_length, min(1, upper))
+
+        alphabet = _ALPHABET
+
+        def generator(rng: Random) -> str:
+            return "".join(rng.choices(alphabet, k=rng.randint(lower, upper)))
+
+        return generator
+
+    def _get_size_range(
+        self, min_items: int, max_items: int | None, name: str | None
+    ) -> tuple[int, int]:
+        """Returns the range of sizes for arrays and maps, taking into account
+        the constraints in the schema and the options of the generator.
+        """
+        if name is not None:
+            size = self._options.sizes[name]
+            return size, size
+
+        upper = max(min_items, self._options.max_items)
+        if max_items is not None:
+            upper = min(upper, max_items)
+        return min_items, upper
+
+
+_ALPHABET = string.ascii_letters + string.digits
+"""Characters to use in strings without a pattern."""
+
+_REGEX_ALPHABET = _ALPHABET + "-_."
+"""Characters to use when a regular expression allows any character or
+excludes some characters only.
+"""
+
+_MAX_REPEAT = 8
+"""Maximum number of repetitions to generate for unbounded repetitions in
+regular expressions.
+"""
+
+_DEFAULT_NUMBER_RANGE = 1000
+"""Width of the range that numbers are chosen from when the schema does not
+specify bounds for them.
+"""
+
+_WRONG_TYPE_VALUES: list[tuple[str, Any]] = [
+    ("string", "invalid"),
+    ("boolean", True),
+    ("null", None),
+    ("array", []),
+    ("object", {}),
+    ("number", 0.5),
+]
+"""Values of different JSON types, used for generating properties with the
+wrong type in invalid message bodies.
+"""
+
+
+def _can_hold_numeric_id(schema: Schema) -> bool:
+    """Returns whether the given schema describes objects whose ``id``
+    property may hold a numeric string like the generated keys of maps.
+    """
+    id_schema = _unwrap(_unwrap(schema.get("properties", {})).get("id"))
+    if not isinstance(id_schema, dict) or id_schema.get("type") != "string":
+        return False
+
+    pattern = id_schema.get("pattern")
+    return pattern is None or re.search(pattern, "1") is not None
+
+
+def _compile_number(schema: Schema, integer: bool) -> Generator:
+    """Compiles a generator for integers or numbers conforming to the bounds
+    in the given schema.
+    """
+    lower, upper = _get_number_bounds(schema, integer)
+
+    if integer:
+        lower, upper = ceil(lower), floor(upper)
+        return lambda rng: rng.randint(lower, upper)
+
+    def generator(rng: Random) -> float:
+        return min(max(round(rng.uniform(lower, upper), 3), lower), upper)
+
+    return generator
+
+
+def _get_number_bounds(schema: Schema, integer: bool) -> tuple[float, float]:
+    """Returns the inclusive bounds of the numbers to generate for the given
+    schema.
+    """
+    epsilon = 1 if integer else 1e-3
+    lower = schema.get("minimum")
+    upper = schema.get("maximum")
+
+    exclusive_lower = schema.get("exclusiveMinimum")
+    if exclusive_lower is True:
+        # Draft 4 style boolean flag
+        exclusive_lower = lower
+    if exclusive_lower is not None and exclusive_lower is not False:
+        lower = exclusive_lower + epsilon
+
+    exclusive_upper = schema.get("exclusiveMaximum")
+    if exclusive_upper is True:
+        exclusive_upper = upper
+    if exclusive_upper is not None and exclusive_upper is not False:
+        upper = exclusive_upper - epsilon
+
+    if lower is None and upper is None:
+        return 0, _DEFAULT_NUMBER_RANGE
+    elif lower is None:
+        return upper - _DEFAULT_NUMBER_RANGE, upper
+    elif upper is None:
+        return lower, lower + _DEFAULT_NUMBER_RANGE
+    else:
+        return lower, upper
+
+
+def _compile_pattern(
+    pattern: str, min_length: int, max_length: int | None
+) -> Generator:
+    """Compiles a generator for strings matching the given regular expression
+    and length constraints.
+    """
+    generate = _compile_regex(sre_parse.parse(pattern))
+
+    def generator(rng: Random) -> str:
+        for _ in range(10):
+            value = generate(rng)
+            if len(value) >= min_length and (
+                max_length is None or len(value) <= max_length
+            ):
+                break
+        return value
+
+    return generator
+
+
+def _compile_regex(parsed: Any) -> Generator:
+    """Compiles a parsed regular expression into a generator of strings that
+    match the regular expression.
+    """
+    parts = [_compile_regex_item(op, av) for op, av in parsed]
+    if len(parts) == 1:
+        return parts[0]
+    return lambda rng: "".join([part(rng) for part in parts])
+
+
+def _compile_regex_item(op: Any, av: Any) -> Generator:  # noqa: C901
+    if op is sre_parse.LITERAL:
+        char = chr(av)
+        return lambda rng: char
+    elif op is sre_parse.NOT_LITERAL:
+        chars = _REGEX_ALPHABET.replace(chr(av), "")
+        return lambda rng: rng.choice(chars)
+    elif op is sre_parse.ANY:
+        return lambda rng: rng.choice(_REGEX_ALPHABET)
+    elif op is sre_parse.IN:
+        chars = _get_chars_in_set(av)
+        return lambda rng: rng.choice(chars)
+    elif op is sre_parse.CATEGORY:
+        chars = _get_chars_in_category(av)
+        return lambda rng: rng.choice(chars)
+    elif op is sre_parse.BRANCH:
+        branches = [_compile_regex(branch) for branch in av[1]]
+        return lambda rng: rng.choice(branches)(rng)
+    elif op is sre_parse.SUBPATTERN:
+        return _compile_regex(av[-1])
+    elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+        lower, upper, item = av
+        upper = min(upper, lower + _MAX_REPEAT)
+        generate = _compile_regex(item)
+        return lambda rng: "".join(
+            [generate(rng) for _ in range(rng.randint(lower, upper))]
+        )
+    elif op is sre_parse.AT:
+        return lambda rng: ""
+    else:
+        raise ValueError(f"unsupported regular expression construct: {op}")
+
+
+def _get_chars_in_category(category: Any) -> str:
+    if category is sre_parse.CATEGORY_DIGIT:
+        return string.digits
+    elif category is sre_parse.CATEGORY_WORD:
+        return _ALPHABET + "_"
+    elif category is sre_parse.CATEGORY_SPACE:
+        return " "
+    else:
+        raise ValueError(f"unsupported character category: {category}")
+
+
+def _get_chars_in_set(items: list[tuple[Any, Any]]) -> str:
+    """Returns the characters from the alphabet of generated strings that
+    belong to the character set of a parsed regular expression.
+    """
+    chars: set[str] = set()
+    negate = False
+    for op, av in items:
+        if op is sre_parse.NEGATE:
+            negate = True
+        elif op is sre_parse.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_parse.RANGE:
+            chars.update(chr(code) for code in range(av[0], av[1] + 1))
+        elif op is sre_parse.CATEGORY:
+            chars.update(_get_chars_in_category(av))
+        else:
+            raise ValueError(f"unsupported construct in character set: {op}")
+
+    if negate:
+        return "".join(char for char in _REGEX_ALPHABET if char not in chars)
+    else:
+        return "".join(sorted(chars))
+
+
+def _make_invalid(body: Any, schema: Schema, rng: Random) -> None:
+    """Modifies a valid message body in-place such that it violates the
+    given schema of its message type.
+
+    The modification is chosen randomly from the following options: adding
+    an unknown property when additional properties are not allowed, removing
+    a required property, or replacing the value of a property with a value
+    of the wrong type. As a last resort, the ``type`` field of the body is
+    replaced with a non-string value.
+    """
+    schema = _unwrap(schema)
+    if "anyOf" in schema:
+        # Body may match any of the branches so we can only break the type
+        body["type"] = 0
+        return
+
+    properties = _unwrap(schema.get("properties", {}))
+    mutations: list[Callable[[], None]] = []
+
+    if schema.get("additionalProperties") is False:
+        mutations.append(lambda: body.__setitem__("x-invalid", True))
+
+    for key in schema.get("required", ()):
+        if key != "type" and key in body:
+            mutations.append(lambda key=key: body.__delitem__(key))
+
+    for key in body:
+        types = _unwrap(properties.get(key, {})).get("type")
+        if key != "type" and types is not None:
+            value = _get_value_of_wrong_type(types)
+            mutations.append(lambda key=key, value=value: body.__setitem__(key, value))
+
+    if mutations:
+        rng.choice(mutations)()
+    else:
+        body["type"] = 0
+
+
+def _get_value_of_wrong_type(types: str | list[str]) -> Any:
+    """Returns a JSON value whose type is not among the given JSON schema
+    types.
+    """
+    if isinstance(types, str):
+        types = [types]
+    for type, value in _WRONG_TYPE_VALUES:
+        if type not in types:
+            return value
+    return None
+
+
+def _random_datetime(rng: Random) -> datetime:
+    """Returns a random timestamp between 2020 and 2030."""
+    return datetime.fromtimestamp(rng.randint(1577836800, 1893456000), timezone.utc)
+
+
+def _unwrap(obj: Any) -> Any:
+    """Returns the object behind a ``jsonref`` proxy, or the object itself if
+    it is not a proxy.
+    """
+    return obj.__subject__ if type(obj) is JsonRef else obj
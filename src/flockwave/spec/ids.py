@@ -1,11 +1,55 @@
 """Helper functions to determine whether a given ID used in the Flockwave
 protocol is valid.
+
+The functions operating on sequences of identifiers (`are_valid_object_ids()`,
+`make_valid_object_ids()`, `are_valid_users()`, `parse_users()` and
+`are_valid_user_names()`) are meant for servers that check the same few
+thousand IDs over and over again. They remember the results for recently
+seen identifiers in bounded caches, so repeated identifiers skip the length
+checks and regular expressions altogether. `parse_user()` and
+`is_valid_user_name()` use the same caches.
 """
 
 import re
+from collections.abc import Callable, Iterable, Sequence
+from threading import Lock
+from typing import Generic, TypeVar
 
 MAX_OBJECT_ID_LENGTH = MAX_UAV_ID_LENGTH = 64
 
+MAX_CACHE_SIZE = 8192
+"""Maximum number of identifiers to remember in each of the caches of this
+module. The least recently added identifier is evicted when a cache is full.
+"""
+
+T = TypeVar("T")
+
+
+class _BoundedCache(dict[str, T], Generic[T]):
+    """Dictionary that calculates the values of missing keys with a function
+    and stores at most a given number of keys, evicting the oldest key when
+    it is full.
+
+    Lookups of keys that are already in the cache are plain dictionary
+    lookups, which is why `__getitem__` can be mapped over sequences of
+    identifiers directly. Insertions and evictions are serialized with a lock
+    so the cache can be shared between threads.
+    """
+
+    def __init__(self, func: Callable[[str], T], max_size: int = MAX_CACHE_SIZE):
+        super().__init__()
+        self._func = func
+        self._lock = Lock()
+        self._max_size = max_size
+
+    def __missing__(self, key: str) -> T:
+        value = self._func(key)
+        with self._lock:
+            if key not in self and len(self) >= self._max_size:
+                del self[next(iter(self))]
+            self[key] = value
+        return value
+
 
 def is_valid_object_id(identifier: str) -> bool:
     """Returns whether the given identifier is a valid object ID.
@@ -41,7 +85,7 @@ def is_valid_user(identifier: str) -> bool:
     Returns:
         whether the identifier is a valid username-domain pair
     """
-    return bool(_user_regex.match(identifier))
+    return _parsed_users[identifier] is not None
 
 
 def make_valid_object_id(identifier: str) -> str:
@@ -61,6 +105,16 @@ def make_valid_object_id(identifier: str) -> str:
     return identifier.replace("/", "-")
 
 
+def _parse_user(identifier: str) -> tuple[str, str] | None:
+    match = _user_regex.match(identifier)
+    if not match:
+        return None
+    return match.group("name") or "", match.group("domain") or ""
+
+
+_parsed_users = _BoundedCache(_parse_user)
+
+
 def parse_user(identifier: str) -> tuple[str, str]:
     """Given an identifier that contains a username-domain pair, returns
     the username and the domain part separately.
@@ -74,7 +128,115 @@ def parse_user(identifier: str) -> tuple[str, str]:
     Raises:
         ValueError: if the username cannot be parsed
     """
-    match = _user_regex.match(identifier)
-    if not match:
+    result = _parsed_users[identifier]
+    if result is None:
         raise ValueError(f"{repr(identifier)} is not a valid username")
-    return match.group("name") or "", match.group("domain") or ""
+    return result
+
+
+_user_name_regex = re.compile(
+    r"[-A-Za-z0-9!#%&'*+/=?\^_`{|}~]*(@[-A-Za-z0-9!#%&'*+/=?\^_`{|}~.]+)?"
+)
+"""Regular expression of the ``userName`` definition of the schema. It must
+be matched against the entire string with ``fullmatch()`` to get the
+semantics of the ``^`` and ``$`` anchors of JSON schema patterns.
+
+Note that this is stricter than the regular expression used by
+`is_valid_user()` and `parse_user()`: it does not allow ``$`` and ``.`` in
+the username part and ``$`` in the domain part.
+"""
+
+_valid_user_names = _BoundedCache(
+    lambda identifier: _user_name_regex.fullmatch(identifier) is not None
+)
+
+
+def is_valid_user_name(identifier: str) -> bool:
+    """Returns whether the given identifier is valid according to the
+    ``userName`` definition of the schema.
+
+    Parameters:
+        identifier: the identifier to validate
+
+    Returns:
+        whether the identifier is a valid username
+    """
+    return _valid_user_names[identifier]
+
+
+_valid_object_ids = _BoundedCache(is_valid_object_id)
+_sanitized_object_ids = _BoundedCache(make_valid_object_id)
+
+
+def are_valid_object_ids(identifiers: Iterable[str]) -> list[bool]:
+    """Returns whether each of the given identifiers is a valid object ID.
+
+    Parameters:
+        identifiers: the object identifiers to validate
+
+    Returns:
+        a list with one boolean for each identifier; it can be turned into a
+        NumPy boolean mask with ``numpy.array()`` if needed
+    """
+    return list(map(_valid_object_ids.__getitem__, identifiers))
+
+
+def make_valid_object_ids(identifiers: Iterable[str]) -> list[str]:
+    """Produces valid object identifiers from each of the given identifiers,
+    with the same rules as `make_valid_object_id()`.
+
+    Parameters:
+        identifiers: the identifiers to transform
+
+    Returns:
+        the transformed identifiers. Identical inputs are mapped to the same
+        string instance as long as they stay in the cache.
+    """
+    return list(map(_sanitized_object_ids.__getitem__, identifiers))
+
+
+def are_valid_users(identifiers: Iterable[str]) -> list[bool]:
+    """Returns whether each of the given identifiers is a valid
+    username-domain pair, with the same rules as `is_valid_user()`.
+
+    Parameters:
+        identifiers: the identifiers to validate
+
+    Returns:
+        a list with one boolean for each identifier
+    """
+    lookup = _parsed_users.__getitem__
+    return [lookup(identifier) is not None for identifier in identifiers]
+
+
+def are_valid_user_names(identifiers: Iterable[str]) -> list[bool]:
+    """Returns whether each of the given identifiers is valid according to
+    the ``userName`` definition of the schema.
+
+    Parameters:
+        identifiers: the identifiers to validate
+
+    Returns:
+        a list with one boolean for each identifier
+    """
+    return list(map(_valid_user_names.__getitem__, identifiers))
+
+
+def parse_users(identifiers: Sequence[str]) -> list[tuple[str, str]]:
+    """Parses each of the given identifiers into a username and a domain
+    part, with the same rules as `parse_user()`.
+
+    Parameters:
+        identifiers: the identifiers to parse as users
+
+    Returns:
+        the username and the domain part of each identifier
+
+    Raises:
+        ValueError: if one of the identifiers cannot be parsed
+    """
+    result = list(map(_parsed_users.__getitem__, identifiers))
+    if None in result:
+        identifier = identifiers[result.index(None)]
+        raise ValueError(f"{repr(identifier)} is not a valid username")
+    return result  # type: ignore
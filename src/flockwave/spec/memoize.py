@@ -9,20 +9,29 @@ Sakkis, licensed under the MIT license. It has been modified as follows:
 
 * Dropped support for signature-preserving decorators to get rid of its
   dependency on the 'decorator' module.
+
+* Added single-flight semantics for concurrent cache misses, optional LRU and
+  TTL bounds, ``cache_clear()`` and ``cache_info()`` on the memoized
+  functions, and a variant for coroutine functions (`memoized_async()`).
 """
 
-from collections.abc import Callable, MutableMapping
+from asyncio import Task, ensure_future, shield
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, MutableMapping
 from functools import partial, wraps
 from inspect import Parameter, signature
 from pickle import dumps
+from threading import Event, Lock, get_ident
+from time import monotonic, perf_counter
 from typing import (
     Any,
+    NamedTuple,
     TypeVar,
     cast,
     overload,
 )
 
-__all__ = ("memoized",)
+__all__ = ("CacheInfo", "memoized", "memoized_async")
 
 
 Arg = TypeVar("Arg")
@@ -30,6 +39,229 @@ T = TypeVar("T")
 
 Cache = MutableMapping[Arg, T]
 
+_MISSING: Any = object()
+"""Marker object for missing cache entries."""
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the cache of a memoized function."""
+
+    hits: int | None
+    """Number of calls that were served from the cache; ``None`` if hits are
+    not counted (see the ``stats`` argument of `memoized()`).
+    """
+
+    misses: int
+    """Number of times the memoized function was evaluated and its result was
+    stored in the cache.
+    """
+
+    max_size: int | None
+    """Maximum number of entries in the cache; ``None`` if unbounded."""
+
+    size: int
+    """Current number of entries in the cache."""
+
+    compute_time: float
+    """Total time spent in evaluating the memoized function, in seconds."""
+
+
+class _Flight:
+    """Evaluation of a memoized function that is in progress in one thread
+    and that other threads may wait for.
+    """
+
+    __slots__ = ("error", "event", "generation", "owner", "value")
+
+    def __init__(self, generation: int):
+        self.error: BaseException | None = None
+        self.event = Event()
+        self.generation = generation
+        self.owner = get_ident()
+        self.value: Any = None
+
+
+class _MemoState:
+    """State of a memoized function: its cache, the evaluations in progress
+    and the statistics of the cache.
+
+    Lookups of unbounded caches without expiry and without hit counting go
+    straight to the ``__getitem__`` method of the cache; all other lookups
+    and all cache misses are serialized with a lock.
+    """
+
+    def __init__(
+        self,
+        cache: Cache[Any, Any] | None,
+        max_size: int | None = None,
+        ttl: float | None = None,
+        stats: bool = False,
+    ):
+        self.is_plain = cache is None and max_size is None and ttl is None and not stats
+        """Whether cache hits can be served by a plain dictionary lookup."""
+
+        if max_size is not None:
+            if cache is not None:
+                raise ValueError("max_size cannot be used with a custom cache")
+            if max_size < 1:
+                raise ValueError("max_size must be positive")
+            cache = OrderedDict()
+        elif cache is None:
+            cache = {}
+
+        self.cache = cache
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0 if stats else None
+        self.misses = 0
+        self.compute_time = 0.0
+        self.generation = 0
+        """Number of times the cache was cleared. Values that were computed
+        before the cache was cleared are not stored in the cache.
+        """
+
+        self._flights: dict[Any, _Flight] = {}
+        self._lock = Lock()
+
+        if self.is_plain:
+            self.get = cache.__getitem__
+        else:
+            self.get = self._get_with_bookkeeping
+
+    def compute(self, key: Any, func: Callable[..., T], *args, **kwargs) -> T:
+        """Evaluates the memoized function for a key that was not found in
+        the cache and stores the result.
+
+        When multiple threads miss the same key at the same time, only one of
+        them evaluates the function; the others wait for its result (or its
+        exception). Threads that miss the key after the cache was cleared do
+        not wait for evaluations that started before the cache was cleared.
+        """
+        with self._lock:
+            value = self._peek(key)
+            if value is not _MISSING:
+                return value
+
+            flight = self._flights.get(key)
+            if flight is None or flight.generation != self.generation:
+                flight = self._flights[key] = _Flight(self.generation)
+            elif flight.owner == get_ident():
+                # Recursive call for the same key from the function itself;
+                # waiting would deadlock
+                flight = None
+
+        if flight is None:
+            return func(*args, **kwargs)
+
+        if flight.owner != get_ident():
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        started_at = perf_counter()
+        try:
+            value = func(*args, **kwargs)
+        except BaseException as ex:
+            flight.error = ex
+            with self._lock:
+                self._land(key, flight)
+            flight.event.set()
+            raise
+
+        flight.value = value
+        with self._lock:
+            self._store(key, value, perf_counter() - started_at, flight.generation)
+            self._land(key, flight)
+        flight.event.set()
+        return value
+
+    def clear(self) -> None:
+        """Removes all entries from the cache and resets the statistics.
+
+        Evaluations that are in progress while the cache is cleared still
+        return their results to their callers, but the results are not
+        stored in the cache.
+        """
+        with self._lock:
+            self.generation += 1
+            self.cache.clear()
+            self.hits = 0 if self.hits is not None else None
+            self.misses = 0
+            self.compute_time = 0.0
+
+    def info(self) -> CacheInfo:
+        """Returns the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.max_size,
+                len(self.cache),
+                self.compute_time,
+            )
+
+    def store(self, key: Any, value: Any, elapsed: float, generation: int) -> None:
+        """Stores a newly computed value in the cache.
+
+        Parameters:
+            key: the cache key
+            value: the computed value
+            elapsed: the time it took to compute the value, in seconds
+            generation: the generation of the cache when the computation of
+                the value started; the value is discarded if the cache was
+                cleared since then
+        """
+        with self._lock:
+            self._store(key, value, elapsed, generation)
+
+    def _land(self, key: Any, flight: _Flight) -> None:
+        # The flight may have been superseded by a newer one for the same key
+        # if the cache was cleared in the meantime
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def _store(self, key: Any, value: Any, elapsed: float, generation: int) -> None:
+        if generation != self.generation:
+            return
+
+        cache = self.cache
+        self.misses += 1
+        self.compute_time += elapsed
+        if self.ttl is not None:
+            cache[key] = (value, monotonic() + self.ttl)
+        else:
+            cache[key] = value
+        if self.max_size is not None and len(cache) > self.max_size:
+            cast(OrderedDict, cache).popitem(last=False)
+
+    def _get_with_bookkeeping(self, key: Any) -> Any:
+        with self._lock:
+            value = self._peek(key)
+            if value is _MISSING:
+                raise KeyError(key)
+            if self.max_size is not None:
+                cast(OrderedDict, self.cache).move_to_end(key)
+            if self.hits is not None:
+                self.hits += 1
+            return value
+
+    def _peek(self, key: Any) -> Any:
+        # dict.get() is used deliberately: it does not invoke __missing__()
+        # on the fast paths
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING and self.ttl is not None:
+            value, expires_at = value
+            if expires_at <= monotonic():
+                del self.cache[key]
+                value = _MISSING
+        return value
+
+
+def _add_cache_methods(wrapper: Any, state: _MemoState) -> None:
+    wrapper.cache_clear = state.clear
+    wrapper.cache_info = state.info
+
 
 @overload
 def memoized(
@@ -38,6 +270,9 @@ def memoized(
     allow_named: bool | None = None,
     hashable: bool = True,
     cache: Cache[Any, T] | None = None,
+    max_size: int | None = None,
+    ttl: float | None = None,
+    stats: bool = False,
 ) -> Callable[[], T]: ...
 
 
@@ -48,6 +283,9 @@ def memoized(
     allow_named: bool | None = None,
     hashable: bool = True,
     cache: Cache[Any, T] | None = None,
+    max_size: int | None = None,
+    ttl: float | None = None,
+    stats: bool = False,
 ) -> Callable[..., T]: ...
 
 
@@ -58,6 +296,9 @@ def memoized(
     allow_named: bool | None = None,
     hashable: bool = True,
     cache: Cache[Any, T] | None = None,
+    max_size: int | None = None,
+    ttl: float | None = None,
+    stats: bool = False,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]: ...
 
 
@@ -67,12 +308,24 @@ def memoized(
     allow_named: bool | None = None,
     hashable: bool = True,
     cache: Cache[Any, T] | None = None,
+    max_size: int | None = None,
+    ttl: float | None = None,
+    stats: bool = False,
 ) -> Callable[..., T] | Callable[[Callable[..., T]], Callable[..., T]]:
     """A generic efficient memoized decorator.
 
     Creates a memoizing decorator that decorates a function as efficiently as
     possible given the function's signature and the passed options.
 
+    The memoized function is thread-safe: when multiple threads call it with
+    the same arguments that are not in the cache yet, only one of them
+    evaluates the function and the others wait for its result. Exceptions are
+    propagated to all waiting threads and are not cached.
+
+    The memoized function has a ``cache_clear()`` method that empties the
+    cache and a ``cache_info()`` method that returns a `CacheInfo` object
+    with the statistics of the cache.
+
     Parameters:
         func: If not None it decorates the given callable ``func``, otherwise
             it returns a decorator. Basically a convenience for creating a
@@ -89,7 +342,18 @@ def memoized(
         hashable: Set to False if any parameter may be non-hashable.
         cache: A dict-like instance to be used as the underlying storage for
             the memoized values. The cache instance must implement
-            ``__getitem__`` and ``__setitem__``. Defaults to a new empty dict.
+            ``__getitem__``, ``__setitem__``, ``get()`` and ``clear()``.
+            Defaults to a new empty dict.
+        max_size: Maximum number of entries in the cache. The least recently
+            used entry is evicted when the cache is full. ``None`` means that
+            the cache is unbounded. Cannot be used with ``cache``.
+        ttl: Number of seconds after which cache entries expire and the
+            function is evaluated again; ``None`` means that entries never
+            expire.
+        stats: Whether to count cache hits in ``cache_info()``. Counting hits,
+            bounding the cache or setting a TTL disables the fastest code
+            paths, which otherwise serve cache hits without executing any
+            Python code.
     """
     if func is None:
         return partial(
@@ -98,8 +362,105 @@ def memoized(
             allow_named=allow_named,
             hashable=hashable,
             cache=cache,
+            max_size=max_size,
+            ttl=ttl,
+            stats=stats,
         )  # type: ignore
 
+    state = _MemoState(cache, max_size, ttl, stats)
+    wrapper = _create_wrapper(func, is_method, allow_named, hashable, state)
+    _add_cache_methods(wrapper, state)
+    return wrapper
+
+
+def memoized_async(
+    func: Callable[..., Awaitable[T]] | None = None,
+    *,
+    max_size: int | None = None,
+    ttl: float | None = None,
+    stats: bool = False,
+) -> Any:
+    """Memoizing decorator for coroutine functions.
+
+    The results of the coroutine function are cached, keyed by its positional
+    and keyword arguments, which must be hashable. When the memoized function
+    is called again with the same arguments while an earlier call is still
+    in progress, the new call waits for the result of the earlier one instead
+    of starting a new evaluation. Cancelling a waiting call does not cancel
+    the evaluation itself. Exceptions are propagated to all waiting calls and
+    are not cached.
+
+    The memoized function must be used from a single event loop. It has the
+    same ``cache_clear()`` and ``cache_info()`` methods as the functions
+    decorated with `memoized()`.
+
+    Parameters:
+        func: If not None it decorates the given coroutine function,
+            otherwise it returns a decorator.
+        max_size: Maximum number of entries in the cache, see `memoized()`
+        ttl: Number of seconds after which cache entries expire, see
+            `memoized()`
+        stats: Whether to count cache hits in ``cache_info()``
+    """
+    if func is None:
+        return partial(memoized_async, max_size=max_size, ttl=ttl, stats=stats)
+
+    state = _MemoState(None, max_size, ttl, stats)
+    # Evaluations in progress and the generations of the cache when they were
+    # started, keyed by the cache keys
+    tasks: dict[Any, tuple[Task, int]] = {}
+
+    async def evaluate(
+        key: Any, args: tuple[Any, ...], kwargs: dict[str, Any], generation: int
+    ) -> T:
+        started_at = perf_counter()
+        try:
+            value = await func(*args, **kwargs)
+        finally:
+            # The task may have been superseded by a newer one for the same
+            # key if the cache was cleared in the meantime
+            entry = tasks.get(key)
+            if entry is not None and entry[1] == generation:
+                del tasks[key]
+        state.store(key, value, perf_counter() - started_at, generation)
+        return value
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> T:
+        key = (args, frozenset(kwargs.items())) if kwargs else args
+        try:
+            return state.get(key)
+        except KeyError:
+            pass
+
+        entry = tasks.get(key)
+        if entry is None or entry[1] != state.generation:
+            generation = state.generation
+            task = ensure_future(evaluate(key, args, kwargs, generation))
+            tasks[key] = task, generation
+            # Retrieve the exception even if all the callers were cancelled,
+            # so asyncio does not complain about it
+            task.add_done_callback(_consume_exception)
+        else:
+            task = entry[0]
+        return await shield(task)
+
+    _add_cache_methods(wrapper, state)
+    return wrapper
+
+
+def _consume_exception(task: Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def _create_wrapper(
+    func: Callable[..., T],
+    is_method: bool,
+    allow_named: bool | None,
+    hashable: bool,
+    state: _MemoState,
+) -> Callable[..., T]:
     sig = signature(func)
     has_defaults = any(
         param.default is not Parameter.empty for param in sig.parameters.values()
@@ -110,10 +471,7 @@ def memoized(
     if allow_named or any(
         param.kind is Parameter.VAR_KEYWORD for param in sig.parameters.values()
     ):
-        if cache is None:
-            cache = {}
-
-        return _args_kwargs_memoized(func, hashable, cache)
+        return _args_kwargs_memoized(func, hashable, state)
 
     nargs = sum(
         1
@@ -126,6 +484,7 @@ def memoized(
         )
     )
 
+    is_plain = state.is_plain
     if (
         nargs > 1
         or any(
@@ -134,25 +493,24 @@ def memoized(
         or has_defaults
         or not hashable
         or nargs == 0
-        and cache is not None
+        and not is_plain
     ):
-        if cache is None:
-            cache = {}
-
-        return _args_memoized(func, hashable, cache)
+        return _args_memoized(func, hashable, state)
 
     if nargs == 1:
-        if is_method or cache is not None:
-            return _one_arg_memoized(func, cache if cache is not None else {})
+        if is_method or not is_plain:
+            return _one_arg_memoized(func, state)
         else:
-            return _fast_one_arg_memoized(func)
+            return _fast_one_arg_memoized(func, state)
 
-    return _fast_zero_arg_memoized(func)
+    return _fast_zero_arg_memoized(func, state)
 
 
 def _args_kwargs_memoized(
-    func: Callable[..., T], hashable: bool, cache: Cache[Any, T]
+    func: Callable[..., T], hashable: bool, state: _MemoState
 ) -> Callable[..., T]:
+    get = state.get
+
     @wraps(func)
     def wrapper(*args, **kwargs) -> T:
         if hashable:
@@ -160,64 +518,86 @@ def _args_kwargs_memoized(
         else:
             key = dumps((args, kwargs), -1)
         try:
-            return cache[key]
+            return get(key)
         except KeyError:
-            cache[key] = value = func(*args, **kwargs)
-            return value
+            return state.compute(key, func, *args, **kwargs)
 
     return wrapper
 
 
 def _args_memoized(
-    func: Callable[..., T], hashable: bool, cache: Cache[Any, T]
+    func: Callable[..., T], hashable: bool, state: _MemoState
 ) -> Callable[..., T]:
+    get = state.get
+
     @wraps(func)
     def wrapper(*args) -> T:
         key = args if hashable else dumps(args, -1)
         try:
-            return cache[key]
+            return get(key)
         except KeyError:
-            cache[key] = value = func(*args)
-            return value
+            return state.compute(key, func, *args)
 
     return wrapper
 
 
 def _one_arg_memoized(
-    func: Callable[[Arg], T], cache: Cache[Arg, T]
+    func: Callable[[Arg], T], state: _MemoState
 ) -> Callable[[Arg], T]:
+    get = state.get
+
     @wraps(func)
     def wrapper(arg: Arg) -> T:
         key = arg
         try:
-            return cache[key]
+            return get(key)
         except KeyError:
-            cache[key] = value = func(arg)
-            return value
+            return state.compute(key, func, arg)
 
     return wrapper
 
 
 # Shamelessly stolen from
 # http://code.activestate.com/recipes/578231-probably-the-fastest-memoization-decorator-in-the-/
-def _fast_one_arg_memoized(func: Callable[[Arg], T]) -> Callable[[Arg], T]:
+#
+# Cache hits are served by dict.__getitem__() without executing any Python
+# code; only cache misses go through the single-flight logic of _MemoState.
+# The bound method is wrapped in a partial object so we can attach the
+# cache_clear() and cache_info() methods to it; calling a partial object with
+# no bound arguments is as fast as calling the bound method itself.
+def _fast_one_arg_memoized(
+    func: Callable[[Arg], T], state: _MemoState
+) -> Callable[[Arg], T]:
     class memodict(dict):
         def __missing__(self, key: Arg) -> T:
-            self[key] = ret = func(key)
-            return ret
+            return state.compute(key, func, key)
 
-    cache = cast(dict[Arg, T], memodict())
-    return cache.__getitem__
+    state.cache = cache = cast(dict[Arg, T], memodict())
+    state.get = cache.__getitem__
+    return _wrap_fast_path(func, partial(cache.__getitem__))
 
 
 # same principle as the above
-def _fast_zero_arg_memoized(func: Callable[[], T]) -> Callable[[], T]:
+def _fast_zero_arg_memoized(
+    func: Callable[[], T], state: _MemoState
+) -> Callable[[], T]:
     class memodict(dict):
         def __missing__(self, key: Any) -> T:
-            self[key] = ret = func()
-            return ret
+            return state.compute(key, func)
 
-    return partial(memodict().__getitem__, None)
+    state.cache = cache = memodict()
+    state.get = cache.__getitem__
+    return _wrap_fast_path(func, partial(cache.__getitem__, None))
+
+
+def _wrap_fast_path(func: Callable[..., T], wrapper: partial) -> Callable[..., T]:
+    for name in ("__module__", "__name__", "__qualname__", "__doc__"):
+        try:
+            setattr(wrapper, name, getattr(func, name))
+        except AttributeError:
+            pass
+    wrapper.__wrapped__ = func  # type: ignore
+    return wrapper
 
 
 # Taken from future.util
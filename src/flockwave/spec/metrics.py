@@ -0,0 +1,444 @@
+"""Optional instrumentation of the validation of Flockwave messages.
+
+When enabled with `enable_metrics()`, the validators created by
+`flockwave.spec.validator` record the number of validated and rejected
+message bodies, the distribution of validation latencies and (optionally)
+payload sizes for each message type, and the schema loading and compilation
+functions of `flockwave.spec.schema` and `flockwave.spec.validator` record
+how long it took to load or compile each schema resource.
+
+When metrics are disabled, which is the default, the only cost of the hooks
+is a single check of a module-level variable in each call of a validator.
+
+The recorded metrics can be exported as a JSON-compatible snapshot or in the
+text exposition format of Prometheus.
+"""
+
+import json
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from threading import Lock
+from typing import Any
+
+__all__ = (
+    "LATENCY_BUCKETS",
+    "SIZE_BUCKETS",
+    "Histogram",
+    "TypeMetrics",
+    "ValidationMetrics",
+    "disable_metrics",
+    "enable_metrics",
+    "get_metrics",
+)
+
+
+LATENCY_BUCKETS = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+)
+"""Upper bounds of the buckets of validation latency histograms, in seconds."""
+
+SIZE_BUCKETS = tuple(256 * 4**exponent for exponent in range(8))
+"""Upper bounds of the buckets of payload size histograms, in bytes, from
+256 bytes to 4 MB.
+"""
+
+_current: "ValidationMetrics | None" = None
+"""The metrics object that the instrumented functions record into, or
+``None`` if metrics are disabled.
+"""
+
+
+class Histogram:
+    """Histogram of observed values with fixed bucket boundaries, following
+    the semantics of Prometheus histograms.
+    """
+
+    buckets: tuple[float, ...]
+    """Upper bounds of the buckets, in increasing order. There is an implicit
+    last bucket with an infinite upper bound.
+    """
+
+    counts: list[int]
+    """Number of observations in each bucket (not cumulative); the last item
+    belongs to the implicit infinite bucket.
+    """
+
+    count: int
+    """Total number of observations."""
+
+    sum: float
+    """Sum of all observed values."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Records an observed value in the histogram."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns a JSON representation of the histogram."""
+        return {
+            "buckets": list(self.buckets),
+            "counts": list(self.counts),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+class TypeMetrics:
+    """Metrics recorded for a single kind and type of message bodies."""
+
+    validated: int
+    """Number of message bodies that passed the validation."""
+
+    failed: int
+    """Number of message bodies that failed the validation."""
+
+    failures: Counter[str]
+    """Number of failures, keyed by the JSON schema rule that was violated,
+    e.g. ``required`` or ``maximum``.
+    """
+
+    latency: Histogram
+    """Histogram of the time spent on validating a single body, in seconds."""
+
+    size: Histogram
+    """Histogram of the sizes of the validated bodies in their compact JSON
+    representation, in bytes. Empty unless payload sizes are measured.
+    """
+
+    def __init__(self):
+        self.validated = 0
+        self.failed = 0
+        self.failures = Counter()
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns a JSON representation of the metrics."""
+        return {
+            "validated": self.validated,
+            "failed": self.failed,
+            "failures": dict(self.failures),
+            "latency": self.latency.to_json(),
+            "size": self.size.to_json(),
+        }
+
+
+class ValidationMetrics:
+    """Metrics recorded by the instrumented functions of the package while
+    metrics are enabled.
+
+    Message types are recorded as ``None`` if the body had no valid type or
+    its type is unknown to the specification. Validators created for custom
+    schemas with `create_validator_for_schema()` record their bodies with the
+    ``schema`` kind, and with the resource path of the schema as the type if
+    the schema is one of the schemas of the specification.
+    """
+
+    measure_size: bool
+    """Whether the sizes of the validated message bodies are measured. This
+    requires encoding each body into JSON, which is roughly as expensive as
+    the validation itself.
+    """
+
+    profile: bool
+    """Whether the time spent on validating the top-level properties of each
+    message body is measured separately. This requires validating each
+    property again against its own subschema, so it should be used only when
+    profiling.
+    """
+
+    types: dict[tuple[str, str | None], TypeMetrics]
+    """Metrics of the validated message bodies, keyed by kind and type."""
+
+    schema_loads: dict[str, float]
+    """Time spent on loading and resolving each schema resource, in seconds."""
+
+    schema_compilations: dict[str, float]
+    """Time spent on compiling the validator of each schema resource, in
+    seconds.
+    """
+
+    subtrees: dict[tuple[str, str | None, str], list[float]]
+    """Number of validations and total time spent on validating individual
+    subtrees of message bodies in profiling mode, keyed by kind, type and the
+    path of the subtree in the schema of the message type.
+    """
+
+    def __init__(self, *, measure_size: bool = False, profile: bool = False):
+        self.measure_size = measure_size
+        self.profile = profile
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears all the recorded metrics."""
+        with self._lock:
+            self.types = defaultdict(TypeMetrics)
+            self.schema_loads = {}
+            self.schema_compilations = {}
+            self.subtrees = defaultdict(lambda: [0, 0.0])
+
+    def record_validation(
+        self,
+        kind: str,
+        message_type: str | None,
+        elapsed: float,
+        *,
+        obj: Any = None,
+        rule: str | None = None,
+        failed: bool = False,
+    ) -> None:
+        """Records the validation of a single message body.
+
+        Parameters:
+            kind: the kind of the message body
+            message_type: the type of the message body
+            elapsed: the time spent on the validation, in seconds
+            obj: the validated message body; used for measuring its size
+            rule: the JSON schema rule that the body violated, if known
+            failed: whether the body failed the validation
+        """
+        size = _get_json_size(obj) if self.measure_size else None
+        with self._lock:
+            metrics = self.types[kind, message_type]
+            if failed:
+                metrics.failed += 1
+                metrics.failures[rule or "unknown"] += 1
+            else:
+                metrics.validated += 1
+            metrics.latency.observe(elapsed)
+            if size is not None:
+                metrics.size.observe(size)
+
+    def record_schema_load(self, resource: str, elapsed: float) -> None:
+        """Records the time spent on loading a schema resource."""
+        with self._lock:
+            self.schema_loads[resource] = elapsed
+
+    def record_schema_compilation(self, resource: str, elapsed: float) -> None:
+        """Records the time spent on compiling the validator of a schema
+        resource.
+        """
+        with self._lock:
+            self.schema_compilations[resource] = elapsed
+
+    def record_subtree(
+        self, kind: str, message_type: str | None, path: str, elapsed: float
+    ) -> None:
+        """Records the time spent on validating a subtree of a message body in
+        profiling mode.
+        """
+        with self._lock:
+            entry = self.subtrees[kind, message_type, path]
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns a JSON-compatible snapshot of the recorded metrics."""
+        with self._lock:
+            return {
+                "types": {
+                    _format_key(kind, message_type): metrics.to_json()
+                    for (kind, message_type), metrics in self.types.items()
+                },
+                "schema_loads": dict(self.schema_loads),
+                "schema_compilations": dict(self.schema_compilations),
+                "subtrees": {
+                    f"{_format_key(kind, message_type)}:{path}": {
+                        "count": count,
+                        "seconds": seconds,
+                    }
+                    for (kind, message_type, path), (
+                        count,
+                        seconds,
+                    ) in self.subtrees.items()
+                },
+            }
+
+    def to_prometheus(self, prefix: str = "flockwave_spec") -> str:
+        """Returns the recorded metrics in the text exposition format of
+        Prometheus.
+
+        Parameters:
+            prefix: prefix of the names of the exported metrics
+        """
+        with self._lock:
+            writer = _PrometheusWriter(prefix)
+            writer.write_type_metrics(self.types)
+            writer.write_schema_timings("schema_load_seconds", self.schema_loads)
+            writer.write_schema_timings(
+                "schema_compilation_seconds", self.schema_compilations
+            )
+            writer.write_subtrees(self.subtrees)
+            return writer.getvalue()
+
+
+def disable_metrics() -> None:
+    """Disables the recording of validation metrics."""
+    global _current
+    _current = None
+
+
+def enable_metrics(
+    *, measure_size: bool = False, profile: bool = False
+) -> ValidationMetrics:
+    """Enables the recording of validation metrics.
+
+    Parameters:
+        measure_size: whether to measure the sizes of the validated message
+            bodies; see `ValidationMetrics.measure_size`
+        profile: whether to measure the time spent on validating the
+            top-level properties of each message body; see
+            `ValidationMetrics.profile`
+
+    Returns:
+        the object that the metrics will be recorded into. Calling this
+        function again replaces the object with a new one.
+    """
+    global _current
+    _current = ValidationMetrics(measure_size=measure_size, profile=profile)
+    return _current
+
+
+def get_metrics() -> ValidationMetrics | None:
+    """Returns the object that validation metrics are being recorded into,
+    or ``None`` if metrics are disabled.
+    """
+    return _current
+
+
+class _PrometheusWriter:
+    """Helper object that formats metrics in the text exposition format of
+    Prometheus.
+    """
+
+    def __init__(self, prefix: str):
+        self._prefix = prefix
+        self._lines: list[str] = []
+
+    def getvalue(self) -> str:
+        return "".join(line + "\n" for line in self._lines)
+
+    def write_header(self, name: str, metric_type: str, description: str) -> str:
+        name = f"{self._prefix}_{name}"
+        self._lines.append(f"# HELP {name} {description}")
+        self._lines.append(f"# TYPE {name} {metric_type}")
+        return name
+
+    def write_sample(self, name: str, labels: dict[str, Any], value: float) -> None:
+        formatted = ",".join(
+            f'{key}="{_escape_label_value(value)}"' for key, value in labels.items()
+        )
+        self._lines.append(f"{name}{{{formatted}}} {value!r}")
+
+    def write_histogram(
+        self, name: str, labels: dict[str, Any], histogram: Histogram
+    ) -> None:
+        cumulative = 0
+        for bound, count in zip(
+            (*histogram.buckets, "+Inf"), histogram.counts, strict=True
+        ):
+            cumulative += count
+            self.write_sample(f"{name}_bucket", {**labels, "le": bound}, cumulative)
+        self.write_sample(f"{name}_sum", labels, histogram.sum)
+        self.write_sample(f"{name}_count", labels, histogram.count)
+
+    def write_type_metrics(
+        self, types: dict[tuple[str, str | None], TypeMetrics]
+    ) -> None:
+        items = [
+            ({"kind": kind, "type": message_type or ""}, metrics)
+            for (kind, message_type), metrics in types.items()
+        ]
+
+        name = self.write_header(
+            "validations_total", "counter", "Number of validated message bodies."
+        )
+        for labels, metrics in items:
+            self.write_sample(name, {**labels, "result": "ok"}, metrics.validated)
+            self.write_sample(name, {**labels, "result": "failed"}, metrics.failed)
+
+        name = self.write_header(
+            "validation_failures_total",
+            "counter",
+            "Number of validation failures by violated schema rule.",
+        )
+        for labels, metrics in items:
+            for rule, count in metrics.failures.items():
+                self.write_sample(name, {**labels, "rule": rule}, count)
+
+        name = self.write_header(
+            "validation_seconds",
+            "histogram",
+            "Time spent on validating a message body.",
+        )
+        for labels, metrics in items:
+            self.write_histogram(name, labels, metrics.latency)
+
+        name = self.write_header(
+            "validation_payload_bytes",
+            "histogram",
+            "Size of validated message bodies in compact JSON.",
+        )
+        for labels, metrics in items:
+            if metrics.size.count:
+                self.write_histogram(name, labels, metrics.size)
+
+    def write_schema_timings(self, name: str, timings: dict[str, float]) -> None:
+        name = self.write_header(
+            name, "gauge", "Time spent on preparing a schema resource."
+        )
+        for resource, elapsed in timings.items():
+            self.write_sample(name, {"resource": resource}, elapsed)
+
+    def write_subtrees(
+        self, subtrees: dict[tuple[str, str | None, str], list[float]]
+    ) -> None:
+        name = self.write_header(
+            "validation_subtree_seconds_total",
+            "counter",
+            "Time spent on validating subtrees of message bodies when profiling.",
+        )
+        for (kind, message_type, path), (_count, seconds) in subtrees.items():
+            labels = {"kind": kind, "type": message_type or "", "path": path}
+            self.write_sample(name, labels, seconds)
+
+
+def _escape_label_value(value: Any) -> str:
+    """Escapes a label value for the Prometheus text exposition format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_key(kind: str, message_type: str | None) -> str:
+    """Formats the key of a message type in snapshots."""
+    return f"{kind}/{message_type}" if message_type is not None else kind
+
+
+def _get_json_size(obj: Any) -> int | None:
+    """Returns the size of the compact JSON representation of an object in
+    bytes, or ``None`` if the object cannot be encoded into JSON.
+    """
+    try:
+        encoded = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    return len(encoded.encode("utf-8"))
@@ -0,0 +1,14348 @@
+# Generated by etc/scripts/generate_models.py. Do not edit.
+# ruff: noqa: C901
+
+"""Model classes for the complex objects and message bodies of the Flockwave
+protocol.
+
+Each class has a ``from_json()`` class method that builds an instance from
+the JSON representation of the object and checks the types of the values
+while doing so, and a ``to_json()`` method that converts the instance back
+to its JSON representation.
+
+``from_json()`` checks the types of the values, the presence of required
+properties, constant and enum values and the absence of unknown properties
+where the schema forbids them. Other constraints of the schema (numeric
+ranges, string patterns and lengths) are not checked; use the validators in
+`flockwave.spec.validator` for a full validation. Unknown properties are
+dropped when the schema allows them.
+
+Optional properties that are missing from the JSON representation are set
+to ``None`` and are omitted from the JSON representation again when the
+instance is converted back. Optional items at the end of tuples are handled
+the same way. When the schema allows ``null`` for an optional property or
+tuple item, a missing value is represented by the private ``_MISSING``
+sentinel instead so explicit ``null`` values survive a round trip.
+"""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+__all__ = (
+    "BODY_CLASSES",
+    "DecodeError",
+    "decode_body",
+    "AckAckResponse",
+    "AckNakResponse",
+    "AntennaInformation",
+    "AsyncCancelRequest",
+    "AsyncCancelResponse",
+    "AsyncRespNotification",
+    "AsyncResumeRequest",
+    "AsyncResumeResponse",
+    "AsyncStNotification",
+    "AsyncTimeoutNotification",
+    "Attitude",
+    "AuthInfRequest",
+    "AuthInfResponse",
+    "AuthReqRequest",
+    "AuthRespMultiStepResponse",
+    "AuthRespSingleStepResponse",
+    "AuthWhoamiRequest",
+    "AuthWhoamiResponse",
+    "BatteryInfo",
+    "BcnInfRequest",
+    "BcnInfResponse",
+    "BcnPropsRequest",
+    "BcnPropsResponse",
+    "BeaconBasicProperties",
+    "BeaconStatusInfo",
+    "ClkInfRequest",
+    "ClkInfResponse",
+    "ClkListRequest",
+    "ClkListResponse",
+    "ClockInfo",
+    "CollectiveRthPlanStatEntry",
+    "CommandExecutionStatus",
+    "CommandResponse",
+    "ConnDelNotification",
+    "ConnInfRequest",
+    "ConnInfResponse",
+    "ConnListRequest",
+    "ConnListResponse",
+    "ConnectionInfo",
+    "DevInfRequest",
+    "DevInfResponse",
+    "DevListRequest",
+    "DevListResponse",
+    "DevListsubRequest",
+    "DevListsubResponse",
+    "DevSubRequest",
+    "DevSubResponse",
+    "DevUnsubRequest",
+    "DevUnsubResponse",
+    "DeviceTreeNode",
+    "DockInfRequest",
+    "DockInfResponse",
+    "DockStatusInfo",
+    "DroneLightsConfiguration",
+    "DroneShowConfiguration",
+    "ECEFCoordinate",
+    "ExtCfgRequest",
+    "ExtCfgResponse",
+    "ExtInfRequest",
+    "ExtInfResponse",
+    "ExtListRequest",
+    "ExtListResponse",
+    "ExtLoadRequest",
+    "ExtLoadResponse",
+    "ExtReloadRequest",
+    "ExtReloadResponse",
+    "ExtSetcfgRequest",
+    "ExtSetcfgResponse",
+    "ExtUnloadRequest",
+    "ExtUnloadResponse",
+    "ExtensionInfo",
+    "FirmwareUpdateTarget",
+    "FlightLog",
+    "FlightLogMetadata",
+    "FwObjectListRequest",
+    "FwObjectListResponse",
+    "FwTargetInfRequest",
+    "FwTargetInfResponse",
+    "FwTargetListRequest",
+    "FwTargetListResponse",
+    "FwUploadRequest",
+    "FwUploadResponse",
+    "GPSCoordinate",
+    "GPSFix",
+    "LcnInfRequest",
+    "LcnInfResponse",
+    "License",
+    "LicenseFeature",
+    "LicenseRestriction",
+    "LogDataRequest",
+    "LogDataResponse",
+    "LogInfRequest",
+    "LogInfResponse",
+    "LogMessage",
+    "MagneticVector",
+    "MessageObservations",
+    "ObjCmdRequest",
+    "ObjCmdResponse",
+    "ObjDelNotification",
+    "ObjListRequest",
+    "ObjListResponse",
+    "PositionXYZ",
+    "PreflightCheckInfo",
+    "PreflightCheckItem",
+    "PrmGetRequest",
+    "PrmGetResponse",
+    "PrmSetManyRequest",
+    "PrmSetManyResponse",
+    "PrmSetManyResponseResultItem",
+    "PrmSetRequest",
+    "PrmSetResponse",
+    "Progress",
+    "RTHTransformationParameters",
+    "RTKConfigurationPreset",
+    "RTKSurveySettings",
+    "RtkInfRequest",
+    "RtkInfResponse",
+    "RtkListRequest",
+    "RtkListResponse",
+    "RtkSourceRequest",
+    "RtkSourceResponse",
+    "RtkStatRequest",
+    "RtkStatResponse",
+    "RtkSurveyRequest",
+    "RtkSurveyResponse",
+    "ShiftTransformationParameters",
+    "ShowAdaptRequest",
+    "ShowAdaptRequestEnvironment",
+    "ShowAdaptRequestEnvironmentLocation",
+    "ShowAdaptResponse",
+    "ShowCfgRequest",
+    "ShowCfgResponse",
+    "ShowCrthPlanRequest",
+    "ShowCrthPlanResponse",
+    "ShowCrthStartRequest",
+    "ShowCrthStartResponse",
+    "ShowLightsRequest",
+    "ShowLightsResponse",
+    "ShowResumeRequest",
+    "ShowResumeResponse",
+    "ShowSetcfgRequest",
+    "ShowSetlightsRequest",
+    "ShowSuspendRequest",
+    "ShowSuspendResponse",
+    "StartConditions",
+    "SurveyStatus",
+    "SysCloseNotification",
+    "SysMsgNotification",
+    "SysPingRequest",
+    "SysPortsRequest",
+    "SysPortsResponse",
+    "SysTimeRequest",
+    "SysTimeResponse",
+    "SysVerRequest",
+    "SysVerResponse",
+    "TakeoffTransformationParameters",
+    "TimeAxisScheduleSegment",
+    "TimeSyncSnapshot",
+    "TimesyncStatusNotification",
+    "TimesyncStatusRequest",
+    "TimesyncStatusResponse",
+    "TransportOptions",
+    "UAVStatusInfo",
+    "UavCalibRequest",
+    "UavCalibResponse",
+    "UavFlyRequest",
+    "UavFlyResponse",
+    "UavHaltRequest",
+    "UavHaltResponse",
+    "UavHoverRequest",
+    "UavHoverResponse",
+    "UavInfRequest",
+    "UavInfResponse",
+    "UavLandRequest",
+    "UavLandResponse",
+    "UavListRequest",
+    "UavListResponse",
+    "UavMotorRequest",
+    "UavMotorResponse",
+    "UavPrefltRequest",
+    "UavPrefltResponse",
+    "UavRstRequest",
+    "UavRstResponse",
+    "UavRthRequest",
+    "UavRthResponse",
+    "UavSignalRequest",
+    "UavSignalResponse",
+    "UavSleepRequest",
+    "UavSleepResponse",
+    "UavTakeoffRequest",
+    "UavTakeoffResponse",
+    "UavTestRequest",
+    "UavTestResponse",
+    "UavVerRequest",
+    "UavVerResponse",
+    "UavWakeupRequest",
+    "UavWakeupResponse",
+    "VelocityNED",
+    "VelocityXYZ",
+    "Weather",
+    "WthAtRequest",
+    "WthAtResponse",
+    "WthInfRequest",
+    "WthInfResponse",
+    "WthListRequest",
+    "WthListResponse",
+)
+
+
+class DecodeError(ValueError):
+    """Exception raised when a JSON object cannot be converted into an instance
+    of a model class.
+    """
+
+    message: str
+    """Description of the problem."""
+
+    path: list[str]
+    """Path of the offending part of the JSON object, in reverse order."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+        self.path = []
+
+    def __str__(self) -> str:
+        return ".".join(["data", *reversed(self.path)]) + " " + self.message
+
+    def within(self, key: Any) -> "DecodeError":
+        """Prepends the given key to the path of the error and returns the
+        error itself.
+        """
+        self.path.append(str(key))
+        return self
+
+
+class _Missing:
+    """Type of the sentinel that represents missing values of optional
+    properties and tuple items where ``None`` is a valid value.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __reduce__(self) -> str:
+        return "_MISSING"
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+_MISSING = _Missing()
+
+
+class _Model:
+    """Base class of the generated model classes."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({args})"
+
+
+def _is_integral_float(value: Any) -> bool:
+    # Integral floats are integers according to the validators
+    return type(value) is float and value.is_integer()
+
+
+def _decode_list(value: Any, decoder: Any) -> list[Any]:
+    if type(value) is not list:
+        raise DecodeError("must be array")
+    result = []
+    try:
+        for item in value:
+            result.append(decoder(item))
+    except DecodeError as ex:
+        raise ex.within(len(result)) from None
+    return result
+
+
+def _decode_map(value: Any, decoder: Any) -> dict[str, Any]:
+    if type(value) is not dict:
+        raise DecodeError("must be object")
+    key = None
+    try:
+        result = {}
+        for key, item in value.items():
+            result[key] = decoder(item)
+        return result
+    except DecodeError as ex:
+        raise ex.within(key) from None
+
+
+def _missing_properties(obj: dict[str, Any], required: frozenset[str]) -> DecodeError:
+    missing = sorted(required - obj.keys())
+    return DecodeError(f"must contain {missing} properties")
+
+
+def _unknown_properties(obj: dict[str, Any], known: frozenset[str]) -> DecodeError:
+    unknown = sorted(obj.keys() - known)
+    return DecodeError(f"must not contain {unknown} properties")
+
+
+_ENUM_0 = ("none", "live", "rehearsal", "lights")
+_ENUM_1 = ("read", "write")
+_ENUM_2 = (
+    "audio",
+    "boolean",
+    "bytes",
+    "cartesian",
+    "color",
+    "duration",
+    "gps",
+    "number",
+    "object",
+    "string",
+    "time",
+    "video",
+)
+_ENUM_3 = ("debug", "dock", "dgps", "gps", "time", "uavRadioLink", "mocap", "other")
+_ENUM_4 = ("disconnected", "connecting", "connected", "disconnecting", "unknown")
+_ENUM_5 = (
+    "accelerometer",
+    "actuator",
+    "altimeter",
+    "battery",
+    "camera",
+    "cpu",
+    "cpuCore",
+    "gps",
+    "group",
+    "gyroscope",
+    "led",
+    "magnetometer",
+    "microphone",
+    "misc",
+    "pyro",
+    "radio",
+    "rangefinder",
+    "rc",
+    "rotor",
+    "sensor",
+    "speaker",
+    "sprayer",
+)
+_ENUM_6 = ("root", "object", "device", "channel")
+_ENUM_7 = ("rc", "auto")
+_ENUM_8 = ("debug", "info", "warning", "error", "critical")
+_ENUM_9 = ("off", "pass", "warning", "running", "softFailure", "failure", "error")
+_ENUM_10 = ("plain", "smart")
+_ENUM_11 = ("builtin", "dynamic", "user")
+_ENUM_12 = ("auto", "rtcm2", "rtcm3", "ubx")
+_ENUM_13 = ("msm4", "msm7")
+_ENUM_14 = ("gps", "glonass", "galileo", "sbas", "qzss", "beidou", "irnss")
+_ENUM_15 = ("layered", "organic")
+_ENUM_16 = ("unknown", "sync", "unsync", "error")
+_ENUM_17 = ("preparation", "rth", "show", "slowdown", "speedup")
+
+
+class AckAckResponse(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "ACK-ACK") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AckAckResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "ACK-ACK":
+                raise DecodeError("must be equal to 'ACK-ACK'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class AckNakResponse(_Model):
+    __slots__ = ("type", "reason")
+
+    type: str
+
+    reason: str | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("reason", "type"))
+
+    def __init__(self, type: str = "ACK-NAK", reason: str | None = None) -> None:
+        self.type = type
+        self.reason = reason
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AckNakResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "ACK-NAK":
+                raise DecodeError("must be equal to 'ACK-NAK'")
+            self.type = value
+            key = "reason"
+            value = obj.get("reason")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "reason" in obj:
+                raise DecodeError("must not be null")
+            self.reason = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.reason
+        if value is not None:
+            result["reason"] = value
+        return result
+
+
+class AntennaInformation(_Model):
+    """RTK antenna info.
+
+    Information about an RTK antenna.
+    """
+
+    __slots__ = (
+        "station_id",
+        "descriptor",
+        "serial_number",
+        "position",
+        "position_ecef",
+    )
+
+    station_id: float | None
+    """Station ID."""
+
+    descriptor: str | None
+    """Antenna descriptor."""
+
+    serial_number: str | None
+    """Serial number."""
+
+    position: GPSCoordinate | None
+    """GPS coordinate of an object."""
+
+    position_ecef: ECEFCoordinate | None
+    """Earth-centered Earth-fixed coordinate of an object."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(())
+
+    def __init__(
+        self,
+        station_id: float | None = None,
+        descriptor: str | None = None,
+        serial_number: str | None = None,
+        position: GPSCoordinate | None = None,
+        position_ecef: ECEFCoordinate | None = None,
+    ) -> None:
+        self.station_id = station_id
+        self.descriptor = descriptor
+        self.serial_number = serial_number
+        self.position = position
+        self.position_ecef = position_ecef
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AntennaInformation:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "stationId"
+            value = obj.get("stationId")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "stationId" in obj:
+                raise DecodeError("must not be null")
+            self.station_id = value
+            key = "descriptor"
+            value = obj.get("descriptor")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "descriptor" in obj:
+                raise DecodeError("must not be null")
+            self.descriptor = value
+            key = "serialNumber"
+            value = obj.get("serialNumber")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "serialNumber" in obj:
+                raise DecodeError("must not be null")
+            self.serial_number = value
+            key = "position"
+            value = obj.get("position")
+            if value is not None:
+                value = GPSCoordinate.from_json(value)
+            elif "position" in obj:
+                raise DecodeError("must not be null")
+            self.position = value
+            key = "positionECEF"
+            value = obj.get("positionECEF")
+            if value is not None:
+                value = ECEFCoordinate.from_json(value)
+            elif "positionECEF" in obj:
+                raise DecodeError("must not be null")
+            self.position_ecef = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {}
+        value = self.station_id
+        if value is not None:
+            result["stationId"] = value
+        value = self.descriptor
+        if value is not None:
+            result["descriptor"] = value
+        value = self.serial_number
+        if value is not None:
+            result["serialNumber"] = value
+        value = self.position
+        if value is not None:
+            result["position"] = value.to_json()
+        value = self.position_ecef
+        if value is not None:
+            result["positionECEF"] = value.to_json()
+        return result
+
+
+class AsyncCancelRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the receipts that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "ASYNC-CANCEL") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AsyncCancelRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "ASYNC-CANCEL":
+                raise DecodeError("must be equal to 'ASYNC-CANCEL'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class AsyncCancelResponse(_Model):
+    __slots__ = ("type", "success", "error")
+
+    type: str
+
+    success: list[str] | None
+    """IDs of the receipts that the message refers to."""
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "success", "type"))
+
+    def __init__(
+        self,
+        type: str = "ASYNC-CANCEL",
+        success: list[str] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.success = success
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AsyncCancelResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "ASYNC-CANCEL":
+                raise DecodeError("must be equal to 'ASYNC-CANCEL'")
+            self.type = value
+            key = "success"
+            value = obj.get("success")
+            if value is not None:
+                value = _decode_list(value, _decode_1)
+            elif "success" in obj:
+                raise DecodeError("must not be null")
+            self.success = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.success
+        if value is not None:
+            result["success"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class AsyncRespNotification(_Model):
+    __slots__ = ("type", "id", "error", "result")
+
+    type: str
+
+    id: str
+    """Identifier of the receipt."""
+
+    error: str | None
+
+    result: Any | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "type"))
+
+    def __init__(
+        self,
+        id: str,
+        type: str = "ASYNC-RESP",
+        error: str | None = None,
+        result: Any | None = None,
+    ) -> None:
+        self.type = type
+        self.id = id
+        self.error = error
+        self.result = result
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AsyncRespNotification:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "ASYNC-RESP":
+                raise DecodeError("must be equal to 'ASYNC-RESP'")
+            self.type = value
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "result"
+            value = obj.get("result")
+            self.result = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "id": self.id}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        return result
+
+
+class AsyncResumeRequest(_Model):
+    __slots__ = ("type", "ids", "values")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the receipts that the message refers to."""
+
+    values: dict[str, Any] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        type: str = "ASYNC-RESUME",
+        values: dict[str, Any] | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.values = values
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AsyncResumeRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "ASYNC-RESUME":
+                raise DecodeError("must be equal to 'ASYNC-RESUME'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "values"
+            value = obj.get("values")
+            if value is not None:
+                if type(value) is not dict:
+                    raise DecodeError("must be object")
+            elif "values" in obj:
+                raise DecodeError("must not be null")
+            self.values = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "ids": self.ids}
+        value = self.values
+        if value is not None:
+            result["values"] = value
+        return result
+
+
+class AsyncResumeResponse(_Model):
+    __slots__ = ("type", "success", "error")
+
+    type: str
+
+    success: list[str] | None
+    """IDs of the receipts that the message refers to."""
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "success", "type"))
+
+    def __init__(
+        self,
+        type: str = "ASYNC-RESUME",
+        success: list[str] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.success = success
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AsyncResumeResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "ASYNC-RESUME":
+                raise DecodeError("must be equal to 'ASYNC-RESUME'")
+            self.type = value
+            key = "success"
+            value = obj.get("success")
+            if value is not None:
+                value = _decode_list(value, _decode_1)
+            elif "success" in obj:
+                raise DecodeError("must not be null")
+            self.success = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.success
+        if value is not None:
+            result["success"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class AsyncStNotification(_Model):
+    __slots__ = ("type", "id", "progress", "suspended")
+
+    type: str
+
+    id: str
+    """Identifier of the receipt."""
+
+    progress: Progress
+    """Progress of some operation being executed on a UAV."""
+
+    suspended: bool | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "progress", "type"))
+
+    def __init__(
+        self,
+        id: str,
+        progress: Progress,
+        type: str = "ASYNC-ST",
+        suspended: bool | None = None,
+    ) -> None:
+        self.type = type
+        self.id = id
+        self.progress = progress
+        self.suspended = suspended
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AsyncStNotification:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "ASYNC-ST":
+                raise DecodeError("must be equal to 'ASYNC-ST'")
+            self.type = value
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "progress"
+            value = obj["progress"]
+            value = Progress.from_json(value)
+            self.progress = value
+            key = "suspended"
+            value = obj.get("suspended")
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            elif "suspended" in obj:
+                raise DecodeError("must not be null")
+            self.suspended = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "type": self.type,
+            "id": self.id,
+            "progress": self.progress.to_json(),
+        }
+        value = self.suspended
+        if value is not None:
+            result["suspended"] = value
+        return result
+
+
+class AsyncTimeoutNotification(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the receipts that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "ASYNC-TIMEOUT") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AsyncTimeoutNotification:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "ASYNC-TIMEOUT":
+                raise DecodeError("must be equal to 'ASYNC-TIMEOUT'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class Attitude(_Model):
+    """Attitude.
+
+    Attitude around the principal aircraft axes.
+    """
+
+    __slots__ = ("roll_angle", "pitch_angle", "yaw_angle")
+
+    roll_angle: int
+    """Roll angle, in 1/10th of degrees."""
+
+    pitch_angle: int
+    """Pitch angle, in 1/10th of degrees."""
+
+    yaw_angle: int
+    """Yaw angle, in 1/10th of degrees."""
+
+    MIN_ITEMS: ClassVar[int] = 3
+
+    def __init__(self, roll_angle: int, pitch_angle: int, yaw_angle: int) -> None:
+        self.roll_angle = roll_angle
+        self.pitch_angle = pitch_angle
+        self.yaw_angle = yaw_angle
+
+    @classmethod
+    def from_json(cls, obj: Any) -> Attitude:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not list:
+            raise DecodeError("must be array")
+        length = len(obj)
+        if length < cls.MIN_ITEMS:
+            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")
+        self = object.__new__(cls)
+        key = 0
+        try:
+            key = 0
+            value = obj[0]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.roll_angle = value
+            key = 1
+            value = obj[1]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.pitch_angle = value
+            key = 2
+            value = obj[2]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.yaw_angle = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> list[Any]:
+        """Returns the JSON representation of this instance."""
+        result = [self.roll_angle, self.pitch_angle, self.yaw_angle]
+        return result
+
+
+class AuthInfRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "AUTH-INF") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AuthInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "AUTH-INF":
+                raise DecodeError("must be equal to 'AUTH-INF'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class AuthInfResponse(_Model):
+    __slots__ = ("type", "methods", "required")
+
+    type: str
+
+    methods: list[str]
+
+    required: bool
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("methods", "required", "type"))
+
+    def __init__(
+        self,
+        methods: list[str],
+        required: bool,
+        type: str = "AUTH-INF",
+    ) -> None:
+        self.type = type
+        self.methods = methods
+        self.required = required
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AuthInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "AUTH-INF":
+                raise DecodeError("must be equal to 'AUTH-INF'")
+            self.type = value
+            key = "methods"
+            value = obj["methods"]
+            value = _decode_list(value, _decode_1)
+            self.methods = value
+            key = "required"
+            value = obj["required"]
+            if type(value) is not bool:
+                raise DecodeError("must be boolean")
+            self.required = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "methods": self.methods, "required": self.required}
+
+
+class AuthReqRequest(_Model):
+    __slots__ = ("type", "method", "session", "data")
+
+    type: str
+
+    method: str
+    """Name of the authentication method to use."""
+
+    session: int | None
+    """Session ID for multi-step authentication methods."""
+
+    data: str
+    """Data to send to the authentication method."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("data", "method", "type"))
+
+    def __init__(
+        self,
+        method: str,
+        data: str,
+        type: str = "AUTH-REQ",
+        session: int | None = None,
+    ) -> None:
+        self.type = type
+        self.method = method
+        self.session = session
+        self.data = data
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AuthReqRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "AUTH-REQ":
+                raise DecodeError("must be equal to 'AUTH-REQ'")
+            self.type = value
+            key = "method"
+            value = obj["method"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.method = value
+            key = "session"
+            value = obj.get("session")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "session" in obj:
+                raise DecodeError("must not be null")
+            self.session = value
+            key = "data"
+            value = obj["data"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.data = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "type": self.type,
+            "method": self.method,
+            "data": self.data,
+        }
+        value = self.session
+        if value is not None:
+            result["session"] = value
+        return result
+
+
+class AuthRespMultiStepResponse(_Model):
+    __slots__ = ("type", "data")
+
+    type: str
+
+    data: str
+    """Data to send to the client that is to be used in the next step of multi-step
+    authentication methods.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("data", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("data", "type"))
+
+    def __init__(self, data: str, type: str = "AUTH-RESP") -> None:
+        self.type = type
+        self.data = data
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AuthRespMultiStepResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "AUTH-RESP":
+                raise DecodeError("must be equal to 'AUTH-RESP'")
+            self.type = value
+            key = "data"
+            value = obj["data"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.data = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "data": self.data}
+
+
+class AuthRespSingleStepResponse(_Model):
+    __slots__ = ("type", "result", "reason", "user")
+
+    type: str
+
+    result: bool
+    """Result of the authentication."""
+
+    reason: str | None
+    """Explains why the authentication attempt failed."""
+
+    user: str | None
+    """Name of the user."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("result", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("reason", "result", "type", "user"))
+
+    def __init__(
+        self,
+        result: bool,
+        type: str = "AUTH-RESP",
+        reason: str | None = None,
+        user: str | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.reason = reason
+        self.user = user
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AuthRespSingleStepResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "AUTH-RESP":
+                raise DecodeError("must be equal to 'AUTH-RESP'")
+            self.type = value
+            key = "result"
+            value = obj["result"]
+            if type(value) is not bool:
+                raise DecodeError("must be boolean")
+            self.result = value
+            key = "reason"
+            value = obj.get("reason")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "reason" in obj:
+                raise DecodeError("must not be null")
+            self.reason = value
+            key = "user"
+            value = obj.get("user")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "user" in obj:
+                raise DecodeError("must not be null")
+            self.user = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "result": self.result}
+        value = self.reason
+        if value is not None:
+            result["reason"] = value
+        value = self.user
+        if value is not None:
+            result["user"] = value
+        return result
+
+
+class AuthWhoamiRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "AUTH-WHOAMI") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AuthWhoamiRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "AUTH-WHOAMI":
+                raise DecodeError("must be equal to 'AUTH-WHOAMI'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class AuthWhoamiResponse(_Model):
+    __slots__ = ("type", "user")
+
+    type: str
+
+    user: str
+    """Name of the user."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type", "user"))
+
+    def __init__(self, user: str, type: str = "AUTH-WHOAMI") -> None:
+        self.type = type
+        self.user = user
+
+    @classmethod
+    def from_json(cls, obj: Any) -> AuthWhoamiResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "AUTH-WHOAMI":
+                raise DecodeError("must be equal to 'AUTH-WHOAMI'")
+            self.type = value
+            key = "user"
+            value = obj["user"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.user = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "user": self.user}
+
+
+class BatteryInfo(_Model):
+    """Battery information.
+
+    Information about the on-board battery of the UAV, if applicable.
+    """
+
+    __slots__ = ("battery_voltage", "state_of_charge", "charging")
+
+    battery_voltage: int
+    """The voltage of the battery, in 1/10th of volts."""
+
+    state_of_charge: int | None
+    """Percentage indicator of the state of charge of the battery (100% = full, 0% =
+    empty, -1 = unknown).
+    """
+
+    charging: bool | None
+    """Whether the battery is charging."""
+
+    MIN_ITEMS: ClassVar[int] = 1
+
+    def __init__(
+        self,
+        battery_voltage: int,
+        state_of_charge: int | None = None,
+        charging: bool | None = None,
+    ) -> None:
+        self.battery_voltage = battery_voltage
+        self.state_of_charge = state_of_charge
+        self.charging = charging
+
+    @classmethod
+    def from_json(cls, obj: Any) -> BatteryInfo:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not list:
+            raise DecodeError("must be array")
+        length = len(obj)
+        if length < cls.MIN_ITEMS:
+            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")
+        self = object.__new__(cls)
+        key = 0
+        try:
+            key = 0
+            value = obj[0]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.battery_voltage = value
+            key = 1
+            value = obj[1] if length > 1 else None
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.state_of_charge = value
+            key = 2
+            value = obj[2] if length > 2 else None
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            self.charging = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> list[Any]:
+        """Returns the JSON representation of this instance."""
+        result = [self.battery_voltage, self.state_of_charge, self.charging]
+        while len(result) > 1 and result[-1] is None:
+            result.pop()
+        return result
+
+
+class BcnInfRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the beacons that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "BCN-INF") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> BcnInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "BCN-INF":
+                raise DecodeError("must be equal to 'BCN-INF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class BcnInfResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, BeaconStatusInfo] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "BCN-INF",
+        status: dict[str, BeaconStatusInfo] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> BcnInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "BCN-INF":
+                raise DecodeError("must be equal to 'BCN-INF'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, BeaconStatusInfo.from_json)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class BcnPropsRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the beacons that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "BCN-PROPS") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> BcnPropsRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "BCN-PROPS":
+                raise DecodeError("must be equal to 'BCN-PROPS'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class BcnPropsResponse(_Model):
+    __slots__ = ("type", "receipt", "error", "result")
+
+    type: str
+
+    receipt: dict[str, str] | None
+
+    error: dict[str, str] | None
+
+    result: dict[str, BeaconBasicProperties] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "BCN-PROPS",
+        receipt: dict[str, str] | None = None,
+        error: dict[str, str] | None = None,
+        result: dict[str, BeaconBasicProperties] | None = None,
+    ) -> None:
+        self.type = type
+        self.receipt = receipt
+        self.error = error
+        self.result = result
+
+    @classmethod
+    def from_json(cls, obj: Any) -> BcnPropsResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "BCN-PROPS":
+                raise DecodeError("must be equal to 'BCN-PROPS'")
+            self.type = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, BeaconBasicProperties.from_json)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.result
+        if value is not None:
+            result["result"] = {key: item.to_json() for key, item in value.items()}
+        return result
+
+
+class BeaconBasicProperties(_Model):
+    """Beacon basic properties.
+
+    Basic information of a single beacon that is unlikely to change over time.
+    """
+
+    __slots__ = ("id", "name")
+
+    id: str
+    """Identifier of a single object."""
+
+    name: str
+    """The human-readable name of the beacon, shown on the UI."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "name"))
+
+    def __init__(self, id: str, name: str) -> None:
+        self.id = id
+        self.name = name
+
+    @classmethod
+    def from_json(cls, obj: Any) -> BeaconBasicProperties:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "name"
+            value = obj["name"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.name = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"id": self.id, "name": self.name}
+
+
+class BeaconStatusInfo(_Model):
+    """Beacon status info.
+
+    Status information of a single beacon.
+    """
+
+    __slots__ = ("id", "active", "heading", "position", "timestamp")
+
+    id: str
+    """Identifier of a single object."""
+
+    active: bool | None
+    """Whether the beacon is currently active (operational). May be omitted for passive
+    beacons or points of interest.
+    """
+
+    heading: int | None
+    """The heading of the beacon in the local tangent plane, in 1/10th of degrees, if
+    known.
+    """
+
+    position: GPSCoordinate | None
+    """GPS coordinate of an object."""
+
+    timestamp: float
+    """Timestamp that denotes when the status of the beacon was updated the last time.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "timestamp"))
+
+    def __init__(
+        self,
+        id: str,
+        timestamp: float,
+        active: bool | None = None,
+        heading: int | None = None,
+        position: GPSCoordinate | None = None,
+    ) -> None:
+        self.id = id
+        self.active = active
+        self.heading = heading
+        self.position = position
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_json(cls, obj: Any) -> BeaconStatusInfo:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "active"
+            value = obj.get("active")
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            elif "active" in obj:
+                raise DecodeError("must not be null")
+            self.active = value
+            key = "heading"
+            value = obj.get("heading")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "heading" in obj:
+                raise DecodeError("must not be null")
+            self.heading = value
+            key = "position"
+            value = obj.get("position")
+            if value is not None:
+                value = GPSCoordinate.from_json(value)
+            elif "position" in obj:
+                raise DecodeError("must not be null")
+            self.position = value
+            key = "timestamp"
+            value = obj["timestamp"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.timestamp = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"id": self.id, "timestamp": self.timestamp}
+        value = self.active
+        if value is not None:
+            result["active"] = value
+        value = self.heading
+        if value is not None:
+            result["heading"] = value
+        value = self.position
+        if value is not None:
+            result["position"] = value.to_json()
+        return result
+
+
+class ClkInfRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the clocks that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "CLK-INF") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ClkInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "CLK-INF":
+                raise DecodeError("must be equal to 'CLK-INF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ClkInfResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, ClockInfo] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "CLK-INF",
+        status: dict[str, ClockInfo] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ClkInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "CLK-INF":
+                raise DecodeError("must be equal to 'CLK-INF'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, ClockInfo.from_json)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class ClkListRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "CLK-LIST") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ClkListRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "CLK-LIST":
+                raise DecodeError("must be equal to 'CLK-LIST'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class ClkListResponse(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the clocks that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "CLK-LIST") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ClkListResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "CLK-LIST":
+                raise DecodeError("must be equal to 'CLK-LIST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ClockInfo(_Model):
+    """Clock info.
+
+    Information about a clock.
+    """
+
+    __slots__ = ("id", "epoch", "retrieved_at", "running", "ticks_per_second", "ticks")
+
+    id: str
+    """Identifier of a single clock."""
+
+    epoch: Any | None
+
+    retrieved_at: float
+
+    running: bool
+
+    ticks_per_second: float | None
+
+    ticks: float
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(
+        ("id", "retrievedAt", "running", "ticks")
+    )
+
+    def __init__(
+        self,
+        id: str,
+        retrieved_at: float,
+        running: bool,
+        ticks: float,
+        epoch: Any | None = None,
+        ticks_per_second: float | None = None,
+    ) -> None:
+        self.id = id
+        self.epoch = epoch
+        self.retrieved_at = retrieved_at
+        self.running = running
+        self.ticks_per_second = ticks_per_second
+        self.ticks = ticks
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ClockInfo:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "epoch"
+            value = obj.get("epoch")
+            self.epoch = value
+            key = "retrievedAt"
+            value = obj["retrievedAt"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.retrieved_at = value
+            key = "running"
+            value = obj["running"]
+            if type(value) is not bool:
+                raise DecodeError("must be boolean")
+            self.running = value
+            key = "ticksPerSecond"
+            value = obj.get("ticksPerSecond")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "ticksPerSecond" in obj:
+                raise DecodeError("must not be null")
+            self.ticks_per_second = value
+            key = "ticks"
+            value = obj["ticks"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.ticks = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "id": self.id,
+            "retrievedAt": self.retrieved_at,
+            "running": self.running,
+            "ticks": self.ticks,
+        }
+        value = self.epoch
+        if value is not None:
+            result["epoch"] = value
+        value = self.ticks_per_second
+        if value is not None:
+            result["ticksPerSecond"] = value
+        return result
+
+
+class CollectiveRthPlanStatEntry(_Model):
+    """Collective RTH plan statistics entry.
+
+    Statistics about a single collective RTH plan in a show.
+    """
+
+    __slots__ = ("time", "duration", "show_duration")
+
+    time: float
+    """Start time of the collective RTH plan relative to show start, in seconds."""
+
+    duration: float
+    """Duration of the collective RTH operation without landing, in seconds."""
+
+    show_duration: float
+    """Total show duration including collective RTH and landing, in seconds."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("duration", "showDuration", "time"))
+
+    def __init__(self, time: float, duration: float, show_duration: float) -> None:
+        self.time = time
+        self.duration = duration
+        self.show_duration = show_duration
+
+    @classmethod
+    def from_json(cls, obj: Any) -> CollectiveRthPlanStatEntry:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "time"
+            value = obj["time"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.time = value
+            key = "duration"
+            value = obj["duration"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.duration = value
+            key = "showDuration"
+            value = obj["showDuration"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.show_duration = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {
+            "time": self.time,
+            "duration": self.duration,
+            "showDuration": self.show_duration,
+        }
+
+
+class CommandExecutionStatus(_Model):
+    """Command execution status.
+
+    Execution status of a command executed on a UAV.
+    """
+
+    __slots__ = (
+        "id",
+        "created_at",
+        "client_notified",
+        "error",
+        "result",
+        "sent",
+        "finished",
+        "cancelled",
+        "progress",
+    )
+
+    id: str
+    """Identifier of the command execution."""
+
+    created_at: float
+    """Timestamp when the command execution was created."""
+
+    client_notified: float | None
+    """Timestamp when the client was notified about the result."""
+
+    error: str | None
+    """Error message if the command execution failed."""
+
+    result: Any | None
+    """Result of the command execution."""
+
+    sent: float | None
+    """Timestamp when the command was sent to the UAV."""
+
+    finished: float | None
+    """Timestamp when the command execution finished."""
+
+    cancelled: float | None
+    """Timestamp when the command execution was cancelled."""
+
+    progress: Progress | None
+    """Progress of some operation being executed on a UAV."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("created_at", "id"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(
+        [
+            "cancelled",
+            "client_notified",
+            "created_at",
+            "error",
+            "finished",
+            "id",
+            "progress",
+            "result",
+            "sent",
+        ]
+    )
+
+    def __init__(
+        self,
+        id: str,
+        created_at: float,
+        client_notified: float | None = None,
+        error: str | None = None,
+        result: Any | None = None,
+        sent: float | None = None,
+        finished: float | None = None,
+        cancelled: float | None = None,
+        progress: Progress | None = None,
+    ) -> None:
+        self.id = id
+        self.created_at = created_at
+        self.client_notified = client_notified
+        self.error = error
+        self.result = result
+        self.sent = sent
+        self.finished = finished
+        self.cancelled = cancelled
+        self.progress = progress
+
+    @classmethod
+    def from_json(cls, obj: Any) -> CommandExecutionStatus:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "created_at"
+            value = obj["created_at"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.created_at = value
+            key = "client_notified"
+            value = obj.get("client_notified")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "client_notified" in obj:
+                raise DecodeError("must not be null")
+            self.client_notified = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "result"
+            value = obj.get("result")
+            self.result = value
+            key = "sent"
+            value = obj.get("sent")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "sent" in obj:
+                raise DecodeError("must not be null")
+            self.sent = value
+            key = "finished"
+            value = obj.get("finished")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "finished" in obj:
+                raise DecodeError("must not be null")
+            self.finished = value
+            key = "cancelled"
+            value = obj.get("cancelled")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "cancelled" in obj:
+                raise DecodeError("must not be null")
+            self.cancelled = value
+            key = "progress"
+            value = obj.get("progress")
+            if value is not None:
+                value = Progress.from_json(value)
+            elif "progress" in obj:
+                raise DecodeError("must not be null")
+            self.progress = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"id": self.id, "created_at": self.created_at}
+        value = self.client_notified
+        if value is not None:
+            result["client_notified"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.sent
+        if value is not None:
+            result["sent"] = value
+        value = self.finished
+        if value is not None:
+            result["finished"] = value
+        value = self.cancelled
+        if value is not None:
+            result["cancelled"] = value
+        value = self.progress
+        if value is not None:
+            result["progress"] = value.to_json()
+        return result
+
+
+class CommandResponse(_Model):
+    """Command response.
+
+    Response given by a UAV to a command request.
+    """
+
+    __slots__ = ("type", "data")
+
+    type: str
+
+    data: Any
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("data", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("data", "type"))
+
+    def __init__(self, type: str, data: Any) -> None:
+        self.type = type
+        self.data = data
+
+    @classmethod
+    def from_json(cls, obj: Any) -> CommandResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.type = value
+            key = "data"
+            value = obj["data"]
+            self.data = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "data": self.data}
+
+
+class ConnDelNotification(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the connections that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "CONN-DEL") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ConnDelNotification:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "CONN-DEL":
+                raise DecodeError("must be equal to 'CONN-DEL'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ConnInfRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the connections that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "CONN-INF") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ConnInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "CONN-INF":
+                raise DecodeError("must be equal to 'CONN-INF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ConnInfResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, ConnectionInfo] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "CONN-INF",
+        status: dict[str, ConnectionInfo] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ConnInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "CONN-INF":
+                raise DecodeError("must be equal to 'CONN-INF'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, ConnectionInfo.from_json)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class ConnListRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "CONN-LIST") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ConnListRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "CONN-LIST":
+                raise DecodeError("must be equal to 'CONN-LIST'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class ConnListResponse(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the connections that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "CONN-LIST") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ConnListResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "CONN-LIST":
+                raise DecodeError("must be equal to 'CONN-LIST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ConnectionInfo(_Model):
+    """Connection info.
+
+    Information about a connection.
+    """
+
+    __slots__ = ("id", "purpose", "description", "status", "timestamp")
+
+    id: str
+    """Identifier of a single connection."""
+
+    purpose: str
+    """Purpose of the connection."""
+
+    description: str | None
+
+    status: str
+    """Status of the connection."""
+
+    timestamp: float | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "purpose", "status"))
+
+    def __init__(
+        self,
+        id: str,
+        purpose: str,
+        status: str,
+        description: str | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        self.id = id
+        self.purpose = purpose
+        self.description = description
+        self.status = status
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ConnectionInfo:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "purpose"
+            value = obj["purpose"]
+            if value not in _ENUM_3:
+                raise DecodeError(f"must be one of {list(_ENUM_3)}")
+            self.purpose = value
+            key = "description"
+            value = obj.get("description")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "description" in obj:
+                raise DecodeError("must not be null")
+            self.description = value
+            key = "status"
+            value = obj["status"]
+            if value not in _ENUM_4:
+                raise DecodeError(f"must be one of {list(_ENUM_4)}")
+            self.status = value
+            key = "timestamp"
+            value = obj.get("timestamp")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "timestamp" in obj:
+                raise DecodeError("must not be null")
+            self.timestamp = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "id": self.id,
+            "purpose": self.purpose,
+            "status": self.status,
+        }
+        value = self.description
+        if value is not None:
+            result["description"] = value
+        value = self.timestamp
+        if value is not None:
+            result["timestamp"] = value
+        return result
+
+
+class DevInfRequest(_Model):
+    __slots__ = ("type", "paths")
+
+    type: str
+
+    paths: list[str]
+    """Paths of the device tree entries that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("paths", "type"))
+
+    def __init__(self, paths: list[str], type: str = "DEV-INF") -> None:
+        self.type = type
+        self.paths = paths
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DevInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DEV-INF":
+                raise DecodeError("must be equal to 'DEV-INF'")
+            self.type = value
+            key = "paths"
+            value = obj["paths"]
+            value = _decode_list(value, _decode_1)
+            self.paths = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "paths": self.paths}
+
+
+class DevInfResponse(_Model):
+    __slots__ = ("type", "values", "error")
+
+    type: str
+
+    values: dict[str, Any]
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type", "values"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "type", "values"))
+
+    def __init__(
+        self,
+        values: dict[str, Any],
+        type: str = "DEV-INF",
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.values = values
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DevInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DEV-INF":
+                raise DecodeError("must be equal to 'DEV-INF'")
+            self.type = value
+            key = "values"
+            value = obj["values"]
+            if type(value) is not dict:
+                raise DecodeError("must be object")
+            self.values = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "values": self.values}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class DevListRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the objects that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "DEV-LIST") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DevListRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DEV-LIST":
+                raise DecodeError("must be equal to 'DEV-LIST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class DevListResponse(_Model):
+    __slots__ = ("type", "devices", "error")
+
+    type: str
+
+    devices: dict[str, DeviceTreeNode] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("devices", "error", "type"))
+
+    def __init__(
+        self,
+        type: str = "DEV-LIST",
+        devices: dict[str, DeviceTreeNode] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.devices = devices
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DevListResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DEV-LIST":
+                raise DecodeError("must be equal to 'DEV-LIST'")
+            self.type = value
+            key = "devices"
+            value = obj.get("devices")
+            if value is not None:
+                value = _decode_map(value, DeviceTreeNode.from_json)
+            elif "devices" in obj:
+                raise DecodeError("must not be null")
+            self.devices = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.devices
+        if value is not None:
+            result["devices"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class DevListsubRequest(_Model):
+    __slots__ = ("type", "path_filter")
+
+    type: str
+
+    path_filter: list[str]
+    """Paths of the device tree entries that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("pathFilter", "type"))
+
+    def __init__(self, path_filter: list[str], type: str = "DEV-LISTSUB") -> None:
+        self.type = type
+        self.path_filter = path_filter
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DevListsubRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DEV-LISTSUB":
+                raise DecodeError("must be equal to 'DEV-LISTSUB'")
+            self.type = value
+            key = "pathFilter"
+            value = obj["pathFilter"]
+            value = _decode_list(value, _decode_1)
+            self.path_filter = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "pathFilter": self.path_filter}
+
+
+class DevListsubResponse(_Model):
+    __slots__ = ("type", "paths")
+
+    type: str
+
+    paths: list[str] | None
+    """Paths of the device tree entries that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("paths", "type"))
+
+    def __init__(
+        self,
+        type: str = "DEV-LISTSUB",
+        paths: list[str] | None = None,
+    ) -> None:
+        self.type = type
+        self.paths = paths
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DevListsubResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DEV-LISTSUB":
+                raise DecodeError("must be equal to 'DEV-LISTSUB'")
+            self.type = value
+            key = "paths"
+            value = obj.get("paths")
+            if value is not None:
+                value = _decode_list(value, _decode_1)
+            elif "paths" in obj:
+                raise DecodeError("must not be null")
+            self.paths = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.paths
+        if value is not None:
+            result["paths"] = value
+        return result
+
+
+class DevSubRequest(_Model):
+    __slots__ = ("type", "paths", "lazy")
+
+    type: str
+
+    paths: list[str]
+    """Paths of the device tree entries that the message refers to."""
+
+    lazy: bool | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("paths", "type"))
+
+    def __init__(
+        self,
+        paths: list[str],
+        type: str = "DEV-SUB",
+        lazy: bool | None = None,
+    ) -> None:
+        self.type = type
+        self.paths = paths
+        self.lazy = lazy
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DevSubRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DEV-SUB":
+                raise DecodeError("must be equal to 'DEV-SUB'")
+            self.type = value
+            key = "paths"
+            value = obj["paths"]
+            value = _decode_list(value, _decode_1)
+            self.paths = value
+            key = "lazy"
+            value = obj.get("lazy")
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            elif "lazy" in obj:
+                raise DecodeError("must not be null")
+            self.lazy = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "paths": self.paths}
+        value = self.lazy
+        if value is not None:
+            result["lazy"] = value
+        return result
+
+
+class DevSubResponse(_Model):
+    __slots__ = ("type", "success", "error")
+
+    type: str
+
+    success: list[str] | None
+    """Paths of the device tree entries that the message refers to."""
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "success", "type"))
+
+    def __init__(
+        self,
+        type: str = "DEV-SUB",
+        success: list[str] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.success = success
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DevSubResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DEV-SUB":
+                raise DecodeError("must be equal to 'DEV-SUB'")
+            self.type = value
+            key = "success"
+            value = obj.get("success")
+            if value is not None:
+                value = _decode_list(value, _decode_1)
+            elif "success" in obj:
+                raise DecodeError("must not be null")
+            self.success = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.success
+        if value is not None:
+            result["success"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class DevUnsubRequest(_Model):
+    __slots__ = ("type", "paths", "remove_all", "include_subtrees")
+
+    type: str
+
+    paths: list[str]
+    """Paths of the device tree entries that the message refers to."""
+
+    remove_all: bool | None
+    """Whether to remove all instances of a subscription that matches one of the paths
+    (true) or only a single one (false).
+    """
+
+    include_subtrees: bool | None
+    """Whether to also remove all subscriptions that are in the subtrees of the paths
+    specified in the request.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("paths", "type"))
+
+    def __init__(
+        self,
+        paths: list[str],
+        type: str = "DEV-UNSUB",
+        remove_all: bool | None = None,
+        include_subtrees: bool | None = None,
+    ) -> None:
+        self.type = type
+        self.paths = paths
+        self.remove_all = remove_all
+        self.include_subtrees = include_subtrees
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DevUnsubRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DEV-UNSUB":
+                raise DecodeError("must be equal to 'DEV-UNSUB'")
+            self.type = value
+            key = "paths"
+            value = obj["paths"]
+            value = _decode_list(value, _decode_1)
+            self.paths = value
+            key = "removeAll"
+            value = obj.get("removeAll")
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            elif "removeAll" in obj:
+                raise DecodeError("must not be null")
+            self.remove_all = value
+            key = "includeSubtrees"
+            value = obj.get("includeSubtrees")
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            elif "includeSubtrees" in obj:
+                raise DecodeError("must not be null")
+            self.include_subtrees = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "paths": self.paths}
+        value = self.remove_all
+        if value is not None:
+            result["removeAll"] = value
+        value = self.include_subtrees
+        if value is not None:
+            result["includeSubtrees"] = value
+        return result
+
+
+class DevUnsubResponse(_Model):
+    __slots__ = ("type", "success", "error")
+
+    type: str
+
+    success: list[str] | None
+    """Paths of the device tree entries that the message refers to."""
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "success", "type"))
+
+    def __init__(
+        self,
+        type: str = "DEV-UNSUB",
+        success: list[str] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.success = success
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DevUnsubResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DEV-UNSUB":
+                raise DecodeError("must be equal to 'DEV-UNSUB'")
+            self.type = value
+            key = "success"
+            value = obj.get("success")
+            if value is not None:
+                value = _decode_list(value, _decode_1)
+            elif "success" in obj:
+                raise DecodeError("must not be null")
+            self.success = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.success
+        if value is not None:
+            result["success"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class DeviceTreeNode(_Model):
+    """Device tree node.
+
+    A single device tree node representing a UAV, a device or a channel.
+    """
+
+    __slots__ = ("type", "sub_type", "class_", "children", "operations", "unit")
+
+    type: str
+    """Type of a device tree node."""
+
+    sub_type: str | None
+    """Type of a channel."""
+
+    class_: str | None
+    """Class of a device."""
+
+    children: dict[str, Any] | None
+
+    operations: list[str] | None
+
+    unit: str | None
+    """Unit in which the value of a numeric channel is expressed."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(
+        ("children", "class", "operations", "subType", "type", "unit")
+    )
+
+    def __init__(
+        self,
+        type: str,
+        sub_type: str | None = None,
+        class_: str | None = None,
+        children: dict[str, Any] | None = None,
+        operations: list[str] | None = None,
+        unit: str | None = None,
+    ) -> None:
+        self.type = type
+        self.sub_type = sub_type
+        self.class_ = class_
+        self.children = children
+        self.operations = operations
+        self.unit = unit
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DeviceTreeNode:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value not in _ENUM_6:
+                raise DecodeError(f"must be one of {list(_ENUM_6)}")
+            self.type = value
+            key = "subType"
+            value = obj.get("subType")
+            if value is not None:
+                if value not in _ENUM_2:
+                    raise DecodeError(f"must be one of {list(_ENUM_2)}")
+            elif "subType" in obj:
+                raise DecodeError("must not be null")
+            self.sub_type = value
+            key = "class"
+            value = obj.get("class")
+            if value is not None:
+                if value not in _ENUM_5:
+                    raise DecodeError(f"must be one of {list(_ENUM_5)}")
+            elif "class" in obj:
+                raise DecodeError("must not be null")
+            self.class_ = value
+            key = "children"
+            value = obj.get("children")
+            if value is not None:
+                if type(value) is not dict:
+                    raise DecodeError("must be object")
+            elif "children" in obj:
+                raise DecodeError("must not be null")
+            self.children = value
+            key = "operations"
+            value = obj.get("operations")
+            if value is not None:
+                value = _decode_list(value, _decode_3)
+            elif "operations" in obj:
+                raise DecodeError("must not be null")
+            self.operations = value
+            key = "unit"
+            value = obj.get("unit")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "unit" in obj:
+                raise DecodeError("must not be null")
+            self.unit = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.sub_type
+        if value is not None:
+            result["subType"] = value
+        value = self.class_
+        if value is not None:
+            result["class"] = value
+        value = self.children
+        if value is not None:
+            result["children"] = value
+        value = self.operations
+        if value is not None:
+            result["operations"] = value
+        value = self.unit
+        if value is not None:
+            result["unit"] = value
+        return result
+
+
+class DockInfRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the docking stations that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "DOCK-INF") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DockInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DOCK-INF":
+                raise DecodeError("must be equal to 'DOCK-INF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class DockInfResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, DockStatusInfo] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "DOCK-INF",
+        status: dict[str, DockStatusInfo] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DockInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "DOCK-INF":
+                raise DecodeError("must be equal to 'DOCK-INF'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, DockStatusInfo.from_json)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class DockStatusInfo(_Model):
+    """Docking station status info.
+
+    Status information of a single docking station.
+    """
+
+    __slots__ = ("id", "position", "timestamp")
+
+    id: str
+    """Identifier of a single object."""
+
+    position: GPSCoordinate | None
+    """GPS coordinate of an object."""
+
+    timestamp: float
+    """Timestamp that denotes when the status of the docking station was updated the
+    last time.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "timestamp"))
+
+    def __init__(
+        self,
+        id: str,
+        timestamp: float,
+        position: GPSCoordinate | None = None,
+    ) -> None:
+        self.id = id
+        self.position = position
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DockStatusInfo:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "position"
+            value = obj.get("position")
+            if value is not None:
+                value = GPSCoordinate.from_json(value)
+            elif "position" in obj:
+                raise DecodeError("must not be null")
+            self.position = value
+            key = "timestamp"
+            value = obj["timestamp"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.timestamp = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"id": self.id, "timestamp": self.timestamp}
+        value = self.position
+        if value is not None:
+            result["position"] = value.to_json()
+        return result
+
+
+class DroneLightsConfiguration(_Model):
+    """Drone lights configuration.
+
+    Full configuration of the behaviour of the LED lights on a drone during a drone
+    show.
+    """
+
+    __slots__ = ("effect", "color")
+
+    effect: str | None
+    """Type of the light effect."""
+
+    color: list[int] | None
+    """Color of the light effect in RGB notations. Values in the array must be between 0
+    and 255, inclusive.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(())
+
+    def __init__(
+        self,
+        effect: str | None = None,
+        color: list[int] | None = None,
+    ) -> None:
+        self.effect = effect
+        self.color = color
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DroneLightsConfiguration:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "effect"
+            value = obj.get("effect")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "effect" in obj:
+                raise DecodeError("must not be null")
+            self.effect = value
+            key = "color"
+            value = obj.get("color")
+            if value is not None:
+                value = _decode_list(value, _decode_4)
+            elif "color" in obj:
+                raise DecodeError("must not be null")
+            self.color = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {}
+        value = self.effect
+        if value is not None:
+            result["effect"] = value
+        value = self.color
+        if value is not None:
+            result["color"] = value
+        return result
+
+
+class DroneShowConfiguration(_Model):
+    """Drone show configuration.
+
+    Full configuration of a drone show.
+    """
+
+    __slots__ = ("start", "mapping", "duration")
+
+    start: StartConditions
+
+    mapping: list[Any] | None
+    """Mapping of show-specific indices to the corresponding UAV IDs, if known. Not
+    mandatory.
+    """
+
+    duration: float | None
+    """The total duration of the show, in seconds. Not mandatory."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("start",))
+
+    def __init__(
+        self,
+        start: StartConditions,
+        mapping: list[Any] | None = None,
+        duration: float | None = None,
+    ) -> None:
+        self.start = start
+        self.mapping = mapping
+        self.duration = duration
+
+    @classmethod
+    def from_json(cls, obj: Any) -> DroneShowConfiguration:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "start"
+            value = obj["start"]
+            value = StartConditions.from_json(value)
+            self.start = value
+            key = "mapping"
+            value = obj.get("mapping")
+            if value is not None:
+                value = _decode_list(value, _decode_0)
+            elif "mapping" in obj:
+                raise DecodeError("must not be null")
+            self.mapping = value
+            key = "duration"
+            value = obj.get("duration")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "duration" in obj:
+                raise DecodeError("must not be null")
+            self.duration = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"start": self.start.to_json()}
+        value = self.mapping
+        if value is not None:
+            result["mapping"] = value
+        value = self.duration
+        if value is not None:
+            result["duration"] = value
+        return result
+
+
+class ECEFCoordinate(_Model):
+    """ECEF coordinate.
+
+    Earth-centered Earth-fixed coordinate of an object.
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    x: float
+    """X coordinate in millimeters."""
+
+    y: float
+    """Y coordinate in millimeters."""
+
+    z: float
+    """Z coordinate in millimeters."""
+
+    MIN_ITEMS: ClassVar[int] = 3
+
+    def __init__(self, x: float, y: float, z: float) -> None:
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ECEFCoordinate:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not list:
+            raise DecodeError("must be array")
+        length = len(obj)
+        if length < cls.MIN_ITEMS:
+            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")
+        self = object.__new__(cls)
+        key = 0
+        try:
+            key = 0
+            value = obj[0]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.x = value
+            key = 1
+            value = obj[1]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.y = value
+            key = 2
+            value = obj[2]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.z = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> list[Any]:
+        """Returns the JSON representation of this instance."""
+        result = [self.x, self.y, self.z]
+        return result
+
+
+class ExtCfgRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the extensions that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "EXT-CFG") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtCfgRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-CFG":
+                raise DecodeError("must be equal to 'EXT-CFG'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ExtCfgResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, dict[str, Any]] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "EXT-CFG",
+        status: dict[str, dict[str, Any]] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtCfgResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-CFG":
+                raise DecodeError("must be equal to 'EXT-CFG'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, _decode_7)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class ExtInfRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the extensions that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "EXT-INF") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-INF":
+                raise DecodeError("must be equal to 'EXT-INF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ExtInfResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, ExtensionInfo] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "EXT-INF",
+        status: dict[str, ExtensionInfo] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-INF":
+                raise DecodeError("must be equal to 'EXT-INF'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, ExtensionInfo.from_json)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class ExtListRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "EXT-LIST") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtListRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-LIST":
+                raise DecodeError("must be equal to 'EXT-LIST'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class ExtListResponse(_Model):
+    __slots__ = ("type", "loaded", "available")
+
+    type: str
+
+    loaded: list[str]
+    """IDs of the extensions that the message refers to."""
+
+    available: list[str]
+    """IDs of the extensions that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("available", "loaded", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("available", "loaded", "type"))
+
+    def __init__(
+        self,
+        loaded: list[str],
+        available: list[str],
+        type: str = "EXT-LIST",
+    ) -> None:
+        self.type = type
+        self.loaded = loaded
+        self.available = available
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtListResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-LIST":
+                raise DecodeError("must be equal to 'EXT-LIST'")
+            self.type = value
+            key = "loaded"
+            value = obj["loaded"]
+            value = _decode_list(value, _decode_1)
+            self.loaded = value
+            key = "available"
+            value = obj["available"]
+            value = _decode_list(value, _decode_1)
+            self.available = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "loaded": self.loaded, "available": self.available}
+
+
+class ExtLoadRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the extensions that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "EXT-LOAD") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtLoadRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-LOAD":
+                raise DecodeError("must be equal to 'EXT-LOAD'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ExtLoadResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, dict[str, Any]] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "EXT-LOAD",
+        status: dict[str, dict[str, Any]] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtLoadResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-LOAD":
+                raise DecodeError("must be equal to 'EXT-LOAD'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, _decode_7)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class ExtReloadRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the extensions that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "EXT-RELOAD") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtReloadRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-RELOAD":
+                raise DecodeError("must be equal to 'EXT-RELOAD'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ExtReloadResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, dict[str, Any]] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "EXT-RELOAD",
+        status: dict[str, dict[str, Any]] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtReloadResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-RELOAD":
+                raise DecodeError("must be equal to 'EXT-RELOAD'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, _decode_7)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class ExtSetcfgRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: dict[str, dict[str, Any]]
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(
+        self,
+        ids: dict[str, dict[str, Any]],
+        type: str = "EXT-SETCFG",
+    ) -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtSetcfgRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-SETCFG":
+                raise DecodeError("must be equal to 'EXT-SETCFG'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_map(value, _decode_7)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ExtSetcfgResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, dict[str, Any]] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "EXT-SETCFG",
+        status: dict[str, dict[str, Any]] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtSetcfgResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-SETCFG":
+                raise DecodeError("must be equal to 'EXT-SETCFG'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, _decode_7)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class ExtUnloadRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the extensions that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "EXT-UNLOAD") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtUnloadRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-UNLOAD":
+                raise DecodeError("must be equal to 'EXT-UNLOAD'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ExtUnloadResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, dict[str, Any]] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "EXT-UNLOAD",
+        status: dict[str, dict[str, Any]] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtUnloadResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "EXT-UNLOAD":
+                raise DecodeError("must be equal to 'EXT-UNLOAD'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, _decode_7)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class ExtensionInfo(_Model):
+    """Extension info.
+
+    Information about an extension.
+    """
+
+    __slots__ = ("id", "loaded", "name", "description")
+
+    id: str
+    """Identifier of a single extension."""
+
+    loaded: bool
+
+    name: str
+
+    description: str | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "loaded", "name"))
+
+    def __init__(
+        self,
+        id: str,
+        loaded: bool,
+        name: str,
+        description: str | None = None,
+    ) -> None:
+        self.id = id
+        self.loaded = loaded
+        self.name = name
+        self.description = description
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ExtensionInfo:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "loaded"
+            value = obj["loaded"]
+            if type(value) is not bool:
+                raise DecodeError("must be boolean")
+            self.loaded = value
+            key = "name"
+            value = obj["name"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.name = value
+            key = "description"
+            value = obj.get("description")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "description" in obj:
+                raise DecodeError("must not be null")
+            self.description = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "id": self.id,
+            "loaded": self.loaded,
+            "name": self.name,
+        }
+        value = self.description
+        if value is not None:
+            result["description"] = value
+        return result
+
+
+class FirmwareUpdateTarget(_Model):
+    """Firmware update target.
+
+    A component of an object that can be targeted with a firmware update.
+    """
+
+    __slots__ = ("id", "name")
+
+    id: str
+    """Identifier of a single firmware update target."""
+
+    name: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "name"))
+
+    def __init__(self, id: str, name: str) -> None:
+        self.id = id
+        self.name = name
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FirmwareUpdateTarget:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "name"
+            value = obj["name"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.name = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"id": self.id, "name": self.name}
+
+
+class FlightLog(_Model):
+    """Flight log.
+
+    Contents of a flight log.
+    """
+
+    __slots__ = ("id", "timestamp", "size", "kind", "body")
+
+    id: str
+    """Identifier of a single flight log."""
+
+    timestamp: float | None
+
+    size: float | None
+
+    kind: str
+
+    body: str | dict[str, Any]
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("body", "id", "kind"))
+
+    def __init__(
+        self,
+        id: str,
+        kind: str,
+        body: str | dict[str, Any],
+        timestamp: float | None = None,
+        size: float | None = None,
+    ) -> None:
+        self.id = id
+        self.timestamp = timestamp
+        self.size = size
+        self.kind = kind
+        self.body = body
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FlightLog:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "timestamp"
+            value = obj.get("timestamp")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "timestamp" in obj:
+                raise DecodeError("must not be null")
+            self.timestamp = value
+            key = "size"
+            value = obj.get("size")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "size" in obj:
+                raise DecodeError("must not be null")
+            self.size = value
+            key = "kind"
+            value = obj["kind"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.kind = value
+            key = "body"
+            value = obj["body"]
+            if type(value) not in (str,) + (dict,):
+                raise DecodeError("must be string or object")
+            self.body = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"id": self.id, "kind": self.kind, "body": self.body}
+        value = self.timestamp
+        if value is not None:
+            result["timestamp"] = value
+        value = self.size
+        if value is not None:
+            result["size"] = value
+        return result
+
+
+class FlightLogMetadata(_Model):
+    """Flight log metadata.
+
+    Metadata of a single flight log entry stored on a UAV.
+    """
+
+    __slots__ = ("id", "timestamp", "size", "kind")
+
+    id: str
+    """Identifier of a single flight log."""
+
+    timestamp: float | None
+
+    size: float | None
+
+    kind: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "kind"))
+
+    def __init__(
+        self,
+        id: str,
+        kind: str,
+        timestamp: float | None = None,
+        size: float | None = None,
+    ) -> None:
+        self.id = id
+        self.timestamp = timestamp
+        self.size = size
+        self.kind = kind
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FlightLogMetadata:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "timestamp"
+            value = obj.get("timestamp")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "timestamp" in obj:
+                raise DecodeError("must not be null")
+            self.timestamp = value
+            key = "size"
+            value = obj.get("size")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "size" in obj:
+                raise DecodeError("must not be null")
+            self.size = value
+            key = "kind"
+            value = obj["kind"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.kind = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"id": self.id, "kind": self.kind}
+        value = self.timestamp
+        if value is not None:
+            result["timestamp"] = value
+        value = self.size
+        if value is not None:
+            result["size"] = value
+        return result
+
+
+class FwObjectListRequest(_Model):
+    __slots__ = ("type", "supports")
+
+    type: str
+
+    supports: list[str] | None
+    """IDs of the firmware update targets that a request refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(
+        self,
+        type: str = "FW-OBJECT-LIST",
+        supports: list[str] | None = None,
+    ) -> None:
+        self.type = type
+        self.supports = supports
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FwObjectListRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "FW-OBJECT-LIST":
+                raise DecodeError("must be equal to 'FW-OBJECT-LIST'")
+            self.type = value
+            key = "supports"
+            value = obj.get("supports")
+            if value is not None:
+                value = _decode_list(value, _decode_1)
+            elif "supports" in obj:
+                raise DecodeError("must not be null")
+            self.supports = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.supports
+        if value is not None:
+            result["supports"] = value
+        return result
+
+
+class FwObjectListResponse(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the objects that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "FW-OBJECT-LIST") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FwObjectListResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "FW-OBJECT-LIST":
+                raise DecodeError("must be equal to 'FW-OBJECT-LIST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class FwTargetInfRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the firmware update targets that a request refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "FW-TARGET-INF") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FwTargetInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "FW-TARGET-INF":
+                raise DecodeError("must be equal to 'FW-TARGET-INF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class FwTargetInfResponse(_Model):
+    __slots__ = ("type", "result", "error")
+
+    type: str
+
+    result: dict[str, FirmwareUpdateTarget] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "FW-TARGET-INF",
+        result: dict[str, FirmwareUpdateTarget] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FwTargetInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "FW-TARGET-INF":
+                raise DecodeError("must be equal to 'FW-TARGET-INF'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, FirmwareUpdateTarget.from_json)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class FwTargetListRequest(_Model):
+    __slots__ = ("type", "supported_by")
+
+    type: str
+
+    supported_by: list[str] | None
+    """IDs of the objects that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(
+        self,
+        type: str = "FW-TARGET-LIST",
+        supported_by: list[str] | None = None,
+    ) -> None:
+        self.type = type
+        self.supported_by = supported_by
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FwTargetListRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "FW-TARGET-LIST":
+                raise DecodeError("must be equal to 'FW-TARGET-LIST'")
+            self.type = value
+            key = "supportedBy"
+            value = obj.get("supportedBy")
+            if value is not None:
+                value = _decode_list(value, _decode_1)
+            elif "supportedBy" in obj:
+                raise DecodeError("must not be null")
+            self.supported_by = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.supported_by
+        if value is not None:
+            result["supportedBy"] = value
+        return result
+
+
+class FwTargetListResponse(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the firmware update targets that a request refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "FW-TARGET-LIST") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FwTargetListResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "FW-TARGET-LIST":
+                raise DecodeError("must be equal to 'FW-TARGET-LIST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class FwUploadRequest(_Model):
+    __slots__ = ("type", "ids", "target", "blob")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the objects that the message refers to."""
+
+    target: str
+    """Identifier of a single firmware update target."""
+
+    blob: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("blob", "ids", "target", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        target: str,
+        blob: str,
+        type: str = "FW-UPLOAD",
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.target = target
+        self.blob = blob
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FwUploadRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "FW-UPLOAD":
+                raise DecodeError("must be equal to 'FW-UPLOAD'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "target"
+            value = obj["target"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.target = value
+            key = "blob"
+            value = obj["blob"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.blob = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {
+            "type": self.type,
+            "ids": self.ids,
+            "target": self.target,
+            "blob": self.blob,
+        }
+
+
+class FwUploadResponse(_Model):
+    __slots__ = ("type", "receipt", "error", "result")
+
+    type: str
+
+    receipt: dict[str, str] | None
+
+    error: dict[str, str] | None
+
+    result: dict[str, Any] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "FW-UPLOAD",
+        receipt: dict[str, str] | None = None,
+        error: dict[str, str] | None = None,
+        result: dict[str, Any] | None = None,
+    ) -> None:
+        self.type = type
+        self.receipt = receipt
+        self.error = error
+        self.result = result
+
+    @classmethod
+    def from_json(cls, obj: Any) -> FwUploadResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "FW-UPLOAD":
+                raise DecodeError("must be equal to 'FW-UPLOAD'")
+            self.type = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_0)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        return result
+
+
+class GPSCoordinate(_Model):
+    """GPS coordinate.
+
+    GPS coordinate of an object.
+    """
+
+    __slots__ = ("latitude", "longitude", "amsl", "ahl", "agl")
+
+    latitude: int
+    """Latitude, in 1e-7 degrees."""
+
+    longitude: int
+    """Longitude, in 1e-7 degrees."""
+
+    amsl: int | None | _Missing
+    """Altitude above mean sea level, in millimeters."""
+
+    ahl: int | None | _Missing
+    """Altitude above home level, in millimeters."""
+
+    agl: int | None | _Missing
+    """Altitude above ground level, in millimeters."""
+
+    MIN_ITEMS: ClassVar[int] = 2
+
+    def __init__(
+        self,
+        latitude: int,
+        longitude: int,
+        amsl: int | None | _Missing = _MISSING,
+        ahl: int | None | _Missing = _MISSING,
+        agl: int | None | _Missing = _MISSING,
+    ) -> None:
+        self.latitude = latitude
+        self.longitude = longitude
+        self.amsl = amsl
+        self.ahl = ahl
+        self.agl = agl
+
+    @classmethod
+    def from_json(cls, obj: Any) -> GPSCoordinate:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not list:
+            raise DecodeError("must be array")
+        length = len(obj)
+        if length < cls.MIN_ITEMS:
+            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")
+        self = object.__new__(cls)
+        key = 0
+        try:
+            key = 0
+            value = obj[0]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.latitude = value
+            key = 1
+            value = obj[1]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.longitude = value
+            key = 2
+            value = obj[2] if length > 2 else _MISSING
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.amsl = value
+            key = 3
+            value = obj[3] if length > 3 else _MISSING
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.ahl = value
+            key = 4
+            value = obj[4] if length > 4 else _MISSING
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.agl = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> list[Any]:
+        """Returns the JSON representation of this instance."""
+        result = [self.latitude, self.longitude, self.amsl, self.ahl, self.agl]
+        while len(result) > 2 and result[-1] is _MISSING:
+            result.pop()
+        return [None if item is _MISSING else item for item in result]
+
+
+class GPSFix(_Model):
+    """GPS fix.
+
+    Basic information about the GPS fix.
+    """
+
+    __slots__ = ("gps_fix_type", "number_of_satellites", "h_acc", "v_acc")
+
+    gps_fix_type: int
+
+    number_of_satellites: int | None | _Missing
+
+    h_acc: int | None | _Missing
+    """Horizontal accuracy, in millimeters."""
+
+    v_acc: int | None | _Missing
+    """Vertical accuracy, in millimeters."""
+
+    MIN_ITEMS: ClassVar[int] = 1
+
+    def __init__(
+        self,
+        gps_fix_type: int,
+        number_of_satellites: int | None | _Missing = _MISSING,
+        h_acc: int | None | _Missing = _MISSING,
+        v_acc: int | None | _Missing = _MISSING,
+    ) -> None:
+        self.gps_fix_type = gps_fix_type
+        self.number_of_satellites = number_of_satellites
+        self.h_acc = h_acc
+        self.v_acc = v_acc
+
+    @classmethod
+    def from_json(cls, obj: Any) -> GPSFix:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not list:
+            raise DecodeError("must be array")
+        length = len(obj)
+        if length < cls.MIN_ITEMS:
+            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")
+        self = object.__new__(cls)
+        key = 0
+        try:
+            key = 0
+            value = obj[0]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.gps_fix_type = value
+            key = 1
+            value = obj[1] if length > 1 else _MISSING
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.number_of_satellites = value
+            key = 2
+            value = obj[2] if length > 2 else _MISSING
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.h_acc = value
+            key = 3
+            value = obj[3] if length > 3 else _MISSING
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.v_acc = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> list[Any]:
+        """Returns the JSON representation of this instance."""
+        result = [self.gps_fix_type, self.number_of_satellites, self.h_acc, self.v_acc]
+        while len(result) > 1 and result[-1] is _MISSING:
+            result.pop()
+        return [None if item is _MISSING else item for item in result]
+
+
+class LcnInfRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "LCN-INF") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> LcnInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "LCN-INF":
+                raise DecodeError("must be equal to 'LCN-INF'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class LcnInfResponse(_Model):
+    __slots__ = ("type", "license")
+
+    type: str
+
+    license: License
+    """A license object that is activated on the server."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("license", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("license", "type"))
+
+    def __init__(self, license: License, type: str = "LCN-INF") -> None:
+        self.type = type
+        self.license = license
+
+    @classmethod
+    def from_json(cls, obj: Any) -> LcnInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "LCN-INF":
+                raise DecodeError("must be equal to 'LCN-INF'")
+            self.type = value
+            key = "license"
+            value = obj["license"]
+            value = License.from_json(value)
+            self.license = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "license": self.license.to_json()}
+
+
+class License(_Model):
+    """License.
+
+    A license object that is activated on the server.
+    """
+
+    __slots__ = ("id", "version", "licensee", "expiry_date", "features", "restrictions")
+
+    id: str
+    """License ID."""
+
+    version: int | None
+    """License version."""
+
+    licensee: str
+    """Name of the license holder."""
+
+    expiry_date: str | None
+    """Expiry date."""
+
+    features: list[LicenseFeature] | None
+    """Additional features."""
+
+    restrictions: list[LicenseRestriction] | None
+    """Restrictions."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "licensee"))
+
+    def __init__(
+        self,
+        id: str,
+        licensee: str,
+        version: int | None = None,
+        expiry_date: str | None = None,
+        features: list[LicenseFeature] | None = None,
+        restrictions: list[LicenseRestriction] | None = None,
+    ) -> None:
+        self.id = id
+        self.version = version
+        self.licensee = licensee
+        self.expiry_date = expiry_date
+        self.features = features
+        self.restrictions = restrictions
+
+    @classmethod
+    def from_json(cls, obj: Any) -> License:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "version"
+            value = obj.get("version")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "version" in obj:
+                raise DecodeError("must not be null")
+            self.version = value
+            key = "licensee"
+            value = obj["licensee"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.licensee = value
+            key = "expiryDate"
+            value = obj.get("expiryDate")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "expiryDate" in obj:
+                raise DecodeError("must not be null")
+            self.expiry_date = value
+            key = "features"
+            value = obj.get("features")
+            if value is not None:
+                value = _decode_list(value, LicenseFeature.from_json)
+            elif "features" in obj:
+                raise DecodeError("must not be null")
+            self.features = value
+            key = "restrictions"
+            value = obj.get("restrictions")
+            if value is not None:
+                value = _decode_list(value, LicenseRestriction.from_json)
+            elif "restrictions" in obj:
+                raise DecodeError("must not be null")
+            self.restrictions = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"id": self.id, "licensee": self.licensee}
+        value = self.version
+        if value is not None:
+            result["version"] = value
+        value = self.expiry_date
+        if value is not None:
+            result["expiryDate"] = value
+        value = self.features
+        if value is not None:
+            result["features"] = [item.to_json() for item in value]
+        value = self.restrictions
+        if value is not None:
+            result["restrictions"] = [item.to_json() for item in value]
+        return result
+
+
+class LicenseFeature(_Model):
+    """License feature.
+
+    An optional feature that is enabled by a license.
+    """
+
+    __slots__ = ("type", "label", "secondary_label", "parameters")
+
+    type: str
+    """Feature type."""
+
+    label: str | None
+    """Description."""
+
+    secondary_label: str | None
+    """Additional info."""
+
+    parameters: dict[str, Any] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(
+        self,
+        type: str,
+        label: str | None = None,
+        secondary_label: str | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> None:
+        self.type = type
+        self.label = label
+        self.secondary_label = secondary_label
+        self.parameters = parameters
+
+    @classmethod
+    def from_json(cls, obj: Any) -> LicenseFeature:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.type = value
+            key = "label"
+            value = obj.get("label")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "label" in obj:
+                raise DecodeError("must not be null")
+            self.label = value
+            key = "secondaryLabel"
+            value = obj.get("secondaryLabel")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "secondaryLabel" in obj:
+                raise DecodeError("must not be null")
+            self.secondary_label = value
+            key = "parameters"
+            value = obj.get("parameters")
+            if value is not None:
+                if type(value) is not dict:
+                    raise DecodeError("must be object")
+            elif "parameters" in obj:
+                raise DecodeError("must not be null")
+            self.parameters = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.label
+        if value is not None:
+            result["label"] = value
+        value = self.secondary_label
+        if value is not None:
+            result["secondaryLabel"] = value
+        value = self.parameters
+        if value is not None:
+            result["parameters"] = value
+        return result
+
+
+class LicenseRestriction(_Model):
+    """License restrictions.
+
+    Restrictions imposed on the functionality of the server by a license.
+    """
+
+    __slots__ = ("type", "label", "secondary_label", "parameters")
+
+    type: str
+    """Restriction type."""
+
+    label: str | None
+    """Description."""
+
+    secondary_label: str | None
+    """Additional info."""
+
+    parameters: dict[str, Any] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(
+        self,
+        type: str,
+        label: str | None = None,
+        secondary_label: str | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> None:
+        self.type = type
+        self.label = label
+        self.secondary_label = secondary_label
+        self.parameters = parameters
+
+    @classmethod
+    def from_json(cls, obj: Any) -> LicenseRestriction:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.type = value
+            key = "label"
+            value = obj.get("label")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "label" in obj:
+                raise DecodeError("must not be null")
+            self.label = value
+            key = "secondaryLabel"
+            value = obj.get("secondaryLabel")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "secondaryLabel" in obj:
+                raise DecodeError("must not be null")
+            self.secondary_label = value
+            key = "parameters"
+            value = obj.get("parameters")
+            if value is not None:
+                if type(value) is not dict:
+                    raise DecodeError("must be object")
+            elif "parameters" in obj:
+                raise DecodeError("must not be null")
+            self.parameters = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.label
+        if value is not None:
+            result["label"] = value
+        value = self.secondary_label
+        if value is not None:
+            result["secondaryLabel"] = value
+        value = self.parameters
+        if value is not None:
+            result["parameters"] = value
+        return result
+
+
+class LogDataRequest(_Model):
+    __slots__ = ("type", "uav_id", "log_id")
+
+    type: str
+
+    uav_id: str
+    """Identifier of a single object."""
+
+    log_id: str
+    """Identifier of a single flight log."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("logId", "type", "uavId"))
+
+    def __init__(self, uav_id: str, log_id: str, type: str = "LOG-DATA") -> None:
+        self.type = type
+        self.uav_id = uav_id
+        self.log_id = log_id
+
+    @classmethod
+    def from_json(cls, obj: Any) -> LogDataRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "LOG-DATA":
+                raise DecodeError("must be equal to 'LOG-DATA'")
+            self.type = value
+            key = "uavId"
+            value = obj["uavId"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.uav_id = value
+            key = "logId"
+            value = obj["logId"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.log_id = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "uavId": self.uav_id, "logId": self.log_id}
+
+
+class LogDataResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: FlightLog | None
+    """Contents of a flight log."""
+
+    error: str | None
+
+    receipt: str | None
+    """Identifier of the receipt."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "LOG-DATA",
+        result: FlightLog | None = None,
+        error: str | None = None,
+        receipt: str | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> LogDataResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "LOG-DATA":
+                raise DecodeError("must be equal to 'LOG-DATA'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = FlightLog.from_json(value)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value.to_json()
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class LogInfRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "LOG-INF") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> LogInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "LOG-INF":
+                raise DecodeError("must be equal to 'LOG-INF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class LogInfResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, list[FlightLogMetadata]] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "LOG-INF",
+        result: dict[str, list[FlightLogMetadata]] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> LogInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "LOG-INF":
+                raise DecodeError("must be equal to 'LOG-INF'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_8)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = {
+                key: [item.to_json() for item in item] for key, item in value.items()
+            }
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class LogMessage(_Model):
+    """Log message.
+
+    A single log message sent from the server to the client.
+    """
+
+    __slots__ = ("message", "timestamp", "sender", "severity")
+
+    message: str
+
+    timestamp: float | None
+
+    sender: str | None
+    """Identifier of a single object."""
+
+    severity: str | None
+    """Severity of the message."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("message",))
+
+    def __init__(
+        self,
+        message: str,
+        timestamp: float | None = None,
+        sender: str | None = None,
+        severity: str | None = None,
+    ) -> None:
+        self.message = message
+        self.timestamp = timestamp
+        self.sender = sender
+        self.severity = severity
+
+    @classmethod
+    def from_json(cls, obj: Any) -> LogMessage:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "message"
+            value = obj["message"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.message = value
+            key = "timestamp"
+            value = obj.get("timestamp")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "timestamp" in obj:
+                raise DecodeError("must not be null")
+            self.timestamp = value
+            key = "sender"
+            value = obj.get("sender")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "sender" in obj:
+                raise DecodeError("must not be null")
+            self.sender = value
+            key = "severity"
+            value = obj.get("severity")
+            if value is not None:
+                if value not in _ENUM_8:
+                    raise DecodeError(f"must be one of {list(_ENUM_8)}")
+            elif "severity" in obj:
+                raise DecodeError("must not be null")
+            self.severity = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"message": self.message}
+        value = self.timestamp
+        if value is not None:
+            result["timestamp"] = value
+        value = self.sender
+        if value is not None:
+            result["sender"] = value
+        value = self.severity
+        if value is not None:
+            result["severity"] = value
+        return result
+
+
+class MagneticVector(_Model):
+    """Magnetic vector."""
+
+    __slots__ = ("north", "east", "down")
+
+    north: int | None
+    """North component, in nanoteslas."""
+
+    east: int | None
+    """East component, in nanoteslas."""
+
+    down: int | None
+    """Down component, in nanoteslas."""
+
+    MIN_ITEMS: ClassVar[int] = 0
+
+    def __init__(
+        self,
+        north: int | None = None,
+        east: int | None = None,
+        down: int | None = None,
+    ) -> None:
+        self.north = north
+        self.east = east
+        self.down = down
+
+    @classmethod
+    def from_json(cls, obj: Any) -> MagneticVector:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not list:
+            raise DecodeError("must be array")
+        length = len(obj)
+        if length < cls.MIN_ITEMS:
+            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")
+        self = object.__new__(cls)
+        key = 0
+        try:
+            key = 0
+            value = obj[0] if length > 0 else None
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.north = value
+            key = 1
+            value = obj[1] if length > 1 else None
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.east = value
+            key = 2
+            value = obj[2] if length > 2 else None
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.down = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> list[Any]:
+        """Returns the JSON representation of this instance."""
+        result = [self.north, self.east, self.down]
+        while len(result) > 0 and result[-1] is None:
+            result.pop()
+        return result
+
+
+class MessageObservations(_Model):
+    """RTK message observations.
+
+    RTK message observation statistics.
+    """
+
+    __slots__ = ("age", "size")
+
+    age: int
+    """The age of the last observation in milliseconds."""
+
+    size: float
+    """Size of the observation in bits per second."""
+
+    MIN_ITEMS: ClassVar[int] = 2
+
+    def __init__(self, age: int, size: float) -> None:
+        self.age = age
+        self.size = size
+
+    @classmethod
+    def from_json(cls, obj: Any) -> MessageObservations:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not list:
+            raise DecodeError("must be array")
+        length = len(obj)
+        if length < cls.MIN_ITEMS:
+            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")
+        self = object.__new__(cls)
+        key = 0
+        try:
+            key = 0
+            value = obj[0]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.age = value
+            key = 1
+            value = obj[1]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.size = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> list[Any]:
+        """Returns the JSON representation of this instance."""
+        result = [self.age, self.size]
+        return result
+
+
+class ObjCmdRequest(_Model):
+    __slots__ = ("type", "ids", "command", "args", "kwds")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the objects that the message refers to."""
+
+    command: str
+    """The command to send."""
+
+    args: list[Any] | None
+    """Positional arguments of the command."""
+
+    kwds: dict[str, Any] | None
+    """Keyword arguments of the command."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("command", "ids", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        command: str,
+        type: str = "OBJ-CMD",
+        args: list[Any] | None = None,
+        kwds: dict[str, Any] | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.command = command
+        self.args = args
+        self.kwds = kwds
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ObjCmdRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "OBJ-CMD":
+                raise DecodeError("must be equal to 'OBJ-CMD'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "command"
+            value = obj["command"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.command = value
+            key = "args"
+            value = obj.get("args")
+            if value is not None:
+                if type(value) is not list:
+                    raise DecodeError("must be array")
+            elif "args" in obj:
+                raise DecodeError("must not be null")
+            self.args = value
+            key = "kwds"
+            value = obj.get("kwds")
+            if value is not None:
+                if type(value) is not dict:
+                    raise DecodeError("must be object")
+            elif "kwds" in obj:
+                raise DecodeError("must not be null")
+            self.kwds = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "type": self.type,
+            "ids": self.ids,
+            "command": self.command,
+        }
+        value = self.args
+        if value is not None:
+            result["args"] = value
+        value = self.kwds
+        if value is not None:
+            result["kwds"] = value
+        return result
+
+
+class ObjCmdResponse(_Model):
+    __slots__ = ("type", "receipt", "error", "result")
+
+    type: str
+
+    receipt: dict[str, str] | None
+
+    error: dict[str, str] | None
+
+    result: dict[str, Any] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "OBJ-CMD",
+        receipt: dict[str, str] | None = None,
+        error: dict[str, str] | None = None,
+        result: dict[str, Any] | None = None,
+    ) -> None:
+        self.type = type
+        self.receipt = receipt
+        self.error = error
+        self.result = result
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ObjCmdResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "OBJ-CMD":
+                raise DecodeError("must be equal to 'OBJ-CMD'")
+            self.type = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_0)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        return result
+
+
+class ObjDelNotification(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the objects that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "OBJ-DEL") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ObjDelNotification:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "OBJ-DEL":
+                raise DecodeError("must be equal to 'OBJ-DEL'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class ObjListRequest(_Model):
+    __slots__ = ("type", "filter")
+
+    type: str
+
+    filter: list[str] | None
+    """Types of objects that the user is interested in."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("filter", "type"))
+
+    def __init__(self, type: str = "OBJ-LIST", filter: list[str] | None = None) -> None:
+        self.type = type
+        self.filter = filter
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ObjListRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "OBJ-LIST":
+                raise DecodeError("must be equal to 'OBJ-LIST'")
+            self.type = value
+            key = "filter"
+            value = obj.get("filter")
+            if value is not None:
+                value = _decode_list(value, _decode_1)
+            elif "filter" in obj:
+                raise DecodeError("must not be null")
+            self.filter = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.filter
+        if value is not None:
+            result["filter"] = value
+        return result
+
+
+class ObjListResponse(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the objects that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "OBJ-LIST") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ObjListResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "OBJ-LIST":
+                raise DecodeError("must be equal to 'OBJ-LIST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class PositionXYZ(_Model):
+    """Position (XYZ).
+
+    Position in a local right-handed XYZ coordinate system.
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    x: int
+    """X component of the vector, in mm."""
+
+    y: int
+    """Y component of the vector, in mm."""
+
+    z: int
+    """Z component of the vector, in mm."""
+
+    MIN_ITEMS: ClassVar[int] = 3
+
+    def __init__(self, x: int, y: int, z: int) -> None:
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @classmethod
+    def from_json(cls, obj: Any) -> PositionXYZ:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not list:
+            raise DecodeError("must be array")
+        length = len(obj)
+        if length < cls.MIN_ITEMS:
+            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")
+        self = object.__new__(cls)
+        key = 0
+        try:
+            key = 0
+            value = obj[0]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.x = value
+            key = 1
+            value = obj[1]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.y = value
+            key = 2
+            value = obj[2]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.z = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> list[Any]:
+        """Returns the JSON representation of this instance."""
+        result = [self.x, self.y, self.z]
+        return result
+
+
+class PreflightCheckInfo(_Model):
+    """UAV preflight check info.
+
+    Preflight check information of a single UAV.
+    """
+
+    __slots__ = ("items", "message", "result")
+
+    items: list[PreflightCheckItem]
+    """Preflight check items."""
+
+    message: str | None
+    """Preflight check summary message."""
+
+    result: str
+    """Result of the preflight check or a single item in a preflight checklist."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("items", "result"))
+
+    def __init__(
+        self,
+        items: list[PreflightCheckItem],
+        result: str,
+        message: str | None = None,
+    ) -> None:
+        self.items = items
+        self.message = message
+        self.result = result
+
+    @classmethod
+    def from_json(cls, obj: Any) -> PreflightCheckInfo:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "items"
+            value = obj["items"]
+            value = _decode_list(value, PreflightCheckItem.from_json)
+            self.items = value
+            key = "message"
+            value = obj.get("message")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "message" in obj:
+                raise DecodeError("must not be null")
+            self.message = value
+            key = "result"
+            value = obj["result"]
+            if value not in _ENUM_9:
+                raise DecodeError(f"must be one of {list(_ENUM_9)}")
+            self.result = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "items": [item.to_json() for item in self.items],
+            "result": self.result,
+        }
+        value = self.message
+        if value is not None:
+            result["message"] = value
+        return result
+
+
+class PreflightCheckItem(_Model):
+    """A single item in a preflight checklist."""
+
+    __slots__ = ("id", "label", "result", "message")
+
+    id: str
+
+    label: str | None
+    """Label of the preflight checklist item."""
+
+    result: str
+    """Result of the preflight check or a single item in a preflight checklist."""
+
+    message: str | None
+    """Detailed message for the preflight checklist item."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "result"))
+
+    def __init__(
+        self,
+        id: str,
+        result: str,
+        label: str | None = None,
+        message: str | None = None,
+    ) -> None:
+        self.id = id
+        self.label = label
+        self.result = result
+        self.message = message
+
+    @classmethod
+    def from_json(cls, obj: Any) -> PreflightCheckItem:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "label"
+            value = obj.get("label")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "label" in obj:
+                raise DecodeError("must not be null")
+            self.label = value
+            key = "result"
+            value = obj["result"]
+            if value not in _ENUM_9:
+                raise DecodeError(f"must be one of {list(_ENUM_9)}")
+            self.result = value
+            key = "message"
+            value = obj.get("message")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "message" in obj:
+                raise DecodeError("must not be null")
+            self.message = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"id": self.id, "result": self.result}
+        value = self.label
+        if value is not None:
+            result["label"] = value
+        value = self.message
+        if value is not None:
+            result["message"] = value
+        return result
+
+
+class PrmGetRequest(_Model):
+    __slots__ = ("type", "ids", "name")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the objects that the message refers to."""
+
+    name: str
+    """The name of the parameter."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "name", "type"))
+
+    def __init__(self, ids: list[str], name: str, type: str = "PRM-GET") -> None:
+        self.type = type
+        self.ids = ids
+        self.name = name
+
+    @classmethod
+    def from_json(cls, obj: Any) -> PrmGetRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "PRM-GET":
+                raise DecodeError("must be equal to 'PRM-GET'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "name"
+            value = obj["name"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.name = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids, "name": self.name}
+
+
+class PrmGetResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, Any] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "PRM-GET",
+        result: dict[str, Any] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> PrmGetResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "PRM-GET":
+                raise DecodeError("must be equal to 'PRM-GET'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                if type(value) is not dict:
+                    raise DecodeError("must be object")
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class PrmSetManyRequest(_Model):
+    __slots__ = ("type", "ids", "parameters")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the objects that the message refers to."""
+
+    parameters: dict[str, Any]
+    """Mapping from parameter names to the corresponding values."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "parameters", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        parameters: dict[str, Any],
+        type: str = "PRM-SET-MANY",
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.parameters = parameters
+
+    @classmethod
+    def from_json(cls, obj: Any) -> PrmSetManyRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "PRM-SET-MANY":
+                raise DecodeError("must be equal to 'PRM-SET-MANY'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "parameters"
+            value = obj["parameters"]
+            if type(value) is not dict:
+                raise DecodeError("must be object")
+            self.parameters = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids, "parameters": self.parameters}
+
+
+class PrmSetManyResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, PrmSetManyResponseResultItem] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "PRM-SET-MANY",
+        result: dict[str, PrmSetManyResponseResultItem] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> PrmSetManyResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "PRM-SET-MANY":
+                raise DecodeError("must be equal to 'PRM-SET-MANY'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, PrmSetManyResponseResultItem.from_json)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class PrmSetManyResponseResultItem(_Model):
+    __slots__ = ("success", "failed")
+
+    success: bool
+
+    failed: list[str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("success",))
+
+    def __init__(self, success: bool, failed: list[str] | None = None) -> None:
+        self.success = success
+        self.failed = failed
+
+    @classmethod
+    def from_json(cls, obj: Any) -> PrmSetManyResponseResultItem:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "success"
+            value = obj["success"]
+            if type(value) is not bool:
+                raise DecodeError("must be boolean")
+            self.success = value
+            key = "failed"
+            value = obj.get("failed")
+            if value is not None:
+                value = _decode_list(value, _decode_1)
+            elif "failed" in obj:
+                raise DecodeError("must not be null")
+            self.failed = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"success": self.success}
+        value = self.failed
+        if value is not None:
+            result["failed"] = value
+        return result
+
+
+class PrmSetRequest(_Model):
+    __slots__ = ("type", "ids", "name", "value")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the objects that the message refers to."""
+
+    name: str
+    """The name of the parameter."""
+
+    value: Any
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "name", "type", "value"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        name: str,
+        value: Any,
+        type: str = "PRM-SET",
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.name = name
+        self.value = value
+
+    @classmethod
+    def from_json(cls, obj: Any) -> PrmSetRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "PRM-SET":
+                raise DecodeError("must be equal to 'PRM-SET'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "name"
+            value = obj["name"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.name = value
+            key = "value"
+            value = obj["value"]
+            self.value = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {
+            "type": self.type,
+            "ids": self.ids,
+            "name": self.name,
+            "value": self.value,
+        }
+
+
+class PrmSetResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "PRM-SET",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> PrmSetResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "PRM-SET":
+                raise DecodeError("must be equal to 'PRM-SET'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class Progress(_Model):
+    """Progress information.
+
+    Progress of some operation being executed on a UAV.
+    """
+
+    __slots__ = ("percentage", "message", "object")
+
+    percentage: int | None
+
+    message: str | None
+
+    object: dict[str, Any] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(())
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("message", "object", "percentage"))
+
+    def __init__(
+        self,
+        percentage: int | None = None,
+        message: str | None = None,
+        object: dict[str, Any] | None = None,
+    ) -> None:
+        self.percentage = percentage
+        self.message = message
+        self.object = object
+
+    @classmethod
+    def from_json(cls, obj: Any) -> Progress:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "percentage"
+            value = obj.get("percentage")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "percentage" in obj:
+                raise DecodeError("must not be null")
+            self.percentage = value
+            key = "message"
+            value = obj.get("message")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "message" in obj:
+                raise DecodeError("must not be null")
+            self.message = value
+            key = "object"
+            value = obj.get("object")
+            if value is not None:
+                if type(value) is not dict:
+                    raise DecodeError("must be object")
+            elif "object" in obj:
+                raise DecodeError("must not be null")
+            self.object = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {}
+        value = self.percentage
+        if value is not None:
+            result["percentage"] = value
+        value = self.message
+        if value is not None:
+            result["message"] = value
+        value = self.object
+        if value is not None:
+            result["object"] = value
+        return result
+
+
+class RTHTransformationParameters(_Model):
+    """RTH transformation parameters.
+
+    Parameters for adapting the RTH (return-to-home) segment of the drone show.
+    """
+
+    __slots__ = (
+        "method",
+        "lights",
+        "min_distance",
+        "velocity_xy",
+        "velocity_z",
+        "altitude",
+        "replace",
+    )
+
+    method: str | None
+    """The RTH method to use. Accepted values: 'plain' (brings the drones to the
+    possibly layered floating grid of the end of their takeoff positions with a
+    collectively optimal transition, _not_ preserving individual home positions. A
+    final integrated land phase follows), 'smart' (brings the drones to their
+    individual home positions, while avoiding drones being closer to each other than
+    the minimum distance threshold thoughout the entire RTH and its final integrated
+    land phase). Default: 'smart'.
+    """
+
+    lights: Any | None
+    """Light effect configuration for the drones during RTH, or a brightness value in
+    the [0, 1] interval to use with the default light configuration.
+    """
+
+    min_distance: float | None
+    """Minimum distance to keep between drones during RTH, in meters. If not specified,
+    the configured validation setting will be used.
+    """
+
+    velocity_xy: float | None
+    """The horizontal RTH speed to use, in m/s. Default value is 5 m/s."""
+
+    velocity_z: float | None
+    """The vertical RTH and land speed to use, in m/s. Default value is 2 m/s."""
+
+    altitude: float | None
+    """The altitude of the smart RTH from where vertical land is called, in meters. If
+    not specified, the minimum navigation altitude will be used as a default.
+    """
+
+    replace: bool | None
+    """Whether to replace the existing RTH and land segment if the show segment is
+    defined. Default: false.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(())
+
+    def __init__(
+        self,
+        method: str | None = None,
+        lights: Any | None = None,
+        min_distance: float | None = None,
+        velocity_xy: float | None = None,
+        velocity_z: float | None = None,
+        altitude: float | None = None,
+        replace: bool | None = None,
+    ) -> None:
+        self.method = method
+        self.lights = lights
+        self.min_distance = min_distance
+        self.velocity_xy = velocity_xy
+        self.velocity_z = velocity_z
+        self.altitude = altitude
+        self.replace = replace
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RTHTransformationParameters:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "method"
+            value = obj.get("method")
+            if value is not None:
+                if value not in _ENUM_10:
+                    raise DecodeError(f"must be one of {list(_ENUM_10)}")
+            elif "method" in obj:
+                raise DecodeError("must not be null")
+            self.method = value
+            key = "lights"
+            value = obj.get("lights")
+            self.lights = value
+            key = "min_distance"
+            value = obj.get("min_distance")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "min_distance" in obj:
+                raise DecodeError("must not be null")
+            self.min_distance = value
+            key = "velocity_xy"
+            value = obj.get("velocity_xy")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "velocity_xy" in obj:
+                raise DecodeError("must not be null")
+            self.velocity_xy = value
+            key = "velocity_z"
+            value = obj.get("velocity_z")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "velocity_z" in obj:
+                raise DecodeError("must not be null")
+            self.velocity_z = value
+            key = "altitude"
+            value = obj.get("altitude")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "altitude" in obj:
+                raise DecodeError("must not be null")
+            self.altitude = value
+            key = "replace"
+            value = obj.get("replace")
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            elif "replace" in obj:
+                raise DecodeError("must not be null")
+            self.replace = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {}
+        value = self.method
+        if value is not None:
+            result["method"] = value
+        value = self.lights
+        if value is not None:
+            result["lights"] = value
+        value = self.min_distance
+        if value is not None:
+            result["min_distance"] = value
+        value = self.velocity_xy
+        if value is not None:
+            result["velocity_xy"] = value
+        value = self.velocity_z
+        if value is not None:
+            result["velocity_z"] = value
+        value = self.altitude
+        if value is not None:
+            result["altitude"] = value
+        value = self.replace
+        if value is not None:
+            result["replace"] = value
+        return result
+
+
+class RTKConfigurationPreset(_Model):
+    """RTK configuration preset.
+
+    Information about an RTK preset.
+    """
+
+    __slots__ = ("title", "type", "format", "sources")
+
+    title: str
+    """A human-readable title of the preset."""
+
+    type: str | None
+    """The type of the preset (built-in, created automatically or added by the user)."""
+
+    format: str
+    """Format of the GPS messages arriving in this configuration."""
+
+    sources: list[str]
+    """List of source connections where this preset collects messages from."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("format", "sources", "title"))
+
+    def __init__(
+        self,
+        title: str,
+        format: str,
+        sources: list[str],
+        type: str | None = None,
+    ) -> None:
+        self.title = title
+        self.type = type
+        self.format = format
+        self.sources = sources
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RTKConfigurationPreset:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "title"
+            value = obj["title"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.title = value
+            key = "type"
+            value = obj.get("type")
+            if value is not None:
+                if value not in _ENUM_11:
+                    raise DecodeError(f"must be one of {list(_ENUM_11)}")
+            elif "type" in obj:
+                raise DecodeError("must not be null")
+            self.type = value
+            key = "format"
+            value = obj["format"]
+            if value not in _ENUM_12:
+                raise DecodeError(f"must be one of {list(_ENUM_12)}")
+            self.format = value
+            key = "sources"
+            value = obj["sources"]
+            value = _decode_list(value, _decode_1)
+            self.sources = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "title": self.title,
+            "format": self.format,
+            "sources": self.sources,
+        }
+        value = self.type
+        if value is not None:
+            result["type"] = value
+        return result
+
+
+class RTKSurveySettings(_Model):
+    """RTK survey settings."""
+
+    __slots__ = ("duration", "accuracy", "message_set", "position", "gnss_types")
+
+    duration: float
+    """Minimum duration of RTK survey."""
+
+    accuracy: float
+    """Expected RTK survey position accuracy in meters."""
+
+    message_set: str | None
+    """RTK message set to use."""
+
+    position: ECEFCoordinate | None
+    """Earth-centered Earth-fixed coordinate of an object."""
+
+    gnss_types: list[str] | None
+    """GNSS types."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("accuracy", "duration"))
+
+    def __init__(
+        self,
+        duration: float,
+        accuracy: float,
+        message_set: str | None = None,
+        position: ECEFCoordinate | None = None,
+        gnss_types: list[str] | None = None,
+    ) -> None:
+        self.duration = duration
+        self.accuracy = accuracy
+        self.message_set = message_set
+        self.position = position
+        self.gnss_types = gnss_types
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RTKSurveySettings:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "duration"
+            value = obj["duration"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.duration = value
+            key = "accuracy"
+            value = obj["accuracy"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.accuracy = value
+            key = "messageSet"
+            value = obj.get("messageSet")
+            if value is not None:
+                if value not in _ENUM_13:
+                    raise DecodeError(f"must be one of {list(_ENUM_13)}")
+            elif "messageSet" in obj:
+                raise DecodeError("must not be null")
+            self.message_set = value
+            key = "position"
+            value = obj.get("position")
+            if value is not None:
+                value = ECEFCoordinate.from_json(value)
+            elif "position" in obj:
+                raise DecodeError("must not be null")
+            self.position = value
+            key = "gnssTypes"
+            value = obj.get("gnssTypes")
+            if value is not None:
+                value = _decode_list(value, _decode_5)
+            elif "gnssTypes" in obj:
+                raise DecodeError("must not be null")
+            self.gnss_types = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"duration": self.duration, "accuracy": self.accuracy}
+        value = self.message_set
+        if value is not None:
+            result["messageSet"] = value
+        value = self.position
+        if value is not None:
+            result["position"] = value.to_json()
+        value = self.gnss_types
+        if value is not None:
+            result["gnssTypes"] = value
+        return result
+
+
+class RtkInfRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the RTK presets that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "RTK-INF") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RtkInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "RTK-INF":
+                raise DecodeError("must be equal to 'RTK-INF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class RtkInfResponse(_Model):
+    __slots__ = ("type", "preset", "error")
+
+    type: str
+
+    preset: dict[str, RTKConfigurationPreset]
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("preset", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "preset", "type"))
+
+    def __init__(
+        self,
+        preset: dict[str, RTKConfigurationPreset],
+        type: str = "RTK-INF",
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.preset = preset
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RtkInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "RTK-INF":
+                raise DecodeError("must be equal to 'RTK-INF'")
+            self.type = value
+            key = "preset"
+            value = obj["preset"]
+            value = _decode_map(value, RTKConfigurationPreset.from_json)
+            self.preset = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "type": self.type,
+            "preset": {key: item.to_json() for key, item in self.preset.items()},
+        }
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class RtkListRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "RTK-LIST") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RtkListRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "RTK-LIST":
+                raise DecodeError("must be equal to 'RTK-LIST'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class RtkListResponse(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the RTK presets that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "RTK-LIST") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RtkListResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "RTK-LIST":
+                raise DecodeError("must be equal to 'RTK-LIST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class RtkSourceRequest(_Model):
+    __slots__ = ("type", "id")
+
+    type: str
+
+    id: str | None | _Missing
+    """The ID of the RTK source to use."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(
+        self,
+        type: str = "RTK-SOURCE",
+        id: str | None | _Missing = _MISSING,
+    ) -> None:
+        self.type = type
+        self.id = id
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RtkSourceRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "RTK-SOURCE":
+                raise DecodeError("must be equal to 'RTK-SOURCE'")
+            self.type = value
+            key = "id"
+            value = obj.get("id", _MISSING)
+            if value is not None and value is not _MISSING:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            self.id = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.id
+        if value is not _MISSING:
+            result["id"] = value
+        return result
+
+
+class RtkSourceResponse(_Model):
+    __slots__ = ("type", "id")
+
+    type: str
+
+    id: str | None
+    """The ID of the RTK source used."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("id", "type"))
+
+    def __init__(self, id: str | None, type: str = "RTK-SOURCE") -> None:
+        self.type = type
+        self.id = id
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RtkSourceResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "RTK-SOURCE":
+                raise DecodeError("must be equal to 'RTK-SOURCE'")
+            self.type = value
+            key = "id"
+            value = obj["id"]
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            self.id = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "id": self.id}
+
+
+class RtkStatRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "RTK-STAT") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RtkStatRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "RTK-STAT":
+                raise DecodeError("must be equal to 'RTK-STAT'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class RtkStatResponse(_Model):
+    __slots__ = ("type", "antenna", "messages", "messages_tx", "cnr", "survey")
+
+    type: str | None
+
+    antenna: AntennaInformation
+    """Information about an RTK antenna."""
+
+    messages: dict[str, MessageObservations]
+
+    messages_tx: dict[str, MessageObservations] | None
+
+    cnr: dict[str, float]
+
+    survey: SurveyStatus
+    """RTK survey accuracy and flags."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(
+        ("antenna", "cnr", "messages", "survey")
+    )
+    KNOWN: ClassVar[frozenset[str]] = frozenset(
+        ("antenna", "cnr", "messages", "messages_tx", "survey", "type")
+    )
+
+    def __init__(
+        self,
+        antenna: AntennaInformation,
+        messages: dict[str, MessageObservations],
+        cnr: dict[str, float],
+        survey: SurveyStatus,
+        type: str = "RTK-STAT",
+        messages_tx: dict[str, MessageObservations] | None = None,
+    ) -> None:
+        self.type = type
+        self.antenna = antenna
+        self.messages = messages
+        self.messages_tx = messages_tx
+        self.cnr = cnr
+        self.survey = survey
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RtkStatResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj.get("type")
+            if value is not None:
+                if value != "RTK-STAT":
+                    raise DecodeError("must be equal to 'RTK-STAT'")
+            elif "type" in obj:
+                raise DecodeError("must not be null")
+            self.type = value
+            key = "antenna"
+            value = obj["antenna"]
+            value = AntennaInformation.from_json(value)
+            self.antenna = value
+            key = "messages"
+            value = obj["messages"]
+            value = _decode_map(value, MessageObservations.from_json)
+            self.messages = value
+            key = "messages_tx"
+            value = obj.get("messages_tx")
+            if value is not None:
+                value = _decode_map(value, MessageObservations.from_json)
+            elif "messages_tx" in obj:
+                raise DecodeError("must not be null")
+            self.messages_tx = value
+            key = "cnr"
+            value = obj["cnr"]
+            value = _decode_map(value, _decode_6)
+            self.cnr = value
+            key = "survey"
+            value = obj["survey"]
+            value = SurveyStatus.from_json(value)
+            self.survey = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "antenna": self.antenna.to_json(),
+            "messages": {key: item.to_json() for key, item in self.messages.items()},
+            "cnr": self.cnr,
+            "survey": self.survey.to_json(),
+        }
+        value = self.type
+        if value is not None:
+            result["type"] = value
+        value = self.messages_tx
+        if value is not None:
+            result["messages_tx"] = {key: item.to_json() for key, item in value.items()}
+        return result
+
+
+class RtkSurveyRequest(_Model):
+    __slots__ = ("type", "settings")
+
+    type: str
+
+    settings: RTKSurveySettings | None
+    """RTK survey settings."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(
+        self,
+        type: str = "RTK-SURVEY",
+        settings: RTKSurveySettings | None = None,
+    ) -> None:
+        self.type = type
+        self.settings = settings
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RtkSurveyRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "RTK-SURVEY":
+                raise DecodeError("must be equal to 'RTK-SURVEY'")
+            self.type = value
+            key = "settings"
+            value = obj.get("settings")
+            if value is not None:
+                value = RTKSurveySettings.from_json(value)
+            elif "settings" in obj:
+                raise DecodeError("must not be null")
+            self.settings = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.settings
+        if value is not None:
+            result["settings"] = value.to_json()
+        return result
+
+
+class RtkSurveyResponse(_Model):
+    __slots__ = ("type", "settings")
+
+    type: str
+
+    settings: RTKSurveySettings
+    """RTK survey settings."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("settings", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("settings", "type"))
+
+    def __init__(self, settings: RTKSurveySettings, type: str = "RTK-SURVEY") -> None:
+        self.type = type
+        self.settings = settings
+
+    @classmethod
+    def from_json(cls, obj: Any) -> RtkSurveyResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "RTK-SURVEY":
+                raise DecodeError("must be equal to 'RTK-SURVEY'")
+            self.type = value
+            key = "settings"
+            value = obj["settings"]
+            value = RTKSurveySettings.from_json(value)
+            self.settings = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "settings": self.settings.to_json()}
+
+
+class ShiftTransformationParameters(_Model):
+    """Shift transformation parameters.
+
+    Parameters for shifting the altitude of the show segment.
+    """
+
+    __slots__ = ("z",)
+
+    z: float | None
+    """Vertical shift to apply to the show segment, in meters."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(())
+
+    def __init__(self, z: float | None = None) -> None:
+        self.z = z
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShiftTransformationParameters:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "z"
+            value = obj.get("z")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "z" in obj:
+                raise DecodeError("must not be null")
+            self.z = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {}
+        value = self.z
+        if value is not None:
+            result["z"] = value
+        return result
+
+
+class ShowAdaptRequest(_Model):
+    __slots__ = ("type", "show", "transformations", "environment")
+
+    type: str
+
+    show: str
+    """Base64-encoded .skyc show file to adapt."""
+
+    transformations: list[Any]
+    """List of transformations to apply to the show."""
+
+    environment: ShowAdaptRequestEnvironment
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(
+        ("environment", "show", "transformations", "type")
+    )
+
+    def __init__(
+        self,
+        show: str,
+        transformations: list[Any],
+        environment: ShowAdaptRequestEnvironment,
+        type: str = "SHOW-ADAPT",
+    ) -> None:
+        self.type = type
+        self.show = show
+        self.transformations = transformations
+        self.environment = environment
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowAdaptRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-ADAPT":
+                raise DecodeError("must be equal to 'SHOW-ADAPT'")
+            self.type = value
+            key = "show"
+            value = obj["show"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.show = value
+            key = "transformations"
+            value = obj["transformations"]
+            value = _decode_list(value, _decode_0)
+            self.transformations = value
+            key = "environment"
+            value = obj["environment"]
+            value = ShowAdaptRequestEnvironment.from_json(value)
+            self.environment = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {
+            "type": self.type,
+            "show": self.show,
+            "transformations": self.transformations,
+            "environment": self.environment.to_json(),
+        }
+
+
+class ShowAdaptRequestEnvironment(_Model):
+    __slots__ = ("location",)
+
+    location: ShowAdaptRequestEnvironmentLocation
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("location",))
+
+    def __init__(self, location: ShowAdaptRequestEnvironmentLocation) -> None:
+        self.location = location
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowAdaptRequestEnvironment:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "location"
+            value = obj["location"]
+            value = ShowAdaptRequestEnvironmentLocation.from_json(value)
+            self.location = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"location": self.location.to_json()}
+
+
+class ShowAdaptRequestEnvironmentLocation(_Model):
+    __slots__ = ("origin", "orientation")
+
+    origin: GPSCoordinate
+    """GPS coordinate of an object."""
+
+    orientation: float
+    """Orientation of the show coordinate system relative to true north, in degrees."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("orientation", "origin"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("orientation", "origin"))
+
+    def __init__(self, origin: GPSCoordinate, orientation: float) -> None:
+        self.origin = origin
+        self.orientation = orientation
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowAdaptRequestEnvironmentLocation:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "origin"
+            value = obj["origin"]
+            value = GPSCoordinate.from_json(value)
+            self.origin = value
+            key = "orientation"
+            value = obj["orientation"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.orientation = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"origin": self.origin.to_json(), "orientation": self.orientation}
+
+
+class ShowAdaptResponse(_Model):
+    __slots__ = ("type", "show", "takeoff_length_change", "rth_length_change", "reason")
+
+    type: str
+
+    show: str
+    """Base64-encoded .skyc show file with adapted takeoff and RTH segments."""
+
+    takeoff_length_change: float
+    """Change in the length of the takeoff segment compared to the original show file,
+    in seconds.
+    """
+
+    rth_length_change: float
+    """Change in the length of the RTH segment compared to the original show file, in
+    seconds.
+    """
+
+    reason: str | None
+    """Explanation of why the show adaptation failed, if applicable."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(
+        ("rthLengthChange", "show", "takeoffLengthChange", "type")
+    )
+    KNOWN: ClassVar[frozenset[str]] = frozenset(
+        ("reason", "rthLengthChange", "show", "takeoffLengthChange", "type")
+    )
+
+    def __init__(
+        self,
+        show: str,
+        takeoff_length_change: float,
+        rth_length_change: float,
+        type: str = "SHOW-ADAPT",
+        reason: str | None = None,
+    ) -> None:
+        self.type = type
+        self.show = show
+        self.takeoff_length_change = takeoff_length_change
+        self.rth_length_change = rth_length_change
+        self.reason = reason
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowAdaptResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-ADAPT":
+                raise DecodeError("must be equal to 'SHOW-ADAPT'")
+            self.type = value
+            key = "show"
+            value = obj["show"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.show = value
+            key = "takeoffLengthChange"
+            value = obj["takeoffLengthChange"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.takeoff_length_change = value
+            key = "rthLengthChange"
+            value = obj["rthLengthChange"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.rth_length_change = value
+            key = "reason"
+            value = obj.get("reason")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "reason" in obj:
+                raise DecodeError("must not be null")
+            self.reason = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "type": self.type,
+            "show": self.show,
+            "takeoffLengthChange": self.takeoff_length_change,
+            "rthLengthChange": self.rth_length_change,
+        }
+        value = self.reason
+        if value is not None:
+            result["reason"] = value
+        return result
+
+
+class ShowCfgRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "SHOW-CFG") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowCfgRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-CFG":
+                raise DecodeError("must be equal to 'SHOW-CFG'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class ShowCfgResponse(_Model):
+    __slots__ = ("type", "configuration")
+
+    type: str
+
+    configuration: DroneShowConfiguration
+    """Full configuration of a drone show."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("configuration", "type"))
+
+    def __init__(
+        self,
+        configuration: DroneShowConfiguration,
+        type: str = "SHOW-CFG",
+    ) -> None:
+        self.type = type
+        self.configuration = configuration
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowCfgResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-CFG":
+                raise DecodeError("must be equal to 'SHOW-CFG'")
+            self.type = value
+            key = "configuration"
+            value = obj["configuration"]
+            value = DroneShowConfiguration.from_json(value)
+            self.configuration = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "configuration": self.configuration.to_json()}
+
+
+class ShowCrthPlanRequest(_Model):
+    __slots__ = (
+        "type",
+        "show",
+        "preferred_distance",
+        "min_distance",
+        "velocity_xy",
+        "velocity_z",
+        "acceleration",
+        "time_resolution",
+        "first_time",
+        "last_time",
+    )
+
+    type: str
+
+    show: str
+    """Base64-encoded `.skyc` show file to generate collective RTH plans for."""
+
+    preferred_distance: float | None | _Missing
+    """Preferred distance between drones during collective RTH, in meters."""
+
+    min_distance: float | None | _Missing
+    """Minimum distance between drones in collective RTH plans, in meters."""
+
+    velocity_xy: float | None | _Missing
+    """Maximum horizontal velocity of drones during collective RTH, in m/s."""
+
+    velocity_z: float | None | _Missing
+    """Maximum vertical velocity of drones during collective RTH, in m/s."""
+
+    acceleration: float | None | _Missing
+    """Maximum acceleration of drones during collective RTH, in m/s²."""
+
+    time_resolution: int | None | _Missing
+    """Time interval between start times of the generated collective RTH plans, in
+    seconds.
+    """
+
+    first_time: int | None | _Missing
+    """Start time of the first collective RTH plan relative to show start, in seconds.
+    """
+
+    last_time: int | None | _Missing
+    """Start time of the last collective RTH plan relative to show start, in seconds."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("show", "type"))
+
+    def __init__(
+        self,
+        show: str,
+        type: str = "SHOW-CRTH-PLAN",
+        preferred_distance: float | None | _Missing = _MISSING,
+        min_distance: float | None | _Missing = _MISSING,
+        velocity_xy: float | None | _Missing = _MISSING,
+        velocity_z: float | None | _Missing = _MISSING,
+        acceleration: float | None | _Missing = _MISSING,
+        time_resolution: int | None | _Missing = _MISSING,
+        first_time: int | None | _Missing = _MISSING,
+        last_time: int | None | _Missing = _MISSING,
+    ) -> None:
+        self.type = type
+        self.show = show
+        self.preferred_distance = preferred_distance
+        self.min_distance = min_distance
+        self.velocity_xy = velocity_xy
+        self.velocity_z = velocity_z
+        self.acceleration = acceleration
+        self.time_resolution = time_resolution
+        self.first_time = first_time
+        self.last_time = last_time
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowCrthPlanRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-CRTH-PLAN":
+                raise DecodeError("must be equal to 'SHOW-CRTH-PLAN'")
+            self.type = value
+            key = "show"
+            value = obj["show"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.show = value
+            key = "preferred_distance"
+            value = obj.get("preferred_distance", _MISSING)
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            self.preferred_distance = value
+            key = "min_distance"
+            value = obj.get("min_distance", _MISSING)
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            self.min_distance = value
+            key = "velocity_xy"
+            value = obj.get("velocity_xy", _MISSING)
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            self.velocity_xy = value
+            key = "velocity_z"
+            value = obj.get("velocity_z", _MISSING)
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            self.velocity_z = value
+            key = "acceleration"
+            value = obj.get("acceleration", _MISSING)
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            self.acceleration = value
+            key = "time_resolution"
+            value = obj.get("time_resolution", _MISSING)
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.time_resolution = value
+            key = "first_time"
+            value = obj.get("first_time", _MISSING)
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.first_time = value
+            key = "last_time"
+            value = obj.get("last_time", _MISSING)
+            if value is not None and value is not _MISSING:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            self.last_time = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "show": self.show}
+        value = self.preferred_distance
+        if value is not _MISSING:
+            result["preferred_distance"] = value
+        value = self.min_distance
+        if value is not _MISSING:
+            result["min_distance"] = value
+        value = self.velocity_xy
+        if value is not _MISSING:
+            result["velocity_xy"] = value
+        value = self.velocity_z
+        if value is not _MISSING:
+            result["velocity_z"] = value
+        value = self.acceleration
+        if value is not _MISSING:
+            result["acceleration"] = value
+        value = self.time_resolution
+        if value is not _MISSING:
+            result["time_resolution"] = value
+        value = self.first_time
+        if value is not _MISSING:
+            result["first_time"] = value
+        value = self.last_time
+        if value is not _MISSING:
+            result["last_time"] = value
+        return result
+
+
+class ShowCrthPlanResponse(_Model):
+    __slots__ = ("type", "show", "show_duration", "stats")
+
+    type: str
+
+    show: str
+    """Base64-encoded `.skyc` show file with collective RTH plans appended."""
+
+    show_duration: float
+    """Total duration of the show including collective RTH and landing, in seconds."""
+
+    stats: list[CollectiveRthPlanStatEntry]
+    """Statistics about each generated collective RTH plan."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(
+        ("show", "showDuration", "stats", "type")
+    )
+    KNOWN: ClassVar[frozenset[str]] = frozenset(
+        ("show", "showDuration", "stats", "type")
+    )
+
+    def __init__(
+        self,
+        show: str,
+        show_duration: float,
+        stats: list[CollectiveRthPlanStatEntry],
+        type: str = "SHOW-CRTH-PLAN",
+    ) -> None:
+        self.type = type
+        self.show = show
+        self.show_duration = show_duration
+        self.stats = stats
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowCrthPlanResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-CRTH-PLAN":
+                raise DecodeError("must be equal to 'SHOW-CRTH-PLAN'")
+            self.type = value
+            key = "show"
+            value = obj["show"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.show = value
+            key = "showDuration"
+            value = obj["showDuration"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.show_duration = value
+            key = "stats"
+            value = obj["stats"]
+            value = _decode_list(value, CollectiveRthPlanStatEntry.from_json)
+            self.stats = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {
+            "type": self.type,
+            "show": self.show,
+            "showDuration": self.show_duration,
+            "stats": [item.to_json() for item in self.stats],
+        }
+
+
+class ShowCrthStartRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "SHOW-CRTH-START") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowCrthStartRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-CRTH-START":
+                raise DecodeError("must be equal to 'SHOW-CRTH-START'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class ShowCrthStartResponse(_Model):
+    __slots__ = ("type", "schedule")
+
+    type: str
+
+    schedule: list[TimeAxisScheduleSegment]
+    """Time axis schedule of a show, consisting of a list of segments (typically from
+    the future only).
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("schedule", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("schedule", "type"))
+
+    def __init__(
+        self,
+        schedule: list[TimeAxisScheduleSegment],
+        type: str = "SHOW-CRTH-START",
+    ) -> None:
+        self.type = type
+        self.schedule = schedule
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowCrthStartResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-CRTH-START":
+                raise DecodeError("must be equal to 'SHOW-CRTH-START'")
+            self.type = value
+            key = "schedule"
+            value = obj["schedule"]
+            value = _decode_list(value, TimeAxisScheduleSegment.from_json)
+            self.schedule = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {
+            "type": self.type,
+            "schedule": [item.to_json() for item in self.schedule],
+        }
+
+
+class ShowLightsRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "SHOW-LIGHTS") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowLightsRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-LIGHTS":
+                raise DecodeError("must be equal to 'SHOW-LIGHTS'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class ShowLightsResponse(_Model):
+    __slots__ = ("type", "configuration")
+
+    type: str
+
+    configuration: DroneLightsConfiguration
+    """Full configuration of the behaviour of the LED lights on a drone during a drone
+    show.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("configuration", "type"))
+
+    def __init__(
+        self,
+        configuration: DroneLightsConfiguration,
+        type: str = "SHOW-LIGHTS",
+    ) -> None:
+        self.type = type
+        self.configuration = configuration
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowLightsResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-LIGHTS":
+                raise DecodeError("must be equal to 'SHOW-LIGHTS'")
+            self.type = value
+            key = "configuration"
+            value = obj["configuration"]
+            value = DroneLightsConfiguration.from_json(value)
+            self.configuration = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "configuration": self.configuration.to_json()}
+
+
+class ShowResumeRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "SHOW-RESUME") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowResumeRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-RESUME":
+                raise DecodeError("must be equal to 'SHOW-RESUME'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class ShowResumeResponse(_Model):
+    __slots__ = ("type", "schedule")
+
+    type: str
+
+    schedule: list[TimeAxisScheduleSegment]
+    """Time axis schedule of a show, consisting of a list of segments (typically from
+    the future only).
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("schedule", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("schedule", "type"))
+
+    def __init__(
+        self,
+        schedule: list[TimeAxisScheduleSegment],
+        type: str = "SHOW-RESUME",
+    ) -> None:
+        self.type = type
+        self.schedule = schedule
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowResumeResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-RESUME":
+                raise DecodeError("must be equal to 'SHOW-RESUME'")
+            self.type = value
+            key = "schedule"
+            value = obj["schedule"]
+            value = _decode_list(value, TimeAxisScheduleSegment.from_json)
+            self.schedule = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {
+            "type": self.type,
+            "schedule": [item.to_json() for item in self.schedule],
+        }
+
+
+class ShowSetcfgRequest(_Model):
+    __slots__ = ("type", "configuration")
+
+    type: str
+
+    configuration: DroneShowConfiguration
+    """Full configuration of a drone show."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("configuration", "type"))
+
+    def __init__(
+        self,
+        configuration: DroneShowConfiguration,
+        type: str = "SHOW-SETCFG",
+    ) -> None:
+        self.type = type
+        self.configuration = configuration
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowSetcfgRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-SETCFG":
+                raise DecodeError("must be equal to 'SHOW-SETCFG'")
+            self.type = value
+            key = "configuration"
+            value = obj["configuration"]
+            value = DroneShowConfiguration.from_json(value)
+            self.configuration = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "configuration": self.configuration.to_json()}
+
+
+class ShowSetlightsRequest(_Model):
+    __slots__ = ("type", "configuration")
+
+    type: str
+
+    configuration: DroneLightsConfiguration
+    """Full configuration of the behaviour of the LED lights on a drone during a drone
+    show.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("configuration", "type"))
+
+    def __init__(
+        self,
+        configuration: DroneLightsConfiguration,
+        type: str = "SHOW-SETLIGHTS",
+    ) -> None:
+        self.type = type
+        self.configuration = configuration
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowSetlightsRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-SETLIGHTS":
+                raise DecodeError("must be equal to 'SHOW-SETLIGHTS'")
+            self.type = value
+            key = "configuration"
+            value = obj["configuration"]
+            value = DroneLightsConfiguration.from_json(value)
+            self.configuration = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "configuration": self.configuration.to_json()}
+
+
+class ShowSuspendRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "SHOW-SUSPEND") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowSuspendRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-SUSPEND":
+                raise DecodeError("must be equal to 'SHOW-SUSPEND'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class ShowSuspendResponse(_Model):
+    __slots__ = ("type", "schedule")
+
+    type: str
+
+    schedule: list[TimeAxisScheduleSegment]
+    """Time axis schedule of a show, consisting of a list of segments (typically from
+    the future only).
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("schedule", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("schedule", "type"))
+
+    def __init__(
+        self,
+        schedule: list[TimeAxisScheduleSegment],
+        type: str = "SHOW-SUSPEND",
+    ) -> None:
+        self.type = type
+        self.schedule = schedule
+
+    @classmethod
+    def from_json(cls, obj: Any) -> ShowSuspendResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SHOW-SUSPEND":
+                raise DecodeError("must be equal to 'SHOW-SUSPEND'")
+            self.type = value
+            key = "schedule"
+            value = obj["schedule"]
+            value = _decode_list(value, TimeAxisScheduleSegment.from_json)
+            self.schedule = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {
+            "type": self.type,
+            "schedule": [item.to_json() for item in self.schedule],
+        }
+
+
+class StartConditions(_Model):
+    __slots__ = (
+        "authorized",
+        "authorization_scope",
+        "clock",
+        "time",
+        "method",
+        "uav_ids",
+    )
+
+    authorized: bool
+    """Whether the server has received authorization from a human operator to start the
+    show.
+    """
+
+    authorization_scope: str | None
+    """Scope of the show authorization."""
+
+    clock: Any
+
+    time: Any
+    """Timestamp when the drone show should start."""
+
+    method: str
+
+    uav_ids: list[str]
+    """Array containing the IDs of the UAVs that should be started automatically."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(
+        ("authorized", "clock", "method", "time", "uavIds")
+    )
+
+    def __init__(
+        self,
+        authorized: bool,
+        clock: Any,
+        time: Any,
+        method: str,
+        uav_ids: list[str],
+        authorization_scope: str | None = None,
+    ) -> None:
+        self.authorized = authorized
+        self.authorization_scope = authorization_scope
+        self.clock = clock
+        self.time = time
+        self.method = method
+        self.uav_ids = uav_ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> StartConditions:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "authorized"
+            value = obj["authorized"]
+            if type(value) is not bool:
+                raise DecodeError("must be boolean")
+            self.authorized = value
+            key = "authorizationScope"
+            value = obj.get("authorizationScope")
+            if value is not None:
+                if value not in _ENUM_0:
+                    raise DecodeError(f"must be one of {list(_ENUM_0)}")
+            elif "authorizationScope" in obj:
+                raise DecodeError("must not be null")
+            self.authorization_scope = value
+            key = "clock"
+            value = obj["clock"]
+            self.clock = value
+            key = "time"
+            value = obj["time"]
+            self.time = value
+            key = "method"
+            value = obj["method"]
+            if value not in _ENUM_7:
+                raise DecodeError(f"must be one of {list(_ENUM_7)}")
+            self.method = value
+            key = "uavIds"
+            value = obj["uavIds"]
+            value = _decode_list(value, _decode_1)
+            self.uav_ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "authorized": self.authorized,
+            "clock": self.clock,
+            "time": self.time,
+            "method": self.method,
+            "uavIds": self.uav_ids,
+        }
+        value = self.authorization_scope
+        if value is not None:
+            result["authorizationScope"] = value
+        return result
+
+
+class SurveyStatus(_Model):
+    """RTK survey status.
+
+    RTK survey accuracy and flags.
+    """
+
+    __slots__ = ("accuracy", "flags")
+
+    accuracy: float
+    """RTK survey position accuracy in meters."""
+
+    flags: int
+    """RTK survey status flags (0: unknown, 1: supported, 2: active, 4: valid)."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("accuracy", "flags"))
+
+    def __init__(self, accuracy: float, flags: int) -> None:
+        self.accuracy = accuracy
+        self.flags = flags
+
+    @classmethod
+    def from_json(cls, obj: Any) -> SurveyStatus:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "accuracy"
+            value = obj["accuracy"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.accuracy = value
+            key = "flags"
+            value = obj["flags"]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.flags = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"accuracy": self.accuracy, "flags": self.flags}
+
+
+class SysCloseNotification(_Model):
+    __slots__ = ("type", "reason")
+
+    type: str
+
+    reason: str | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "SYS-CLOSE", reason: str | None = None) -> None:
+        self.type = type
+        self.reason = reason
+
+    @classmethod
+    def from_json(cls, obj: Any) -> SysCloseNotification:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SYS-CLOSE":
+                raise DecodeError("must be equal to 'SYS-CLOSE'")
+            self.type = value
+            key = "reason"
+            value = obj.get("reason")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "reason" in obj:
+                raise DecodeError("must not be null")
+            self.reason = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.reason
+        if value is not None:
+            result["reason"] = value
+        return result
+
+
+class SysMsgNotification(_Model):
+    __slots__ = ("type", "items")
+
+    type: str
+
+    items: list[LogMessage]
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("items", "type"))
+
+    def __init__(self, items: list[LogMessage], type: str = "SYS-MSG") -> None:
+        self.type = type
+        self.items = items
+
+    @classmethod
+    def from_json(cls, obj: Any) -> SysMsgNotification:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SYS-MSG":
+                raise DecodeError("must be equal to 'SYS-MSG'")
+            self.type = value
+            key = "items"
+            value = obj["items"]
+            value = _decode_list(value, LogMessage.from_json)
+            self.items = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "items": [item.to_json() for item in self.items]}
+
+
+class SysPingRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "SYS-PING") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> SysPingRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SYS-PING":
+                raise DecodeError("must be equal to 'SYS-PING'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class SysPortsRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "SYS-PORTS") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> SysPortsRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SYS-PORTS":
+                raise DecodeError("must be equal to 'SYS-PORTS'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class SysPortsResponse(_Model):
+    __slots__ = ("type", "ports")
+
+    type: str
+
+    ports: dict[str, float]
+    """Mapping of services offered by the server to the corresponding ports."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ports", "type"))
+
+    def __init__(self, ports: dict[str, float], type: str = "SYS-PORTS") -> None:
+        self.type = type
+        self.ports = ports
+
+    @classmethod
+    def from_json(cls, obj: Any) -> SysPortsResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SYS-PORTS":
+                raise DecodeError("must be equal to 'SYS-PORTS'")
+            self.type = value
+            key = "ports"
+            value = obj["ports"]
+            value = _decode_map(value, _decode_6)
+            self.ports = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ports": self.ports}
+
+
+class SysTimeRequest(_Model):
+    __slots__ = ("type", "adjustment")
+
+    type: str
+
+    adjustment: float | None
+    """The number of milliseconds that the clock of the server should be forwarded by.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("adjustment", "type"))
+
+    def __init__(self, type: str = "SYS-TIME", adjustment: float | None = None) -> None:
+        self.type = type
+        self.adjustment = adjustment
+
+    @classmethod
+    def from_json(cls, obj: Any) -> SysTimeRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SYS-TIME":
+                raise DecodeError("must be equal to 'SYS-TIME'")
+            self.type = value
+            key = "adjustment"
+            value = obj.get("adjustment")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "adjustment" in obj:
+                raise DecodeError("must not be null")
+            self.adjustment = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.adjustment
+        if value is not None:
+            result["adjustment"] = value
+        return result
+
+
+class SysTimeResponse(_Model):
+    __slots__ = ("type", "timestamp")
+
+    type: str
+
+    timestamp: int
+    """The current UNIX timestamp on the server in milliseconds."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("timestamp", "type"))
+
+    def __init__(self, timestamp: int, type: str = "SYS-TIME") -> None:
+        self.type = type
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_json(cls, obj: Any) -> SysTimeResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SYS-TIME":
+                raise DecodeError("must be equal to 'SYS-TIME'")
+            self.type = value
+            key = "timestamp"
+            value = obj["timestamp"]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.timestamp = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "timestamp": self.timestamp}
+
+
+class SysVerRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "SYS-VER") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> SysVerRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SYS-VER":
+                raise DecodeError("must be equal to 'SYS-VER'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class SysVerResponse(_Model):
+    __slots__ = ("type", "name", "software", "version", "revision")
+
+    type: str
+
+    name: str | None
+    """The name of the server."""
+
+    software: str
+    """The name of the server implementation."""
+
+    version: str
+    """Version number in major.minor.patch format; minor and patch versions are
+    optional.
+    """
+
+    revision: str | None
+    """The revision number of the server, if known."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("software", "type", "version"))
+
+    def __init__(
+        self,
+        software: str,
+        version: str,
+        type: str = "SYS-VER",
+        name: str | None = None,
+        revision: str | None = None,
+    ) -> None:
+        self.type = type
+        self.name = name
+        self.software = software
+        self.version = version
+        self.revision = revision
+
+    @classmethod
+    def from_json(cls, obj: Any) -> SysVerResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "SYS-VER":
+                raise DecodeError("must be equal to 'SYS-VER'")
+            self.type = value
+            key = "name"
+            value = obj.get("name")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "name" in obj:
+                raise DecodeError("must not be null")
+            self.name = value
+            key = "software"
+            value = obj["software"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.software = value
+            key = "version"
+            value = obj["version"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.version = value
+            key = "revision"
+            value = obj.get("revision")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "revision" in obj:
+                raise DecodeError("must not be null")
+            self.revision = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "type": self.type,
+            "software": self.software,
+            "version": self.version,
+        }
+        value = self.name
+        if value is not None:
+            result["name"] = value
+        value = self.revision
+        if value is not None:
+            result["revision"] = value
+        return result
+
+
+class TakeoffTransformationParameters(_Model):
+    """Takeoff transformation parameters.
+
+    Parameters for adapting the takeoff segment of the drone show.
+    """
+
+    __slots__ = (
+        "positions",
+        "duration",
+        "method",
+        "lights",
+        "min_distance",
+        "velocity_xy",
+        "velocity_z",
+        "altitude",
+        "replace",
+    )
+
+    positions: list[Any] | None
+    """Explicit takeoff positions to use, as [x, y, z] coordinates in meters relative to
+    the show origin. If empty, original takeoff positions of drones will be used
+    instead.
+    """
+
+    duration: float | None
+    """Optional overall duration of the transformation to set, in seconds."""
+
+    method: str | None
+    """The takeoff method to use. Accepted values: 'layered' (takeoff to a floating grid
+    from original takeoff positions or explicit positions provided, then morph to the
+    first formation of the show), 'organic' (takeoff with a reversed smart RTH
+    procedure, that provides an organic look and also preserves mapping between
+    takeoff and formation positions). If not specified, it will be inferred from
+    other parameters.
+    """
+
+    lights: Any | None
+    """Light effect configuration for the drones during takeoff, or a brightness value
+    in the [0, 1] interval to use with the default light configuration.
+    """
+
+    min_distance: float | None
+    """Minimum distance to keep between drones during multi-layer takeoff and transition
+    to the first formation, in meters. If not specified, the configured validation
+    setting will be used.
+    """
+
+    velocity_xy: float | None
+    """The horizontal speed to use towards the first formation, in m/s. Default is 5
+    m/s.
+    """
+
+    velocity_z: float | None
+    """The vertical speed to use during takeoff and towards the first formation, in m/s.
+    Default value is 1.5 m/s.
+    """
+
+    altitude: float | None
+    """The takeoff height of the last (lowest) layer before any horizontal motion is
+    planned, in meters. Default value is 10 m/s.
+    """
+
+    replace: bool | None
+    """Whether to replace the existing takeoff segment if the show segment is defined.
+    Default: false.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(())
+
+    def __init__(
+        self,
+        positions: list[Any] | None = None,
+        duration: float | None = None,
+        method: str | None = None,
+        lights: Any | None = None,
+        min_distance: float | None = None,
+        velocity_xy: float | None = None,
+        velocity_z: float | None = None,
+        altitude: float | None = None,
+        replace: bool | None = None,
+    ) -> None:
+        self.positions = positions
+        self.duration = duration
+        self.method = method
+        self.lights = lights
+        self.min_distance = min_distance
+        self.velocity_xy = velocity_xy
+        self.velocity_z = velocity_z
+        self.altitude = altitude
+        self.replace = replace
+
+    @classmethod
+    def from_json(cls, obj: Any) -> TakeoffTransformationParameters:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "positions"
+            value = obj.get("positions")
+            if value is not None:
+                value = _decode_list(value, _decode_0)
+            elif "positions" in obj:
+                raise DecodeError("must not be null")
+            self.positions = value
+            key = "duration"
+            value = obj.get("duration")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "duration" in obj:
+                raise DecodeError("must not be null")
+            self.duration = value
+            key = "method"
+            value = obj.get("method")
+            if value is not None:
+                if value not in _ENUM_15:
+                    raise DecodeError(f"must be one of {list(_ENUM_15)}")
+            elif "method" in obj:
+                raise DecodeError("must not be null")
+            self.method = value
+            key = "lights"
+            value = obj.get("lights")
+            self.lights = value
+            key = "min_distance"
+            value = obj.get("min_distance")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "min_distance" in obj:
+                raise DecodeError("must not be null")
+            self.min_distance = value
+            key = "velocity_xy"
+            value = obj.get("velocity_xy")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "velocity_xy" in obj:
+                raise DecodeError("must not be null")
+            self.velocity_xy = value
+            key = "velocity_z"
+            value = obj.get("velocity_z")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "velocity_z" in obj:
+                raise DecodeError("must not be null")
+            self.velocity_z = value
+            key = "altitude"
+            value = obj.get("altitude")
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            elif "altitude" in obj:
+                raise DecodeError("must not be null")
+            self.altitude = value
+            key = "replace"
+            value = obj.get("replace")
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            elif "replace" in obj:
+                raise DecodeError("must not be null")
+            self.replace = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {}
+        value = self.positions
+        if value is not None:
+            result["positions"] = value
+        value = self.duration
+        if value is not None:
+            result["duration"] = value
+        value = self.method
+        if value is not None:
+            result["method"] = value
+        value = self.lights
+        if value is not None:
+            result["lights"] = value
+        value = self.min_distance
+        if value is not None:
+            result["min_distance"] = value
+        value = self.velocity_xy
+        if value is not None:
+            result["velocity_xy"] = value
+        value = self.velocity_z
+        if value is not None:
+            result["velocity_z"] = value
+        value = self.altitude
+        if value is not None:
+            result["altitude"] = value
+        value = self.replace
+        if value is not None:
+            result["replace"] = value
+        return result
+
+
+class TimeAxisScheduleSegment(_Model):
+    """Time axis schedule segment.
+
+    A single segment of the time axis schedule of a show.
+    """
+
+    __slots__ = ("type", "start_ms", "end_ms", "params")
+
+    type: str
+    """Type of the time axis segment."""
+
+    start_ms: int
+    """Start time of the segment in milliseconds since the Unix epoch."""
+
+    end_ms: Any
+    """End time of the segment in milliseconds since the Unix epoch, 'auto' if not yet
+    calculated, or 'inf' if the segment runs indefinitely.
+    """
+
+    params: dict[str, Any] | None
+    """Additional parameters for the segment."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("endMs", "startMs", "type"))
+
+    def __init__(
+        self,
+        type: str,
+        start_ms: int,
+        end_ms: Any,
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        self.type = type
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.params = params
+
+    @classmethod
+    def from_json(cls, obj: Any) -> TimeAxisScheduleSegment:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value not in _ENUM_17:
+                raise DecodeError(f"must be one of {list(_ENUM_17)}")
+            self.type = value
+            key = "startMs"
+            value = obj["startMs"]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.start_ms = value
+            key = "endMs"
+            value = obj["endMs"]
+            self.end_ms = value
+            key = "params"
+            value = obj.get("params")
+            if value is not None:
+                if type(value) is not dict:
+                    raise DecodeError("must be object")
+            elif "params" in obj:
+                raise DecodeError("must not be null")
+            self.params = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "type": self.type,
+            "startMs": self.start_ms,
+            "endMs": self.end_ms,
+        }
+        value = self.params
+        if value is not None:
+            result["params"] = value
+        return result
+
+
+class TimeSyncSnapshot(_Model):
+    """Time sync snapshot.
+
+    Snapshot of the time synchronization state of the server clock.
+    """
+
+    __slots__ = ("state", "offset", "source", "jitter")
+
+    state: str
+    """Current estimate of whether the server clock is synchronized to the world clock.
+    """
+
+    offset: float | None
+    """Offset between the server clock and the world clock, in seconds."""
+
+    source: str | None
+    """Identifier of the time source used to determine the offset."""
+
+    jitter: float | None
+    """Jitter of the time source used to determine the offset."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(
+        ("jitter", "offset", "source", "state")
+    )
+
+    def __init__(
+        self,
+        state: str,
+        offset: float | None,
+        source: str | None,
+        jitter: float | None,
+    ) -> None:
+        self.state = state
+        self.offset = offset
+        self.source = source
+        self.jitter = jitter
+
+    @classmethod
+    def from_json(cls, obj: Any) -> TimeSyncSnapshot:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "state"
+            value = obj["state"]
+            if value not in _ENUM_16:
+                raise DecodeError(f"must be one of {list(_ENUM_16)}")
+            self.state = value
+            key = "offset"
+            value = obj["offset"]
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            self.offset = value
+            key = "source"
+            value = obj["source"]
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            self.source = value
+            key = "jitter"
+            value = obj["jitter"]
+            if value is not None:
+                if type(value) is not int and type(value) is not float:
+                    raise DecodeError("must be number")
+            self.jitter = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {
+            "state": self.state,
+            "offset": self.offset,
+            "source": self.source,
+            "jitter": self.jitter,
+        }
+
+
+class TimesyncStatusNotification(_Model):
+    __slots__ = ("type", "status")
+
+    type: str
+
+    status: TimeSyncSnapshot
+    """Snapshot of the time synchronization state of the server clock."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("status", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("status", "type"))
+
+    def __init__(self, status: TimeSyncSnapshot, type: str = "TIMESYNC-STATUS") -> None:
+        self.type = type
+        self.status = status
+
+    @classmethod
+    def from_json(cls, obj: Any) -> TimesyncStatusNotification:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "TIMESYNC-STATUS":
+                raise DecodeError("must be equal to 'TIMESYNC-STATUS'")
+            self.type = value
+            key = "status"
+            value = obj["status"]
+            value = TimeSyncSnapshot.from_json(value)
+            self.status = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "status": self.status.to_json()}
+
+
+class TimesyncStatusRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "TIMESYNC-STATUS") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> TimesyncStatusRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "TIMESYNC-STATUS":
+                raise DecodeError("must be equal to 'TIMESYNC-STATUS'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class TimesyncStatusResponse(_Model):
+    __slots__ = ("type", "status")
+
+    type: str
+
+    status: TimeSyncSnapshot
+    """Snapshot of the time synchronization state of the server clock."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("status", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("status", "type"))
+
+    def __init__(self, status: TimeSyncSnapshot, type: str = "TIMESYNC-STATUS") -> None:
+        self.type = type
+        self.status = status
+
+    @classmethod
+    def from_json(cls, obj: Any) -> TimesyncStatusResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "TIMESYNC-STATUS":
+                raise DecodeError("must be equal to 'TIMESYNC-STATUS'")
+            self.type = value
+            key = "status"
+            value = obj["status"]
+            value = TimeSyncSnapshot.from_json(value)
+            self.status = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "status": self.status.to_json()}
+
+
+class TransportOptions(_Model):
+    """Transport options.
+
+    Additional preferences about how the message should be delivered to UAVs.
+    """
+
+    __slots__ = ("channel", "broadcast", "ignore_ids")
+
+    channel: int | None
+    """Index of the communication channel to use."""
+
+    broadcast: bool | None
+    """Stores whether the server is allowed to use a broadcast message."""
+
+    ignore_ids: bool | None
+    """Whether to broadcast the message to all UAVs, ignoring the explicit UAV IDs in
+    the command.
+    """
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(())
+
+    def __init__(
+        self,
+        channel: int | None = None,
+        broadcast: bool | None = None,
+        ignore_ids: bool | None = None,
+    ) -> None:
+        self.channel = channel
+        self.broadcast = broadcast
+        self.ignore_ids = ignore_ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> TransportOptions:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "channel"
+            value = obj.get("channel")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "channel" in obj:
+                raise DecodeError("must not be null")
+            self.channel = value
+            key = "broadcast"
+            value = obj.get("broadcast")
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            elif "broadcast" in obj:
+                raise DecodeError("must not be null")
+            self.broadcast = value
+            key = "ignoreIds"
+            value = obj.get("ignoreIds")
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            elif "ignoreIds" in obj:
+                raise DecodeError("must not be null")
+            self.ignore_ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {}
+        value = self.channel
+        if value is not None:
+            result["channel"] = value
+        value = self.broadcast
+        if value is not None:
+            result["broadcast"] = value
+        value = self.ignore_ids
+        if value is not None:
+            result["ignoreIds"] = value
+        return result
+
+
+class UAVStatusInfo(_Model):
+    """UAV status info.
+
+    Status information of a single UAV.
+    """
+
+    __slots__ = (
+        "id",
+        "mode",
+        "position",
+        "position_xyz",
+        "gps",
+        "heading",
+        "attitude",
+        "velocity",
+        "velocity_xyz",
+        "timestamp",
+        "battery",
+        "light",
+        "rssi",
+        "errors",
+        "debug",
+    )
+
+    id: str
+    """Identifier of a single object."""
+
+    mode: str | None
+    """The flight mode of the UAV."""
+
+    position: GPSCoordinate | None
+    """GPS coordinate of an object."""
+
+    position_xyz: PositionXYZ | None
+    """Position in a local right-handed XYZ coordinate system."""
+
+    gps: GPSFix | None
+    """Basic information about the GPS fix."""
+
+    heading: int | None
+    """The heading of the UAV in the local tangent plane, in 1/10th of degrees."""
+
+    attitude: Attitude | None
+    """Attitude around the principal aircraft axes."""
+
+    velocity: VelocityNED | None
+    """Velocity in the NED coordinate system."""
+
+    velocity_xyz: VelocityXYZ | None
+    """Velocity in a local right-handed XYZ coordinate system."""
+
+    timestamp: float
+    """Timestamp that denotes when the status of the UAV was updated the last time."""
+
+    battery: BatteryInfo | None
+    """Information about the on-board battery of the UAV, if applicable."""
+
+    light: int | None
+    """Color in RGB565 representation."""
+
+    rssi: list[int] | None
+    """Received signal strength indicator, for each of the channels the UAV is
+    accessible on.
+    """
+
+    errors: list[int] | None
+    """List of currently active error codes for a single UAV."""
+
+    debug: str | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("id", "timestamp"))
+
+    def __init__(
+        self,
+        id: str,
+        timestamp: float,
+        mode: str | None = None,
+        position: GPSCoordinate | None = None,
+        position_xyz: PositionXYZ | None = None,
+        gps: GPSFix | None = None,
+        heading: int | None = None,
+        attitude: Attitude | None = None,
+        velocity: VelocityNED | None = None,
+        velocity_xyz: VelocityXYZ | None = None,
+        battery: BatteryInfo | None = None,
+        light: int | None = None,
+        rssi: list[int] | None = None,
+        errors: list[int] | None = None,
+        debug: str | None = None,
+    ) -> None:
+        self.id = id
+        self.mode = mode
+        self.position = position
+        self.position_xyz = position_xyz
+        self.gps = gps
+        self.heading = heading
+        self.attitude = attitude
+        self.velocity = velocity
+        self.velocity_xyz = velocity_xyz
+        self.timestamp = timestamp
+        self.battery = battery
+        self.light = light
+        self.rssi = rssi
+        self.errors = errors
+        self.debug = debug
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UAVStatusInfo:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "id"
+            value = obj["id"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.id = value
+            key = "mode"
+            value = obj.get("mode")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "mode" in obj:
+                raise DecodeError("must not be null")
+            self.mode = value
+            key = "position"
+            value = obj.get("position")
+            if value is not None:
+                value = GPSCoordinate.from_json(value)
+            elif "position" in obj:
+                raise DecodeError("must not be null")
+            self.position = value
+            key = "positionXYZ"
+            value = obj.get("positionXYZ")
+            if value is not None:
+                value = PositionXYZ.from_json(value)
+            elif "positionXYZ" in obj:
+                raise DecodeError("must not be null")
+            self.position_xyz = value
+            key = "gps"
+            value = obj.get("gps")
+            if value is not None:
+                value = GPSFix.from_json(value)
+            elif "gps" in obj:
+                raise DecodeError("must not be null")
+            self.gps = value
+            key = "heading"
+            value = obj.get("heading")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "heading" in obj:
+                raise DecodeError("must not be null")
+            self.heading = value
+            key = "attitude"
+            value = obj.get("attitude")
+            if value is not None:
+                value = Attitude.from_json(value)
+            elif "attitude" in obj:
+                raise DecodeError("must not be null")
+            self.attitude = value
+            key = "velocity"
+            value = obj.get("velocity")
+            if value is not None:
+                value = VelocityNED.from_json(value)
+            elif "velocity" in obj:
+                raise DecodeError("must not be null")
+            self.velocity = value
+            key = "velocityXYZ"
+            value = obj.get("velocityXYZ")
+            if value is not None:
+                value = VelocityXYZ.from_json(value)
+            elif "velocityXYZ" in obj:
+                raise DecodeError("must not be null")
+            self.velocity_xyz = value
+            key = "timestamp"
+            value = obj["timestamp"]
+            if type(value) is not int and type(value) is not float:
+                raise DecodeError("must be number")
+            self.timestamp = value
+            key = "battery"
+            value = obj.get("battery")
+            if value is not None:
+                value = BatteryInfo.from_json(value)
+            elif "battery" in obj:
+                raise DecodeError("must not be null")
+            self.battery = value
+            key = "light"
+            value = obj.get("light")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "light" in obj:
+                raise DecodeError("must not be null")
+            self.light = value
+            key = "rssi"
+            value = obj.get("rssi")
+            if value is not None:
+                value = _decode_list(value, _decode_4)
+            elif "rssi" in obj:
+                raise DecodeError("must not be null")
+            self.rssi = value
+            key = "errors"
+            value = obj.get("errors")
+            if value is not None:
+                value = _decode_list(value, _decode_4)
+            elif "errors" in obj:
+                raise DecodeError("must not be null")
+            self.errors = value
+            key = "debug"
+            value = obj.get("debug")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "debug" in obj:
+                raise DecodeError("must not be null")
+            self.debug = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"id": self.id, "timestamp": self.timestamp}
+        value = self.mode
+        if value is not None:
+            result["mode"] = value
+        value = self.position
+        if value is not None:
+            result["position"] = value.to_json()
+        value = self.position_xyz
+        if value is not None:
+            result["positionXYZ"] = value.to_json()
+        value = self.gps
+        if value is not None:
+            result["gps"] = value.to_json()
+        value = self.heading
+        if value is not None:
+            result["heading"] = value
+        value = self.attitude
+        if value is not None:
+            result["attitude"] = value.to_json()
+        value = self.velocity
+        if value is not None:
+            result["velocity"] = value.to_json()
+        value = self.velocity_xyz
+        if value is not None:
+            result["velocityXYZ"] = value.to_json()
+        value = self.battery
+        if value is not None:
+            result["battery"] = value.to_json()
+        value = self.light
+        if value is not None:
+            result["light"] = value
+        value = self.rssi
+        if value is not None:
+            result["rssi"] = value
+        value = self.errors
+        if value is not None:
+            result["errors"] = value
+        value = self.debug
+        if value is not None:
+            result["debug"] = value
+        return result
+
+
+class UavCalibRequest(_Model):
+    __slots__ = ("type", "ids", "component")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    component: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("component", "ids", "type"))
+
+    def __init__(self, ids: list[str], component: str, type: str = "UAV-CALIB") -> None:
+        self.type = type
+        self.ids = ids
+        self.component = component
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavCalibRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-CALIB":
+                raise DecodeError("must be equal to 'UAV-CALIB'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "component"
+            value = obj["component"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.component = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids, "component": self.component}
+
+
+class UavCalibResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-CALIB",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavCalibResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-CALIB":
+                raise DecodeError("must be equal to 'UAV-CALIB'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavFlyRequest(_Model):
+    __slots__ = ("type", "ids", "target")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    target: GPSCoordinate
+    """GPS coordinate of an object."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "target", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        target: GPSCoordinate,
+        type: str = "UAV-FLY",
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.target = target
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavFlyRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-FLY":
+                raise DecodeError("must be equal to 'UAV-FLY'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "target"
+            value = obj["target"]
+            value = GPSCoordinate.from_json(value)
+            self.target = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids, "target": self.target.to_json()}
+
+
+class UavFlyResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-FLY",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavFlyResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-FLY":
+                raise DecodeError("must be equal to 'UAV-FLY'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavHaltRequest(_Model):
+    __slots__ = ("type", "ids", "transport")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    transport: TransportOptions | None
+    """Additional preferences about how the message should be delivered to UAVs."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        type: str = "UAV-HALT",
+        transport: TransportOptions | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.transport = transport
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavHaltRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-HALT":
+                raise DecodeError("must be equal to 'UAV-HALT'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "transport"
+            value = obj.get("transport")
+            if value is not None:
+                value = TransportOptions.from_json(value)
+            elif "transport" in obj:
+                raise DecodeError("must not be null")
+            self.transport = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "ids": self.ids}
+        value = self.transport
+        if value is not None:
+            result["transport"] = value.to_json()
+        return result
+
+
+class UavHaltResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-HALT",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavHaltResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-HALT":
+                raise DecodeError("must be equal to 'UAV-HALT'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavHoverRequest(_Model):
+    __slots__ = ("type", "ids", "transport")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    transport: TransportOptions | None
+    """Additional preferences about how the message should be delivered to UAVs."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        type: str = "UAV-HOVER",
+        transport: TransportOptions | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.transport = transport
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavHoverRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-HOVER":
+                raise DecodeError("must be equal to 'UAV-HOVER'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "transport"
+            value = obj.get("transport")
+            if value is not None:
+                value = TransportOptions.from_json(value)
+            elif "transport" in obj:
+                raise DecodeError("must not be null")
+            self.transport = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "ids": self.ids}
+        value = self.transport
+        if value is not None:
+            result["transport"] = value.to_json()
+        return result
+
+
+class UavHoverResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-HOVER",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavHoverResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-HOVER":
+                raise DecodeError("must be equal to 'UAV-HOVER'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavInfRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "UAV-INF") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-INF":
+                raise DecodeError("must be equal to 'UAV-INF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class UavInfResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, UAVStatusInfo] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-INF",
+        status: dict[str, UAVStatusInfo] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-INF":
+                raise DecodeError("must be equal to 'UAV-INF'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, UAVStatusInfo.from_json)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class UavLandRequest(_Model):
+    __slots__ = ("type", "ids", "transport")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    transport: TransportOptions | None
+    """Additional preferences about how the message should be delivered to UAVs."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        type: str = "UAV-LAND",
+        transport: TransportOptions | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.transport = transport
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavLandRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-LAND":
+                raise DecodeError("must be equal to 'UAV-LAND'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "transport"
+            value = obj.get("transport")
+            if value is not None:
+                value = TransportOptions.from_json(value)
+            elif "transport" in obj:
+                raise DecodeError("must not be null")
+            self.transport = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "ids": self.ids}
+        value = self.transport
+        if value is not None:
+            result["transport"] = value.to_json()
+        return result
+
+
+class UavLandResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-LAND",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavLandResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-LAND":
+                raise DecodeError("must be equal to 'UAV-LAND'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavListRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "UAV-LIST") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavListRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-LIST":
+                raise DecodeError("must be equal to 'UAV-LIST'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class UavListResponse(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "UAV-LIST") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavListResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-LIST":
+                raise DecodeError("must be equal to 'UAV-LIST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class UavMotorRequest(_Model):
+    __slots__ = ("type", "ids", "start", "force", "transport")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    start: bool
+    """Whether the motors should be started or stopped."""
+
+    force: bool | None
+    """Whether the command should be forced even if it is unsafe."""
+
+    transport: TransportOptions | None
+    """Additional preferences about how the message should be delivered to UAVs."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "start", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        start: bool,
+        type: str = "UAV-MOTOR",
+        force: bool | None = None,
+        transport: TransportOptions | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.start = start
+        self.force = force
+        self.transport = transport
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavMotorRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-MOTOR":
+                raise DecodeError("must be equal to 'UAV-MOTOR'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "start"
+            value = obj["start"]
+            if type(value) is not bool:
+                raise DecodeError("must be boolean")
+            self.start = value
+            key = "force"
+            value = obj.get("force")
+            if value is not None:
+                if type(value) is not bool:
+                    raise DecodeError("must be boolean")
+            elif "force" in obj:
+                raise DecodeError("must not be null")
+            self.force = value
+            key = "transport"
+            value = obj.get("transport")
+            if value is not None:
+                value = TransportOptions.from_json(value)
+            elif "transport" in obj:
+                raise DecodeError("must not be null")
+            self.transport = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "type": self.type,
+            "ids": self.ids,
+            "start": self.start,
+        }
+        value = self.force
+        if value is not None:
+            result["force"] = value
+        value = self.transport
+        if value is not None:
+            result["transport"] = value.to_json()
+        return result
+
+
+class UavMotorResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-MOTOR",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavMotorResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-MOTOR":
+                raise DecodeError("must be equal to 'UAV-MOTOR'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavPrefltRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "UAV-PREFLT") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavPrefltRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-PREFLT":
+                raise DecodeError("must be equal to 'UAV-PREFLT'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class UavPrefltResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, PreflightCheckInfo] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-PREFLT",
+        status: dict[str, PreflightCheckInfo] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavPrefltResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-PREFLT":
+                raise DecodeError("must be equal to 'UAV-PREFLT'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, PreflightCheckInfo.from_json)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class UavRstRequest(_Model):
+    __slots__ = ("type", "ids", "component", "transport")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    component: str | None
+    """The component to reboot."""
+
+    transport: TransportOptions | None
+    """Additional preferences about how the message should be delivered to UAVs."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        type: str = "UAV-RST",
+        component: str | None = None,
+        transport: TransportOptions | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.component = component
+        self.transport = transport
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavRstRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-RST":
+                raise DecodeError("must be equal to 'UAV-RST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "component"
+            value = obj.get("component")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "component" in obj:
+                raise DecodeError("must not be null")
+            self.component = value
+            key = "transport"
+            value = obj.get("transport")
+            if value is not None:
+                value = TransportOptions.from_json(value)
+            elif "transport" in obj:
+                raise DecodeError("must not be null")
+            self.transport = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "ids": self.ids}
+        value = self.component
+        if value is not None:
+            result["component"] = value
+        value = self.transport
+        if value is not None:
+            result["transport"] = value.to_json()
+        return result
+
+
+class UavRstResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-RST",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavRstResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-RST":
+                raise DecodeError("must be equal to 'UAV-RST'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavRthRequest(_Model):
+    __slots__ = ("type", "ids", "transport")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    transport: TransportOptions | None
+    """Additional preferences about how the message should be delivered to UAVs."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        type: str = "UAV-RTH",
+        transport: TransportOptions | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.transport = transport
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavRthRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-RTH":
+                raise DecodeError("must be equal to 'UAV-RTH'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "transport"
+            value = obj.get("transport")
+            if value is not None:
+                value = TransportOptions.from_json(value)
+            elif "transport" in obj:
+                raise DecodeError("must not be null")
+            self.transport = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "ids": self.ids}
+        value = self.transport
+        if value is not None:
+            result["transport"] = value.to_json()
+        return result
+
+
+class UavRthResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-RTH",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavRthResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-RTH":
+                raise DecodeError("must be equal to 'UAV-RTH'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavSignalRequest(_Model):
+    __slots__ = ("type", "ids", "signals", "duration", "transport")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    signals: list[str]
+
+    duration: int
+
+    transport: TransportOptions | None
+    """Additional preferences about how the message should be delivered to UAVs."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(
+        ("duration", "ids", "signals", "type")
+    )
+
+    def __init__(
+        self,
+        ids: list[str],
+        signals: list[str],
+        duration: int,
+        type: str = "UAV-SIGNAL",
+        transport: TransportOptions | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.signals = signals
+        self.duration = duration
+        self.transport = transport
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavSignalRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-SIGNAL":
+                raise DecodeError("must be equal to 'UAV-SIGNAL'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "signals"
+            value = obj["signals"]
+            value = _decode_list(value, _decode_1)
+            self.signals = value
+            key = "duration"
+            value = obj["duration"]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.duration = value
+            key = "transport"
+            value = obj.get("transport")
+            if value is not None:
+                value = TransportOptions.from_json(value)
+            elif "transport" in obj:
+                raise DecodeError("must not be null")
+            self.transport = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "type": self.type,
+            "ids": self.ids,
+            "signals": self.signals,
+            "duration": self.duration,
+        }
+        value = self.transport
+        if value is not None:
+            result["transport"] = value.to_json()
+        return result
+
+
+class UavSignalResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-SIGNAL",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavSignalResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-SIGNAL":
+                raise DecodeError("must be equal to 'UAV-SIGNAL'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavSleepRequest(_Model):
+    __slots__ = ("type", "ids", "transport")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    transport: TransportOptions | None
+    """Additional preferences about how the message should be delivered to UAVs."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        type: str = "UAV-SLEEP",
+        transport: TransportOptions | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.transport = transport
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavSleepRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-SLEEP":
+                raise DecodeError("must be equal to 'UAV-SLEEP'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "transport"
+            value = obj.get("transport")
+            if value is not None:
+                value = TransportOptions.from_json(value)
+            elif "transport" in obj:
+                raise DecodeError("must not be null")
+            self.transport = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "ids": self.ids}
+        value = self.transport
+        if value is not None:
+            result["transport"] = value.to_json()
+        return result
+
+
+class UavSleepResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-SLEEP",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavSleepResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-SLEEP":
+                raise DecodeError("must be equal to 'UAV-SLEEP'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavTakeoffRequest(_Model):
+    __slots__ = ("type", "ids", "transport")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    transport: TransportOptions | None
+    """Additional preferences about how the message should be delivered to UAVs."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        type: str = "UAV-TAKEOFF",
+        transport: TransportOptions | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.transport = transport
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavTakeoffRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-TAKEOFF":
+                raise DecodeError("must be equal to 'UAV-TAKEOFF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "transport"
+            value = obj.get("transport")
+            if value is not None:
+                value = TransportOptions.from_json(value)
+            elif "transport" in obj:
+                raise DecodeError("must not be null")
+            self.transport = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "ids": self.ids}
+        value = self.transport
+        if value is not None:
+            result["transport"] = value.to_json()
+        return result
+
+
+class UavTakeoffResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-TAKEOFF",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavTakeoffResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-TAKEOFF":
+                raise DecodeError("must be equal to 'UAV-TAKEOFF'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavTestRequest(_Model):
+    __slots__ = ("type", "ids", "component")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    component: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("component", "ids", "type"))
+
+    def __init__(self, ids: list[str], component: str, type: str = "UAV-TEST") -> None:
+        self.type = type
+        self.ids = ids
+        self.component = component
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavTestRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-TEST":
+                raise DecodeError("must be equal to 'UAV-TEST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "component"
+            value = obj["component"]
+            if type(value) is not str:
+                raise DecodeError("must be string")
+            self.component = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids, "component": self.component}
+
+
+class UavTestResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-TEST",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavTestResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-TEST":
+                raise DecodeError("must be equal to 'UAV-TEST'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavVerRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "UAV-VER") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavVerRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-VER":
+                raise DecodeError("must be equal to 'UAV-VER'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class UavVerResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, dict[str, str]] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-VER",
+        result: dict[str, dict[str, str]] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavVerResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-VER":
+                raise DecodeError("must be equal to 'UAV-VER'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_9)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class UavWakeupRequest(_Model):
+    __slots__ = ("type", "ids", "transport")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the UAVs that the message refers to."""
+
+    transport: TransportOptions | None
+    """Additional preferences about how the message should be delivered to UAVs."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(
+        self,
+        ids: list[str],
+        type: str = "UAV-WAKEUP",
+        transport: TransportOptions | None = None,
+    ) -> None:
+        self.type = type
+        self.ids = ids
+        self.transport = transport
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavWakeupRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-WAKEUP":
+                raise DecodeError("must be equal to 'UAV-WAKEUP'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+            key = "transport"
+            value = obj.get("transport")
+            if value is not None:
+                value = TransportOptions.from_json(value)
+            elif "transport" in obj:
+                raise DecodeError("must not be null")
+            self.transport = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type, "ids": self.ids}
+        value = self.transport
+        if value is not None:
+            result["transport"] = value.to_json()
+        return result
+
+
+class UavWakeupResponse(_Model):
+    __slots__ = ("type", "result", "error", "receipt")
+
+    type: str
+
+    result: dict[str, bool] | None
+
+    error: dict[str, str] | None
+
+    receipt: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "receipt", "result", "type"))
+
+    def __init__(
+        self,
+        type: str = "UAV-WAKEUP",
+        result: dict[str, bool] | None = None,
+        error: dict[str, str] | None = None,
+        receipt: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.result = result
+        self.error = error
+        self.receipt = receipt
+
+    @classmethod
+    def from_json(cls, obj: Any) -> UavWakeupResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "UAV-WAKEUP":
+                raise DecodeError("must be equal to 'UAV-WAKEUP'")
+            self.type = value
+            key = "result"
+            value = obj.get("result")
+            if value is not None:
+                value = _decode_map(value, _decode_2)
+            elif "result" in obj:
+                raise DecodeError("must not be null")
+            self.result = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+            key = "receipt"
+            value = obj.get("receipt")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "receipt" in obj:
+                raise DecodeError("must not be null")
+            self.receipt = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.result
+        if value is not None:
+            result["result"] = value
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        value = self.receipt
+        if value is not None:
+            result["receipt"] = value
+        return result
+
+
+class VelocityNED(_Model):
+    """Velocity (NED).
+
+    Velocity in the NED coordinate system.
+    """
+
+    __slots__ = ("north", "east", "down")
+
+    north: int
+    """North component of the vector, in mm/s."""
+
+    east: int
+    """East component of the vector, in mm/s."""
+
+    down: int
+    """Down component of the vector, in mm/s."""
+
+    MIN_ITEMS: ClassVar[int] = 3
+
+    def __init__(self, north: int, east: int, down: int) -> None:
+        self.north = north
+        self.east = east
+        self.down = down
+
+    @classmethod
+    def from_json(cls, obj: Any) -> VelocityNED:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not list:
+            raise DecodeError("must be array")
+        length = len(obj)
+        if length < cls.MIN_ITEMS:
+            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")
+        self = object.__new__(cls)
+        key = 0
+        try:
+            key = 0
+            value = obj[0]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.north = value
+            key = 1
+            value = obj[1]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.east = value
+            key = 2
+            value = obj[2]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.down = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> list[Any]:
+        """Returns the JSON representation of this instance."""
+        result = [self.north, self.east, self.down]
+        return result
+
+
+class VelocityXYZ(_Model):
+    """Velocity (XYZ).
+
+    Velocity in a local right-handed XYZ coordinate system.
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    x: int
+    """X component of the vector, in mm/s."""
+
+    y: int
+    """Y component of the vector, in mm/s."""
+
+    z: int
+    """Z component of the vector, in mm/s."""
+
+    MIN_ITEMS: ClassVar[int] = 3
+
+    def __init__(self, x: int, y: int, z: int) -> None:
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @classmethod
+    def from_json(cls, obj: Any) -> VelocityXYZ:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not list:
+            raise DecodeError("must be array")
+        length = len(obj)
+        if length < cls.MIN_ITEMS:
+            raise DecodeError(f"must contain at least {cls.MIN_ITEMS} items")
+        self = object.__new__(cls)
+        key = 0
+        try:
+            key = 0
+            value = obj[0]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.x = value
+            key = 1
+            value = obj[1]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.y = value
+            key = 2
+            value = obj[2]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.z = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> list[Any]:
+        """Returns the JSON representation of this instance."""
+        result = [self.x, self.y, self.z]
+        return result
+
+
+class Weather(_Model):
+    """Weather info."""
+
+    __slots__ = (
+        "station_id",
+        "position",
+        "timestamp",
+        "code",
+        "sunrise",
+        "sunset",
+        "temperature",
+        "feels_like",
+        "pressure",
+        "humidity",
+        "dew_point",
+        "clouds",
+        "uv_index",
+        "kp_index",
+        "magnetic_vector",
+        "visibility",
+        "wind_direction",
+        "wind_speed",
+        "wind_gust",
+    )
+
+    station_id: str | None
+    """Identifier of a single object."""
+
+    position: GPSCoordinate
+    """GPS coordinate of an object."""
+
+    timestamp: int
+    """Timestamp that denotes the time the weather information applies to."""
+
+    code: int | None
+    """Numeric weather condition code according to OpenWeatherMap conventions."""
+
+    sunrise: int | None
+    """Time of sunrise; negative if the Sun does not rise on the given day."""
+
+    sunset: int | None
+    """Time of sunset; negative if the Sun does not set on the given day."""
+
+    temperature: int | None
+    """Temperature, in kelvin."""
+
+    feels_like: int | None
+    """Temperature, in kelvin, adjusted for human perception of weather."""
+
+    pressure: int | None
+    """Atmospheric pressure on the sea level, in Pa."""
+
+    humidity: int | None
+    """Humidity, in %."""
+
+    dew_point: int | None
+    """Atmospheric temperature in 1/10th kelvin below which water droplets begin to
+    condense and dew can form.
+    """
+
+    clouds: int | None
+    """Cloudiness, in %."""
+
+    uv_index: int | None
+    """UV index, 1/100 units; e.g. 89 --> 0.89."""
+
+    kp_index: int | None
+    """Planetary K-index."""
+
+    magnetic_vector: MagneticVector | None
+    """Magnetic vector."""
+
+    visibility: int | None
+    """Average visibility, in metres."""
+
+    wind_direction: int | None
+    """Meteorological wind direction, in 1/10th degrees clockwise from due North."""
+
+    wind_speed: int | None
+    """Wind speed, in mm/s."""
+
+    wind_gust: int | None
+    """Wind gust, in mm/s."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("position", "timestamp"))
+
+    def __init__(
+        self,
+        position: GPSCoordinate,
+        timestamp: int,
+        station_id: str | None = None,
+        code: int | None = None,
+        sunrise: int | None = None,
+        sunset: int | None = None,
+        temperature: int | None = None,
+        feels_like: int | None = None,
+        pressure: int | None = None,
+        humidity: int | None = None,
+        dew_point: int | None = None,
+        clouds: int | None = None,
+        uv_index: int | None = None,
+        kp_index: int | None = None,
+        magnetic_vector: MagneticVector | None = None,
+        visibility: int | None = None,
+        wind_direction: int | None = None,
+        wind_speed: int | None = None,
+        wind_gust: int | None = None,
+    ) -> None:
+        self.station_id = station_id
+        self.position = position
+        self.timestamp = timestamp
+        self.code = code
+        self.sunrise = sunrise
+        self.sunset = sunset
+        self.temperature = temperature
+        self.feels_like = feels_like
+        self.pressure = pressure
+        self.humidity = humidity
+        self.dew_point = dew_point
+        self.clouds = clouds
+        self.uv_index = uv_index
+        self.kp_index = kp_index
+        self.magnetic_vector = magnetic_vector
+        self.visibility = visibility
+        self.wind_direction = wind_direction
+        self.wind_speed = wind_speed
+        self.wind_gust = wind_gust
+
+    @classmethod
+    def from_json(cls, obj: Any) -> Weather:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "stationId"
+            value = obj.get("stationId")
+            if value is not None:
+                if type(value) is not str:
+                    raise DecodeError("must be string")
+            elif "stationId" in obj:
+                raise DecodeError("must not be null")
+            self.station_id = value
+            key = "position"
+            value = obj["position"]
+            value = GPSCoordinate.from_json(value)
+            self.position = value
+            key = "timestamp"
+            value = obj["timestamp"]
+            if type(value) is not int and not _is_integral_float(value):
+                raise DecodeError("must be integer")
+            self.timestamp = value
+            key = "code"
+            value = obj.get("code")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "code" in obj:
+                raise DecodeError("must not be null")
+            self.code = value
+            key = "sunrise"
+            value = obj.get("sunrise")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "sunrise" in obj:
+                raise DecodeError("must not be null")
+            self.sunrise = value
+            key = "sunset"
+            value = obj.get("sunset")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "sunset" in obj:
+                raise DecodeError("must not be null")
+            self.sunset = value
+            key = "temperature"
+            value = obj.get("temperature")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "temperature" in obj:
+                raise DecodeError("must not be null")
+            self.temperature = value
+            key = "feelsLike"
+            value = obj.get("feelsLike")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "feelsLike" in obj:
+                raise DecodeError("must not be null")
+            self.feels_like = value
+            key = "pressure"
+            value = obj.get("pressure")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "pressure" in obj:
+                raise DecodeError("must not be null")
+            self.pressure = value
+            key = "humidity"
+            value = obj.get("humidity")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "humidity" in obj:
+                raise DecodeError("must not be null")
+            self.humidity = value
+            key = "dewPoint"
+            value = obj.get("dewPoint")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "dewPoint" in obj:
+                raise DecodeError("must not be null")
+            self.dew_point = value
+            key = "clouds"
+            value = obj.get("clouds")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "clouds" in obj:
+                raise DecodeError("must not be null")
+            self.clouds = value
+            key = "uvIndex"
+            value = obj.get("uvIndex")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "uvIndex" in obj:
+                raise DecodeError("must not be null")
+            self.uv_index = value
+            key = "kpIndex"
+            value = obj.get("kpIndex")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "kpIndex" in obj:
+                raise DecodeError("must not be null")
+            self.kp_index = value
+            key = "magneticVector"
+            value = obj.get("magneticVector")
+            if value is not None:
+                value = MagneticVector.from_json(value)
+            elif "magneticVector" in obj:
+                raise DecodeError("must not be null")
+            self.magnetic_vector = value
+            key = "visibility"
+            value = obj.get("visibility")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "visibility" in obj:
+                raise DecodeError("must not be null")
+            self.visibility = value
+            key = "windDirection"
+            value = obj.get("windDirection")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "windDirection" in obj:
+                raise DecodeError("must not be null")
+            self.wind_direction = value
+            key = "windSpeed"
+            value = obj.get("windSpeed")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "windSpeed" in obj:
+                raise DecodeError("must not be null")
+            self.wind_speed = value
+            key = "windGust"
+            value = obj.get("windGust")
+            if value is not None:
+                if type(value) is not int and not _is_integral_float(value):
+                    raise DecodeError("must be integer")
+            elif "windGust" in obj:
+                raise DecodeError("must not be null")
+            self.wind_gust = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {
+            "position": self.position.to_json(),
+            "timestamp": self.timestamp,
+        }
+        value = self.station_id
+        if value is not None:
+            result["stationId"] = value
+        value = self.code
+        if value is not None:
+            result["code"] = value
+        value = self.sunrise
+        if value is not None:
+            result["sunrise"] = value
+        value = self.sunset
+        if value is not None:
+            result["sunset"] = value
+        value = self.temperature
+        if value is not None:
+            result["temperature"] = value
+        value = self.feels_like
+        if value is not None:
+            result["feelsLike"] = value
+        value = self.pressure
+        if value is not None:
+            result["pressure"] = value
+        value = self.humidity
+        if value is not None:
+            result["humidity"] = value
+        value = self.dew_point
+        if value is not None:
+            result["dewPoint"] = value
+        value = self.clouds
+        if value is not None:
+            result["clouds"] = value
+        value = self.uv_index
+        if value is not None:
+            result["uvIndex"] = value
+        value = self.kp_index
+        if value is not None:
+            result["kpIndex"] = value
+        value = self.magnetic_vector
+        if value is not None:
+            result["magneticVector"] = value.to_json()
+        value = self.visibility
+        if value is not None:
+            result["visibility"] = value
+        value = self.wind_direction
+        if value is not None:
+            result["windDirection"] = value
+        value = self.wind_speed
+        if value is not None:
+            result["windSpeed"] = value
+        value = self.wind_gust
+        if value is not None:
+            result["windGust"] = value
+        return result
+
+
+class WthAtRequest(_Model):
+    __slots__ = ("type", "position")
+
+    type: str
+
+    position: GPSCoordinate
+    """GPS coordinate of an object."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("position", "type"))
+
+    def __init__(self, position: GPSCoordinate, type: str = "WTH-AT") -> None:
+        self.type = type
+        self.position = position
+
+    @classmethod
+    def from_json(cls, obj: Any) -> WthAtRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "WTH-AT":
+                raise DecodeError("must be equal to 'WTH-AT'")
+            self.type = value
+            key = "position"
+            value = obj["position"]
+            value = GPSCoordinate.from_json(value)
+            self.position = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "position": self.position.to_json()}
+
+
+class WthAtResponse(_Model):
+    __slots__ = ("type", "weather")
+
+    type: str
+
+    weather: Weather | None
+    """Weather info."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type", "weather"))
+
+    def __init__(self, type: str = "WTH-AT", weather: Weather | None = None) -> None:
+        self.type = type
+        self.weather = weather
+
+    @classmethod
+    def from_json(cls, obj: Any) -> WthAtResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "WTH-AT":
+                raise DecodeError("must be equal to 'WTH-AT'")
+            self.type = value
+            key = "weather"
+            value = obj.get("weather")
+            if value is not None:
+                value = Weather.from_json(value)
+            elif "weather" in obj:
+                raise DecodeError("must not be null")
+            self.weather = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.weather
+        if value is not None:
+            result["weather"] = value.to_json()
+        return result
+
+
+class WthInfRequest(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the weather stations that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "WTH-INF") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> WthInfRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "WTH-INF":
+                raise DecodeError("must be equal to 'WTH-INF'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+class WthInfResponse(_Model):
+    __slots__ = ("type", "status", "error")
+
+    type: str
+
+    status: dict[str, Weather] | None
+
+    error: dict[str, str] | None
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("error", "status", "type"))
+
+    def __init__(
+        self,
+        type: str = "WTH-INF",
+        status: dict[str, Weather] | None = None,
+        error: dict[str, str] | None = None,
+    ) -> None:
+        self.type = type
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def from_json(cls, obj: Any) -> WthInfResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "WTH-INF":
+                raise DecodeError("must be equal to 'WTH-INF'")
+            self.type = value
+            key = "status"
+            value = obj.get("status")
+            if value is not None:
+                value = _decode_map(value, Weather.from_json)
+            elif "status" in obj:
+                raise DecodeError("must not be null")
+            self.status = value
+            key = "error"
+            value = obj.get("error")
+            if value is not None:
+                value = _decode_map(value, _decode_1)
+            elif "error" in obj:
+                raise DecodeError("must not be null")
+            self.error = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        result: dict[str, Any] = {"type": self.type}
+        value = self.status
+        if value is not None:
+            result["status"] = {key: item.to_json() for key, item in value.items()}
+        value = self.error
+        if value is not None:
+            result["error"] = value
+        return result
+
+
+class WthListRequest(_Model):
+    __slots__ = ("type",)
+
+    type: str
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("type",))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("type",))
+
+    def __init__(self, type: str = "WTH-LIST") -> None:
+        self.type = type
+
+    @classmethod
+    def from_json(cls, obj: Any) -> WthListRequest:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "WTH-LIST":
+                raise DecodeError("must be equal to 'WTH-LIST'")
+            self.type = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type}
+
+
+class WthListResponse(_Model):
+    __slots__ = ("type", "ids")
+
+    type: str
+
+    ids: list[str]
+    """IDs of the weather stations that the message refers to."""
+
+    REQUIRED: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+    KNOWN: ClassVar[frozenset[str]] = frozenset(("ids", "type"))
+
+    def __init__(self, ids: list[str], type: str = "WTH-LIST") -> None:
+        self.type = type
+        self.ids = ids
+
+    @classmethod
+    def from_json(cls, obj: Any) -> WthListResponse:
+        """Creates an instance from its JSON representation."""
+        if type(obj) is not dict:
+            raise DecodeError("must be object")
+        if not cls.REQUIRED <= obj.keys():
+            raise _missing_properties(obj, cls.REQUIRED)
+        if not obj.keys() <= cls.KNOWN:
+            raise _unknown_properties(obj, cls.KNOWN)
+        self = object.__new__(cls)
+        key = ""
+        try:
+            key = "type"
+            value = obj["type"]
+            if value != "WTH-LIST":
+                raise DecodeError("must be equal to 'WTH-LIST'")
+            self.type = value
+            key = "ids"
+            value = obj["ids"]
+            value = _decode_list(value, _decode_1)
+            self.ids = value
+        except DecodeError as ex:
+            raise ex.within(key) from None
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON representation of this instance."""
+        return {"type": self.type, "ids": self.ids}
+
+
+def _decode_0(value: Any) -> Any:
+    return value
+
+
+def _decode_1(value: Any) -> str:
+    if type(value) is not str:
+        raise DecodeError("must be string")
+    return value
+
+
+def _decode_2(value: Any) -> bool:
+    if type(value) is not bool:
+        raise DecodeError("must be boolean")
+    return value
+
+
+def _decode_3(value: Any) -> str:
+    if value not in _ENUM_1:
+        raise DecodeError(f"must be one of {list(_ENUM_1)}")
+    return value
+
+
+def _decode_4(value: Any) -> int:
+    if type(value) is not int and not _is_integral_float(value):
+        raise DecodeError("must be integer")
+    return value
+
+
+def _decode_5(value: Any) -> str:
+    if value not in _ENUM_14:
+        raise DecodeError(f"must be one of {list(_ENUM_14)}")
+    return value
+
+
+def _decode_6(value: Any) -> float:
+    if type(value) is not int and type(value) is not float:
+        raise DecodeError("must be number")
+    return value
+
+
+def _decode_7(value: Any) -> dict[str, Any]:
+    if type(value) is not dict:
+        raise DecodeError("must be object")
+    return value
+
+
+def _decode_8(value: Any) -> list[FlightLogMetadata]:
+    value = _decode_list(value, FlightLogMetadata.from_json)
+    return value
+
+
+def _decode_9(value: Any) -> dict[str, str]:
+    value = _decode_map(value, _decode_1)
+    return value
+
+
+BODY_CLASSES: dict[str, dict[str | None, tuple[Any, ...]]] = {
+    "notification": {
+        "ASYNC-RESP": (AsyncRespNotification,),
+        "ASYNC-ST": (AsyncStNotification,),
+        "ASYNC-TIMEOUT": (AsyncTimeoutNotification,),
+        "CONN-DEL": (ConnDelNotification,),
+        "OBJ-DEL": (ObjDelNotification,),
+        "SYS-CLOSE": (SysCloseNotification,),
+        "SYS-MSG": (SysMsgNotification,),
+        "TIMESYNC-STATUS": (TimesyncStatusNotification,),
+    },
+    "request": {
+        "ASYNC-CANCEL": (AsyncCancelRequest,),
+        "ASYNC-RESUME": (AsyncResumeRequest,),
+        "AUTH-INF": (AuthInfRequest,),
+        "AUTH-REQ": (AuthReqRequest,),
+        "AUTH-WHOAMI": (AuthWhoamiRequest,),
+        "BCN-INF": (BcnInfRequest,),
+        "BCN-PROPS": (BcnPropsRequest,),
+        "CLK-INF": (ClkInfRequest,),
+        "CLK-LIST": (ClkListRequest,),
+        "CONN-INF": (ConnInfRequest,),
+        "CONN-LIST": (ConnListRequest,),
+        "DEV-INF": (DevInfRequest,),
+        "DEV-LIST": (DevListRequest,),
+        "DEV-LISTSUB": (DevListsubRequest,),
+        "DEV-SUB": (DevSubRequest,),
+        "DEV-UNSUB": (DevUnsubRequest,),
+        "DOCK-INF": (DockInfRequest,),
+        "EXT-CFG": (ExtCfgRequest,),
+        "EXT-INF": (ExtInfRequest,),
+        "EXT-LIST": (ExtListRequest,),
+        "EXT-LOAD": (ExtLoadRequest,),
+        "EXT-RELOAD": (ExtReloadRequest,),
+        "EXT-SETCFG": (ExtSetcfgRequest,),
+        "EXT-UNLOAD": (ExtUnloadRequest,),
+        "FW-OBJECT-LIST": (FwObjectListRequest,),
+        "FW-TARGET-INF": (FwTargetInfRequest,),
+        "FW-TARGET-LIST": (FwTargetListRequest,),
+        "FW-UPLOAD": (FwUploadRequest,),
+        "LCN-INF": (LcnInfRequest,),
+        "LOG-DATA": (LogDataRequest,),
+        "LOG-INF": (LogInfRequest,),
+        "OBJ-CMD": (ObjCmdRequest,),
+        "OBJ-LIST": (ObjListRequest,),
+        "PRM-GET": (PrmGetRequest,),
+        "PRM-SET": (PrmSetRequest,),
+        "PRM-SET-MANY": (PrmSetManyRequest,),
+        "RTK-INF": (RtkInfRequest,),
+        "RTK-LIST": (RtkListRequest,),
+        "RTK-SOURCE": (RtkSourceRequest,),
+        "RTK-STAT": (RtkStatRequest,),
+        "RTK-SURVEY": (RtkSurveyRequest,),
+        "SHOW-ADAPT": (ShowAdaptRequest,),
+        "SHOW-CFG": (ShowCfgRequest,),
+        "SHOW-CRTH-PLAN": (ShowCrthPlanRequest,),
+        "SHOW-CRTH-START": (ShowCrthStartRequest,),
+        "SHOW-LIGHTS": (ShowLightsRequest,),
+        "SHOW-RESUME": (ShowResumeRequest,),
+        "SHOW-SETCFG": (ShowSetcfgRequest,),
+        "SHOW-SETLIGHTS": (ShowSetlightsRequest,),
+        "SHOW-SUSPEND": (ShowSuspendRequest,),
+        "SYS-PING": (SysPingRequest,),
+        "SYS-PORTS": (SysPortsRequest,),
+        "SYS-TIME": (SysTimeRequest,),
+        "SYS-VER": (SysVerRequest,),
+        "TIMESYNC-STATUS": (TimesyncStatusRequest,),
+        "UAV-CALIB": (UavCalibRequest,),
+        "UAV-FLY": (UavFlyRequest,),
+        "UAV-HALT": (UavHaltRequest,),
+        "UAV-HOVER": (UavHoverRequest,),
+        "UAV-INF": (UavInfRequest,),
+        "UAV-LAND": (UavLandRequest,),
+        "UAV-LIST": (UavListRequest,),
+        "UAV-MOTOR": (UavMotorRequest,),
+        "UAV-PREFLT": (UavPrefltRequest,),
+        "UAV-RST": (UavRstRequest,),
+        "UAV-RTH": (UavRthRequest,),
+        "UAV-SIGNAL": (UavSignalRequest,),
+        "UAV-SLEEP": (UavSleepRequest,),
+        "UAV-TAKEOFF": (UavTakeoffRequest,),
+        "UAV-TEST": (UavTestRequest,),
+        "UAV-VER": (UavVerRequest,),
+        "UAV-WAKEUP": (UavWakeupRequest,),
+        "WTH-AT": (WthAtRequest,),
+        "WTH-INF": (WthInfRequest,),
+        "WTH-LIST": (WthListRequest,),
+    },
+    "response": {
+        "ACK-ACK": (AckAckResponse,),
+        "ACK-NAK": (AckNakResponse,),
+        "ASYNC-CANCEL": (AsyncCancelResponse,),
+        "ASYNC-RESUME": (AsyncResumeResponse,),
+        "AUTH-INF": (AuthInfResponse,),
+        "AUTH-RESP": (AuthRespSingleStepResponse, AuthRespMultiStepResponse),
+        "AUTH-WHOAMI": (AuthWhoamiResponse,),
+        "BCN-INF": (BcnInfResponse,),
+        "BCN-PROPS": (BcnPropsResponse,),
+        "CLK-INF": (ClkInfResponse,),
+        "CLK-LIST": (ClkListResponse,),
+        "CONN-INF": (ConnInfResponse,),
+        "CONN-LIST": (ConnListResponse,),
+        "DEV-INF": (DevInfResponse,),
+        "DEV-LIST": (DevListResponse,),
+        "DEV-LISTSUB": (DevListsubResponse,),
+        "DEV-SUB": (DevSubResponse,),
+        "DEV-UNSUB": (DevUnsubResponse,),
+        "DOCK-INF": (DockInfResponse,),
+        "EXT-CFG": (ExtCfgResponse,),
+        "EXT-INF": (ExtInfResponse,),
+        "EXT-LIST": (ExtListResponse,),
+        "EXT-LOAD": (ExtLoadResponse,),
+        "EXT-RELOAD": (ExtReloadResponse,),
+        "EXT-SETCFG": (ExtSetcfgResponse,),
+        "EXT-UNLOAD": (ExtUnloadResponse,),
+        "FW-OBJECT-LIST": (FwObjectListResponse,),
+        "FW-TARGET-INF": (FwTargetInfResponse,),
+        "FW-TARGET-LIST": (FwTargetListResponse,),
+        "FW-UPLOAD": (FwUploadResponse,),
+        "LCN-INF": (LcnInfResponse,),
+        "LOG-DATA": (LogDataResponse,),
+        "LOG-INF": (LogInfResponse,),
+        "OBJ-CMD": (ObjCmdResponse,),
+        "OBJ-LIST": (ObjListResponse,),
+        "PRM-GET": (PrmGetResponse,),
+        "PRM-SET": (PrmSetResponse,),
+        "PRM-SET-MANY": (PrmSetManyResponse,),
+        "RTK-INF": (RtkInfResponse,),
+        "RTK-LIST": (RtkListResponse,),
+        "RTK-SOURCE": (RtkSourceResponse,),
+        "RTK-STAT": (RtkStatResponse,),
+        "RTK-SURVEY": (RtkSurveyResponse,),
+        "SHOW-ADAPT": (ShowAdaptResponse,),
+        "SHOW-CFG": (ShowCfgResponse,),
+        "SHOW-CRTH-PLAN": (ShowCrthPlanResponse,),
+        "SHOW-CRTH-START": (ShowCrthStartResponse,),
+        "SHOW-LIGHTS": (ShowLightsResponse,),
+        "SHOW-RESUME": (ShowResumeResponse,),
+        "SHOW-SUSPEND": (ShowSuspendResponse,),
+        "SYS-PORTS": (SysPortsResponse,),
+        "SYS-TIME": (SysTimeResponse,),
+        "SYS-VER": (SysVerResponse,),
+        "TIMESYNC-STATUS": (TimesyncStatusResponse,),
+        "UAV-CALIB": (UavCalibResponse,),
+        "UAV-FLY": (UavFlyResponse,),
+        "UAV-HALT": (UavHaltResponse,),
+        "UAV-HOVER": (UavHoverResponse,),
+        "UAV-INF": (UavInfResponse,),
+        "UAV-LAND": (UavLandResponse,),
+        "UAV-LIST": (UavListResponse,),
+        "UAV-MOTOR": (UavMotorResponse,),
+        "UAV-PREFLT": (UavPrefltResponse,),
+        "UAV-RST": (UavRstResponse,),
+        "UAV-RTH": (UavRthResponse,),
+        "UAV-SIGNAL": (UavSignalResponse,),
+        "UAV-SLEEP": (UavSleepResponse,),
+        "UAV-TAKEOFF": (UavTakeoffResponse,),
+        "UAV-TEST": (UavTestResponse,),
+        "UAV-VER": (UavVerResponse,),
+        "UAV-WAKEUP": (UavWakeupResponse,),
+        "WTH-AT": (WthAtResponse,),
+        "WTH-INF": (WthInfResponse,),
+        "WTH-LIST": (WthListResponse,),
+        None: (RtkStatResponse,),
+    },
+}
+"""Model classes of message bodies, keyed by the kind and the type of
+the message body. The ``None`` key lists the classes of message bodies
+where the type is optional."""
+
+
+def decode_body(obj: Any, kind: str) -> Any:
+    """Converts the JSON representation of a message body of the given kind
+    into an instance of the corresponding model class.
+
+    Parameters:
+        obj: the JSON representation of the message body
+        kind: the kind of the message body; one of ``notification``,
+            ``request`` or ``response``
+
+    Returns:
+        an instance of the model class of the message body
+
+    Raises:
+        DecodeError: if the message body does not match the model class of its
+            type or its type is unknown
+    """
+    if type(obj) is not dict:
+        raise DecodeError("must be object")
+
+    message_type = obj.get("type")
+    if message_type is not None and type(message_type) is not str:
+        raise DecodeError("must be string").within("type")
+
+    classes = BODY_CLASSES[kind].get(message_type)
+    if classes is None:
+        raise DecodeError(f"must be a known {kind} type").within("type")
+
+    errors = []
+    for cls in classes:
+        try:
+            return cls.from_json(obj)
+        except DecodeError as ex:
+            errors.append(ex)
+
+    raise errors[0]
@@ -1,23 +1,40 @@
 """Flockwave protocol JSON schema related functions."""
 
 import json
+import os
 from enum import Enum
-from importlib.resources import open_text
-from typing import Any
+from hashlib import sha256
+from importlib.resources import files, open_text
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Literal
 
 from jsonpointer import JsonPointer, resolve_pointer
-from jsonref import replace_refs
+from jsonref import JsonRef, replace_refs
 
+from . import metrics as _metrics
+from .cache import DiskCache, get_cache_root
+from .compiled import get_schema_bundle
 from .memoize import memoized
+from .version import __version__
 
 __all__ = (
+    "LAZY_RESOLUTION_ENV_VAR",
     "SCHEMA_PACKAGE",
+    "disable_lazy_resolution",
+    "enable_lazy_resolution",
+    "is_lazy_resolution_enabled",
+    "get_body_schema",
     "get_message_schema",
     "get_message_body_schema",
     "get_notification_body_schema",
     "get_request_body_schema",
     "get_response_body_schema",
     "get_complex_object_schema",
+    "get_message_body_schema_for_type",
+    "get_message_types",
+    "get_schema_digest",
+    "MessageBodyKind",
     "Schema",
 )
 
@@ -29,11 +46,38 @@ FLOCKWAVE_SPEC_PREFIX = "http://collmot.com/schemas/flockwave/1.0"
 Schema = dict[str, Any]
 """Type alias for schema objects"""
 
+MessageBodyKind = Literal["message", "notification", "request", "response"]
+"""Type alias for the kinds of message bodies that have their own top-level
+schema in the specification.
+"""
+
+_BODY_SCHEMA_RESOURCES: dict[str, str] = {
+    "message": "message_body.json",
+    "notification": "notification_body.json",
+    "request": "request_body.json",
+    "response": "response_body.json",
+}
+"""Mapping from message body kinds to the resource paths of their schemas."""
+
+LAZY_RESOLUTION_ENV_VAR = "FLOCKWAVE_SPEC_LAZY_REFS"
+"""Name of the environment variable that enables the lazy resolution of JSON
+references when set to a non-empty value other than ``0``.
+"""
+
+_lazy_resolution: bool | None = None
+"""Whether JSON references are resolved lazily, as configured with
+`enable_lazy_resolution()` or `disable_lazy_resolution()`, or ``None`` if it
+should be taken from the environment.
+"""
+
 
 @memoized
 def _get_json_object_from_resource(resource_path: str) -> dict[str, Any]:
     """Loads and parses a JSON object from the given resource path.
 
+    The object is taken from the schema bundle in `flockwave.spec.compiled`
+    if the bundle is available; the JSON file itself is read otherwise.
+
     This function is memoized.
 
     Arguments:
@@ -43,17 +87,48 @@ def _get_json_object_from_resource(resource_path: str) -> dict[str, Any]:
     Returns:
         the JSON object from the given resource
     """
+    bundle = get_schema_bundle()
+    if bundle is not None:
+        obj = bundle.get(resource_path)
+        if obj is not None:
+            return obj
+
     with open_text(SCHEMA_PACKAGE, resource_path) as fp:
         return json.load(fp)
 
 
-@memoized
 def _get_schema_from_resource(
     resource_path: str,
     json_pointer: str | JsonPointer | None = None,
 ) -> Schema:
     """Loads and parses a JSON schema from the given resource path.
 
+    The results of this function are memoized separately for eager and lazy
+    resolution of JSON references; see `enable_lazy_resolution()`.
+
+    Arguments:
+        resource_path: path of the JSON file containing the schema
+            resource to load, relative to the ``flockwave.spec`` package.
+        json_pointer: JSON pointer to the part of the contents
+            of the JSON file that contains the schema we are interested in.
+            ``None`` means that the entire JSON file will be returned.
+
+    Returns:
+        the JSON schema from the given resource
+    """
+    if isinstance(json_pointer, JsonPointer):
+        json_pointer = json_pointer.path
+    return _load_schema_from_resource(
+        resource_path, json_pointer, is_lazy_resolution_enabled()
+    )
+
+
+@memoized
+def _load_schema_from_resource(
+    resource_path: str, json_pointer: str | None, lazy: bool
+) -> Schema:
+    """Loads and parses a JSON schema from the given resource path.
+
     This function is memoized.
 
     Arguments:
@@ -62,28 +137,61 @@ def _get_schema_from_resource(
         json_pointer: JSON pointer to the part of the contents
             of the JSON file that contains the schema we are interested in.
             ``None`` means that the entire JSON file will be returned.
-        resolve_refs: whether JSON references should be resolved to the
-            files they refer to
+        lazy: whether JSON references should be resolved only when they are
+            accessed for the first time. When ``False``, all the references
+            reachable from the schema are resolved before returning.
 
     Returns:
         the JSON schema from the given resource
     """
+    metrics = _metrics._current
+    if metrics is None:
+        return _resolve_schema_from_resource(resource_path, json_pointer, lazy)
+
+    started_at = perf_counter()
+    schema = _resolve_schema_from_resource(resource_path, json_pointer, lazy)
+    key = f"{resource_path}#{json_pointer}" if json_pointer else resource_path
+    metrics.record_schema_load(key, perf_counter() - started_at)
+    return schema
+
+
+def _resolve_schema_from_resource(
+    resource_path: str, json_pointer: str | None, lazy: bool
+) -> Schema:
+    """Loads a JSON schema from the given resource path and resolves its JSON
+    references, or takes the resolved schema from the on-disk cache.
+
+    See `_load_schema_from_resource()` for the description of the arguments.
+    """
+    # The on-disk cache stores fully resolved schemas so it is not used in
+    # lazy mode
+    cache = None if lazy else _get_disk_cache()
+    if cache is not None:
+        cache_key = f"schema:{resource_path}#{json_pointer or ''}"
+        cached_obj = cache.get_json(cache_key)
+        if cached_obj is not None:
+            return cached_obj
+
     obj = _get_json_object_from_resource(resource_path)
     obj = replace_refs(
         obj,
+        base_uri=f"{FLOCKWAVE_SPEC_PREFIX}/{resource_path}",
         loader=_jsonref_loader,
         jsonschema=True,
         proxies=True,
     )
 
-    if isinstance(json_pointer, JsonPointer):
-        obj = json_pointer.get(obj)
-    elif json_pointer is not None:
+    if json_pointer is not None:
         obj = resolve_pointer(obj, json_pointer)
 
-    # We need to trigger the resolution of '$ref' references. In theory,
-    # we could use proxies=False but we were running into problems with that.
-    repr(obj)
+    if not lazy:
+        # We need to trigger the resolution of '$ref' references. In theory,
+        # we could use proxies=False but we were running into problems with
+        # that.
+        repr(obj)
+
+    if cache is not None:
+        cache.put_json(cache_key, _to_plain_json(obj))
 
     return obj  # type: ignore
 
@@ -100,10 +208,16 @@ def get_complex_object_schema(name: str) -> Schema:
     return _get_schema_from_resource("definitions.json", "/" + name)
 
 
+@memoized
 def get_enum_from_schema(name: str, class_name: str | None = None) -> Enum:
     """Returns a Python enum class from the schema of the given Flockwave
     complex object, assuming that it describes an enum of strings.
 
+    The enum class is created only once for each combination of arguments;
+    subsequent calls return the same class. See `flockwave.spec.enums` for
+    enums whose members are the strings themselves, with precomputed lookup
+    tables.
+
     Parameters:
         name: the name of a Flockwave complex object from the
             specification
@@ -126,6 +240,43 @@ def get_enum_from_schema(name: str, class_name: str | None = None) -> Enum:
         raise TypeError(f"{name!r} cannot be converted into a Python enum")
 
 
+def disable_lazy_resolution() -> None:
+    """Disables the lazy resolution of JSON references in the schemas returned
+    by this module, even if the ``FLOCKWAVE_SPEC_LAZY_REFS`` environment
+    variable is set.
+    """
+    global _lazy_resolution
+    _lazy_resolution = False
+
+
+def enable_lazy_resolution() -> None:
+    """Enables the lazy resolution of JSON references in the schemas returned
+    by this module.
+
+    By default, all the JSON references reachable from a schema are resolved
+    when the schema is loaded, which loads every message type for the
+    top-level schemas. In lazy mode, references are resolved and cached when
+    they are accessed for the first time, so processes that use only a few
+    parts of the specification do not pay for loading the rest of it. On the
+    other hand, errors in the schema files surface later, when the broken
+    reference is accessed, and the on-disk cache is not used.
+
+    The mode affects the schemas loaded after this function was called only.
+    """
+    global _lazy_resolution
+    _lazy_resolution = True
+
+
+def is_lazy_resolution_enabled() -> bool:
+    """Returns whether JSON references in the schemas returned by this module
+    are resolved lazily.
+    """
+    if _lazy_resolution is None:
+        return os.environ.get(LAZY_RESOLUTION_ENV_VAR, "") not in ("", "0")
+    else:
+        return _lazy_resolution
+
+
 def get_message_schema() -> Schema:
     """Returns the JSON schema of Flockwave messages."""
     return _get_schema_from_resource("message.json")
@@ -151,6 +302,253 @@ def get_request_body_schema() -> Schema:
     return _get_schema_from_resource("request_body.json")
 
 
+def get_body_schema(kind: MessageBodyKind = "message") -> Schema:
+    """Returns the JSON schema of Flockwave message bodies of the given kind.
+
+    Parameters:
+        kind: the kind of message bodies whose schema is to be returned
+
+    Returns:
+        the JSON schema of all message bodies of the given kind
+    """
+    return _get_schema_from_resource(_get_body_schema_resource(kind))
+
+
+def get_message_types(kind: MessageBodyKind = "message") -> list[str]:
+    """Returns the list of message types that may appear in the ``type``
+    field of a message body of the given kind.
+
+    Parameters:
+        kind: the kind of message bodies to consider
+
+    Returns:
+        the sorted list of message types
+    """
+    resource_path = _get_body_schema_resource(kind)
+    return sorted(_get_resources_by_message_type(resource_path))
+
+
+def get_message_body_schema_for_type(
+    message_type: str, kind: MessageBodyKind = "message"
+) -> Schema:
+    """Returns the JSON schema that a message body of the given kind must
+    conform to if its ``type`` field is equal to the given message type.
+
+    The returned schema is a lot smaller than the schema of all message bodies
+    of the given kind as it contains only the branches that are relevant for
+    the given message type.
+
+    Parameters:
+        message_type: the type of the message body
+        kind: the kind of message bodies to consider
+
+    Returns:
+        the JSON schema of the message body with the given type
+
+    Raises:
+        KeyError: if there is no such message type for the given kind
+    """
+    resource_path = _get_body_schema_resource(kind)
+    return _get_schema_for_message_type(resource_path, message_type)
+
+
+@memoized
+def get_schema_digest() -> str:
+    """Returns a digest of the contents of all the JSON schema files in the
+    ``flockwave.spec`` package.
+
+    The digest changes whenever any of the schema files is added, removed or
+    modified, so it can be used to decide whether artifacts derived from the
+    schemas are up-to-date.
+
+    When the on-disk cache is enabled, the digest is stored in the cache
+    along with the sizes and modification times of the schema files, so the
+    contents of the files are read only once per installation of the package
+    instead of once per process.
+
+    This function is memoized.
+
+    Returns:
+        the SHA-256 digest of the schema files, in hexadecimal notation
+    """
+    resources = sorted(
+        (
+            resource
+            for resource in files(SCHEMA_PACKAGE).iterdir()
+            if resource.name.endswith(".json")
+        ),
+        key=lambda resource: resource.name,
+    )
+
+    root = get_cache_root()
+    fingerprint = None if root is None else _get_fingerprint_of_files(resources)
+    if fingerprint is None:
+        return _get_digest_of_files(resources)
+
+    cache = DiskCache(root)  # type: ignore
+    cache_key = f"digest:{__version__}"
+    entry = cache.get_json(cache_key)
+    if isinstance(entry, dict) and entry.get("fingerprint") == fingerprint:
+        digest = entry.get("digest")
+        if isinstance(digest, str):
+            return digest
+
+    digest = _get_digest_of_files(resources)
+    cache.put_json(cache_key, {"fingerprint": fingerprint, "digest": digest})
+    return digest
+
+
+@memoized
+def _get_schema_resource_names() -> frozenset[str]:
+    """Returns the names of all the JSON schema files in the ``flockwave.spec``
+    package.
+
+    This function is memoized.
+    """
+    return frozenset(
+        resource.name
+        for resource in files(SCHEMA_PACKAGE).iterdir()
+        if resource.name.endswith(".json")
+    )
+
+
+def _get_digest_of_files(resources: list[Any]) -> str:
+    """Returns the SHA-256 digest of the names and contents of the given
+    resources, in hexadecimal notation.
+    """
+    digest = sha256()
+    for resource in resources:
+        digest.update(resource.name.encode("utf-8") + b"\0")
+        digest.update(resource.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+def _get_fingerprint_of_files(resources: list[Any]) -> list[Any] | None:
+    """Returns the names, sizes and modification times of the given
+    resources, or ``None`` if they are not files in the filesystem (e.g.,
+    because the package is installed as a zip file).
+    """
+    result = []
+    for resource in resources:
+        if not isinstance(resource, Path):
+            return None
+        try:
+            stat = resource.stat()
+        except OSError:
+            return None
+        result.append([resource.name, stat.st_size, stat.st_mtime_ns])
+    return result
+
+
+def _get_disk_cache() -> DiskCache | None:
+    """Returns the on-disk cache for the current version of the package and
+    the current contents of the schema files, or ``None`` if the on-disk
+    cache is disabled.
+    """
+    root = get_cache_root()
+    return None if root is None else _get_disk_cache_in(root)
+
+
+@memoized
+def _get_disk_cache_in(root: Path) -> DiskCache:
+    """Returns the on-disk cache for the current version of the package and
+    the current contents of the schema files in the given root directory.
+
+    This function is memoized.
+    """
+    return DiskCache(root / f"{__version__}-{get_schema_digest()[:16]}")
+
+
+def _get_body_schema_resource(kind: MessageBodyKind) -> str:
+    """Returns the resource path of the schema of message bodies of the given
+    kind.
+    """
+    try:
+        return _BODY_SCHEMA_RESOURCES[kind]
+    except KeyError:
+        raise ValueError(f"unknown message body kind: {kind!r}") from None
+
+
+@memoized
+def _get_message_types_in_resource(resource_path: str) -> frozenset[str]:
+    """Returns the set of message types that the schema in the given resource
+    may match, based on the ``const`` constraint of the ``type`` property of
+    the schema or the schemas referenced from its top-level ``anyOf`` branches.
+
+    This function is memoized.
+    """
+    obj = _get_json_object_from_resource(resource_path)
+
+    message_type = obj.get("properties", {}).get("type", {}).get("const")
+    if isinstance(message_type, str):
+        return frozenset((message_type,))
+
+    result: set[str] = set()
+    for ref in _get_external_refs_in_any_of(obj):
+        result.update(_get_message_types_in_resource(ref))
+    return frozenset(result)
+
+
+@memoized
+def _get_resources_by_message_type(resource_path: str) -> dict[str, tuple[str, ...]]:
+    """Returns a mapping from message types to the resource paths of the
+    schemas that message bodies of the given type must be checked against,
+    given the resource path of a union of message body schemas.
+
+    This function is memoized.
+    """
+    message_types = _get_message_types_in_resource(resource_path)
+    if len(message_types) == 1:
+        return {next(iter(message_types)): (resource_path,)}
+
+    obj = _get_json_object_from_resource(resource_path)
+    result: dict[str, tuple[str, ...]] = {}
+    for ref in _get_external_refs_in_any_of(obj):
+        for message_type, paths in _get_resources_by_message_type(ref).items():
+            result[message_type] = result.get(message_type, ()) + paths
+    return result
+
+
+@memoized
+def _get_schema_for_message_type(resource_path: str, message_type: str) -> Schema:
+    """Returns the JSON schema of message bodies with the given type, given
+    the resource path of a union of message body schemas.
+
+    This function is memoized.
+    """
+    paths = _get_resources_by_message_type(resource_path)[message_type]
+    if len(paths) == 1:
+        return _get_schema_from_resource(paths[0])
+    else:
+        return {"anyOf": [_get_schema_from_resource(path) for path in paths]}
+
+
+def _get_external_refs_in_any_of(obj: dict[str, Any]) -> list[str]:
+    """Returns the resource paths of the external JSON references found in
+    the top-level ``anyOf`` branches of the given JSON schema.
+    """
+    result = []
+    for branch in obj.get("anyOf", ()):
+        ref = branch.get("$ref")
+        if isinstance(ref, str) and not ref.startswith("#"):
+            result.append(ref.partition("#")[0])
+    return result
+
+
+def _to_plain_json(obj: Any) -> Any:
+    """Converts a JSON object that may contain ``jsonref`` proxies into an
+    equivalent JSON object without proxies.
+    """
+    if type(obj) is JsonRef:
+        obj = obj.__subject__
+    if isinstance(obj, dict):
+        return {key: _to_plain_json(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [_to_plain_json(item) for item in obj]
+    else:
+        return obj
+
+
 def _jsonref_loader(uri: str):
     """Specialized URI resolver for Flockwave's JSON schema files.
 
@@ -0,0 +1,1373 @@
+"""Serializers for outgoing Flockwave messages that are generated from the
+JSON schemas of the message types.
+
+Servers typically validate each outgoing message body and then encode it into
+JSON with `json.dumps()`, walking the same object twice. The serializers in
+this module are generated Python functions specialized for a single message
+type: they walk the message body once, check it against the schema of the
+message type and emit compact JSON text in the same pass.
+
+The output is canonical: properties declared in the schema are written in
+the order of the schema, and all other keys of objects are written in
+sorted order. Properties that are missing from the body but that have a
+default value in the schema are written with their default value, just like
+the validators of `flockwave.spec.validator` would add them to the body
+before it is encoded. Numbers that are not finite are rejected because they
+cannot be represented in JSON.
+
+Objects whose declared properties are all primitive values or arrays of
+integers, such as the status of a UAV in ``UAV-INF``, are checked with a
+single condition and written in a single step when they have no other
+properties. Objects that do not satisfy the condition are serialized
+property by property, which also reports the failures.
+
+Parts of schemas that use keywords that the generator does not support
+(e.g., ``format``) are checked with a ``fastjsonschema`` validator compiled
+for that part of the schema only, and encoded with the `json` module.
+
+Requires the ``fastjsonschema`` module. You can install this with the
+``validation`` extra.
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from json.encoder import encode_basestring
+from math import isfinite
+from typing import Any
+
+import fastjsonschema
+from jsonpointer import resolve_pointer
+
+from flockwave.spec.schema import (
+    FLOCKWAVE_SPEC_PREFIX,
+    MessageBodyKind,
+    _get_body_schema_resource,
+    _get_json_object_from_resource,
+    _get_resources_by_message_type,
+    _get_schema_from_resource,
+    _to_plain_json,
+    get_message_types,
+)
+
+from .memoize import memoized
+from .validator import ValidationError, _get_inner_validator_for_body
+
+__all__ = ("MessageSerializer",)
+
+
+class MessageSerializer:
+    """Serializer for message bodies of a given kind that checks the bodies
+    against the schema of their message type while encoding them into JSON.
+
+    Serializers for the individual message types are generated lazily, when
+    a body with the given type is seen for the first time. Bodies without a
+    known message type are validated against the schema of all message
+    bodies of the given kind and then encoded with the `json` module.
+    """
+
+    def __init__(self, kind: MessageBodyKind = "response"):
+        """Constructor.
+
+        Parameters:
+            kind: the kind of message bodies that the serializer will receive
+        """
+        self._kind = kind
+        self._known_types = frozenset(get_message_types(kind))
+        self._serializers: dict[str, Any] = {}
+
+    def __call__(self, obj: Any) -> str:
+        """Checks the given message body against its schema and encodes it
+        into compact JSON text.
+
+        Raises:
+            ValidationError: if the message body is not valid
+        """
+        message_type = obj.get("type") if isinstance(obj, dict) else None
+        if type(message_type) is not str:
+            message_type = None
+
+        serialize = self._serializers.get(message_type)  # type: ignore
+        if serialize is None:
+            if message_type not in self._known_types:
+                return self._serialize_unknown(obj)
+            serialize = _get_serializer_for_message_type(message_type, self._kind)  # type: ignore
+            self._serializers[message_type] = serialize  # type: ignore
+
+        out: list[str] = []
+        try:
+            serialize(obj, out)
+        except _SerializationFailure as ex:
+            raise ValidationError(ex.format()) from None
+        return "".join(out)
+
+    def encode(self, obj: Any) -> bytes:
+        """Checks the given message body against its schema and encodes it
+        into UTF-8 encoded JSON.
+
+        Raises:
+            ValidationError: if the message body is not valid or contains
+                strings that cannot be encoded in UTF-8
+        """
+        text = self(obj)
+        try:
+            return text.encode("utf-8")
+        except UnicodeEncodeError as ex:
+            raise ValidationError(f"data must be encodable in UTF-8: {ex}") from None
+
+    def encode_into(self, obj: Any, buffer: bytearray) -> int:
+        """Checks the given message body against its schema and appends its
+        UTF-8 encoded JSON representation to the given buffer. This allows
+        the caller to batch multiple messages into a single buffer that is
+        cleared and reused after it has been written to the transport.
+
+        Nothing is appended to the buffer if the message body is not valid.
+
+        Returns:
+            the number of bytes appended to the buffer
+
+        Raises:
+            ValidationError: if the message body is not valid or contains
+                strings that cannot be encoded in UTF-8
+        """
+        encoded = self.encode(obj)
+        buffer += encoded
+        return len(encoded)
+
+    def _serialize_unknown(self, obj: Any) -> str:
+        """Validates and encodes a message body without a known message type."""
+        try:
+            _get_inner_validator_for_body(None, self._kind)(obj)
+        except fastjsonschema.JsonSchemaValueException as ex:
+            raise ValidationError(str(ex)) from None
+        try:
+            return _dumps(obj)
+        except _SerializationFailure as ex:
+            raise ValidationError(ex.format()) from None
+
+
+class _SerializationFailure(Exception):
+    """Exception raised by generated serializers when the object being
+    serialized does not conform to the schema.
+    """
+
+    message: str
+    """Description of the failure, without the path of the offending part of
+    the object.
+    """
+
+    path: list[Any]
+    """Path of the offending part of the object, in reverse order. Items are
+    appended to the path while the exception propagates up.
+    """
+
+    suffix: str
+    """Path of the offending part of the object within the innermost part of
+    the object that the generated serializer knows about, e.g. when the
+    failure was reported by a ``fastjsonschema`` validator.
+    """
+
+    def __init__(self, message: str, suffix: str = ""):
+        super().__init__(message)
+        self.message = message
+        self.path = []
+        self.suffix = suffix
+
+    def format(self) -> str:
+        """Formats the failure in the same way as ``fastjsonschema`` does."""
+        path = "".join(
+            f"[{item}]" if type(item) is int else f".{item}"
+            for item in reversed(self.path)
+        )
+        return f"data{path}{self.suffix} {self.message}"
+
+
+_json_encoder = json.JSONEncoder(
+    ensure_ascii=False, allow_nan=False, sort_keys=True, separators=(",", ":")
+)
+
+
+def _dumps(value: Any) -> str:
+    """Encodes a value that is not constrained by the schema into JSON."""
+    try:
+        return _json_encoder.encode(value)
+    except (TypeError, ValueError) as ex:
+        raise _SerializationFailure(f"must be JSON serializable: {ex}") from None
+
+
+def _get_number_text(value: Any) -> str:
+    """Returns the JSON representation of a number that is not an instance of
+    `int`, or of a subclass of `int`.
+    """
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if not isfinite(value):
+        raise _SerializationFailure("must be finite")
+    return float.__repr__(value)
+
+
+def _has_duplicates(items: Any) -> bool:
+    """Returns whether the given list contains duplicate items according to
+    the semantics of JSON schema.
+    """
+    if all(type(item) is str for item in items):
+        return len(set(items)) != len(items)
+    return len({_dumps(item) for item in items}) != len(items)
+
+
+def _is_integer(value: Any) -> bool:
+    """Returns whether the given value is an integer according to the
+    semantics of ``fastjsonschema``.
+    """
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_number(value: Any) -> bool:
+    """Returns whether the given value is a number according to the semantics
+    of JSON schema.
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _missing_properties(obj: Any, required: list[str]) -> _SerializationFailure:
+    """Creates a failure that lists the required properties that are missing
+    from the given object, in the same way as ``fastjsonschema`` does.
+    """
+    missing = [name for name in required if name not in obj]
+    return _SerializationFailure(f"must contain {missing} properties")
+
+
+def _unknown_properties(obj: Any, declared: frozenset[str]) -> _SerializationFailure:
+    """Creates a failure that lists the properties of the given object that
+    are not declared in the schema, in the same way as ``fastjsonschema``
+    does.
+    """
+    return _SerializationFailure(f"must not contain {obj.keys() - declared} properties")
+
+
+def _is_same_json(value: Any, expected: Any) -> bool:
+    """Returns whether the given value is equal to the expected value
+    according to the semantics of the ``const`` and ``enum`` keywords.
+    """
+    if isinstance(expected, bool) or isinstance(value, bool):
+        return value is expected
+    return value == expected and _is_number(value) == _is_number(expected)
+
+
+def _sorted_keys(keys: Any) -> list[str]:
+    """Returns the given keys of an object in sorted order, ensuring that all
+    of them are strings.
+    """
+    result = sorted(key for key in keys if isinstance(key, str))
+    if len(result) != len(keys):
+        raise _SerializationFailure("must have string keys only")
+    return result
+
+
+_INT_LIST_FORMATS = tuple("[" + ",".join(["%d"] * n) + "]" for n in range(16))
+"""Format strings that encode short lists of integers into JSON, indexed by
+the length of the list.
+"""
+
+_INT_LIST_TEMPLATE = (
+    "(_int_list_formats[len({0})] % tuple({0}) if len({0}) < 16 "
+    "else repr({0}).replace(' ', ''))"
+)
+"""Expression that encodes a list whose items are all of type `int` into JSON.
+Longer lists are encoded via their representation, which differs from JSON
+only in the spaces after the commas.
+"""
+
+_HELPERS: dict[str, Any] = {
+    "_Failure": _SerializationFailure,
+    "_MISSING": object(),
+    "_dumps": _dumps,
+    "_enc": encode_basestring,
+    "_has_duplicates": _has_duplicates,
+    "_frepr": float.__repr__,
+    "_int_list_formats": _INT_LIST_FORMATS,
+    "_int_type": frozenset((int,)),
+    "_irepr": int.__repr__,
+    "_isfinite": isfinite,
+    "_is_integer": _is_integer,
+    "_is_number": _is_number,
+    "_is_same_json": _is_same_json,
+    "_missing_properties": _missing_properties,
+    "_number": _get_number_text,
+    "_sorted_keys": _sorted_keys,
+    "_unknown_properties": _unknown_properties,
+}
+"""Helper objects that the generated code may refer to."""
+
+_ANNOTATIONS = frozenset(
+    (
+        "$id",
+        "$schema",
+        "default",
+        "definitions",
+        "desciption",
+        "description",
+        "examples",
+        "title",
+    )
+)
+"""Keywords of JSON schemas that do not affect validation."""
+
+_SUPPORTED = _ANNOTATIONS | frozenset(
+    (
+        "$ref",
+        "additionalProperties",
+        "anyOf",
+        "const",
+        "enum",
+        "exclusiveMaximum",
+        "exclusiveMinimum",
+        "items",
+        "maxItems",
+        "maxLength",
+        "maximum",
+        "minItems",
+        "minLength",
+        "minProperties",
+        "minimum",
+        "oneOf",
+        "pattern",
+        "properties",
+        "required",
+        "type",
+        "uniqueItems",
+    )
+)
+"""Keywords of JSON schemas that the generator supports."""
+
+_PRIMITIVE_TYPES = frozenset(("boolean", "integer", "null", "number", "string"))
+"""JSON types whose values are serialized inline by the generated code."""
+
+_TYPE_CONDITIONS = {
+    "array": "isinstance({0}, (list, tuple))",
+    "boolean": "type({0}) is bool",
+    "integer": "(type({0}) is int or _is_integer({0}))",
+    "null": "{0} is None",
+    "number": "(type({0}) is float or type({0}) is int or _is_number({0}))",
+    "object": "isinstance({0}, dict)",
+    "string": "isinstance({0}, str)",
+}
+"""Python expressions that check whether a value has a given JSON type."""
+
+_FAST_PATHS = {
+    "boolean": ("type({0}) is bool", '("true" if {0} else "false")'),
+    "integer": ("type({0}) is int", "_irepr({0})"),
+    "number": (
+        "(type({0}) is int or type({0}) is float and _isfinite({0}))",
+        "(_irepr({0}) if type({0}) is int else _frepr({0}))",
+    ),
+    "string": ("type({0}) is str", "_enc({0})"),
+}
+"""Conditions that check whether a value has a given JSON type, restricted to
+the exact Python types that can be encoded without further checks, and the
+expressions that encode such values.
+"""
+
+_RANGE_CHECKS = (
+    ("minimum", "<", "must be bigger than or equal to {0}"),
+    ("maximum", ">", "must be smaller than or equal to {0}"),
+    ("exclusiveMinimum", "<=", "must be bigger than {0}"),
+    ("exclusiveMaximum", ">=", "must be smaller than {0}"),
+)
+"""Numeric range keywords, the operators that detect a violation and the
+corresponding failure messages.
+"""
+
+_Location = tuple[str, str]
+"""Location of a schema node: the resource path and the JSON pointer of the
+node within the resource.
+"""
+
+
+@memoized
+def _get_serializer_for_message_type(message_type: str, kind: MessageBodyKind):
+    """Returns a generated serializer function for message bodies of the
+    given kind and type. The function takes the message body and a list of
+    strings that the JSON text is appended to.
+
+    This function is memoized.
+    """
+    resource_paths = _get_resources_by_message_type(_get_body_schema_resource(kind))
+    code, constants = _generate_serializer_code(resource_paths[message_type])
+    namespace = {**_HELPERS, **constants}
+    exec(compile(code, "<flockwave.spec serializer>", "exec"), namespace)  # noqa: S102
+    return namespace["serialize"]
+
+
+def _generate_serializer_code(
+    resource_paths: tuple[str, ...],
+) -> tuple[str, dict[str, Any]]:
+    """Generates the source code of a Python module that contains a
+    ``serialize()`` function for the schemas in the given resources. A
+    message body is accepted if it conforms to any of the schemas.
+
+    Returns:
+        the source code and the constants that the code refers to
+    """
+    generator = _SerializerGenerator()
+    roots = [generator.get_function((path, "")) for path in resource_paths]
+    if len(roots) == 1:
+        generator.functions.append([f"serialize = {roots[0]}"])
+    else:
+        lines = ["def serialize(v, out):"]
+        builder = _FunctionBuilder(lines)
+        generator.emit_any_of(builder, roots, "v")
+        builder.close()
+        generator.functions.append(lines)
+
+    code = "\n\n".join("\n".join(lines) for lines in generator.functions)
+    return code + "\n", generator.constants
+
+
+class _FunctionBuilder:
+    """Helper object that emits the body of a single generated function and
+    merges consecutive writes of literal text.
+    """
+
+    def __init__(self, lines: list[str]):
+        self._lines = lines
+        self._pending: list[str] = []
+        self._indent = 1
+        self._counter = 0
+        self.line("w = out.append")
+
+    def close(self) -> None:
+        self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            text = "".join(self._pending)
+            self._pending.clear()
+            self.line(f"w({text!r})")
+
+    def line(self, code: str) -> None:
+        self.flush()
+        self.statement(code)
+
+    def statement(self, code: str) -> None:
+        """Emits a line of code that does not write anything, without
+        flushing pending literal text. The text is merged with the next
+        write instead.
+        """
+        self._lines.append("    " * self._indent + code)
+
+    def literal(self, text: str) -> None:
+        if text:
+            self._pending.append(text)
+
+    def take_literal(self) -> str:
+        """Removes the pending literal text and returns it so it can be
+        written in multiple branches of the generated code.
+        """
+        text = "".join(self._pending)
+        self._pending.clear()
+        return text
+
+    def new_variable(self, prefix: str = "x") -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def fail(self, message: str) -> None:
+        self.line(f"raise _Failure({message!r})")
+
+    def fail_if(self, condition: str, message: str) -> None:
+        # Pending literal text is not needed if the check fails so it does
+        # not have to be flushed
+        self.statement(f"if {condition}:")
+        self.statement(f"    raise _Failure({message!r})")
+
+    def write(self, expr: str) -> None:
+        if self._pending:
+            text = "".join(self._pending)
+            self._pending.clear()
+            expr = f"{text!r} + ({expr})"
+        self.line(f"w({expr})")
+
+    @contextmanager
+    def block(self, header: str) -> Iterator[None]:
+        self.line(header)
+        self._indent += 1
+        try:
+            yield
+            self.flush()
+        finally:
+            self._indent -= 1
+
+
+class _SerializerGenerator:
+    """Generates the source code of serializer functions for the nodes of
+    JSON schemas.
+
+    Each object or array node and each branch of an ``anyOf`` or ``oneOf``
+    node is turned into a separate function; primitive values are checked
+    and serialized inline by the function of the enclosing node. Functions
+    are generated once for each schema node, which also takes care of
+    recursive schemas.
+    """
+
+    def __init__(self):
+        self.constants: dict[str, Any] = {}
+        self.functions: list[list[str]] = []
+        self._names: dict[_Location, str] = {}
+
+    def add_constant(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def get_function(self, location: _Location) -> str:
+        """Returns the name of the function that serializes values according
+        to the schema node at the given location, generating the function
+        if needed.
+        """
+        name = self._names.get(location)
+        if name is None:
+            name = self._names[location] = f"_f{len(self._names)}"
+            lines = [f"def {name}(v, out):"]
+            builder = _FunctionBuilder(lines)
+            self.emit_function_body(builder, location, _get_node(location))
+            builder.close()
+            self.functions.append(lines)
+
+        return name
+
+    def emit_function_body(
+        self, builder: _FunctionBuilder, location: _Location, node: Any
+    ) -> None:
+        """Emits the body of the function of the schema node at the given
+        location. Failures are annotated with the key or index of the
+        property or item that was being serialized, stored in ``k``.
+        """
+        if _has_children(node):
+            builder.line("k = None")
+            with builder.block("try:"):
+                self.emit_node(builder, location, node, "v")
+            with builder.block("except _Failure as ex:"):
+                with builder.block("if k is not None:"):
+                    builder.line("ex.path.append(k)")
+                builder.line("raise")
+        else:
+            self.emit_node(builder, location, node, "v")
+
+    def emit_node(
+        self, builder: _FunctionBuilder, location: _Location, node: Any, var: str
+    ) -> None:
+        """Emits code that checks and serializes the value in the given
+        variable according to the schema node at the given location, except
+        for object and array values that are handled by the function of the
+        node only if the node is the node of the current function.
+        """
+        if node is True or node == {} or _is_annotation_only(node):
+            builder.write(f"_dumps({var})")
+        elif node is False:
+            builder.fail("must not be present")
+        elif "$ref" in node:
+            self.emit_value(builder, _resolve_ref(location, node["$ref"]), var)
+        elif "anyOf" in node or "oneOf" in node:
+            keyword = "anyOf" if "anyOf" in node else "oneOf"
+            branches = [
+                self.get_function(_child(location, keyword, index))
+                for index in range(len(node[keyword]))
+            ]
+            if keyword == "anyOf":
+                self.emit_any_of(builder, branches, var)
+            else:
+                self.emit_one_of(builder, branches, var)
+        elif not _is_supported(node):
+            self.emit_fallback(builder, location, var)
+        else:
+            self.emit_typed_node(builder, location, node, var)
+
+    def emit_value(
+        self, builder: _FunctionBuilder, location: _Location, var: str
+    ) -> None:
+        """Emits code that checks and serializes the value in the given
+        variable according to the schema node at the given location, either
+        inline or by calling the function of the node.
+        """
+        location = _follow_refs(location)
+        node = _get_node(location)
+        if _is_inline(node):
+            self.emit_node(builder, location, node, var)
+            return
+
+        function = self.get_function(location)
+        condition = _get_fast_path_for_array(location, var)
+        if condition is None:
+            builder.line(f"{function}({var}, out)")
+            return
+
+        # Arrays of integers that conform to the schema, such as coordinates,
+        # are encoded in the same write as the preceding literal text instead
+        # of calling the function of the node that writes them item by item
+        text = builder.take_literal()
+        with builder.block(f"if {condition}:"):
+            builder.literal(text)
+            builder.write(_INT_LIST_TEMPLATE.format(var))
+        with builder.block("else:"):
+            builder.literal(text)
+            builder.line(f"{function}({var}, out)")
+
+    def emit_any_of(
+        self, builder: _FunctionBuilder, branches: list[str], var: str
+    ) -> None:
+        builder.line("mark = len(out)")
+        with builder.block(f"for f in ({', '.join(branches)},):"):
+            with builder.block("try:"):
+                builder.line(f"f({var}, out)")
+                builder.line("break")
+            with builder.block("except _Failure:"):
+                builder.line("del out[mark:]")
+        with builder.block("else:"):
+            builder.fail("must be valid by one of anyOf definition")
+
+    def emit_one_of(
+        self, builder: _FunctionBuilder, branches: list[str], var: str
+    ) -> None:
+        builder.line("mark = len(out)")
+        builder.line("matches = 0")
+        with builder.block(f"for f in ({', '.join(branches)},):"):
+            with builder.block("try:"):
+                builder.line(f"f({var}, out if matches == 0 else [])")
+                builder.line("matches += 1")
+            with builder.block("except _Failure:"):
+                with builder.block("if matches == 0:"):
+                    builder.line("del out[mark:]")
+        builder.fail_if("matches != 1", "must be valid exactly by one definition")
+
+    def emit_fallback(
+        self, builder: _FunctionBuilder, location: _Location, var: str
+    ) -> None:
+        """Emits code that checks the value in the given variable with a
+        ``fastjsonschema`` validator and encodes it with the `json` module.
+        """
+        schema = _to_plain_json(_get_schema_from_resource(*location))
+        validator = self.add_constant(fastjsonschema.compile(schema))
+        with builder.block("try:"):
+            builder.line(f"{validator}({var})")
+        with builder.block("except _JsonSchemaValueException as ex:"):
+            builder.line(
+                "raise _Failure(ex.message[len(ex.name) + 1 :], ex.name[4:]) from None"
+            )
+        builder.write(f"_dumps({var})")
+        self.constants["_JsonSchemaValueException"] = (
+            fastjsonschema.JsonSchemaValueException
+        )
+
+    def emit_typed_node(
+        self, builder: _FunctionBuilder, location: _Location, node: Any, var: str
+    ) -> None:
+        """Emits code for a schema node that may have ``type``, ``const``,
+        ``enum`` and type-specific validation keywords.
+        """
+        types = node.get("type")
+        if isinstance(types, str):
+            types = [types]
+
+        if "const" in node:
+            const = self.add_constant(node["const"])
+            builder.fail_if(
+                f"not _is_same_json({var}, {const})",
+                f"must be same as const definition: {node['const']}",
+            )
+        if "enum" in node:
+            self.emit_enum_check(builder, node["enum"], var)
+
+        if types is None:
+            if "const" in node:
+                builder.literal(_dumps(node["const"]))
+            else:
+                builder.write(f"_dumps({var})")
+            return
+
+        if len(types) == 1:
+            builder.fail_if(
+                "not " + _TYPE_CONDITIONS[types[0]].format(var),
+                f"must be {types[0]}",
+            )
+            self.emit_typed_value(builder, location, node, types[0], var)
+            return
+
+        keyword = "if"
+        for json_type in types:
+            condition = _TYPE_CONDITIONS[json_type].format(var)
+            with builder.block(f"{keyword} {condition}:"):
+                self.emit_typed_value(builder, location, node, json_type, var)
+            keyword = "elif"
+        with builder.block("else:"):
+            builder.fail(f"must be {' or '.join(types)}")
+
+    def emit_enum_check(
+        self, builder: _FunctionBuilder, values: list[Any], var: str
+    ) -> None:
+        message = f"must be one of {values}"
+        if all(isinstance(value, str) for value in values):
+            allowed = self.add_constant(frozenset(values))
+            builder.fail_if(
+                f"not isinstance({var}, str) or {var} not in {allowed}", message
+            )
+        else:
+            allowed = self.add_constant(tuple(values))
+            builder.fail_if(
+                f"not any(_is_same_json({var}, y) for y in {allowed})", message
+            )
+
+    def emit_typed_value(
+        self,
+        builder: _FunctionBuilder,
+        location: _Location,
+        node: Any,
+        json_type: str,
+        var: str,
+    ) -> None:
+        """Emits code that checks and serializes the value in the given
+        variable, knowing that it has the given JSON type.
+        """
+        if json_type == "null":
+            builder.literal("null")
+        elif json_type == "boolean":
+            builder.write(f'"true" if {var} else "false"')
+        elif json_type == "string":
+            self.emit_string_checks(builder, node, var)
+            if "const" in node:
+                builder.literal(_dumps(node["const"]))
+            else:
+                builder.write(f"_enc({var})")
+        elif json_type in ("integer", "number"):
+            self.emit_range_checks(builder, node, var)
+            builder.write(f"_irepr({var}) if type({var}) is int else _number({var})")
+        elif json_type == "object":
+            self.emit_object(builder, location, node, var)
+        else:
+            self.emit_array(builder, location, node, var)
+
+    def emit_range_checks(self, builder: _FunctionBuilder, node: Any, var: str) -> None:
+        for keyword, operator, message in _RANGE_CHECKS:
+            if keyword in node:
+                builder.fail_if(
+                    f"{var} {operator} {node[keyword]!r}",
+                    message.format(node[keyword]),
+                )
+
+    def emit_string_checks(
+        self, builder: _FunctionBuilder, node: Any, var: str
+    ) -> None:
+        if "minLength" in node:
+            builder.fail_if(
+                f"len({var}) < {node['minLength']}",
+                f"must be longer than or equal to {node['minLength']} characters",
+            )
+        if "maxLength" in node:
+            builder.fail_if(
+                f"len({var}) > {node['maxLength']}",
+                f"must be shorter than or equal to {node['maxLength']} characters",
+            )
+        if "pattern" in node:
+            regex = self.add_constant(re.compile(node["pattern"]))
+            builder.fail_if(
+                f"not {regex}.search({var})", f"must match pattern {node['pattern']}"
+            )
+
+    def emit_object(
+        self, builder: _FunctionBuilder, location: _Location, node: Any, var: str
+    ) -> None:
+        properties: dict[str, Any] = node.get("properties", {})
+        required: list[str] = node.get("required", [])
+        additional = node.get("additionalProperties", True)
+
+        if required:
+            if len(required) == 1:
+                condition = f"{required[0]!r} not in {var}"
+            else:
+                keys = self.add_constant(frozenset(required))
+                condition = f"not {var}.keys() >= {keys}"
+            builder.statement(f"if {condition}:")
+            builder.statement(
+                f"    raise _missing_properties({var}, {self.add_constant(required)})"
+            )
+        if "minProperties" in node:
+            builder.fail_if(
+                f"len({var}) < {node['minProperties']}",
+                f"must contain at least {node['minProperties']} properties",
+            )
+
+        if not properties and (additional is True or additional == {}):
+            builder.write(f"_dumps({var})")
+            return
+
+        self.emit_fused_object(builder, location, node, var)
+
+        builder.literal("{")
+        writer = _ObjectWriter(builder)
+        for name in properties:
+            value_location = _child(location, "properties", name)
+            self.emit_property(
+                builder, writer, value_location, var, name, name in required
+            )
+
+        if properties:
+            declared = self.add_constant(frozenset(properties))
+            keys = f"{var}.keys() - {declared}"
+            if additional is False:
+                # The failure belongs to the object itself, not to the last
+                # property that was serialized
+                builder.statement(f"if len({var}) != {writer.count}:")
+                builder.statement("    k = None")
+                builder.statement(f"    raise _unknown_properties({var}, {declared})")
+            else:
+                with builder.block(f"if len({var}) != {writer.count}:"):
+                    self.emit_additional_properties(
+                        builder, writer, location, additional, var, keys
+                    )
+        elif additional is False:
+            builder.statement(f"if {var}:")
+            builder.statement(f"    raise _unknown_properties({var}, frozenset())")
+        else:
+            self.emit_additional_properties(
+                builder, writer, location, additional, var, var
+            )
+        builder.literal("}")
+
+    def emit_fused_object(
+        self, builder: _FunctionBuilder, location: _Location, node: Any, var: str
+    ) -> None:
+        """Emits code that checks all the properties of the object in the given
+        variable with a single condition and serializes the object in a
+        single write, if the object has no properties other than those
+        declared in the schema node and all the declared properties are
+        primitive values or arrays of integers. The generated function
+        returns after the write.
+
+        Objects that do not satisfy the condition are left to the code that
+        follows, which also reports the failures. Nothing is emitted if some
+        of the declared properties cannot be checked with a condition.
+        """
+        properties: dict[str, Any] = node.get("properties", {})
+        required: list[str] = node.get("required", [])
+        if not properties or next(iter(properties)) not in required:
+            # The separator before the optional properties would depend on
+            # which of them are present
+            return
+
+        assignments: list[str] = []
+        conditions: list[str] = []
+        parts: list[str] = []
+        for index, name in enumerate(properties):
+            value_location = _child(location, "properties", name)
+            x = f"z{index}"
+            fast_path = self.get_fast_path(value_location, x)
+            if fast_path is None:
+                return
+
+            condition, expr = fast_path
+            key = ("{" if index == 0 else ",") + encode_basestring(name) + ":"
+            if name in required:
+                assignments.append(f"{x} = {var}[{name!r}]")
+                conditions.append(condition)
+                parts.extend((repr(key), expr))
+            else:
+                default = _get_default(value_location)
+                missing = "" if default is _NO_DEFAULT else key + _dumps(default)
+                assignments.append(f"{x} = {var}.get({name!r}, _MISSING)")
+                conditions.append(f"({x} is _MISSING or {condition})")
+                parts.append(f"({missing!r} if {x} is _MISSING else {key!r} + {expr})")
+        parts.append("'}'")
+
+        declared = self.add_constant(frozenset(properties))
+        text = builder.take_literal()
+        with builder.block(f"if {var}.keys() <= {declared}:"):
+            for assignment in assignments:
+                builder.line(assignment)
+            with builder.block(f"if {' and '.join(conditions)}:"):
+                builder.literal(text)
+                builder.write(f"''.join(({', '.join(parts)},))")
+                builder.line("return")
+        builder.literal(text)
+
+    def get_fast_path(self, location: _Location, var: str) -> tuple[str, str] | None:
+        """Returns a condition that holds if the value in the given variable
+        conforms to the schema node at the given location and an expression
+        that encodes such a value into JSON, if the node accepts primitive
+        values or arrays of integers only and no further checks are needed
+        for values that satisfy the condition.
+        """
+        location = _follow_refs(location)
+        condition = _get_fast_path_for_array(location, var)
+        if condition is not None:
+            return condition, _INT_LIST_TEMPLATE.format(var)
+
+        node = _get_node(location)
+        if not _is_inline(node) or not isinstance(node, dict):
+            return None
+        if "const" in node or "enum" in node:
+            return None
+
+        json_type = node.get("type")
+        fast_path = _FAST_PATHS.get(json_type)  # type: ignore
+        if fast_path is None:
+            return None
+
+        condition, expr = (template.format(var) for template in fast_path)
+        conditions = [condition]
+        if json_type == "string":
+            if "minLength" in node:
+                conditions.append(f"len({var}) >= {node['minLength']}")
+            if "maxLength" in node:
+                conditions.append(f"len({var}) <= {node['maxLength']}")
+            if "pattern" in node:
+                regex = self.add_constant(re.compile(node["pattern"]))
+                conditions.append(f"{regex}.search({var})")
+        elif json_type != "boolean":
+            conditions.append(_get_range_check(node, var))
+        return " and ".join(filter(None, conditions)), expr
+
+    def emit_property(
+        self,
+        builder: _FunctionBuilder,
+        writer: "_ObjectWriter",
+        location: _Location,
+        var: str,
+        name: str,
+        required: bool,
+    ) -> None:
+        x = builder.new_variable()
+        key = encode_basestring(name) + ":"
+        if required:
+            builder.statement(f"k = {name!r}")
+            builder.statement(f"{x} = {var}[{name!r}]")
+            writer.write_key(key)
+            self.emit_value(builder, location, x)
+            writer.after_required()
+            return
+
+        default = _get_default(location)
+        builder.line(f"{x} = {var}.get({name!r}, _MISSING)")
+        writer.before_optional()
+        with builder.block(f"if {x} is not _MISSING:"):
+            builder.statement(f"k = {name!r}")
+            writer.write_key(key)
+            self.emit_value(builder, location, x)
+            writer.after_optional()
+        if default is not _NO_DEFAULT:
+            with builder.block("else:"):
+                writer.write_key(key)
+                builder.literal(_dumps(default))
+                writer.after_optional(counted=False)
+
+    def emit_additional_properties(
+        self,
+        builder: _FunctionBuilder,
+        writer: "_ObjectWriter",
+        location: _Location,
+        additional: Any,
+        var: str,
+        keys: str,
+    ) -> None:
+        x = builder.new_variable()
+        writer.before_loop()
+        with builder.block(f"for k in _sorted_keys({keys}):"):
+            builder.line(f"{x} = {var}[k]")
+            writer.write_dynamic_key("_enc(k)")
+            if additional is True:
+                builder.write(f"_dumps({x})")
+            else:
+                self.emit_value(builder, _child(location, "additionalProperties"), x)
+
+    def emit_array(
+        self, builder: _FunctionBuilder, location: _Location, node: Any, var: str
+    ) -> None:
+        if "minItems" in node:
+            builder.fail_if(
+                f"len({var}) < {node['minItems']}",
+                f"must contain at least {node['minItems']} items",
+            )
+        if "maxItems" in node:
+            builder.fail_if(
+                f"len({var}) > {node['maxItems']}",
+                f"must contain less than or equal to {node['maxItems']} items",
+            )
+        if node.get("uniqueItems"):
+            builder.fail_if(f"_has_duplicates({var})", "must contain unique items")
+
+        items = node.get("items", True)
+        if isinstance(items, list):
+            self.emit_tuple_items(builder, location, items, var)
+            return
+
+        if items is True or items == {}:
+            builder.write(f"_dumps({var})")
+            return
+
+        item_location = _child(location, "items")
+        fast_path = _get_fast_path_for_items(_get_node(_follow_refs(item_location)))
+        if fast_path is None:
+            self.emit_array_items(builder, item_location, var)
+            return
+
+        # Arrays of strings or integers without further constraints are
+        # encoded with a single join if all their items have the exact type
+        condition, encoder = fast_path
+        y = builder.new_variable("y")
+        with builder.block(f"if all({condition.format(y)} for {y} in {var}):"):
+            builder.write(f"'[' + ','.join(map({encoder}, {var})) + ']'")
+        with builder.block("else:"):
+            self.emit_array_items(builder, item_location, var)
+
+    def emit_array_items(
+        self, builder: _FunctionBuilder, location: _Location, var: str
+    ) -> None:
+        x = builder.new_variable()
+        builder.literal("[")
+        with builder.block(f"for k, {x} in enumerate({var}):"):
+            with builder.block("if k:"):
+                builder.literal(",")
+            self.emit_value(builder, location, x)
+        builder.literal("]")
+
+    def emit_tuple_items(
+        self,
+        builder: _FunctionBuilder,
+        location: _Location,
+        items: list[Any],
+        var: str,
+    ) -> None:
+        builder.line(f"n = len({var})")
+        locations = [
+            _follow_refs(_child(location, "items", index))
+            for index in range(len(items))
+        ]
+        if not all(_accepts_any_integer(_get_node(loc)) for loc in locations):
+            self.emit_tuple_items_one_by_one(builder, location, items, var)
+            return
+
+        # Tuples of integers, such as coordinates, are checked item by item
+        # but encoded with a single join
+        with builder.block(f"if all(type(y) is int for y in {var}):"):
+            for index, item_location in enumerate(locations):
+                node = _get_node(item_location)
+                if any(keyword in node for keyword, _, _ in _RANGE_CHECKS):
+                    with builder.block(f"if n > {index}:"):
+                        builder.line(f"k = {index}")
+                        self.emit_range_checks(builder, node, f"{var}[{index}]")
+            builder.write(f"'[' + ','.join(map(_irepr, {var})) + ']'")
+        with builder.block("else:"):
+            self.emit_tuple_items_one_by_one(builder, location, items, var)
+
+    def emit_tuple_items_one_by_one(
+        self,
+        builder: _FunctionBuilder,
+        location: _Location,
+        items: list[Any],
+        var: str,
+    ) -> None:
+        builder.literal("[")
+        for index in range(len(items)):
+            with builder.block(f"if n > {index}:"):
+                builder.line(f"k = {index}")
+                if index:
+                    builder.literal(",")
+                x = builder.new_variable()
+                builder.line(f"{x} = {var}[{index}]")
+                self.emit_value(builder, _child(location, "items", index), x)
+        with builder.block(f"for y in {var}[{len(items)}:]:"):
+            builder.write('"," + _dumps(y)')
+        builder.literal("]")
+
+
+class _ObjectWriter:
+    """Helper object that keeps track of whether a comma is needed before the
+    next property of an object being serialized by the generated code, and
+    how many of the keys of the object have been serialized.
+
+    The state is tracked at generation time as long as possible; it is
+    stored in the ``sep`` variable of the generated code once it depends on
+    the presence of optional properties.
+    """
+
+    def __init__(self, builder: _FunctionBuilder):
+        self._builder = builder
+        self._state = "first"
+        self._required = 0
+        self._counted = False
+
+    @property
+    def count(self) -> str:
+        """Expression that evaluates to the number of declared properties
+        present in the object.
+        """
+        return f"n + {self._required}" if self._counted else str(self._required)
+
+    def before_optional(self) -> None:
+        if not self._counted:
+            self._builder.line("n = 0")
+            self._counted = True
+        if self._state == "first":
+            self._builder.line('sep = ""')
+            self._state = "dynamic"
+
+    def before_loop(self) -> None:
+        if self._state == "first":
+            self._builder.line('sep = ""')
+            self._state = "dynamic"
+
+    def write_key(self, key: str) -> None:
+        if self._state == "dynamic":
+            self._builder.write("sep")
+            self._builder.literal(key)
+        else:
+            self._builder.literal(("," if self._state == "rest" else "") + key)
+
+    def write_dynamic_key(self, expr: str) -> None:
+        if self._state == "rest":
+            self._builder.write(f'"," + {expr} + ":"')
+        else:
+            self._builder.write(f'sep + {expr} + ":"')
+            self._builder.line('sep = ","')
+
+    def after_required(self) -> None:
+        self._required += 1
+        self._state = "rest"
+
+    def after_optional(self, counted: bool = True) -> None:
+        if counted:
+            self._builder.line("n += 1")
+        if self._state == "dynamic":
+            self._builder.line('sep = ","')
+
+
+_NO_DEFAULT = object()
+"""Marker object for properties without a default value."""
+
+
+def _accepts_any_integer(node: Any) -> bool:
+    """Returns whether the given schema node is serialized inline and accepts
+    all integers that satisfy its range constraints.
+    """
+    if not _is_inline(node) or not isinstance(node, dict):
+        return False
+    if "const" in node or "enum" in node:
+        return False
+    types = node.get("type")
+    if isinstance(types, str):
+        types = [types]
+    return types is None or "integer" in types or "number" in types
+
+
+def _child(location: _Location, *keys: Any) -> _Location:
+    """Returns the location of a child node of the node at the given
+    location.
+    """
+    resource_path, pointer = location
+    for key in keys:
+        pointer += "/" + str(key).replace("~", "~0").replace("/", "~1")
+    return resource_path, pointer
+
+
+def _follow_refs(location: _Location) -> _Location:
+    """Follows the JSON references starting from the schema node at the given
+    location and returns the location of the first node that is not a
+    reference.
+    """
+    node = _get_node(location)
+    while isinstance(node, dict) and "$ref" in node:
+        location = _resolve_ref(location, node["$ref"])
+        node = _get_node(location)
+    return location
+
+
+def _get_default(location: _Location) -> Any:
+    """Returns the default value of the schema node at the given location,
+    following JSON references, or `_NO_DEFAULT` if it has no default value.
+    """
+    node = _get_node(location)
+    while isinstance(node, dict) and "$ref" in node and "default" not in node:
+        location = _resolve_ref(location, node["$ref"])
+        node = _get_node(location)
+    if isinstance(node, dict) and "default" in node:
+        return node["default"]
+    return _NO_DEFAULT
+
+
+def _get_fast_path_for_array(location: _Location, var: str) -> str | None:
+    """Returns a condition that holds if the value in the given variable is a
+    list of integers that conforms to the schema node at the given location,
+    if the node accepts arrays only and at least some arrays of integers.
+    Such lists can be encoded with a single `str.join()` call.
+    """
+    node = _get_node(location)
+    if not isinstance(node, dict) or node.get("type") != "array":
+        return None
+    if set(node) - _ANNOTATIONS - {"type", "items", "minItems", "maxItems"}:
+        return None
+
+    min_items = node.get("minItems", 0)
+    conditions = [f"type({var}) is list"]
+    if min_items:
+        conditions.append(f"len({var}) >= {min_items}")
+    if "maxItems" in node:
+        conditions.append(f"len({var}) <= {node['maxItems']}")
+
+    items = node.get("items", True)
+    if isinstance(items, list):
+        # Ranges are checked only when all items are known to be integers
+        checks = _get_tuple_item_checks(location, len(items), min_items, var)
+        if checks is None:
+            return None
+        lengths = [check for check in checks if check.startswith("len(")]
+        conditions.extend(lengths)
+        conditions.append(f"_int_type.issuperset(map(type, {var}))")
+        conditions.extend(check for check in checks if check not in lengths)
+    else:
+        check = ""
+        if "items" in node:
+            item_node = _get_node(_follow_refs(_child(location, "items")))
+            check = _get_integer_range_check(item_node, "y")
+        if check is None:
+            return None
+        conditions.append(f"_int_type.issuperset(map(type, {var}))")
+        if check:
+            conditions.append(f"all({check} for y in {var})")
+
+    return " and ".join(conditions)
+
+
+def _get_range_check(node: Any, var: str) -> str:
+    """Returns a condition that holds if the number in the given variable
+    satisfies the range constraints of the given schema node, or an empty
+    string if the node has no range constraints.
+    """
+    return " and ".join(
+        f"not {var} {operator} {node[keyword]!r}"
+        for keyword, operator, _ in _RANGE_CHECKS
+        if keyword in node
+    )
+
+
+def _get_tuple_item_checks(
+    location: _Location, num_items: int, min_items: int, var: str
+) -> list[str] | None:
+    """Returns the conditions that a list of integers in the given variable
+    has to satisfy to conform to the ``items`` keyword of the array schema
+    node at the given location, which is a list of the given length.
+
+    Returns:
+        the conditions, or ``None`` if the node does not accept lists of
+        integers of at least the minimum length
+    """
+    result = []
+    for index in range(num_items):
+        item_location = _follow_refs(_child(location, "items", index))
+        check = _get_integer_range_check(_get_node(item_location), f"{var}[{index}]")
+        if check is None:
+            if index < min_items:
+                return None
+            result.append(f"len({var}) <= {index}")
+            break
+        if check and index < min_items:
+            result.append(check)
+        elif check:
+            result.append(f"(len({var}) <= {index} or {check})")
+    return result
+
+
+def _get_fast_path_for_items(node: Any) -> tuple[str, str] | None:
+    """Returns a condition for the items of an array and the name of a
+    function that encodes such items into JSON, if all items of the array can
+    be encoded with a single `str.join()` call when they satisfy the
+    condition.
+    """
+    if not isinstance(node, dict) or set(node) - _ANNOTATIONS != {"type"}:
+        return None
+    if node["type"] == "string":
+        return "type({0}) is str", "_enc"
+    if node["type"] in ("integer", "number"):
+        return "type({0}) is int", "_irepr"
+    return None
+
+
+def _get_integer_range_check(node: Any, var: str) -> str | None:
+    """Returns a condition that holds if the integer in the given variable
+    conforms to the given schema node, or ``None`` if the node does not
+    accept all integers that satisfy its range constraints. The condition is
+    an empty string if the node accepts all integers.
+    """
+    if node is True or node == {}:
+        return ""
+    if not _accepts_any_integer(node):
+        return None
+    return _get_range_check(node, var)
+
+
+def _get_node(location: _Location) -> Any:
+    """Returns the raw schema node at the given location."""
+    resource_path, pointer = location
+    obj = _get_json_object_from_resource(resource_path)
+    return resolve_pointer(obj, pointer) if pointer else obj
+
+
+def _has_children(node: Any) -> bool:
+    """Returns whether the generated function of the given schema node may
+    serialize properties or items, and therefore needs to annotate failures
+    with the key or index being serialized.
+    """
+    if not isinstance(node, dict):
+        return False
+    types = node.get("type")
+    if isinstance(types, str):
+        types = [types]
+    return bool(types) and ("object" in types or "array" in types)
+
+
+def _is_annotation_only(node: Any) -> bool:
+    """Returns whether the given schema node contains annotations only."""
+    return isinstance(node, dict) and not (set(node) - _ANNOTATIONS)
+
+
+def _is_inline(node: Any) -> bool:
+    """Returns whether the given schema node is serialized inline, i.e.
+    whether it accepts only primitive values that do not need a separate
+    function.
+    """
+    if not isinstance(node, dict):
+        return True
+    if "$ref" in node:
+        return False
+    if "anyOf" in node or "oneOf" in node or not _is_supported(node):
+        return False
+    types = node.get("type")
+    if types is None:
+        return True
+    if isinstance(types, str):
+        types = [types]
+    return all(json_type in _PRIMITIVE_TYPES for json_type in types)
+
+
+def _is_supported(node: Any) -> bool:
+    """Returns whether the generator supports all the keywords in the given
+    schema node.
+    """
+    if set(node) - _SUPPORTED:
+        return False
+    types = node.get("type")
+    if types is None:
+        # Type-specific keywords without a type would have to be applied
+        # conditionally; let fastjsonschema deal with them
+        return not (set(node) - _ANNOTATIONS - {"const", "enum"})
+    return isinstance(types, (str, list))
+
+
+def _resolve_ref(location: _Location, ref: str) -> _Location:
+    """Resolves a JSON reference relative to the given location."""
+    resource_path, _, pointer = ref.partition("#")
+    if resource_path.startswith(FLOCKWAVE_SPEC_PREFIX):
+        resource_path = resource_path.removeprefix(FLOCKWAVE_SPEC_PREFIX)
+        resource_path = resource_path.removeprefix("/")
+    return (resource_path or location[0], pointer)
@@ -0,0 +1,216 @@
+"""Incremental reader for streams of JSON values.
+
+The reader accepts newline-delimited JSON (NDJSON), concatenated JSON values
+with or without whitespace between them, and ordinary JSON files containing a
+single value. It reads its input in chunks so the memory it needs is bounded
+by the size of the largest value in the stream and not by the size of the
+stream itself.
+"""
+
+import re
+from codecs import getincrementaldecoder
+from collections.abc import Iterator
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, BinaryIO, NamedTuple
+
+__all__ = ("JSONStreamItem", "JSONStreamReader")
+
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+"""Default number of bytes to read from the input stream at once."""
+
+DEFAULT_MAX_VALUE_SIZE = 64 * 1024 * 1024
+"""Default upper limit on the size of a single JSON value in the stream, in
+characters. Values that cannot be parsed from a buffer of this size are
+reported as errors.
+"""
+
+_LOOKAHEAD = 8
+"""Number of characters at the end of the buffer where a JSON syntax error
+may simply be the result of a truncated token.
+"""
+
+_decoder = JSONDecoder()
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+class JSONStreamItem(NamedTuple):
+    """A single JSON value or syntax error found in a stream."""
+
+    value: Any
+    """The parsed JSON value; ``None`` for syntax errors."""
+
+    line: int
+    """Line number where the value or the syntax error starts, 1-based."""
+
+    column: int
+    """Column number where the value or the syntax error starts, 1-based."""
+
+    error: str | None = None
+    """Description of the syntax error if this item represents an error."""
+
+
+class JSONStreamReader:
+    """Incremental reader for streams of JSON values.
+
+    Iterating over the reader yields a `JSONStreamItem` for each JSON value in
+    the stream. Syntax errors are yielded as items with an error message;
+    the reader then skips to the next line and continues from there, which
+    works well for NDJSON streams.
+    """
+
+    bytes_read: int
+    """Number of bytes read from the underlying stream so far."""
+
+    def __init__(
+        self,
+        fp: BinaryIO,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_value_size: int = DEFAULT_MAX_VALUE_SIZE,
+        first_line: int = 1,
+    ):
+        """Constructor.
+
+        Parameters:
+            fp: the stream to read from, opened in binary mode. The stream
+                must be UTF-8 encoded.
+            chunk_size: number of bytes to read from the stream at once
+            max_value_size: upper limit on the size of a single JSON value, in
+                characters
+            first_line: line number of the first line of the stream; useful
+                when the stream is a part of a larger file
+        """
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._max_value_size = max_value_size
+        self._first_line = first_line
+        self.bytes_read = 0
+
+    def __iter__(self) -> Iterator[JSONStreamItem]:
+        self._buffer = ""
+        self._pos = 0
+        self._line = self._first_line
+        self._line_start = 0
+        self._eof = False
+        self._skip_line = False
+        self._read_size = self._chunk_size
+        self._utf8 = getincrementaldecoder("utf-8")("replace")
+
+        while True:
+            self._skip_to_next_value()
+            if self._pos < len(self._buffer) and not self._skip_line:
+                item = self._parse_next_value()
+                if item is not None:
+                    yield item
+                    continue
+
+            if self._eof:
+                break
+
+            self._read_next_chunk()
+
+    def _advance_to(self, new_pos: int) -> None:
+        """Moves the current position in the buffer forward, keeping track of
+        the current line number.
+        """
+        buffer, pos = self._buffer, self._pos
+        newlines = buffer.count("\n", pos, new_pos)
+        if newlines:
+            self._line += newlines
+            self._line_start = buffer.rfind("\n", pos, new_pos) + 1
+        self._pos = new_pos
+
+    def _get_location_of(self, index: int) -> tuple[int, int]:
+        """Returns the line and column number of the character with the given
+        index in the buffer, assuming that it is not before the current
+        position.
+        """
+        buffer, pos = self._buffer, self._pos
+        line = self._line + buffer.count("\n", pos, index)
+        newline = buffer.rfind("\n", pos, index)
+        line_start = self._line_start if newline < 0 else newline + 1
+        return line, index - line_start + 1
+
+    def _parse_next_value(self) -> JSONStreamItem | None:
+        """Attempts to parse the next JSON value from the buffer.
+
+        Returns:
+            the parsed value or a syntax error, or ``None`` if more data needs
+            to be read from the stream before the value can be parsed
+        """
+        buffer, pos = self._buffer, self._pos
+
+        try:
+            value, end = _decoder.raw_decode(buffer, pos)
+        except JSONDecodeError as ex:
+            if self._eof or _is_syntax_error_in_complete_part(ex, len(buffer)):
+                error_pos, message = ex.pos, ex.msg
+            elif len(buffer) - pos >= self._max_value_size:
+                error_pos = pos
+                message = f"JSON value is longer than {self._max_value_size} characters"
+            else:
+                # Value may continue in the next chunk
+                return None
+
+            # Report the error and skip to the next line
+            line, column = self._get_location_of(error_pos)
+            self._skip_line = True
+            return JSONStreamItem(None, line, column, message)
+
+        if end == len(buffer) and not self._eof and _is_number(value):
+            # A number at the end of the buffer may continue in the next chunk
+            return None
+
+        item = JSONStreamItem(value, *self._get_location_of(pos))
+        self._advance_to(end)
+        self._read_size = self._chunk_size
+        return item
+
+    def _read_next_chunk(self) -> None:
+        """Reads the next chunk from the stream into the buffer, dropping the
+        part of the buffer that was already consumed.
+        """
+        chunk = self._fp.read(self._read_size)
+        if chunk:
+            self.bytes_read += len(chunk)
+            text = self._utf8.decode(chunk)
+        else:
+            self._eof = True
+            text = self._utf8.decode(b"", final=True)
+
+        pos = self._pos
+        self._buffer = self._buffer[pos:] + text
+        self._line_start -= pos
+        self._pos = 0
+
+        # If we are in the middle of a value, read larger chunks next time to
+        # avoid quadratic behaviour for large values
+        if self._buffer:
+            self._read_size = min(self._read_size * 2, self._max_value_size)
+
+    def _skip_to_next_value(self) -> None:
+        """Skips whitespace in the buffer, or the rest of the current line if
+        we are recovering from a syntax error.
+        """
+        buffer, pos = self._buffer, self._pos
+        if self._skip_line:
+            newline = buffer.find("\n", pos)
+            if newline < 0:
+                self._advance_to(len(buffer))
+                return
+            self._skip_line = False
+            pos = newline + 1
+        self._advance_to(_whitespace.match(buffer, pos).end())  # type: ignore
+
+
+def _is_syntax_error_in_complete_part(ex: JSONDecodeError, length: int) -> bool:
+    """Returns whether the given JSON decoding error is a genuine syntax error
+    that would not go away if more data was appended to the buffer of the
+    given length.
+    """
+    return ex.pos + _LOOKAHEAD < length and not ex.msg.startswith("Unterminated string")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
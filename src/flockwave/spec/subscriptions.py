@@ -0,0 +1,461 @@
+"""Index of the device tree subscriptions of clients, as managed by the
+``DEV-SUB``, ``DEV-UNSUB`` and ``DEV-LISTSUB`` messages.
+
+A subscription to a device tree path covers the node at the path and its
+entire subtree, so a channel update has to be delivered to every client
+that is subscribed to the path of the channel or to any of its ancestors.
+`SubscriptionIndex` stores the subscriptions in a trie keyed by the
+components of the paths, so finding the subscribers of a channel takes time
+proportional to the depth of the channel in the tree instead of the number
+of subscriptions. The results are cached until the subscriptions of the
+affected nodes change, which makes repeated queries for the same channels a
+single dictionary lookup.
+
+A client may subscribe to the same path multiple times; the index counts the
+subscriptions, and the client keeps receiving updates until the same number
+of unsubscriptions have been processed.
+
+`DeviceTreeUpdateBatch` collects the channel updates of a single tick and
+merges them into a single ``DEV-INF`` notification per client.
+"""
+
+import re
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from typing import Any, Generic, TypeVar
+
+__all__ = (
+    "DeviceTreeUpdateBatch",
+    "MAX_CACHE_SIZE",
+    "SubscriptionIndex",
+    "is_valid_device_tree_path",
+)
+
+
+MAX_CACHE_SIZE = 65536
+"""Maximum number of device tree paths whose subscribers are remembered by a
+subscription index. The cache is cleared when it is full.
+"""
+
+C = TypeVar("C", bound=Hashable)
+
+_device_tree_path_regex = re.compile(r"(/[^/]+)+|/")
+
+
+def is_valid_device_tree_path(path: Any) -> bool:
+    """Returns whether the given object is a valid device tree path according
+    to the ``deviceTreePath`` schema of the specification.
+    """
+    return isinstance(path, str) and bool(_device_tree_path_regex.fullmatch(path))
+
+
+def _get_path_components(path: str) -> list[str]:
+    """Returns the components of a device tree path, which is assumed to be
+    valid.
+    """
+    return path.split("/")[1:] if path != "/" else []
+
+
+def _is_in_subtree(path: str, root: str) -> bool:
+    """Returns whether the given device tree path is in the subtree of the
+    given root path, including the root itself.
+    """
+    return root == "/" or path == root or path.startswith(root + "/")
+
+
+class _Node(Generic[C]):
+    """Node of the trie in a subscription index."""
+
+    __slots__ = ("cached", "children", "counts")
+
+    cached: dict[str, set[str]]
+    """The paths whose subscribers are cached in the index and whose deepest
+    node in the trie is this node, keyed by the component of the path that
+    follows this node, or by an empty string for the path of this node
+    itself. These are the cache entries that have to be removed when the
+    subscriptions of this node or its ancestors change.
+    """
+
+    children: dict[str, "_Node[C]"]
+    """The child nodes of this node, keyed by the next path component."""
+
+    counts: dict[C, int]
+    """Number of subscriptions of each client to the path of this node."""
+
+    def __init__(self):
+        self.cached = {}
+        self.children = {}
+        self.counts = {}
+
+
+class SubscriptionIndex(Generic[C]):
+    """Index of the device tree subscriptions of a set of clients.
+
+    Clients may be arbitrary hashable objects, e.g. client IDs or connection
+    objects.
+    """
+
+    def __init__(self, max_cache_size: int = MAX_CACHE_SIZE):
+        """Constructor.
+
+        Parameters:
+            max_cache_size: maximum number of device tree paths whose
+                subscribers are remembered between queries
+        """
+        self._root: _Node[C] = _Node()
+        self._paths_by_client: dict[C, dict[str, int]] = {}
+        self._cache: dict[str, frozenset[C]] = {}
+        self._max_cache_size = max_cache_size
+
+    def __contains__(self, client: Any) -> bool:
+        return client in self._paths_by_client
+
+    @property
+    def clients(self) -> list[C]:
+        """The clients that have at least one subscription."""
+        return list(self._paths_by_client)
+
+    def subscribe(self, client: C, path: str, count: int = 1) -> int:
+        """Subscribes a client to the given device tree path.
+
+        Parameters:
+            client: the client to subscribe
+            path: the device tree path to subscribe to
+            count: the number of subscriptions to add
+
+        Returns:
+            the number of subscriptions of the client to the path after the
+            operation
+
+        Raises:
+            ValueError: if the path is not a valid device tree path or the
+                count is not positive
+        """
+        if not is_valid_device_tree_path(path):
+            raise ValueError(f"{path!r} is not a valid device tree path")
+        if count < 1:
+            raise ValueError(f"count must be positive, got {count!r}")
+
+        node = self._root
+        for component in _get_path_components(path):
+            child = node.children.get(component)
+            if child is None:
+                # Paths whose deepest node was the parent may now go deeper
+                self._invalidate_under(node, component)
+                child = node.children[component] = _Node()
+            node = child
+
+        total = node.counts.get(client, 0) + count
+        if total == count:
+            self._invalidate(node)
+        node.counts[client] = total
+        self._paths_by_client.setdefault(client, {})[path] = total
+        return total
+
+    def unsubscribe(
+        self,
+        client: C,
+        path: str,
+        *,
+        remove_all: bool = False,
+        include_subtrees: bool = False,
+    ) -> list[str]:
+        """Unsubscribes a client from the given device tree path.
+
+        Parameters:
+            client: the client to unsubscribe
+            path: the device tree path to unsubscribe from
+            remove_all: whether to remove all the subscriptions of the client
+                to the path (``True``) or only a single one (``False``)
+            include_subtrees: whether to also remove the subscriptions of the
+                client to the paths in the subtree of the given path
+
+        Returns:
+            the paths that the client had a subscription to and that were
+            affected by the operation
+        """
+        paths = self._paths_by_client.get(client)
+        if not paths:
+            return []
+
+        if include_subtrees:
+            affected = [other for other in paths if _is_in_subtree(other, path)]
+        else:
+            affected = [path] if path in paths else []
+
+        for other in affected:
+            self._remove(client, other, paths[other] if remove_all else 1)
+        return affected
+
+    def unsubscribe_all(self, client: C) -> None:
+        """Removes all the subscriptions of a client, e.g. when it has
+        disconnected.
+        """
+        for path, count in list(self._paths_by_client.get(client, {}).items()):
+            self._remove(client, path, count)
+
+    def get_subscribers(self, path: str) -> frozenset[C]:
+        """Returns the clients that should receive updates of the given device
+        tree path, i.e. the clients that are subscribed to the path or to one
+        of its ancestors.
+
+        The result for the same path is the same object as long as the
+        subscribers of the path do not change.
+
+        Raises:
+            ValueError: if the path is not a valid device tree path
+        """
+        result = self._cache.get(path)
+        if result is None:
+            if not is_valid_device_tree_path(path):
+                raise ValueError(f"{path!r} is not a valid device tree path")
+
+            node = self._root
+            clients = set(node.counts)
+            next_component = ""
+            for component in _get_path_components(path):
+                child = node.children.get(component)
+                if child is None:
+                    next_component = component
+                    break
+                node = child
+                clients.update(node.counts)
+            result = frozenset(clients)
+
+            if len(self._cache) >= self._max_cache_size:
+                self._invalidate(self._root)
+            self._cache[path] = result
+            paths = node.cached.get(next_component)
+            if paths is None:
+                node.cached[next_component] = {path}
+            else:
+                paths.add(path)
+
+        return result
+
+    def get_subscriptions(
+        self, client: C, path_filter: Iterable[str] = ("/",)
+    ) -> list[str]:
+        """Returns the device tree paths that a client is subscribed to, in the
+        format of the ``paths`` field of a ``DEV-LISTSUB`` response.
+
+        Each path is included as many times as the number of subscriptions of
+        the client to the path, multiplied by the number of paths in the
+        filter that match the path.
+
+        Parameters:
+            client: the client whose subscriptions are to be returned
+            path_filter: the paths whose subtrees the returned subscriptions
+                must be in
+        """
+        paths = self._paths_by_client.get(client, {})
+        result = []
+        for root in path_filter:
+            for path, count in paths.items():
+                if _is_in_subtree(path, root):
+                    result.extend([path] * count)
+        return result
+
+    def handle_request(
+        self,
+        client: C,
+        body: Mapping[str, Any],
+        *,
+        path_exists: Callable[[str], bool] | None = None,
+    ) -> dict[str, Any]:
+        """Handles a ``DEV-SUB``, ``DEV-UNSUB`` or ``DEV-LISTSUB`` request of a
+        client and returns the body of the response.
+
+        Parameters:
+            client: the client that sent the request
+            body: the body of the request
+            path_exists: function that returns whether a device tree path
+                exists, used for rejecting nonexistent paths in ``DEV-SUB``
+                requests that are not lazy. ``None`` means that all paths are
+                accepted.
+
+        Raises:
+            ValueError: if the request has an unsupported type
+        """
+        message_type = body.get("type")
+        if message_type == "DEV-LISTSUB":
+            return {
+                "type": message_type,
+                "paths": self.get_subscriptions(
+                    client, body.get("pathFilter") or ("/",)
+                ),
+            }
+
+        if message_type == "DEV-SUB":
+            if body.get("lazy"):
+                path_exists = None
+            process = self._subscribe_path
+        elif message_type == "DEV-UNSUB":
+            process = self._unsubscribe_path
+        else:
+            raise ValueError(f"unsupported request type: {message_type!r}")
+
+        success: list[str] = []
+        error: dict[str, str] = {}
+        for path in body.get("paths", ()):
+            if not is_valid_device_tree_path(path):
+                error[str(path)] = "Invalid device tree path"
+            else:
+                reason = process(client, path, body, path_exists, success)
+                if reason:
+                    error[path] = reason
+
+        response: dict[str, Any] = {"type": message_type, "success": success}
+        if error:
+            response["error"] = error
+        return response
+
+    def _subscribe_path(
+        self,
+        client: C,
+        path: str,
+        body: Mapping[str, Any],
+        path_exists: Callable[[str], bool] | None,
+        success: list[str],
+    ) -> str | None:
+        if path_exists is not None and not path_exists(path):
+            return "Path does not exist"
+        self.subscribe(client, path)
+        success.append(path)
+
+    def _unsubscribe_path(
+        self,
+        client: C,
+        path: str,
+        body: Mapping[str, Any],
+        path_exists: Callable[[str], bool] | None,
+        success: list[str],
+    ) -> str | None:
+        removed = self.unsubscribe(
+            client,
+            path,
+            remove_all=bool(body.get("removeAll")),
+            include_subtrees=bool(body.get("includeSubtrees")),
+        )
+        if not removed:
+            return "Not subscribed to this path"
+        success.extend(removed)
+
+    def _invalidate(self, node: _Node[C]) -> None:
+        """Removes the cached subscribers of the paths that go through the
+        given node of the trie, i.e. the paths whose deepest node is in the
+        subtree of the node.
+        """
+        cache = self._cache
+        queue = [node]
+        while queue:
+            node = queue.pop()
+            for paths in node.cached.values():
+                for path in paths:
+                    cache.pop(path, None)
+            node.cached.clear()
+            queue.extend(node.children.values())
+
+    def _invalidate_under(self, node: _Node[C], component: str) -> None:
+        """Removes the cached subscribers of the paths whose deepest node is
+        the given node and that continue with the given component.
+        """
+        for path in node.cached.pop(component, ()):
+            self._cache.pop(path, None)
+
+    def _remove(self, client: C, path: str, count: int) -> None:
+        """Removes the given number of subscriptions of a client to a device
+        tree path that the client is known to be subscribed to.
+        """
+        nodes = [self._root]
+        for component in _get_path_components(path):
+            nodes.append(nodes[-1].children[component])
+
+        node = nodes[-1]
+        paths = self._paths_by_client[client]
+        remaining = node.counts[client] - count
+        if remaining > 0:
+            node.counts[client] = paths[path] = remaining
+            return
+
+        del node.counts[client]
+        del paths[path]
+        if not paths:
+            del self._paths_by_client[client]
+        self._invalidate(node)
+
+        # Prune the nodes that have no subscriptions and no children, along
+        # with the cache entries that refer to them
+        components = _get_path_components(path)
+        for parent, component in zip(
+            reversed(nodes[:-1]), reversed(components), strict=True
+        ):
+            child = parent.children[component]
+            if child.counts or child.children:
+                break
+            self._invalidate(child)
+            del parent.children[component]
+
+
+class DeviceTreeUpdateBatch(Generic[C]):
+    """Collects the updates of device tree channels during a single tick and
+    merges them into one ``DEV-INF`` notification per client.
+
+    When the same channel is updated multiple times in the same tick, only
+    the last value is sent.
+    """
+
+    def __init__(self, index: SubscriptionIndex[C]):
+        """Constructor.
+
+        Parameters:
+            index: the subscription index that determines which client
+                receives which updates
+        """
+        self._index = index
+        self._values: dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, path: str, value: Any) -> None:
+        """Records the new value of the channel at the given device tree path."""
+        self._values[path] = value
+
+    def update(self, values: Mapping[str, Any]) -> None:
+        """Records the new values of multiple channels, keyed by their device
+        tree paths.
+        """
+        self._values.update(values)
+
+    def flush(self) -> dict[C, dict[str, Any]]:
+        """Returns the ``DEV-INF`` notification bodies to send to the clients
+        and clears the batch.
+
+        Returns:
+            the notification bodies, keyed by the clients that should receive
+            them. Clients without any subscribed updates are omitted.
+        """
+        values, self._values = self._values, {}
+
+        # Group the updates by their sets of subscribers first; channels of
+        # the same device typically share the same set
+        groups: dict[frozenset[C], dict[str, Any]] = {}
+        get_subscribers = self._index.get_subscribers
+        for path, value in values.items():
+            subscribers = get_subscribers(path)
+            if subscribers:
+                group = groups.get(subscribers)
+                if group is None:
+                    groups[subscribers] = {path: value}
+                else:
+                    group[path] = value
+
+        result: dict[C, dict[str, Any]] = {}
+        for subscribers, group in groups.items():
+            for client in subscribers:
+                body = result.get(client)
+                if body is None:
+                    result[client] = {"type": "DEV-INF", "values": dict(group)}
+                else:
+                    body["values"].update(group)
+        return result
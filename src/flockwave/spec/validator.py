@@ -5,14 +5,50 @@ Requires the ``fsatjsonschema`` module. You can install this with the
 ``validation`` extra.
 """
 
-from collections.abc import Callable
-from typing import Any
+import marshal
+import re
+import sys
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import suppress
+from random import Random
+from time import perf_counter
+from types import CodeType
+from typing import Any, NamedTuple
 
 import fastjsonschema
+from fastjsonschema.ref_resolver import RefResolver
 
-from flockwave.spec.schema import Schema
+from flockwave.spec.schema import (
+    FLOCKWAVE_SPEC_PREFIX,
+    MessageBodyKind,
+    Schema,
+    _get_body_schema_resource,
+    _get_disk_cache,
+    _get_json_object_from_resource,
+    _get_resources_by_message_type,
+    _get_schema_from_resource,
+    _get_schema_resource_names,
+    _to_plain_json,
+    get_message_body_schema_for_type,
+    get_message_types,
+)
 
-__all__ = ("create_validator_for_schema", "ValidationError", "Validator")
+from . import metrics as _metrics
+from .compiled import get_compiled_validator
+from .memoize import memoized
+
+__all__ = (
+    "create_deferred_body_validator",
+    "create_dispatching_validator",
+    "create_validator_for_schema",
+    "validate_envelope",
+    "validate_many",
+    "Envelope",
+    "ValidationError",
+    "ValidationFailure",
+    "Validator",
+)
 
 
 Validator = Callable[[Any], None]
@@ -25,14 +61,589 @@ class ValidationError(RuntimeError):
     pass
 
 
+class ValidationFailure(NamedTuple):
+    """Description of a validation failure of a single object, as returned
+    by `validate_many()`.
+    """
+
+    path: str
+    """Path of the offending part of the object, e.g. ``data.status.01``."""
+
+    message: str
+    """Human-readable description of the failure."""
+
+
+class Envelope(NamedTuple):
+    """Envelope of a Flockwave message, as returned by `validate_envelope()`."""
+
+    id: str
+    """ID of the message."""
+
+    version: str
+    """Version of the specification that the message conforms to."""
+
+    refs: str | None
+    """ID of the message that this message refers to, or ``None`` if the
+    message does not refer to another message.
+    """
+
+    type: str | None
+    """Type of the body of the message, or ``None`` if the message has no
+    body or the body has no type. The body itself is not validated by
+    `validate_envelope()`.
+    """
+
+    body: Any
+    """Body of the message, or ``None`` if the message has no body."""
+
+    error: dict[str, Any] | None
+    """Error object of the message, or ``None`` if the message has no error
+    object.
+    """
+
+
 def create_validator_for_schema(schema: Schema) -> Validator:
-    """Creates a validator for the given JSON schema object."""
-    inner_validator: Validator = fastjsonschema.compile(schema)  # type: ignore
+    """Creates a validator for the given JSON schema object.
+
+    When the schema is one of the top-level schemas of the ``flockwave.spec``
+    package and ahead-of-time compiled validators are available in
+    `flockwave.spec.compiled`, the compiled validator is used instead of
+    compiling the schema at runtime.
+    """
+    return _wrap_inner_validator(
+        _compile_schema(schema), _get_resource_path_of_schema(schema)
+    )
+
+
+def create_dispatching_validator(kind: MessageBodyKind = "message") -> Validator:
+    """Creates a validator for message bodies of the given kind that looks at
+    the ``type`` field of the body first and then validates the body against
+    the schema of that message type only.
+
+    This is equivalent to validating the body against the schema returned by
+    `get_body_schema()`, but the cost of validating a single body does not
+    grow with the number of message types in the specification. Validators
+    for the individual message types are compiled lazily, when a message with
+    the given type is seen for the first time. Bodies without a known message
+    type are validated against the schema of all message bodies of the given
+    kind.
+
+    Parameters:
+        kind: the kind of message bodies that the validator will receive
+
+    Returns:
+        the validator function
+    """
+    known_types = frozenset(get_message_types(kind))
+    validators: dict[str, Validator] = {}
+
+    def validator(obj: Any) -> None:
+        message_type = obj.get("type") if isinstance(obj, dict) else None
+        if type(message_type) is not str:
+            message_type = None
+
+        validate = validators.get(message_type)  # type: ignore
+        if validate is None:
+            validate = _get_inner_validator_for_body(message_type, kind)
+            if message_type in known_types:
+                validators[message_type] = validate  # type: ignore
+
+        metrics = _metrics._current
+        try:
+            if metrics is None:
+                validate(obj)
+            else:
+                if message_type not in known_types:
+                    message_type = None
+                _validate_and_record(validate, obj, kind, message_type, metrics)
+        except fastjsonschema.JsonSchemaValueException as ex:
+            raise ValidationError(str(ex)) from None
+
+    return validator
+
+
+def create_deferred_body_validator(
+    kind: MessageBodyKind = "message",
+    *,
+    sample_rate: float = 1.0,
+    seed: int | None = None,
+) -> Callable[[Envelope], bool]:
+    """Creates a validator for the bodies of messages whose envelopes were
+    already validated with `validate_envelope()`.
+
+    A message is valid according to the ``message.json`` schema if and only
+    if its envelope is accepted by `validate_envelope()` and the returned
+    envelope is accepted by a body validator of the ``message`` kind with a
+    sample rate of 1. Validators of other kinds are stricter because they
+    accept bodies of the given kind only.
+
+    Parameters:
+        kind: the kind of message bodies that the validator will receive
+        sample_rate: the probability that the body of a message is validated;
+            bodies of the other messages are accepted without validation.
+            Useful for spot-checking trusted traffic.
+        seed: seed of the random number generator used for sampling
+
+    Returns:
+        the validator function. The function returns whether the body was
+        validated and raises `ValidationError` if it was found to be invalid.
+        Bodies of messages with error objects are never validated, just like
+        in the ``message.json`` schema.
+    """
+    if not 0 <= sample_rate <= 1:
+        raise ValueError("sample rate must be between 0 and 1")
+
+    validate = create_dispatching_validator(kind)
+    random = Random(seed).random  # noqa: S311
+
+    def validator(envelope: Envelope) -> bool:
+        # Messages with a valid error object are valid irrespectively of
+        # their bodies
+        if envelope.error is not None:
+            return False
+        if sample_rate < 1 and random() >= sample_rate:
+            return False
+
+        validate(envelope.body)
+        return True
+
+    return validator
+
+
+def validate_envelope(message: Any) -> Envelope:
+    """Validates the envelope of a Flockwave message, i.e. everything except
+    the message body.
+
+    This is a cheap check whose cost does not depend on the size of the body.
+    It allows the caller to make routing decisions or reject duplicate
+    messages before validating the body, or to skip the validation of the
+    body altogether for trusted traffic. Use `create_deferred_body_validator()`
+    to validate the body later.
+
+    Parameters:
+        message: the message to validate
+
+    Returns:
+        the parsed envelope of the message
+
+    Raises:
+        ValidationError: if the envelope of the message is not valid
+    """
+    if not isinstance(message, dict):
+        raise ValidationError("data must be object")
+
+    version_regex, min_id_length, max_id_length = _get_envelope_constraints()
+
+    version = message.get("$fw.version")
+    if not isinstance(version, str) or not version_regex.fullmatch(version):
+        raise ValidationError(
+            "data.$fw.version must be string matching the version number format"
+        )
+
+    message_id = _check_message_id(message, "id", min_id_length, max_id_length)
+    refs = _check_message_id(message, "refs", min_id_length, max_id_length)
+    if message_id is None:
+        raise ValidationError("data must contain ['id'] properties")
+
+    error = _check_error_object(message.get("error"))
+    if "body" not in message:
+        if error is None:
+            raise ValidationError(
+                "data must contain ['body'] properties or a valid error object"
+            )
+        return Envelope(message_id, version, refs, None, None, error)
+
+    body = message["body"]
+    message_type = body.get("type") if isinstance(body, dict) else None
+    if type(message_type) is not str:
+        message_type = None
+
+    return Envelope(message_id, version, refs, message_type, body, error)
+
+
+def validate_many(
+    objs: Iterable[Any], kind: MessageBodyKind = "message"
+) -> list[ValidationFailure | None]:
+    """Validates multiple message bodies of the given kind at once.
+
+    Bodies are grouped by their ``type`` field and each group is validated
+    with the validator of the corresponding message type, just like
+    `create_dispatching_validator()` would do. Unlike the validators returned
+    by the other functions of this module, this function does not raise an
+    exception for invalid bodies; it reports the outcome of the validation
+    for each body separately instead.
+
+    Parameters:
+        objs: the message bodies to validate
+        kind: the kind of the message bodies
+
+    Returns:
+        a list containing one item for each message body in the input, in the
+        same order. Each item is ``None`` if the corresponding body is valid
+        or a `ValidationFailure` describing the problem if it is invalid.
+    """
+    items = objs if isinstance(objs, Sequence) else list(objs)
+    results: list[ValidationFailure | None] = [None] * len(items)
+
+    groups: dict[str | None, list[int]] = defaultdict(list)
+    for index, obj in enumerate(items):
+        message_type = obj.get("type") if isinstance(obj, dict) else None
+        groups[message_type if type(message_type) is str else None].append(index)
+
+    metrics = _metrics._current
+    known_types = _get_resources_by_message_type(_get_body_schema_resource(kind))
+    for message_type, indices in groups.items():
+        validate = _get_inner_validator_for_body(message_type, kind)
+        recorded_type = message_type if message_type in known_types else None
+        for index in indices:
+            try:
+                if metrics is None:
+                    validate(items[index])
+                else:
+                    _validate_and_record(
+                        validate, items[index], kind, recorded_type, metrics
+                    )
+            except fastjsonschema.JsonSchemaValueException as ex:
+                results[index] = ValidationFailure(ex.name, ex.message)
+
+    return results
+
+
+def _check_error_object(error: Any) -> dict[str, Any] | None:
+    """Checks the error object of a message envelope.
+
+    Returns:
+        the error object if it is valid, ``None`` if it is missing or invalid
+    """
+    if not isinstance(error, dict) or not error:
+        return None
+    code = error.get("code", 0)
+    message = error.get("message", "")
+    if not isinstance(message, str):
+        return None
+    # Same check as the one for the "integer" type in fastjsonschema; note
+    # that subclasses of int (e.g., IntEnum members) are accepted
+    if isinstance(code, bool):
+        return None
+    if not isinstance(code, int) and not (
+        isinstance(code, float) and code.is_integer()
+    ):
+        return None
+    return error
+
+
+def _check_message_id(
+    message: dict[str, Any], key: str, min_length: int, max_length: int
+) -> str | None:
+    """Checks an optional message ID in a message envelope.
+
+    Raises:
+        ValidationError: if the message ID is present and is not valid
+    """
+    value = message.get(key)
+    if value is None and key not in message:
+        return None
+    if not isinstance(value, str) or not min_length <= len(value) <= max_length:
+        raise ValidationError(
+            f"data.{key} must be string of length {min_length} to {max_length}"
+        )
+    return value
+
+
+@memoized
+def _get_envelope_constraints() -> tuple[re.Pattern[str], int, int]:
+    """Returns the regular expression for version numbers and the minimum and
+    maximum length of message IDs, as defined in the schema.
+
+    This function is memoized.
+    """
+    definitions = _get_json_object_from_resource("definitions.json")
+    message_id = definitions["messageId"]
+    return (
+        re.compile(definitions["versionNumber"]["pattern"]),
+        message_id["minLength"],
+        message_id["maxLength"],
+    )
+
+
+def _get_inner_validator_for_body(
+    message_type: str | None, kind: MessageBodyKind
+) -> Validator:
+    """Returns an inner validator that raises ``fastjsonschema`` exceptions
+    for message bodies of the given kind and type.
+
+    Unknown message types share the validator of all message bodies of the
+    given kind so they do not pollute the memoization caches.
+    """
+    resource_path = _get_body_schema_resource(kind)
+    if message_type is not None and message_type in _get_resources_by_message_type(
+        resource_path
+    ):
+        return _get_inner_validator_for_message_type(message_type, kind)
+    else:
+        return _get_inner_validator_for_resource(resource_path)
+
+
+@memoized
+def _get_inner_validator_for_message_type(
+    message_type: str, kind: MessageBodyKind
+) -> Validator:
+    """Returns an inner validator that raises ``fastjsonschema`` exceptions
+    for message bodies of the given kind and type.
+
+    This function is memoized so the validators are compiled only once even if
+    there are multiple dispatching validators for the same kind.
+    """
+    resource_paths = _get_resources_by_message_type(_get_body_schema_resource(kind))
+    inner_validators = [
+        _get_inner_validator_for_resource(path) for path in resource_paths[message_type]
+    ]
+    if len(inner_validators) == 1:
+        return inner_validators[0]
+    else:
+        return _any_of(inner_validators)
+
+
+def _any_of(inner_validators: list[Validator]) -> Validator:
+    """Combines multiple inner validators into a single one that accepts an
+    object if at least one of the validators accepts it.
+    """
 
     def validator(obj: Any) -> None:
+        for validate in inner_validators:
+            try:
+                return validate(obj)
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+
+        raise fastjsonschema.JsonSchemaValueException(
+            "data must be valid by one of anyOf definition",
+            value=obj,
+            name="data",
+            rule="anyOf",
+        )
+
+    return validator
+
+
+def _compile_schema(schema: Schema) -> Validator:
+    """Compiles the given JSON schema into an inner validator that raises
+    ``fastjsonschema`` exceptions.
+
+    Schemas that are loaded from the resources of the ``flockwave.spec``
+    package and that are identified by their ``$id`` are looked up among the
+    ahead-of-time compiled validators first.
+    """
+    resource_path = _get_resource_path_of_schema(schema)
+    if resource_path is not None:
+        return _get_inner_validator_for_resource(resource_path)
+    else:
+        return fastjsonschema.compile(schema)  # type: ignore
+
+
+def _get_resource_path_of_schema(schema: Schema) -> str | None:
+    """Returns the resource path of the given schema if it is one of the
+    schemas loaded from the resources of the ``flockwave.spec`` package, or
+    ``None`` otherwise.
+    """
+    schema_id = schema.get("$id")
+    if isinstance(schema_id, str) and schema_id.startswith(FLOCKWAVE_SPEC_PREFIX):
+        resource_path = schema_id.removeprefix(FLOCKWAVE_SPEC_PREFIX).removeprefix("/")
+        # Callers may use the same prefix for their own schemas so we need to
+        # check whether the resource exists before loading it
+        if resource_path not in _get_schema_resource_names():
+            return None
+        # Identity check ensures that we do not use a compiled validator for
+        # a schema that was constructed by the caller
+        if _get_schema_from_resource(resource_path) is schema:
+            return resource_path
+    return None
+
+
+@memoized
+def _get_inner_validator_for_resource(resource_path: str) -> Validator:
+    """Returns an inner validator that raises ``fastjsonschema`` exceptions
+    for the schema in the given resource.
+
+    This function is memoized.
+    """
+    metrics = _metrics._current
+    if metrics is None:
+        return _load_inner_validator_for_resource(resource_path)
+
+    started_at = perf_counter()
+    validator = _load_inner_validator_for_resource(resource_path)
+    metrics.record_schema_compilation(resource_path, perf_counter() - started_at)
+    return validator
+
+
+def _load_inner_validator_for_resource(resource_path: str) -> Validator:
+    """Loads the ahead-of-time compiled validator of the schema in the given
+    resource, or compiles it if needed.
+    """
+    validator = get_compiled_validator(resource_path)
+    if validator is not None:
+        return validator
+
+    cache = _get_disk_cache()
+    if cache is None:
+        return fastjsonschema.compile(_get_schema_from_resource(resource_path))  # type: ignore
+
+    # Generated code depends on the version of fastjsonschema and bytecode
+    # depends on the version of Python. The bytecode is cached instead of the
+    # source code because compiling the source code of the larger validators
+    # takes several hundred milliseconds.
+    cache_key = (
+        f"validator:{fastjsonschema.VERSION}:{sys.implementation.cache_tag}:"
+        f"{resource_path}"
+    )
+    data = cache.get_bytes(cache_key, ".marshal")
+    if data is not None:
+        # Corrupted cache entries are regenerated below
+        with suppress(Exception):
+            return _exec_validator_code(marshal.loads(data))  # noqa: S302
+
+    code = _compile_validator_code(
+        _generate_validator_code(_get_schema_from_resource(resource_path))
+    )
+    cache.put_bytes(cache_key, marshal.dumps(code), ".marshal")
+    return _exec_validator_code(code)
+
+
+def _generate_validator_code(schema: Schema) -> str:
+    """Generates the source code of a Python module that contains a
+    ``validate()`` function for the given JSON schema.
+    """
+    code = fastjsonschema.compile_to_code(schema)
+
+    # The name of the generated function depends on the $id of the schema
+    # so we need to provide a stable alias for it
+    func_name = RefResolver.from_schema(schema, store={}).get_scope_name()
+    if func_name != "validate":
+        code += f"\n\nvalidate = {func_name}\n"
+
+    return code
+
+
+def _compile_validator_code(code: str) -> CodeType:
+    """Compiles the source code generated by `_generate_validator_code()`."""
+    return compile(code, "<flockwave.spec validator>", "exec")
+
+
+def _exec_validator_code(code: CodeType) -> Validator:
+    """Executes the compiled code of a validator module and returns the
+    ``validate()`` function that it defines.
+    """
+    namespace: dict[str, Any] = {}
+    exec(code, namespace)  # noqa: S102
+    return namespace["validate"]
+
+
+def _load_validator_code(code: str) -> Validator:
+    """Executes the source code generated by `_generate_validator_code()` and
+    returns the ``validate()`` function that it defines.
+    """
+    return _exec_validator_code(_compile_validator_code(code))
+
+
+def _wrap_inner_validator(
+    inner_validator: Validator, resource_path: str | None = None
+) -> Validator:
+    """Wraps an inner validator that raises ``fastjsonschema`` exceptions
+    into a validator that raises `ValidationError` instead.
+
+    Parameters:
+        inner_validator: the inner validator to wrap
+        resource_path: the resource path of the schema of the validator, if
+            known; used as the message type in validation metrics
+    """
+
+    def validator(obj: Any) -> None:
+        metrics = _metrics._current
         try:
-            inner_validator(obj)
+            if metrics is None:
+                inner_validator(obj)
+            else:
+                _validate_and_record(
+                    inner_validator, obj, "schema", resource_path, metrics
+                )
         except fastjsonschema.JsonSchemaValueException as ex:
             raise ValidationError(str(ex)) from None
 
     return validator
+
+
+def _validate_and_record(
+    inner_validator: Validator,
+    obj: Any,
+    kind: str,
+    message_type: str | None,
+    metrics: "_metrics.ValidationMetrics",
+) -> None:
+    """Validates an object with an inner validator that raises
+    ``fastjsonschema`` exceptions and records the outcome in the given
+    metrics object.
+
+    Raises:
+        fastjsonschema.JsonSchemaValueException: if the object is not valid
+    """
+    started_at = perf_counter()
+    try:
+        inner_validator(obj)
+    except fastjsonschema.JsonSchemaValueException as ex:
+        elapsed = perf_counter() - started_at
+        metrics.record_validation(
+            kind, message_type, elapsed, obj=obj, rule=ex.rule, failed=True
+        )
+        raise
+
+    metrics.record_validation(kind, message_type, perf_counter() - started_at, obj=obj)
+    if metrics.profile and kind != "schema" and message_type is not None:
+        _profile_subtrees(obj, message_type, kind, metrics)  # type: ignore
+
+
+def _profile_subtrees(
+    obj: Any,
+    message_type: str,
+    kind: MessageBodyKind,
+    metrics: "_metrics.ValidationMetrics",
+) -> None:
+    """Validates the top-level properties of a message body against their own
+    subschemas and records the time spent on each of them.
+    """
+    for path, key, validate in _get_subtree_validators(message_type, kind):
+        if key in obj:
+            started_at = perf_counter()
+            try:
+                validate(obj[key])
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+            elapsed = perf_counter() - started_at
+            metrics.record_subtree(kind, message_type, path, elapsed)
+
+
+@memoized
+def _get_subtree_validators(
+    message_type: str, kind: MessageBodyKind
+) -> tuple[tuple[str, str, Validator], ...]:
+    """Returns validators for the subschemas of the top-level properties in
+    the schema of message bodies of the given kind and type, along with the
+    paths of the subschemas in the schema and the names of the properties.
+
+    This function is memoized.
+    """
+    schema = _to_plain_json(get_message_body_schema_for_type(message_type, kind))
+    branches = schema.get("anyOf")
+    if branches is None:
+        prefixes_and_branches = [("", schema)]
+    else:
+        prefixes_and_branches = [
+            (f"anyOf.{index}.", branch) for index, branch in enumerate(branches)
+        ]
+
+    result = []
+    for prefix, branch in prefixes_and_branches:
+        for key, subschema in branch.get("properties", {}).items():
+            validator = fastjsonschema.compile(subschema)  # type: ignore
+            result.append((f"{prefix}properties.{key}", key, validator))
+    return tuple(result)
@@ -0,0 +1,119 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+from pytest import raises
+
+from flockwave.spec import async_validator
+from flockwave.spec.async_validator import AsyncValidator
+from flockwave.spec.validator import ValidationError
+
+
+def test_inline_and_offloaded_validation():
+    async def main():
+        async with AsyncValidator(size_threshold=1000) as validator:
+            body = {"type": "UAV-INF", "ids": ["01"]}
+            assert not validator.should_offload(body)
+            assert not validator.should_offload(body, size=1000)
+            assert validator.should_offload(body, size=1001)
+            assert validator.should_offload({"type": "SHOW-CFG"})
+
+            await validator.validate(body)
+            await validator.validate(body, size=5000)
+            await validator.validate({"type": "SHOW-CFG"})
+            await validator.validate({"type": "LOG-DATA", "uavId": "01", "logId": "1"})
+
+            with raises(ValidationError):
+                await validator.validate({"type": "UAV-INF", "ids": 1})
+            with raises(ValidationError):
+                await validator.validate({"type": "UAV-INF", "ids": 1}, size=5000)
+            with raises(ValidationError):
+                await validator.validate({"type": "SHOW-CFG", "foo": 1})
+            assert validator.pending == 0
+
+    asyncio.run(main())
+
+
+def test_backpressure_and_cancellation():
+    release = Event()
+    started = []
+
+    def validate(obj):
+        started.append(obj)
+        release.wait(5)
+
+    async def main():
+        executor = ThreadPoolExecutor(1)
+        validator = AsyncValidator(executor=executor, max_pending=2)
+        validator._validator = validate
+
+        bodies = [{"type": "SHOW-CFG", "index": index} for index in range(3)]
+        tasks = [asyncio.ensure_future(validator.validate(body)) for body in bodies]
+        await asyncio.sleep(0.05)
+
+        # One job is running, one is queued in the pool and the third caller
+        # is waiting for a free slot
+        assert validator.pending == 2
+        assert len(started) == 1
+
+        # Cancelling the caller of the queued job removes it from the pool
+        # but its slot is freed only when the pool has dropped it
+        tasks[1].cancel()
+        await asyncio.sleep(0.05)
+        assert validator.pending == 2
+
+        release.set()
+        await asyncio.gather(tasks[0], tasks[2])
+        assert tasks[1].cancelled()
+        assert [body["index"] for body in started] == [0, 2]
+        assert validator.pending == 0
+
+        # Executors passed in by the caller are not shut down
+        validator.close()
+        assert executor.submit(int, "3").result() == 3
+        executor.shutdown()
+
+    asyncio.run(main())
+
+
+def test_process_pool():
+    async def main():
+        async with AsyncValidator(
+            "request", executor="process", max_workers=1
+        ) as validator:
+            await validator.validate({"type": "SHOW-CFG"})
+            with raises(ValidationError):
+                await validator.validate({"type": "LOG-DATA", "uavId": "01"})
+
+    asyncio.run(main())
+
+
+def test_precompiled_types(monkeypatch):
+    compiled = []
+    get_validator = async_validator._get_inner_validator_for_body
+
+    def get_inner_validator_for_body(message_type, kind):
+        compiled.append(message_type)
+        return get_validator(message_type, kind)
+
+    monkeypatch.setattr(
+        async_validator, "_get_inner_validator_for_body", get_inner_validator_for_body
+    )
+
+    # SYS-MSG is not a request; it would compile the validator of all request
+    # bodies just like an unknown type
+    offloaded_types = ("SYS-MSG", "SHOW-CFG", "NO-SUCH-TYPE")
+    validator = AsyncValidator("request", offloaded_types=offloaded_types)
+    validator.close()
+    assert compiled == ["SHOW-CFG"]
+
+    compiled.clear()
+    AsyncValidator.initialize_worker("request", offloaded_types)
+    assert compiled == ["SHOW-CFG"]
+
+
+def test_invalid_arguments():
+    with raises(ValueError, match="max_pending"):
+        AsyncValidator(max_pending=0)
+    with raises(ValueError, match="invalid executor"):
+        AsyncValidator(executor="fiber")  # type: ignore
@@ -0,0 +1,138 @@
+import json
+
+from pytest import fixture, raises
+
+from flockwave.spec import cache as cache_module
+from flockwave.spec import validator as validator_module
+from flockwave.spec.cache import (
+    CACHE_DIR_ENV_VAR,
+    DiskCache,
+    disable_cache,
+    enable_cache,
+    get_cache_root,
+)
+from flockwave.spec.schema import (
+    _get_disk_cache,
+    _get_schema_from_resource,
+    _load_schema_from_resource,
+    get_schema_digest,
+)
+from flockwave.spec.validator import (
+    _generate_validator_code,
+    _load_inner_validator_for_resource,
+    _load_validator_code,
+)
+from flockwave.spec.version import __version__
+
+
+@fixture(autouse=True)
+def restore_cache_config(monkeypatch):
+    monkeypatch.setattr(cache_module, "_cache_root", cache_module._UNSET)
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+
+
+def test_cache_is_opt_in(tmp_path, monkeypatch):
+    assert get_cache_root() is None
+    assert _get_disk_cache() is None
+
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    assert get_cache_root() == tmp_path
+
+    disable_cache()
+    assert get_cache_root() is None
+
+    enable_cache(tmp_path / "foo")
+    assert get_cache_root() == tmp_path / "foo"
+
+
+def test_disk_cache(tmp_path):
+    cache = DiskCache(tmp_path / "cache")
+    assert cache.get_json("foo/bar") is None
+
+    cache.put_json("foo/bar", {"a": [1, 2, 3]})
+    assert cache.get_json("foo/bar") == {"a": [1, 2, 3]}
+    assert [path.name for path in cache.path.iterdir()] == ["foo%2Fbar.json"]
+
+    cache.put_text("foo/bar", "{not json", ".json")
+    assert cache.get_json("foo/bar") is None
+
+    assert cache.get_bytes("baz") is None
+    cache.put_bytes("baz", b"\x00\xff")
+    assert cache.get_bytes("baz") == b"\x00\xff"
+
+    cache.clear()
+    assert not cache.path.exists()
+
+
+def test_schema_is_cached_on_disk(tmp_path):
+    enable_cache(tmp_path)
+    cache = _get_disk_cache()
+    assert cache is not None
+    assert cache.path.parent == tmp_path
+
+    load_schema = _load_schema_from_resource.__wrapped__  # type: ignore
+    schema = load_schema("definitions.json", "/uavStatusInfo", False)
+    cached_schema = cache.get_json("schema:definitions.json#/uavStatusInfo")
+    assert cached_schema == json.loads(json.dumps(cached_schema))
+    assert cached_schema["properties"]["position"]["type"] == "array"
+
+    assert load_schema("definitions.json", "/uavStatusInfo", False) == schema
+
+
+def test_generated_validator_code():
+    schema = _get_schema_from_resource("response_UAV-INF.json")
+    validate = _load_validator_code(_generate_validator_code(schema))
+    validate({"type": "UAV-INF", "status": {}})
+    with raises(Exception, match="must be object"):
+        validate({"type": "UAV-INF", "status": 123})
+
+    schema = _get_schema_from_resource("message.json")
+    validate = _load_validator_code(_generate_validator_code(schema))
+    validate({"$fw.version": "1.0", "id": "1", "body": None})
+
+
+def test_schema_digest_is_cached_on_disk(tmp_path):
+    compute_digest = get_schema_digest.__wrapped__  # type: ignore
+    digest = compute_digest()
+
+    enable_cache(tmp_path)
+    assert compute_digest() == digest
+
+    cache = DiskCache(tmp_path)
+    key = f"digest:{__version__}"
+    entry = cache.get_json(key)
+    assert entry["digest"] == digest
+
+    # The digest is taken from the cache while the files do not change...
+    cache.put_json(key, {**entry, "digest": "cached"})
+    assert compute_digest() == "cached"
+
+    # ...and computed again when they do
+    entry["fingerprint"][0][1] += 1
+    cache.put_json(key, {**entry, "digest": "stale"})
+    assert compute_digest() == digest
+
+
+def test_validator_bytecode_is_cached_on_disk(tmp_path, monkeypatch):
+    # Compiled validators, if they were generated, take precedence over the
+    # on-disk cache
+    monkeypatch.setattr(validator_module, "get_compiled_validator", lambda _: None)
+    enable_cache(tmp_path)
+    cache = _get_disk_cache()
+    assert cache is not None
+
+    for _ in range(2):
+        validate = _load_inner_validator_for_resource("response_UAV-INF.json")
+        validate({"type": "UAV-INF", "status": {}})
+        (entry,) = [
+            path
+            for path in cache.path.iterdir()
+            if path.name.startswith("validator") and path.suffix == ".marshal"
+        ]
+
+    # Corrupted entries are replaced
+    entry.write_bytes(b"garbage")
+    validate = _load_inner_validator_for_resource("response_UAV-INF.json")
+    with raises(Exception, match="must be object"):
+        validate({"type": "UAV-INF", "status": 123})
+    assert entry.read_bytes() != b"garbage"
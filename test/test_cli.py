@@ -0,0 +1,139 @@
+import json
+
+from click.testing import CliRunner
+from pytest import fixture, mark
+
+from flockwave.spec import cli as cli_module
+from flockwave.spec.cli import cli
+from flockwave.spec.generate import GeneratorOptions, MessageGenerator
+
+
+def generate_messages(count: int, invalid_ratio: float = 0.0) -> list[str]:
+    generator = MessageGenerator(seed=42, options=GeneratorOptions(max_items=3))
+    return [
+        json.dumps(message)
+        for message in generator.iter_bodies(count=count, invalid_ratio=invalid_ratio)
+    ]
+
+
+def run_validate(*args: str, input: bytes | None = None) -> tuple[int, list[str]]:
+    result = CliRunner().invoke(cli, ["validate", *args], input=input)
+    if result.exception and not isinstance(result.exception, SystemExit):
+        raise result.exception
+    # Throughput statistics are printed to stderr and they vary between runs
+    lines = [
+        line for line in result.output.splitlines() if not line.startswith("Checked ")
+    ]
+    return result.exit_code, lines
+
+
+@fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(cli_module, "_CHUNK_SIZE", 2048)
+    monkeypatch.setattr(cli_module, "_WARM_UP_SIZE", 1024)
+
+
+def test_valid_stream(tmp_path):
+    messages = generate_messages(20)
+
+    path = tmp_path / "messages.ndjson"
+    path.write_text("\n".join(messages) + "\n")
+    exit_code, lines = run_validate(str(path))
+    assert exit_code == 0
+    assert lines == [f"{path} contains valid Flockwave messages."]
+
+    # Concatenated messages without separators
+    path.write_text("".join(messages))
+    exit_code, lines = run_validate(str(path))
+    assert exit_code == 0
+    assert lines == [f"{path} contains valid Flockwave messages."]
+
+
+def test_invalid_message_in_stream(tmp_path):
+    messages = generate_messages(10)
+    messages[4] = json.dumps({"type": "NO-SUCH-TYPE"})
+    messages[7] = '{"type": "SYS-PING", '
+
+    path = tmp_path / "messages.ndjson"
+    path.write_text("\n".join(messages) + "\n")
+    exit_code, lines = run_validate(str(path))
+    assert exit_code == 1
+    assert lines[0] == f"{path}:5:1: data cannot be validated by any definition"
+    # The syntax error is detected where the next message starts
+    assert lines[1] == (
+        f"{path}:9:1: Expecting property name enclosed in double quotes"
+    )
+    assert lines[2:] == [
+        f"{path} contains 2 invalid Flockwave message(s).",
+        "2 of 10 tested messages were invalid.",
+    ]
+
+
+def test_standard_input():
+    messages = generate_messages(10)
+    messages[3] = '[1, {"type": "SYS-VER"}]'
+    data = "\n".join(messages).encode("utf-8")
+
+    exit_code, lines = run_validate("-", input=data)
+    assert exit_code == 1
+    assert lines == [
+        "<stdin>:4:1: item #0: data cannot be validated by any definition",
+        "<stdin> contains 1 invalid Flockwave message(s).",
+        "1 of 11 tested messages were invalid.",
+    ]
+
+    exit_code, lines = run_validate("-", input=b"")
+    assert exit_code == 0
+    assert lines == ["<stdin> contains no objects at all."]
+
+
+def create_stream_with_failures() -> str:
+    messages = generate_messages(200, invalid_ratio=0.1)
+    messages[50] = '{"type": "SYS-PING", '
+    # Documents pretty-printed with nested objects and arrays at the start of
+    # a line must not be split
+    for index in range(1, len(messages), 3):
+        body = json.loads(messages[index])
+        messages[index] = json.dumps([body, [body]], indent=0)
+    messages[121] = json.dumps({"type": "NO-SUCH-TYPE", "x": [[1], {}]}, indent=0)
+    return "\n".join(messages) + "\n"
+
+
+@mark.parametrize("jobs", ["2", "3"])
+def test_parallel_validation_of_files(tmp_path, small_chunks, jobs):
+    path = tmp_path / "messages.ndjson"
+    path.write_text(create_stream_with_failures())
+    assert len(list(cli_module._split_file(0, str(path), int(jobs)))) > 1
+
+    other_path = tmp_path / "other.ndjson"
+    other_path.write_text(create_stream_with_failures().replace("\n", "\n\n"))
+
+    expected = run_validate("-j", "1", str(path), str(other_path))
+    assert expected[0] == 1
+    assert any(line.startswith(f"{path}:") for line in expected[1])
+    assert any(line.startswith(f"{other_path}:") for line in expected[1])
+    assert run_validate("-j", jobs, str(path), str(other_path)) == expected
+
+
+def test_parallel_validation_of_standard_input(small_chunks):
+    data = create_stream_with_failures().encode("utf-8")
+
+    expected = run_validate("-j", "1", "-", input=data)
+    assert expected[0] == 1
+    assert run_validate("-j", "3", "-", input=data) == expected
+
+
+def test_boundaries():
+    def split(data: bytes) -> list[bytes]:
+        starts = [match.end() - 1 for match in cli_module._BOUNDARY.finditer(data)]
+        return [
+            data[i:j] for i, j in zip([0, *starts], [*starts, len(data)], strict=True)
+        ]
+
+    assert split(b'{"a":1}\n{"b":2}\n[3]\n') == [b'{"a":1}\n', b'{"b":2}\n', b"[3]\n"]
+    assert split(b'{"a":1} \r\n\n{"b":2}') == [b'{"a":1} \r\n\n', b'{"b":2}']
+    assert split(b'{"a":1}{"b":2}') == [b'{"a":1}{"b":2}']
+
+    # Nested objects and arrays of pretty-printed documents
+    document = json.dumps({"a": [{"b": [[1], {}]}, [2]], "c": {"d": {}}}, indent=0)
+    assert split(document.encode("utf-8")) == [document.encode("utf-8")]
@@ -0,0 +1,100 @@
+import json
+from pathlib import Path
+
+from pytest import fixture, importorskip, mark, raises
+
+importorskip("msgpack")
+
+from flockwave.spec.codec import (  # noqa: E402
+    FORMAT_VERSION,
+    CodecError,
+    decode,
+    encode,
+    get_tag_table,
+    get_tag_table_id,
+)
+from flockwave.spec.generate import MessageGenerator  # noqa: E402
+
+examples_dir = Path(__file__).parent.parent / "doc" / "modules" / "ROOT" / "examples"
+example_filenames = sorted(x.name for x in examples_dir.glob("*.json"))
+
+
+@fixture(params=example_filenames)
+def example(request):
+    bodies = json.load((examples_dir / request.param).open())
+    return {"$fw.version": "1.0", "id": "1234", "body": bodies}
+
+
+def test_tag_table():
+    table = get_tag_table()
+    assert len(table) == len(set(table))
+    assert len(get_tag_table_id()) == 2
+
+    # Frequently used property names should have single-byte tags
+    for name in ("$fw.version", "id", "refs", "body", "type", "status", "position"):
+        assert table.index(name) < 128
+
+
+def test_example_round_trip(example):
+    encoded = encode(example)
+    assert encoded[0] == FORMAT_VERSION
+    assert decode(encoded) == example
+    assert len(encoded) < len(json.dumps(example, separators=(",", ":")))
+
+
+@mark.parametrize("kind", ["notification", "request", "response"])
+def test_generated_messages_round_trip(kind):
+    generator = MessageGenerator(kind, seed=42)
+    for message in generator.iter_bodies(count=500, envelope=True):
+        assert decode(encode(message)) == message
+
+
+@mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        -17,
+        2**63,
+        1.5,
+        "type",
+        ["type", {"type": "type"}],
+        {"": [], "body": {}, "no-such-property": {"id": [[{"refs": None}]]}},
+    ],
+)
+def test_json_values_round_trip(value):
+    assert decode(encode(value)) == value
+
+
+def test_key_order_is_preserved():
+    message = {"type": "UAV-INF", "status": {"2": {}, "1": {}}, "$fw.version": "1"}
+    assert list(decode(encode(message))) == ["type", "status", "$fw.version"]
+    assert list(decode(encode(message))["status"]) == ["2", "1"]
+
+
+def test_encode_does_not_modify_input():
+    message = {"body": {"ids": [{"id": "1"}, [{"id": "2"}]]}}
+    encode(message)
+    assert message == {"body": {"ids": [{"id": "1"}, [{"id": "2"}]]}}
+
+
+def test_encoding_errors():
+    with raises(CodecError, match="keys must be strings"):
+        encode({"body": {1: "one"}})
+    with raises(CodecError, match="cannot encode"):
+        encode({"body": 2**64})
+    with raises(CodecError, match="cannot encode"):
+        encode({"body": object()})
+
+
+def test_decoding_errors():
+    encoded = encode({"type": "SYS-PING"})
+
+    with raises(CodecError, match="unsupported message format"):
+        decode(b'{"type": "SYS-PING"}')
+    with raises(CodecError, match="different version"):
+        decode(encoded[:1] + bytes(b ^ 0xFF for b in encoded[1:3]) + encoded[3:])
+    with raises(CodecError, match="invalid encoded message"):
+        decode(encoded[:-1])
+    with raises(CodecError, match="unknown tag"):
+        decode(encoded[:3] + b"\x81\xcd\xff\xff\xc0")
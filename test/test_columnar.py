@@ -0,0 +1,249 @@
+import json
+
+from pytest import importorskip, mark, raises
+
+np = importorskip("numpy")
+
+from flockwave.spec.columnar import (  # noqa: E402
+    COLUMNS,
+    ColumnarDecodeError,
+    ColumnarEncodeError,
+    decode_uav_inf,
+    decode_uav_inf_stream,
+    encode_uav_inf,
+)
+from flockwave.spec.generate import MessageGenerator  # noqa: E402
+from flockwave.spec.validator import create_dispatching_validator  # noqa: E402
+
+
+def create_body() -> dict:
+    return {
+        "type": "UAV-INF",
+        "status": {
+            "01": {
+                "id": "01",
+                "position": [519976597, -7406863, 93765, None, 1200],
+                "heading": 3599,
+                "timestamp": 1449562661000,
+                "battery": [124, 80, True],
+                "light": 65535,
+                "rssi": [80, -1],
+            },
+            "02": {
+                "id": "02",
+                "position": [-900000000, 1799999999],
+                "timestamp": 1449562661500.5,
+                "battery": [111],
+                "rssi": [],
+            },
+            "03": {"id": "03", "timestamp": 1449562662000, "rssi": [100]},
+        },
+    }
+
+
+def test_decode_uav_inf():
+    fleet = decode_uav_inf(create_body())
+
+    assert len(fleet) == 3
+    assert fleet.ids == ["01", "02", "03"]
+    assert fleet.index == {"01": 0, "02": 1, "03": 2}
+    assert fleet.batch.tolist() == [0, 0, 0]
+
+    assert fleet.latitude.dtype == np.int32
+    assert fleet.latitude.tolist() == [519976597, -900000000, 0]
+    assert fleet.longitude.tolist() == [-7406863, 1799999999, 0]
+    assert fleet.masks["latitude"].tolist() == [True, True, False]
+    assert fleet.amsl.tolist() == [93765, 0, 0]
+    assert fleet.masks["ahl"].tolist() == [False, False, False]
+    assert fleet.agl.tolist() == [1200, 0, 0]
+    assert fleet.heading.tolist() == [3599, 0, 0]
+    assert fleet.masks["heading"].tolist() == [True, False, False]
+    assert fleet.battery_voltage.tolist() == [124, 111, 0]
+    assert fleet.battery_percentage.tolist() == [80, 0, 0]
+    assert fleet.masks["battery_percentage"].tolist() == [True, False, False]
+    assert fleet.battery_charging.tolist() == [True, False, False]
+    assert fleet.light.dtype == np.uint16
+    assert fleet.light.tolist() == [65535, 0, 0]
+    assert fleet.timestamp.tolist() == [1449562661000, 1449562661500.5, 1449562662000]
+    assert "timestamp" not in fleet.masks
+    assert fleet.rssi.tolist() == [[80, -1], [0, 0], [100, 0]]
+    assert fleet.masks["rssi"].tolist() == [[True, True], [False, False], [True, False]]
+
+
+def test_decode_stream():
+    bodies = [create_body(), {"type": "UAV-INF", "status": {}}, create_body()]
+    fleet = decode_uav_inf_stream(bodies)
+    assert len(fleet) == 6
+    assert fleet.batch.tolist() == [0, 0, 0, 2, 2, 2]
+    assert fleet.index == {"01": 3, "02": 4, "03": 5}
+    assert fleet.heading.tolist() == [3599, 0, 0, 3599, 0, 0]
+
+
+def test_decode_empty():
+    fleet = decode_uav_inf({"type": "UAV-INF", "error": {"01": "no such UAV"}})
+    assert len(fleet) == 0
+    for name in COLUMNS:
+        assert len(getattr(fleet, name)) == 0
+    assert fleet.rssi.shape == (0, 0)
+
+
+def test_decode_generated_bodies():
+    generator = MessageGenerator("response", seed=42)
+    bodies = [generator.generate_body("UAV-INF") for _ in range(50)]
+    fleet = decode_uav_inf_stream(bodies)
+
+    row = 0
+    for body in bodies:
+        for uav_id, status in body.get("status", {}).items():
+            assert fleet.ids[row] == uav_id
+            assert fleet.timestamp[row] == status["timestamp"]
+            if "heading" in status:
+                assert fleet.heading[row] == status["heading"]
+            if "position" in status:
+                assert fleet.latitude[row] == status["position"][0]
+            assert fleet.masks["light"][row] == ("light" in status)
+            row += 1
+    assert len(fleet) == row
+
+
+@mark.parametrize(
+    ("key", "value", "message"),
+    [
+        ("position", [900000001, 0], "latitude of '01' must be between"),
+        ("position", [0, 1800000000], "longitude of '01' must be between"),
+        ("position", [0, 0, 2**31], "amsl of '01' must be between"),
+        ("heading", 3600, "heading of '01' must be between 0 and 3599"),
+        ("heading", -1, "heading of '01' must be between 0 and 3599"),
+        ("light", 65536, "light of '01' must be between 0 and 65535"),
+        ("battery", [-1], "battery_voltage of '01' must be between"),
+        ("battery", [120, 101], "battery_percentage of '01' must be between"),
+        ("rssi", [80, 101], "rssi of '01' must be between -1 and 100"),
+        ("heading", 12.5, "heading of '01' must be integer, got 12.5"),
+        ("heading", True, "heading of '01' must be integer, got True"),
+        ("position", [True, 0], "latitude of '01' must be integer, got True"),
+        ("timestamp", False, "timestamp of '01' must be number, got False"),
+        ("rssi", [80, True], "rssi of '01' must be integer, got True"),
+        ("heading", "N", "heading of '01' must be integer"),
+        ("heading", [1], "heading of '01' must be integer"),
+        ("battery", [120, 50, 1], "battery_charging of '01' must be boolean"),
+        ("rssi", [80, "x"], "rssi of '01' must be integer, got 'x'"),
+        ("light", 2**70, "light contains values that are out of range"),
+        ("position", {}, "position of '01' must be array"),
+        ("rssi", 80, "rssi of '01' must be array"),
+        ("timestamp", "now", "timestamp of '01' must be number"),
+    ],
+)
+def test_invalid_values(key, value, message):
+    body = create_body()
+    body["status"]["01"][key] = value
+    with raises(ColumnarDecodeError, match=message):
+        decode_uav_inf(body)
+
+
+def test_invalid_bodies():
+    with raises(ColumnarDecodeError, match="message body must be an object"):
+        decode_uav_inf([])  # type: ignore
+    with raises(ColumnarDecodeError, match="status must be an object"):
+        decode_uav_inf({"type": "UAV-INF", "status": []})
+    with raises(ColumnarDecodeError, match="status of '01' must be an object"):
+        decode_uav_inf({"type": "UAV-INF", "status": {"01": 5}})
+    with raises(ColumnarDecodeError, match="status of '01' has no timestamp"):
+        decode_uav_inf({"type": "UAV-INF", "status": {"01": {"id": "01"}}})
+
+
+def test_encode_uav_inf():
+    encoded = encode_uav_inf(
+        ["01", "02"],
+        timestamp=1449562661000,
+        mode=["mission", "land"],
+        position=[[47.4731, 19.0620, 120.5], [-90, 179.99999994, np.nan]],
+        heading=[359.97, -90],
+        velocity=[[1.5, -0.25, 0.0004], [0, 0, 1]],
+        battery_voltage=[12.4, 11.06],
+        battery_percentage=[80, -1],
+        light=[[255, 255, 255], [0, 255, 0]],
+        errors=[[], [3, np.int16(17)]],
+    )
+    body = json.loads(encoded)
+    assert body == {
+        "type": "UAV-INF",
+        "status": {
+            "01": {
+                "id": "01",
+                "mode": "mission",
+                "position": [474731000, 190620000, 120500],
+                "heading": 0,
+                "velocity": [1500, -250, 0],
+                "timestamp": 1449562661000,
+                "battery": [124, 80],
+                "light": 65535,
+                "errors": [],
+            },
+            "02": {
+                "id": "02",
+                "mode": "land",
+                "position": [-900000000, 1799999999, None],
+                "heading": 2700,
+                "velocity": [0, 0, 1000],
+                "timestamp": 1449562661000,
+                "battery": [111, -1],
+                "light": 2016,
+                "errors": [3, 17],
+            },
+        },
+    }
+    create_dispatching_validator("response")(body)
+
+
+def test_encode_round_trip():
+    ids = [f"{i:04}" for i in range(1000)]
+    latitudes = np.linspace(-89.9, 89.9, len(ids))
+    encoded = encode_uav_inf(
+        ids,
+        timestamp=np.arange(len(ids)) * 0.5,
+        position=np.column_stack([latitudes, latitudes * 2]),
+        battery_voltage=np.full(len(ids), 12.6),
+    )
+    fleet = decode_uav_inf(json.loads(encoded))
+    assert fleet.ids == ids
+    assert np.array_equal(fleet.latitude, np.rint(latitudes * 1e7))
+    assert np.array_equal(fleet.timestamp, np.arange(len(ids)) * 0.5)
+    assert fleet.masks["battery_voltage"].all()
+    assert not fleet.masks["battery_percentage"].any()
+
+
+def test_encode_empty_fleet():
+    assert json.loads(encode_uav_inf([], timestamp=0)) == {
+        "type": "UAV-INF",
+        "status": {},
+    }
+
+
+@mark.parametrize(
+    ("kwds", "message"),
+    [
+        ({"ids": ["a/b"]}, "must not contain '/'"),
+        ({"ids": [""]}, "invalid UAV ID"),
+        ({"ids": ["01", "01"], "timestamp": [0, 1]}, "must be unique"),
+        ({"timestamp": [1, 2]}, "timestamp must have shape"),
+        ({"timestamp": np.nan}, "timestamp must be finite"),
+        ({"position": [[90.1, 0]]}, "latitude of row 0 must be between"),
+        ({"position": [[0, 180]]}, "longitude of row 0 must be between"),
+        ({"position": [[0]]}, "position must have two or three columns"),
+        ({"position": [[np.nan, 0]]}, "latitude must be finite"),
+        ({"velocity": [1, 2, 3]}, "velocity must have shape"),
+        ({"battery_voltage": -0.1}, "battery_voltage of row 0 must be between"),
+        ({"battery_percentage": 50}, "requires battery_voltage"),
+        ({"battery_voltage": 12, "battery_percentage": 101}, "must be between"),
+        ({"light": [[256, 0, 0]]}, "between 0 and 255"),
+        ({"light": [[0.5, 0, 0]]}, "between 0 and 255"),
+        ({"errors": [[1.5]]}, "error codes must be integers"),
+        ({"errors": []}, "errors must have 1 items"),
+        ({"mode": ["a", "b"]}, "mode must have 1 items"),
+        ({"mode": [None]}, "mode must be string"),
+    ],
+)
+def test_encode_errors(kwds, message):
+    kwds = {"ids": ["01"], "timestamp": 0, **kwds}
+    with raises(ColumnarEncodeError, match=message):
+        encode_uav_inf(**kwds)
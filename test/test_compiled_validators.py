@@ -0,0 +1,151 @@
+import json
+import sys
+from importlib.resources import files
+from types import ModuleType
+
+from pytest import fixture, raises, skip
+
+from flockwave.spec import compiled as compiled_module
+from flockwave.spec import schema as schema_module
+from flockwave.spec.compiled import (
+    BUNDLE_RESOURCE_NAME,
+    MANIFEST_MODULE_NAME,
+    get_compiled_validator,
+    get_manifest,
+    get_module_name_for_resource,
+    get_schema_bundle,
+)
+from flockwave.spec.schema import (
+    FLOCKWAVE_SPEC_PREFIX,
+    SCHEMA_PACKAGE,
+    get_schema_digest,
+)
+from flockwave.spec.validator import ValidationError, create_validator_for_schema
+from flockwave.spec.version import __version__
+
+
+@fixture
+def manifest():
+    manifest = get_manifest()
+    if manifest is None:
+        skip("Compiled validators are not available")
+    return manifest
+
+
+def test_module_name_for_resource():
+    assert get_module_name_for_resource("message.json") == "message"
+    assert get_module_name_for_resource("request_UAV-INF.json") == "request_UAV_INF"
+    assert (
+        get_module_name_for_resource("response_AUTH-RESP_Multi-Step.json")
+        == "response_AUTH_RESP_Multi_Step"
+    )
+
+
+def test_compiled_validators_are_up_to_date(manifest):
+    assert manifest.SCHEMA_DIGEST == get_schema_digest(), (
+        "Schema files have changed since the validators were compiled; "
+        "run etc/scripts/compile_validators.py to rebuild them"
+    )
+
+
+def test_stale_manifest_is_ignored(monkeypatch):
+    fake_manifest = ModuleType(MANIFEST_MODULE_NAME)
+    fake_manifest.VERSION = __version__  # type: ignore
+    fake_manifest.SCHEMA_DIGEST = get_schema_digest()  # type: ignore
+    fake_manifest.RESOURCES = ()  # type: ignore
+    monkeypatch.setitem(
+        sys.modules, f"flockwave.spec.compiled.{MANIFEST_MODULE_NAME}", fake_manifest
+    )
+
+    try:
+        get_manifest.cache_clear()
+        assert get_manifest() is fake_manifest
+
+        # The digest recorded at build time is not compared with the schema
+        # files at runtime
+        get_manifest.cache_clear()
+        monkeypatch.setattr(fake_manifest, "SCHEMA_DIGEST", "0" * 64)
+        assert get_manifest() is fake_manifest
+
+        get_manifest.cache_clear()
+        monkeypatch.delattr(fake_manifest, "SCHEMA_DIGEST")
+        assert get_manifest() is None
+
+        get_manifest.cache_clear()
+        monkeypatch.setattr(
+            fake_manifest, "SCHEMA_DIGEST", get_schema_digest(), raising=False
+        )
+        monkeypatch.setattr(fake_manifest, "VERSION", "0.0.0")
+        assert get_manifest() is None
+    finally:
+        monkeypatch.undo()
+        get_manifest.cache_clear()
+
+
+def test_compiled_validators_are_available(manifest):
+    assert "message.json" in manifest.RESOURCES
+    assert "response_UAV-INF.json" in manifest.RESOURCES
+    assert get_compiled_validator("response_UAV-INF.json") is not None
+    assert get_compiled_validator("no-such-schema.json") is None
+
+
+def test_schema_bundle_is_up_to_date():
+    bundle = get_schema_bundle()
+    if bundle is None:
+        skip("Schema bundle is not available")
+
+    resources = [
+        resource
+        for resource in files(SCHEMA_PACKAGE).iterdir()
+        if resource.name.endswith(".json")
+    ]
+    assert sorted(bundle) == sorted(resource.name for resource in resources)
+    for resource in resources:
+        assert bundle[resource.name] == json.loads(resource.read_bytes()), (
+            f"{resource.name} has changed since the schema bundle was generated; "
+            "run etc/scripts/compile_validators.py to rebuild it"
+        )
+
+
+def test_stale_schema_bundle_is_ignored(monkeypatch, tmp_path):
+    schemas = {"message.json": {"type": "object"}}
+    bundle = {"version": __version__, "digest": "0" * 64}
+    manifest = ModuleType(MANIFEST_MODULE_NAME)
+    manifest.SCHEMA_DIGEST = "0" * 64  # type: ignore
+    monkeypatch.setattr(compiled_module, "files", lambda _: tmp_path)
+    monkeypatch.setattr(compiled_module, "get_manifest", lambda: manifest)
+
+    def load_bundle(**kwds):
+        data = {**bundle, **kwds, "schemas": schemas}
+        (tmp_path / BUNDLE_RESOURCE_NAME).write_text(json.dumps(data))
+        get_schema_bundle.cache_clear()
+        return get_schema_bundle()
+
+    try:
+        assert load_bundle() == schemas
+        assert load_bundle(digest="1" * 64) is None
+        assert load_bundle(digest=None) is None
+        assert load_bundle(version="0.0.0") is None
+
+        # The bundle is used only along with the compiled validators of the
+        # same build
+        monkeypatch.setattr(compiled_module, "get_manifest", lambda: None)
+        assert load_bundle() is None
+    finally:
+        get_schema_bundle.cache_clear()
+
+
+def test_schema_bundle_is_used(monkeypatch):
+    bundle = {"test_bundle_only.json": {"type": "string"}}
+    monkeypatch.setattr(schema_module, "get_schema_bundle", lambda: bundle)
+    load_json = schema_module._get_json_object_from_resource
+    assert load_json("test_bundle_only.json") is bundle["test_bundle_only.json"]
+
+
+def test_custom_schema_with_flockwave_prefix():
+    for name in ("custom.json", "sub/custom.json", "", "message.json"):
+        schema = {"$id": f"{FLOCKWAVE_SPEC_PREFIX}/{name}", "type": "integer"}
+        validator = create_validator_for_schema(schema)
+        validator(42)
+        with raises(ValidationError):
+            validator("42")
@@ -0,0 +1,215 @@
+import asyncio
+from math import ceil, floor
+from random import Random
+
+from pytest import fixture, mark, raises
+
+from flockwave.spec.correlation import (
+    CorrelationTable,
+    CorrelationTableFullError,
+    TimerWheel,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@fixture
+def table(clock) -> CorrelationTable:
+    return CorrelationTable(
+        timeout=10, receipt_timeout=60, max_pending=10, resolution=0.5, clock=clock
+    )
+
+
+def response(refs: str, **body):
+    return {"$fw.version": "1.0", "id": f"re-{refs}", "refs": refs, "body": body}
+
+
+@mark.parametrize(("slots", "levels"), [(16, 3), (64, 2), (256, 2), (256, 4)])
+def test_timer_wheel_matches_brute_force(slots, levels):
+    rng = Random(slots * levels)  # noqa: S311
+    now = 100.0
+    wheel = TimerWheel(0.1, slots=slots, levels=levels, now=now)
+    deadlines = {}
+
+    for _ in range(2000):
+        action = rng.random()
+        key = rng.randrange(100)
+        if action < 0.5:
+            deadline = now + rng.expovariate(1 / rng.choice((1, 100, 10000)))
+            wheel.schedule(key, deadline)
+            deadlines[key] = max(ceil(deadline / 0.1), floor(now / 0.1) + 1)
+        elif action < 0.6:
+            assert wheel.cancel(key) == (key in deadlines)
+            deadlines.pop(key, None)
+        else:
+            now += rng.expovariate(1 / rng.choice((0.3, 30, 3000)))
+            tick = floor(now / 0.1)
+            expected = {key for key, value in deadlines.items() if value <= tick}
+            expired = wheel.advance(now)
+            assert len(expired) == len(expected)
+            assert set(expired) == expected
+            assert [deadlines[key] for key in expired] == sorted(
+                deadlines[key] for key in expired
+            )
+            for key in expired:
+                del deadlines[key]
+        assert len(wheel) == len(deadlines)
+
+
+def test_timer_wheel_never_expires_early():
+    wheel = TimerWheel(1, now=0)
+    wheel.schedule("a", 2.5)
+    wheel.schedule("b", -5)
+    assert wheel.advance(0.9) == []
+    assert wheel.advance(1) == ["b"]
+    assert wheel.advance(2.9) == []
+    assert wheel.advance(3) == ["a"]
+    assert "a" not in wheel
+
+    # Deadlines beyond the span of the wheel
+    wheel = TimerWheel(1, slots=4, levels=1, now=0)
+    wheel.schedule("c", 10)
+    assert wheel.advance(9) == []
+    assert wheel.advance(10) == ["c"]
+
+    with raises(ValueError):
+        TimerWheel(slots=100)
+
+
+def test_request_response(table, clock):
+    request = table.add_request("1", context="ctx")
+    table.add_request("2", timeout=20)
+    assert table.num_pending_requests == 2
+    with raises(ValueError):
+        table.add_request("1")
+
+    message = response("1", type="SYS-PING")
+    assert table.match_response(message) is request
+    assert request.response is message
+    assert request.context == "ctx"
+    assert table.get_request("1") is None
+
+    assert table.match_response(message) is None
+    assert table.match_response({"id": "x"}) is None
+    assert table.num_unmatched == 2
+
+    # Error messages are matched too
+    error = {"$fw.version": "1.0", "id": "e", "refs": "2", "error": {"code": 1}}
+    assert table.match_response(error).response is error  # type: ignore
+    assert len(table) == 0
+
+
+def test_request_timeout(table, clock):
+    table.add_request("1")
+    table.add_request("2", timeout=20)
+    table.add_request("3")
+    assert table.cancel_request("3") is not None
+    assert table.cancel_request("3") is None
+
+    clock.now += 9.9
+    assert not table.expire()
+
+    clock.now += 0.1
+    expired = table.expire()
+    assert [request.id for request in expired.requests] == ["1"]
+    assert expired.receipts == []
+
+    clock.now += 10
+    assert [request.id for request in table.expire().requests] == ["2"]
+    assert len(table) == 0
+
+
+def test_receipts(table, clock):
+    request = table.add_request("1")
+    table.match_response(
+        response("1", type="UAV-TAKEOFF", receipt={"01": "r1", "02": "r2", "03": "r3"})
+    )
+    assert request.receipts == {"01": "r1", "02": "r2", "03": "r3"}
+    assert table.num_pending_receipts == 3
+    assert table.get_receipt("r1").request is request  # type: ignore
+
+    (receipt,) = table.match_notification(
+        {"type": "ASYNC-RESP", "id": "r1", "result": True}
+    )
+    assert receipt.object_id == "01"
+    assert receipt.state == "completed"
+    assert receipt.result is True
+
+    clock.now += 50
+    (receipt,) = table.match_notification(
+        {"type": "ASYNC-ST", "id": "r2", "progress": {"percentage": 50}}
+    )
+    assert receipt.progress == {"percentage": 50}
+    assert receipt.state == "pending"
+
+    # Progress report restarts the timeout of r2 but not of r3
+    clock.now += 20
+    expired = table.expire()
+    assert [receipt.id for receipt in expired.receipts] == ["r3"]
+    assert expired.receipts[0].state == "timed_out"
+
+    (receipt,) = table.match_notification(
+        {"type": "ASYNC-RESP", "id": "r2", "error": "failed"}
+    )
+    assert receipt.state == "failed"
+    assert receipt.error == "failed"
+    assert len(table) == 0
+
+    assert table.match_notification({"type": "ASYNC-RESP", "id": "r2"}) == []
+    assert table.match_notification({"type": "SYS-MSG"}) == []
+
+
+def test_async_timeout_notification(table):
+    table.add_request("1")
+    table.match_response(response("1", type="UAV-LAND", receipt={"01": "r1"}))
+    table.add_request("2")
+    table.match_response(response("2", type="UAV-LAND", receipt={"02": "r2"}))
+
+    receipts = table.match_notification(
+        {"type": "ASYNC-TIMEOUT", "ids": ["r1", "r2", "r3"]}
+    )
+    assert [receipt.id for receipt in receipts] == ["r1", "r2"]
+    assert all(receipt.state == "timed_out" for receipt in receipts)
+    assert len(table) == 0
+
+
+def test_bounded_size(table):
+    for index in range(10):
+        table.add_request(str(index))
+    with raises(CorrelationTableFullError):
+        table.add_request("10")
+
+    receipts = {f"{index:02}": f"r{index}" for index in range(20)}
+    table.match_response(response("0", type="UAV-LAND", receipt=receipts))
+    assert len(table) == 10
+    assert table.num_pending_receipts == 1
+    assert table.num_dropped_receipts == 19
+
+
+def test_run_expiry():
+    async def main():
+        table = CorrelationTable(timeout=0.05, resolution=0.01)
+        table.add_request("1")
+        table.add_request("2", timeout=10)
+
+        expired = []
+        task = asyncio.create_task(table.run_expiry(expired.append))
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+        assert len(expired) == 1
+        assert [request.id for request in expired[0].requests] == ["1"]
+        assert table.num_pending_requests == 1
+
+    asyncio.run(main())
@@ -0,0 +1,242 @@
+import json
+from copy import deepcopy
+
+from pytest import fixture, raises
+
+from flockwave.spec.delta import (
+    DeltaDecoder,
+    DeltaEncoder,
+    DeltaError,
+    ResyncRequired,
+)
+from flockwave.spec.generate import MessageGenerator
+from flockwave.spec.validator import create_dispatching_validator
+
+
+def create_status(uav_id: str, tick: int) -> dict:
+    return {
+        "id": uav_id,
+        "mode": "pos",
+        "position": [519976597 + tick, -7406863, 93765],
+        "heading": 900,
+        "timestamp": 1449562661000 + tick * 100,
+        "battery": [124, 80],
+        "errors": [],
+    }
+
+
+def create_body(tick: int, num_uavs: int = 3) -> dict:
+    return {
+        "type": "UAV-INF",
+        "status": {f"{i:02}": create_status(f"{i:02}", tick) for i in range(num_uavs)},
+    }
+
+
+@fixture
+def encoder():
+    return DeltaEncoder(keyframe_interval=10)
+
+
+@fixture
+def decoder():
+    return DeltaDecoder()
+
+
+def transmit(frame):
+    return json.loads(json.dumps(frame))
+
+
+def test_first_frame_is_keyframe(encoder, decoder):
+    body = create_body(0)
+    frame = encoder.encode(body)
+    assert frame["keyframe"] is True
+    assert frame["seq"] == 1
+    assert frame["ids"] == ["00", "01", "02"]
+    assert frame["changed"] == body["status"]
+    assert decoder.needs_resync
+    assert decoder.decode(transmit(frame)) == body
+    assert not decoder.needs_resync
+
+
+def test_only_changes_are_sent(encoder, decoder):
+    decoder.decode(transmit(encoder.encode(create_body(0))))
+
+    body = create_body(1)
+    body["status"]["01"]["mode"] = "land"
+    del body["status"]["02"]["errors"]
+    frame = encoder.encode(body)
+
+    assert "keyframe" not in frame
+    assert "ids" not in frame
+    assert set(frame["changed"]) == {"01"}
+    assert frame["changed"]["01"] == {"mode": "land"}
+    assert frame["diff"]["00"] == {"position": [1, 0, 0], "timestamp": 100}
+    assert frame["removed"] == {"02": ["errors"]}
+    assert decoder.decode(transmit(frame)) == body
+
+    # Nothing changed
+    frame = encoder.encode(body)
+    assert frame == {"seq": 3, "type": "UAV-INF"}
+    assert decoder.decode(transmit(frame)) == body
+
+
+def test_changes_in_uav_set(encoder, decoder):
+    decoder.decode(transmit(encoder.encode(create_body(0, num_uavs=3))))
+
+    body = create_body(0, num_uavs=2)
+    body["error"] = {"02": "UAV is offline"}
+    frame = encoder.encode(body)
+    assert frame["ids"] == ["00", "01"]
+    assert "changed" not in frame
+    assert frame["rest"] == {"error": {"02": "UAV is offline"}}
+    assert decoder.decode(transmit(frame)) == body
+
+    body = create_body(0, num_uavs=3)
+    frame = encoder.encode(body)
+    assert frame["ids"] == ["00", "01", "02"]
+    assert decoder.decode(transmit(frame)) == body
+
+    body = {"type": "UAV-INF", "error": {"00": "no such UAV"}}
+    frame = encoder.encode(body)
+    assert frame["ids"] is None
+    assert decoder.decode(transmit(frame)) == body
+
+
+def test_periodic_keyframes(encoder, decoder):
+    keyframes = []
+    for tick in range(25):
+        frame = encoder.encode(create_body(tick))
+        if frame.get("keyframe"):
+            keyframes.append(frame["seq"])
+    assert keyframes == [1, 11, 21]
+
+
+def test_resync_after_lost_frame(encoder, decoder):
+    decoder.decode(transmit(encoder.encode(create_body(0))))
+    encoder.encode(create_body(1))  # lost
+
+    with raises(ResyncRequired):
+        decoder.decode(transmit(encoder.encode(create_body(2))))
+    assert decoder.needs_resync
+    with raises(ResyncRequired):
+        decoder.decode(transmit(encoder.encode(create_body(3))))
+
+    encoder.request_keyframe()
+    body = create_body(4)
+    frame = encoder.encode(body)
+    assert frame["keyframe"] is True
+    assert decoder.decode(transmit(frame)) == body
+    assert not decoder.needs_resync
+
+
+def test_encoder_copies_input(encoder, decoder):
+    body = create_body(0)
+    decoder.decode(transmit(encoder.encode(body)))
+
+    # Modify the position in-place
+    body["status"]["00"]["position"][0] += 1
+    frame = encoder.encode(body)
+    assert frame["diff"] == {"00": {"position": [1, 0, 0]}}
+    assert decoder.decode(transmit(frame)) == body
+
+
+def test_numeric_diffs(encoder, decoder):
+    body = create_body(0, num_uavs=1)
+    decoder.decode(transmit(encoder.encode(body)))
+
+    status = body["status"]["00"]
+    status["heading"] = 900.5
+    status["battery"] = [124]
+    status["errors"] = [3]
+    status["position"] = [519976597, -7406863, None]
+    frame = encoder.encode(body)
+    assert "diff" not in frame
+    assert decoder.decode(transmit(frame)) == body
+
+    status["heading"] = 901
+    status["battery"] = [123]
+    frame = encoder.encode(body)
+    assert frame["changed"] == {"00": {"heading": 901}}
+    assert frame["diff"] == {"00": {"battery": [-1]}}
+    assert decoder.decode(transmit(frame)) == body
+
+
+def test_changes_of_value_type(encoder, decoder):
+    body = create_body(0, num_uavs=1)
+    decoder.decode(transmit(encoder.encode(body)))
+
+    # 1 == 1.0 == True in Python, but they are different JSON values
+    status = body["status"]["00"]
+    status["heading"] = 900.0
+    status["position"] = [519976597, -7406863, 93765.0]
+    frame = encoder.encode(body)
+    assert frame["changed"] == {
+        "00": {"heading": 900.0, "position": [519976597, -7406863, 93765.0]}
+    }
+    assert type(frame["changed"]["00"]["heading"]) is float
+    decoded = decoder.decode(transmit(frame))["status"]["00"]
+    assert type(decoded["heading"]) is float
+    assert type(decoded["position"][2]) is float
+
+    status["errors"] = [1]
+    decoder.decode(transmit(encoder.encode(body)))
+    status["errors"] = [True]
+    frame = encoder.encode(body)
+    assert frame["changed"] == {"00": {"errors": [True]}}
+    assert frame["changed"]["00"]["errors"][0] is True
+
+    body = {"type": "DEV-INF", "values": {"/1/led": 1, "/1/gps": {"fix": 1}}}
+    decoder.decode(transmit(encoder.encode(body)))
+    frame = encoder.encode(
+        {"type": "DEV-INF", "values": {"/1/led": True, "/1/gps": {"fix": 1.0}}}
+    )
+    assert frame["changed"] == {"/1/led": True, "/1/gps": {"fix": 1.0}}
+    assert frame["changed"]["/1/led"] is True
+    assert type(frame["changed"]["/1/gps"]["fix"]) is float
+
+
+def test_dev_inf(encoder, decoder):
+    body = {"type": "DEV-INF", "values": {"/1/battery/voltage": 13.4, "/1/led": {}}}
+    assert decoder.decode(transmit(encoder.encode(body))) == body
+
+    body = deepcopy(body)
+    body["values"]["/1/led"]["on"] = True
+    frame = encoder.encode(body)
+    assert frame["changed"] == {"/1/led": {"on": True}}
+    assert decoder.decode(transmit(frame)) == body
+
+    # Switching to a different message type starts with a keyframe
+    frame = encoder.encode(create_body(0))
+    assert frame["keyframe"] is True
+    assert decoder.decode(transmit(frame)) == create_body(0)
+
+
+def test_errors(encoder, decoder):
+    with raises(DeltaError, match="unsupported message type"):
+        encoder.encode({"type": "SYS-PING"})
+    with raises(DeltaError, match="must be an object"):
+        encoder.encode({"type": "UAV-INF", "status": []})
+    with raises(DeltaError, match="malformed"):
+        decoder.decode({"type": "UAV-INF"})
+    with raises(DeltaError, match="malformed"):
+        decoder.decode({"seq": 1, "type": "UAV-INF", "keyframe": True, "changed": 5})
+
+    decoder.decode(transmit(encoder.encode(create_body(0))))
+    frame = transmit(encoder.encode(create_body(1)))
+    frame["diff"]["00"]["position"].append(1)
+    with raises(DeltaError, match="malformed"):
+        decoder.decode(frame)
+
+
+def test_generated_bodies_stay_valid():
+    validator = create_dispatching_validator("response")
+    generator = MessageGenerator("response", seed=42)
+    bodies = [generator.generate_body(t) for t in ("UAV-INF", "DEV-INF") * 5]
+
+    encoder = DeltaEncoder(keyframe_interval=7)
+    decoder = DeltaDecoder()
+    for index in range(200):
+        body = bodies[index * index % len(bodies)]
+        decoded = decoder.decode(transmit(encoder.encode(body)))
+        assert decoded == body
+        validator(decoded)
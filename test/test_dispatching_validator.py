@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+from pytest import fixture, mark, raises
+
+from flockwave.spec.schema import get_message_body_schema_for_type, get_message_types
+from flockwave.spec.validator import ValidationError, create_dispatching_validator
+
+examples_dir = Path().parent.parent / "doc" / "modules" / "ROOT" / "examples"
+example_filenames = sorted(x.name for x in examples_dir.glob("*.json"))
+
+
+@fixture(scope="module")
+def validate():
+    return create_dispatching_validator()
+
+
+def is_valid(validator, obj) -> bool:
+    try:
+        validator(obj)
+        return True
+    except ValidationError:
+        return False
+
+
+@mark.parametrize("filename", example_filenames)
+def test_examples_are_valid(filename: str, validate):
+    obj = json.load((examples_dir / filename).open())
+    for item in obj if isinstance(obj, list) else [obj]:
+        validate(item)
+
+
+def test_message_types():
+    request_types = get_message_types("request")
+    assert "UAV-INF" in request_types
+    assert "ASYNC-ST" not in request_types
+    assert "ASYNC-ST" in get_message_types("notification")
+    assert set(request_types) <= set(get_message_types())
+
+
+def test_schema_for_type():
+    schema = get_message_body_schema_for_type("UAV-INF", "response")
+    assert schema["properties"]["type"]["const"] == "UAV-INF"
+
+    schema = get_message_body_schema_for_type("UAV-INF")
+    assert len(schema["anyOf"]) == 2
+
+    with raises(KeyError):
+        get_message_body_schema_for_type("ASYNC-ST", "request")
+
+
+def test_invalid_bodies(validate):
+    assert is_valid(validate, None)
+    assert not is_valid(validate, {})
+    assert not is_valid(validate, [])
+    assert not is_valid(validate, {"type": "NO-SUCH-MESSAGE"})
+    assert not is_valid(validate, {"type": ["UAV-INF"]})
+    assert not is_valid(validate, {"type": "CONN-INF", "ids": 1234})
+
+
+def test_kind_restriction():
+    validate = create_dispatching_validator("request")
+    assert is_valid(validate, {"type": "UAV-INF", "ids": ["1"]})
+    assert not is_valid(validate, {"type": "UAV-INF", "status": {}})
+    assert not is_valid(validate, None)
+    assert not is_valid(validate, {"type": "CONN-INF"})
+
+    validate = create_dispatching_validator("response")
+    assert is_valid(validate, {"type": "UAV-INF", "status": {}})
+    assert is_valid(validate, {"type": "AUTH-RESP", "result": True})
@@ -0,0 +1,86 @@
+import json
+import pickle
+
+from pytest import raises
+
+from flockwave.spec.enums import (
+    SchemaEnum,
+    get_enum,
+    get_enum_names,
+    get_enum_table,
+)
+from flockwave.spec.schema import get_complex_object_schema, get_enum_from_schema
+
+
+def test_enum_names():
+    names = get_enum_names()
+    assert "deviceClass" in names
+    assert "channelType" in names
+    assert "severity" in names
+    assert "connectionPurpose" in names
+    assert "timeAxisScheduleSegment.type" in names
+    assert "rtkSurveySettings.gnssTypes" in names
+
+    # Enums in anyOf alternatives are not registered
+    assert "clockEpoch" not in names
+    assert "timeAxisScheduleSegment.endMs" not in names
+
+
+def test_get_enum():
+    DeviceClass = get_enum("deviceClass")
+    assert DeviceClass is get_enum("deviceClass")
+    assert DeviceClass.__name__ == "DeviceClass"
+    assert issubclass(DeviceClass, SchemaEnum)
+    assert [member.value for member in DeviceClass] == (
+        get_complex_object_schema("deviceClass")["enum"]
+    )
+
+    assert DeviceClass("gps") is DeviceClass.gps
+    assert DeviceClass.gps == "gps"
+    assert str(DeviceClass.gps) == "gps"
+    assert json.dumps([DeviceClass.gps]) == '["gps"]'
+
+    assert get_enum("timeAxisScheduleSegment.type").__name__ == (
+        "TimeAxisScheduleSegmentType"
+    )
+
+    with raises(KeyError):
+        get_enum("uavStatusInfo")
+
+
+def test_import_by_class_name():
+    from flockwave.spec.enums import Severity
+
+    assert Severity is get_enum("severity")
+    assert pickle.loads(pickle.dumps(Severity.warning)) is Severity.warning  # noqa: S301
+
+    with raises(ImportError):
+        from flockwave.spec.enums import NoSuchEnum  # noqa: F401
+
+
+def test_enum_table():
+    table = get_enum_table("severity")
+    Severity = table.enum
+    assert table is get_enum_table("severity")
+    assert len(table) == 5
+    assert table.values == ("debug", "info", "warning", "error", "critical")
+    assert table.by_value["error"] is Severity.error
+    assert table.get("fatal") is None
+    assert table.ordinals["debug"] == 0
+    assert table.ordinals[Severity.critical] == 4
+
+    assert table.to_members(["info", "error"]) == [Severity.info, Severity.error]
+    with raises(ValueError, match="'fatal' is not a valid Severity"):
+        table.to_members(["info", "fatal"])
+
+    ordinals = table.to_ordinals(["warning", "fatal", "debug"])
+    assert ordinals == [2, -1, 0]
+    assert table.from_ordinals(ordinals) == [Severity.warning, None, Severity.debug]
+
+
+def test_get_enum_from_schema_is_memoized():
+    Severity = get_enum_from_schema("severity")
+    assert Severity is get_enum_from_schema("severity")
+    assert Severity is not get_enum_from_schema("severity", "OtherSeverity")
+    with raises(TypeError):
+        get_enum_from_schema("uavStatusInfo")
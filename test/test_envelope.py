@@ -0,0 +1,151 @@
+from random import Random
+
+from pytest import mark, raises
+
+from flockwave.spec.errors import FlockwaveErrorCode
+from flockwave.spec.generate import MessageGenerator
+from flockwave.spec.schema import get_message_schema
+from flockwave.spec.validator import (
+    Envelope,
+    ValidationError,
+    create_deferred_body_validator,
+    create_validator_for_schema,
+    validate_envelope,
+)
+
+
+def is_valid(validator, obj) -> bool:
+    try:
+        validator(obj)
+        return True
+    except ValidationError:
+        return False
+
+
+def validate_in_two_stages(message) -> None:
+    create_deferred_body_validator()(validate_envelope(message))
+
+
+def create_message(**kwds):
+    message = {"$fw.version": "1.0", "id": "abc", "body": {"type": "SYS-PING"}}
+    message.update(kwds)
+    return {key: value for key, value in message.items() if value is not ...}
+
+
+def test_validate_envelope():
+    envelope = validate_envelope(create_message(refs="xyz"))
+    assert envelope == Envelope(
+        "abc", "1.0", "xyz", "SYS-PING", {"type": "SYS-PING"}, None
+    )
+
+    error = {"code": 42, "message": "oops"}
+    envelope = validate_envelope(create_message(body=..., error=error))
+    assert envelope == Envelope("abc", "1.0", None, None, None, error)
+
+    # The body is not validated in the first stage
+    envelope = validate_envelope(create_message(body={"type": "NO-SUCH-TYPE"}))
+    assert envelope.type == "NO-SUCH-TYPE"
+    with raises(ValidationError):
+        create_deferred_body_validator()(envelope)
+
+
+@mark.parametrize(
+    ("kwds", "message"),
+    [
+        ({"$fw.version": ...}, "version"),
+        ({"$fw.version": "1.x"}, "version"),
+        ({"$fw.version": 1}, "version"),
+        ({"$fw.version": "1.0\n"}, "version"),
+        ({"id": ...}, "'id'"),
+        ({"id": ""}, "data.id"),
+        ({"id": "x" * 37}, "data.id"),
+        ({"refs": None}, "data.refs"),
+        ({"body": ..., "error": {}}, "error object"),
+        ({"body": ..., "error": {"code": "42"}}, "error object"),
+        ({"body": ..., "error": {"code": True}}, "error object"),
+        ({"body": ..., "error": {"code": 1.5}}, "error object"),
+    ],
+)
+def test_invalid_envelopes(kwds, message):
+    with raises(ValidationError, match=message):
+        validate_envelope(create_message(**kwds))
+
+
+def test_two_stage_validation_is_equivalent_to_message_schema():
+    validator = create_validator_for_schema(get_message_schema())
+    generator = MessageGenerator(seed=3)
+    rng = Random(3)  # noqa: S311
+
+    messages = list(generator.iter_bodies(count=100, envelope=True))
+    for message_type in generator.message_types[:20]:
+        messages.append(generator.generate_message(message_type, invalid=True))
+
+    mutations = [
+        ("$fw.version", "2"),
+        ("$fw.version", "v2"),
+        ("id", 17),
+        ("refs", "r"),
+        ("refs", ""),
+        ("body", None),
+        ("body", []),
+        ("body", {"type": "SYS-PING", "extra": 1}),
+        ("error", {"code": 1}),
+        ("error", {"message": 1}),
+        ("error", "error"),
+    ]
+    for message in messages[:50]:
+        for key, value in rng.sample(mutations, 3):
+            messages.append({**message, key: value})
+        messages.append({k: v for k, v in message.items() if k != "body"})
+        messages.append([message])
+
+    outcomes = set()
+    for message in messages:
+        outcome = is_valid(validator, message)
+        assert is_valid(validate_in_two_stages, message) == outcome, message
+        outcomes.add(outcome)
+    assert outcomes == {True, False}
+
+
+@mark.parametrize(
+    "kwds",
+    [
+        {"$fw.version": "1.0\n"},
+        {"$fw.version": "\n1.0"},
+        {"$fw.version": "1.0.0\n"},
+        {"body": ..., "error": {"code": 1.0}},
+        {"body": ..., "error": {"code": -3.0, "message": "oops"}},
+        {"body": ..., "error": {"code": 1.5}},
+        {"body": ..., "error": {"code": True}},
+        {"body": ..., "error": {"code": False, "message": "oops"}},
+        {"body": ..., "error": {"code": float("inf")}},
+        {"body": ..., "error": {"code": FlockwaveErrorCode.LOW_DISK_SPACE}},
+        {
+            "body": ...,
+            "error": {"code": FlockwaveErrorCode.LOW_DISK_SPACE, "message": ""},
+        },
+    ],
+)
+def test_envelope_edge_cases_match_message_schema(kwds):
+    validator = create_validator_for_schema(get_message_schema())
+    message = create_message(**kwds)
+    assert is_valid(validate_in_two_stages, message) == is_valid(validator, message)
+
+
+def test_sampled_body_validation():
+    envelope = validate_envelope(create_message(body={"type": "SHOW-CFG", "x": 1}))
+
+    never = create_deferred_body_validator(sample_rate=0)
+    assert not never(envelope)
+
+    sometimes = create_deferred_body_validator(sample_rate=0.25, seed=42)
+    results = [is_valid(sometimes, envelope) for _ in range(1000)]
+    assert 150 < results.count(False) < 350
+
+    valid = validate_envelope(create_message())
+    assert create_deferred_body_validator("request")(valid)
+    with raises(ValidationError):
+        create_deferred_body_validator("response")(valid)
+
+    with raises(ValueError):
+        create_deferred_body_validator(sample_rate=1.5)
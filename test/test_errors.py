@@ -0,0 +1,75 @@
+from pytest import raises
+
+from flockwave.spec.errors import (
+    ErrorSeverity,
+    FlockwaveErrorCode,
+    count_uavs_per_error_code,
+    get_error_abbreviation,
+    get_error_bitset,
+    get_error_codes_from_bitset,
+    get_error_description,
+    get_error_severity,
+    get_worst_severity_from_bitset,
+    get_worst_severity_per_uav,
+)
+
+
+def test_lookup_tables_match_enum():
+    for code in FlockwaveErrorCode:
+        assert get_error_abbreviation(code) == code.abbreviation
+        assert get_error_description(code) == code.description
+        assert get_error_severity(code) is code.severity
+
+    assert FlockwaveErrorCode(66).abbreviation == "lowbat"
+    assert get_error_abbreviation(100) == "E100"
+    assert get_error_abbreviation(300) == "E300"
+    assert get_error_description(100) == "Error 100"
+    assert get_error_description(-1) == "Error -1"
+
+
+def test_severities():
+    assert get_error_severity(0) is ErrorSeverity.INFO
+    assert get_error_severity(63) is ErrorSeverity.INFO
+    assert get_error_severity(64) is ErrorSeverity.WARNING
+    assert get_error_severity(127) is ErrorSeverity.WARNING
+    assert get_error_severity(128) is ErrorSeverity.ERROR
+    assert get_error_severity(191) is ErrorSeverity.ERROR
+    assert get_error_severity(192) is ErrorSeverity.CRITICAL
+    assert get_error_severity(255) is ErrorSeverity.CRITICAL
+    assert get_error_severity(-5) is ErrorSeverity.INFO
+    assert get_error_severity(1000) is ErrorSeverity.CRITICAL
+
+
+def test_bitsets():
+    codes = [255, 3, 66, 3, 0, 128]
+    bitset = get_error_bitset(codes)
+    assert bitset.bit_length() == 256
+    assert get_error_codes_from_bitset(bitset) == [0, 3, 66, 128, 255]
+    assert get_worst_severity_from_bitset(bitset) is ErrorSeverity.CRITICAL
+    assert get_worst_severity_from_bitset(get_error_bitset([1, 70])) == 1
+    assert get_worst_severity_from_bitset(0) is None
+    assert get_error_codes_from_bitset(0) == []
+
+    with raises(ValueError, match="out of range"):
+        get_error_bitset([256])
+    with raises(ValueError, match="out of range"):
+        get_error_bitset([-1])
+
+
+def test_fleet_aggregation():
+    status = {
+        "01": {"id": "01", "errors": [3, 66]},
+        "02": {"id": "02", "errors": []},
+        "03": {"id": "03"},
+        "04": {"id": "04", "errors": [66, 66, 192]},
+        "05": {"id": "05", "errors": [1000]},
+    }
+    assert get_worst_severity_per_uav(status) == {
+        "01": ErrorSeverity.WARNING,
+        "02": None,
+        "03": None,
+        "04": ErrorSeverity.CRITICAL,
+        "05": ErrorSeverity.CRITICAL,
+    }
+    assert count_uavs_per_error_code(status) == {3: 1, 66: 2, 192: 1, 1000: 1}
+    assert count_uavs_per_error_code({}) == {}
@@ -0,0 +1,76 @@
+from pytest import fixture, mark, raises
+
+from flockwave.spec.generate import GeneratorOptions, MessageGenerator
+from flockwave.spec.schema import get_message_schema, get_message_types
+from flockwave.spec.validator import (
+    ValidationError,
+    create_dispatching_validator,
+    create_validator_for_schema,
+)
+
+KINDS = ("notification", "request", "response")
+
+
+@fixture(scope="module", params=KINDS)
+def kind(request):
+    return request.param
+
+
+def test_generated_bodies_are_valid(kind):
+    validator = create_dispatching_validator(kind)
+    for seed in range(3):
+        generator = MessageGenerator(kind, seed=seed)
+        for message_type in get_message_types(kind):
+            for _ in range(5):
+                validator(generator.generate_body(message_type))
+
+
+def test_generated_invalid_bodies_are_invalid(kind):
+    validator = create_dispatching_validator(kind)
+    generator = MessageGenerator(kind, seed=42)
+    for message_type in get_message_types(kind):
+        for _ in range(5):
+            body = generator.generate_body(message_type, invalid=True)
+            with raises(ValidationError):
+                validator(body)
+
+
+def test_generated_messages_are_valid():
+    validator = create_validator_for_schema(get_message_schema())
+    generator = MessageGenerator(seed=1)
+    for message in generator.iter_bodies(count=200, envelope=True):
+        validator(message)
+
+
+def test_seed_makes_output_reproducible():
+    first = list(MessageGenerator(seed=7).iter_bodies(count=50))
+    second = list(MessageGenerator(seed=7).iter_bodies(count=50))
+    assert first == second
+
+
+@mark.parametrize("num_uavs", [1, 100])
+def test_explicit_sizes(num_uavs):
+    options = GeneratorOptions(sizes={"status": num_uavs})
+    generator = MessageGenerator("response", seed=3, options=options)
+    validator = create_dispatching_validator("response")
+
+    body = generator.generate_body("UAV-INF")
+    while "status" not in body:
+        body = generator.generate_body("UAV-INF")
+
+    validator(body)
+    assert len(body["status"]) == num_uavs
+    for key, status in body["status"].items():
+        assert status["id"] == key
+
+
+def test_iter_bodies():
+    generator = MessageGenerator("request", seed=0)
+    bodies = list(generator.iter_bodies(["SYS-PING", "UAV-INF"], count=20))
+    assert len(bodies) == 20
+    assert {body["type"] for body in bodies} <= {"SYS-PING", "UAV-INF"}
+
+
+def test_unknown_message_type():
+    with raises(KeyError):
+        MessageGenerator("request").generate_body("NO-SUCH-MESSAGE")
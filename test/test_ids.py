@@ -0,0 +1,129 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+
+from fastjsonschema import JsonSchemaException, compile
+from pytest import raises
+
+from flockwave.spec.ids import (
+    MAX_CACHE_SIZE,
+    _BoundedCache,
+    are_valid_object_ids,
+    are_valid_user_names,
+    are_valid_users,
+    is_valid_object_id,
+    is_valid_user,
+    is_valid_user_name,
+    make_valid_object_id,
+    make_valid_object_ids,
+    parse_user,
+    parse_users,
+)
+from flockwave.spec.schema import get_complex_object_schema
+
+CHARACTERS = ["a", "Z", "0", ".", "@", "/", "$", "^", "\\", "\n", " ", "~", "é"]
+
+
+def create_identifiers():
+    result = ["", "x" * 64, "x" * 65, "abc\n", "\nabc"]
+    for length in (1, 2, 3):
+        result.extend("".join(chars) for chars in product(CHARACTERS, repeat=length))
+    return result
+
+
+def is_valid_according_to_schema(validator, identifier):
+    try:
+        validator(identifier)
+    except JsonSchemaException:
+        return False
+    else:
+        return True
+
+
+def test_object_ids_match_schema():
+    validator = compile(get_complex_object_schema("objectId"))
+    identifiers = create_identifiers()
+    expected = [is_valid_according_to_schema(validator, x) for x in identifiers]
+    assert are_valid_object_ids(identifiers) == expected
+    assert [is_valid_object_id(x) for x in identifiers] == expected
+
+
+def test_user_names_match_schema():
+    validator = compile(get_complex_object_schema("userName"))
+    identifiers = create_identifiers()
+    expected = [is_valid_according_to_schema(validator, x) for x in identifiers]
+    assert are_valid_user_names(identifiers) == expected
+    assert [is_valid_user_name(x) for x in identifiers] == expected
+
+    # Repeated lookups are served from the cache
+    assert are_valid_user_names(identifiers) == expected
+
+
+def test_make_valid_object_ids():
+    identifiers = create_identifiers()
+    sanitized = make_valid_object_ids(identifiers)
+    assert sanitized == [make_valid_object_id(x) for x in identifiers]
+    assert all(are_valid_object_ids(sanitized))
+
+    # Identical inputs are mapped to the same instance
+    first, second = make_valid_object_ids(["a/b", "".join(["a", "/", "b"])])
+    assert first is second
+
+
+def test_users():
+    identifiers = ["user@example.com", "user", "@domain", "", "a@b@c", "a b"]
+    assert are_valid_users(identifiers) == [True, True, True, True, False, False]
+    assert [is_valid_user(x) for x in identifiers] == are_valid_users(identifiers)
+
+    assert parse_users(identifiers[:4]) == [
+        ("user", "example.com"),
+        ("user", ""),
+        ("", "domain"),
+        ("", ""),
+    ]
+    with raises(ValueError, match="'a@b@c' is not a valid username"):
+        parse_users(identifiers)
+    with raises(ValueError, match="'a b' is not a valid username"):
+        parse_user("a b")
+    assert parse_user("john.doe@example.com") == ("john.doe", "example.com")
+
+
+def test_bounded_cache():
+    calls = []
+
+    def func(key):
+        calls.append(key)
+        return key.upper()
+
+    cache = _BoundedCache(func, max_size=2)
+    assert [cache[x] for x in "abab"] == ["A", "B", "A", "B"]
+    assert calls == ["a", "b"]
+
+    assert cache["c"] == "C"
+    assert list(cache) == ["b", "c"]
+    assert cache["a"] == "A"
+    assert calls == ["a", "b", "c", "a"]
+    assert len(cache) == 2
+
+    assert MAX_CACHE_SIZE > 1000
+
+
+def test_bounded_cache_threads():
+    cache = _BoundedCache(str.upper, max_size=4)
+    keys = [f"{index % 50}" for index in range(50000)]
+
+    def lookup_all():
+        for key in keys:
+            assert cache[key] == key
+
+    # Switch threads as often as possible to provoke concurrent evictions
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(lookup_all) for _ in range(8)]:
+                future.result()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert len(cache) <= 4
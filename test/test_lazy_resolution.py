@@ -0,0 +1,85 @@
+from pytest import fixture
+
+from flockwave.spec import cache as cache_module
+from flockwave.spec import schema as schema_module
+from flockwave.spec.cache import CACHE_DIR_ENV_VAR
+from flockwave.spec.schema import (
+    LAZY_RESOLUTION_ENV_VAR,
+    _load_schema_from_resource,
+    _to_plain_json,
+    disable_lazy_resolution,
+    enable_lazy_resolution,
+    get_complex_object_schema,
+    is_lazy_resolution_enabled,
+)
+from flockwave.spec.validator import create_validator_for_schema
+
+
+@fixture(autouse=True)
+def restore_lazy_resolution(monkeypatch):
+    monkeypatch.setattr(schema_module, "_lazy_resolution", None)
+    monkeypatch.delenv(LAZY_RESOLUTION_ENV_VAR, raising=False)
+
+    # Schemas taken from the on-disk cache are not loaded at all
+    monkeypatch.setattr(cache_module, "_cache_root", cache_module._UNSET)
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+
+
+@fixture
+def loaded_uris(monkeypatch):
+    result = []
+    original_loader = schema_module._jsonref_loader
+
+    def loader(uri):
+        result.append(uri.rpartition("/")[2])
+        return original_loader(uri)
+
+    monkeypatch.setattr(schema_module, "_jsonref_loader", loader)
+    return result
+
+
+def test_lazy_resolution_is_opt_in(monkeypatch):
+    assert not is_lazy_resolution_enabled()
+
+    monkeypatch.setenv(LAZY_RESOLUTION_ENV_VAR, "1")
+    assert is_lazy_resolution_enabled()
+
+    monkeypatch.setenv(LAZY_RESOLUTION_ENV_VAR, "0")
+    assert not is_lazy_resolution_enabled()
+
+    enable_lazy_resolution()
+    assert is_lazy_resolution_enabled()
+
+    disable_lazy_resolution()
+    assert not is_lazy_resolution_enabled()
+
+
+def test_eager_resolution_loads_everything(loaded_uris):
+    load_schema = _load_schema_from_resource.__wrapped__  # type: ignore
+    load_schema("message.json", None, False)
+    assert "response_UAV-INF.json" in loaded_uris
+
+
+def test_lazy_resolution_loads_on_demand(loaded_uris):
+    load_schema = _load_schema_from_resource.__wrapped__  # type: ignore
+    schema = load_schema("message.json", None, True)
+    assert loaded_uris == []
+
+    body = schema["definitions"]["standardMessage"]["properties"]["body"]
+    assert "anyOf" in body
+    assert loaded_uris == ["message_body.json"]
+    assert "response_UAV-INF.json" not in loaded_uris
+
+
+def test_lazy_schema_is_equivalent_to_eager_schema():
+    load_schema = _load_schema_from_resource.__wrapped__  # type: ignore
+    lazy = load_schema("response_body.json", None, True)
+    eager = load_schema("response_body.json", None, False)
+    assert _to_plain_json(lazy) == _to_plain_json(eager)
+
+
+def test_lazy_schema_can_be_used_for_validation():
+    enable_lazy_resolution()
+    schema = get_complex_object_schema("gpsCoordinate")
+    validator = create_validator_for_schema(schema)
+    validator([473000000, 190000000, 1000])
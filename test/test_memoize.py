@@ -0,0 +1,252 @@
+import asyncio
+from functools import partial
+from threading import Barrier, Event, Thread
+from time import sleep
+
+from pytest import raises
+
+from flockwave.spec import memoize as memoize_module
+from flockwave.spec.memoize import CacheInfo, memoized, memoized_async
+
+
+def test_fast_path_is_kept():
+    calls = []
+
+    @memoized
+    def square(x):
+        """Squares a number."""
+        calls.append(x)
+        return x * x
+
+    assert isinstance(square, partial)
+    assert square.__name__ == "square"
+    assert square.__doc__ == "Squares a number."
+    assert square.__wrapped__.__name__ == "square"
+
+    assert [square(x) for x in (2, 3, 2, 2)] == [4, 9, 4, 4]
+    assert calls == [2, 3]
+    assert square.cache_info() == CacheInfo(None, 2, None, 2, square.cache_info()[4])
+
+    square.cache_clear()
+    assert square(2) == 4
+    assert calls == [2, 3, 2]
+    assert square.cache_info().misses == 1
+
+
+def test_zero_arg_and_multi_arg_functions():
+    calls = []
+
+    @memoized
+    def constant():
+        calls.append(None)
+        return 42
+
+    @memoized
+    def add(x, y=1):
+        calls.append((x, y))
+        return x + y
+
+    assert constant() == constant() == 42
+    assert add(1, y=2) == add(1, y=2) == 3
+    assert add(1) == 2
+    assert calls == [None, (1, 2), (1, 1)]
+
+    constant.cache_clear()
+    add.cache_clear()
+    assert constant() == 42
+    assert add(1, y=2) == 3
+    assert len(calls) == 5
+
+
+def test_lru_bound():
+    calls = []
+
+    @memoized(max_size=2, stats=True)
+    def identity(x):
+        calls.append(x)
+        return x
+
+    for x in (1, 2, 1, 3, 1, 2):
+        identity(x)
+
+    # 2 was evicted when 3 was added, because 1 was used more recently
+    assert calls == [1, 2, 3, 2]
+    info = identity.cache_info()
+    assert (info.hits, info.misses, info.max_size, info.size) == (2, 4, 2, 2)
+
+    with raises(ValueError):
+        memoized(max_size=2, cache={})(identity)
+
+
+def test_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(memoize_module, "monotonic", lambda: now[0])
+    calls = []
+
+    @memoized(ttl=10)
+    def identity(x):
+        calls.append(x)
+        return x
+
+    identity(1)
+    now[0] += 9
+    identity(1)
+    assert calls == [1]
+
+    now[0] += 1
+    identity(1)
+    assert calls == [1, 1]
+
+
+def test_single_flight():
+    num_threads = 8
+    barrier = Barrier(num_threads)
+    calls = []
+    results = []
+
+    @memoized
+    def load(name):
+        calls.append(name)
+        sleep(0.05)
+        return name.upper()
+
+    def worker():
+        barrier.wait()
+        results.append(load("schema"))
+
+    threads = [Thread(target=worker) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["schema"]
+    assert results == ["SCHEMA"] * num_threads
+
+
+def test_exceptions_are_not_cached():
+    calls = []
+
+    @memoized
+    def fail(x):
+        calls.append(x)
+        raise RuntimeError("nope")
+
+    for _ in range(2):
+        with raises(RuntimeError, match="nope"):
+            fail(1)
+    assert calls == [1, 1]
+    assert fail.cache_info().size == 0
+
+
+def test_recursive_call_with_same_key_does_not_deadlock():
+    depth = []
+
+    @memoized
+    def recurse(x):
+        depth.append(x)
+        return recurse(x) if len(depth) < 3 else len(depth)
+
+    assert recurse(1) == 3
+
+
+def test_async_single_flight():
+    calls = []
+
+    @memoized_async(stats=True)
+    async def fetch(name, *, suffix=""):
+        calls.append(name)
+        await asyncio.sleep(0.01)
+        return name.upper() + suffix
+
+    async def main():
+        results = await asyncio.gather(*(fetch("a") for _ in range(5)))
+        assert results == ["A"] * 5
+        assert await fetch("a") == "A"
+        assert await fetch("a", suffix="!") == "A!"
+
+        # Cancelling a waiting call does not cancel the evaluation
+        task = asyncio.ensure_future(fetch("b"))
+        await asyncio.sleep(0)
+        task.cancel()
+        assert await fetch("b") == "B"
+
+    asyncio.run(main())
+    assert calls == ["a", "a", "b"]
+    info = fetch.cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 3, 3)
+
+    fetch.cache_clear()
+    assert fetch.cache_info().size == 0
+
+
+def test_async_exceptions_are_propagated():
+    calls = []
+
+    @memoized_async
+    async def fail():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("nope")
+
+    async def main():
+        results = await asyncio.gather(fail(), fail(), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        with raises(RuntimeError):
+            await fail()
+
+    asyncio.run(main())
+    assert calls == [None, None]
+
+
+def test_clear_during_evaluation():
+    started, release = Event(), Event()
+    calls = []
+
+    @memoized
+    def load(name):
+        calls.append(name)
+        count = len(calls)
+        if count == 1:
+            started.set()
+            release.wait(timeout=5)
+        return count
+
+    results = []
+    thread = Thread(target=lambda: results.append(load("schema")))
+    thread.start()
+    started.wait()
+    load.cache_clear()
+
+    # Calls after the cache was cleared do not wait for the stale evaluation
+    assert load("schema") == 2
+    release.set()
+    thread.join()
+
+    assert results == [1]
+    assert load("schema") == 2
+    assert calls == ["schema", "schema"]
+    assert load.cache_info().size == 1
+
+
+def test_async_clear_during_evaluation():
+    calls = []
+
+    @memoized_async
+    async def fetch(name):
+        calls.append(name)
+        count = len(calls)
+        await asyncio.sleep(0.01 if count == 1 else 0)
+        return count
+
+    async def main():
+        task = asyncio.ensure_future(fetch("a"))
+        await asyncio.sleep(0)
+        fetch.cache_clear()
+        assert await fetch("a") == 2
+        assert await task == 1
+        assert await fetch("a") == 2
+
+    asyncio.run(main())
+    assert calls == ["a", "a"]
+    assert fetch.cache_info().size == 1
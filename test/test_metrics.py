@@ -0,0 +1,147 @@
+import json
+
+from pytest import fixture, raises
+
+from flockwave.spec.metrics import (
+    LATENCY_BUCKETS,
+    Histogram,
+    disable_metrics,
+    enable_metrics,
+    get_metrics,
+)
+from flockwave.spec.schema import _load_schema_from_resource, get_message_schema
+from flockwave.spec.validator import (
+    ValidationError,
+    _get_inner_validator_for_resource,
+    create_dispatching_validator,
+    create_validator_for_schema,
+    validate_many,
+)
+
+
+@fixture
+def metrics():
+    yield enable_metrics(measure_size=True)
+    disable_metrics()
+
+
+def test_disabled_by_default():
+    assert get_metrics() is None
+    create_dispatching_validator()({"type": "SYS-PING"})
+    assert get_metrics() is None
+
+
+def test_histogram():
+    histogram = Histogram((1, 10))
+    for value in (0.5, 1, 5, 10, 11):
+        histogram.observe(value)
+    assert histogram.counts == [2, 2, 1]
+    assert histogram.count == 5
+    assert histogram.sum == 27.5
+
+
+def test_validation_metrics(metrics):
+    validate = create_dispatching_validator("request")
+    validate({"type": "UAV-INF", "ids": ["01", "02"]})
+    validate({"type": "UAV-INF", "ids": []})
+    with raises(ValidationError):
+        validate({"type": "UAV-INF"})
+    with raises(ValidationError):
+        validate({"type": "NO-SUCH-TYPE"})
+
+    snapshot = metrics.snapshot()
+    uav_inf = snapshot["types"]["request/UAV-INF"]
+    assert uav_inf["validated"] == 2
+    assert uav_inf["failed"] == 1
+    assert uav_inf["failures"] == {"required": 1}
+    assert uav_inf["latency"]["count"] == 3
+    assert uav_inf["latency"]["buckets"] == list(LATENCY_BUCKETS)
+    assert uav_inf["size"]["count"] == 3
+    assert uav_inf["size"]["sum"] == sum(
+        len(json.dumps(body, separators=(",", ":")))
+        for body in (
+            {"type": "UAV-INF", "ids": ["01", "02"]},
+            {"type": "UAV-INF", "ids": []},
+            {"type": "UAV-INF"},
+        )
+    )
+
+    # Unknown message types are recorded without their type
+    assert snapshot["types"]["request"]["failed"] == 1
+
+    validate = create_validator_for_schema(get_message_schema())
+    validate({"$fw.version": "1.0", "id": "1", "body": {"type": "SYS-PING"}})
+    assert metrics.snapshot()["types"]["schema/message.json"]["validated"] == 1
+
+
+def test_validate_many_metrics(metrics):
+    bodies = [
+        {"type": "UAV-INF", "ids": ["01", "02"]},
+        {"type": "UAV-INF"},
+        {"type": "NO-SUCH-TYPE"},
+    ]
+    results = validate_many(bodies, "request")
+    assert [result is None for result in results] == [True, False, False]
+
+    types = metrics.snapshot()["types"]
+    assert types["request/UAV-INF"]["validated"] == 1
+    assert types["request/UAV-INF"]["failed"] == 1
+    assert types["request/UAV-INF"]["failures"] == {"required": 1}
+    assert types["request"]["failed"] == 1
+    assert "request/NO-SUCH-TYPE" not in types
+
+
+def test_schema_timings(metrics):
+    _load_schema_from_resource("notification_SYS-CLOSE.json", "/properties", False)
+    _get_inner_validator_for_resource.cache_clear()
+    _get_inner_validator_for_resource("notification_SYS-CLOSE.json")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["schema_loads"]["notification_SYS-CLOSE.json#/properties"] >= 0
+    assert "notification_SYS-CLOSE.json" in snapshot["schema_compilations"]
+
+
+def test_profiling():
+    metrics = enable_metrics(profile=True)
+    try:
+        validate = create_dispatching_validator("response")
+        validate({"type": "UAV-INF", "status": {"01": {"id": "01", "timestamp": 1}}})
+        validate({"type": "UAV-INF", "status": {}, "error": {}})
+    finally:
+        disable_metrics()
+
+    subtrees = metrics.snapshot()["subtrees"]
+    assert subtrees["response/UAV-INF:properties.status"]["count"] == 2
+    assert subtrees["response/UAV-INF:properties.error"]["count"] == 1
+    assert subtrees["response/UAV-INF:properties.type"]["seconds"] >= 0
+
+
+def test_prometheus_export(metrics):
+    validate = create_dispatching_validator("request")
+    validate({"type": "UAV-INF", "ids": ["01"]})
+    with raises(ValidationError):
+        validate({"type": "UAV-INF", "ids": "01"})
+
+    text = metrics.to_prometheus()
+    lines = text.splitlines()
+    assert "# TYPE flockwave_spec_validations_total counter" in lines
+    assert (
+        'flockwave_spec_validations_total{kind="request",type="UAV-INF",result="ok"} 1'
+        in lines
+    )
+    assert (
+        "flockwave_spec_validation_failures_total"
+        '{kind="request",type="UAV-INF",rule="type"} 1' in lines
+    )
+    assert (
+        'flockwave_spec_validation_seconds_bucket{kind="request",type="UAV-INF",'
+        'le="+Inf"} 2' in lines
+    )
+    assert (
+        'flockwave_spec_validation_seconds_count{kind="request",type="UAV-INF"} 2'
+        in lines
+    )
+    assert text.endswith("\n")
+
+    metrics.reset()
+    assert metrics.snapshot()["types"] == {}
@@ -0,0 +1,166 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from pytest import fixture, mark, raises
+
+from flockwave.spec.generate import MessageGenerator
+from flockwave.spec.models import (
+    _MISSING,
+    BODY_CLASSES,
+    BatteryInfo,
+    DecodeError,
+    GPSCoordinate,
+    RtkSourceRequest,
+    UavInfResponse,
+    UAVStatusInfo,
+    decode_body,
+)
+from flockwave.spec.validator import create_dispatching_validator
+
+root_dir = Path(__file__).parent.parent
+examples_dir = root_dir / "doc" / "modules" / "ROOT" / "examples"
+example_filenames = sorted(
+    x.name
+    for kind in ("notification", "request", "response")
+    for x in examples_dir.glob(f"{kind}_*.json")
+)
+
+
+@fixture(params=example_filenames)
+def examples(request):
+    kind = request.param.partition("_")[0]
+    bodies = json.load((examples_dir / request.param).open())
+    return kind, bodies if isinstance(bodies, list) else [bodies]
+
+
+def test_examples_round_trip(examples):
+    kind, bodies = examples
+    validator = create_dispatching_validator(kind)
+    for body in bodies:
+        model = decode_body(body, kind)
+        encoded = model.to_json()
+        assert decode_body(encoded, kind) == model
+        validator(encoded)
+
+
+@mark.parametrize("kind", ["notification", "request", "response"])
+def test_generated_bodies(kind):
+    generator = MessageGenerator(kind, seed=42)
+    validator = create_dispatching_validator(kind)
+
+    for body in generator.iter_bodies(count=500):
+        validator(decode_body(body, kind).to_json())
+
+    for body in generator.iter_bodies(count=200, invalid_ratio=1.0):
+        with raises(DecodeError):
+            decode_body(body, kind)
+
+
+def test_body_classes():
+    assert BODY_CLASSES["response"]["UAV-INF"] == (UavInfResponse,)
+    assert "UAV-INF" in BODY_CLASSES["request"]
+    assert "UAV-INF" not in BODY_CLASSES["notification"]
+
+
+def test_decode_uav_status():
+    status = UAVStatusInfo.from_json(
+        {
+            "id": "01",
+            "timestamp": 1449562661000,
+            "position": [519976597, -7406863, 93765],
+            "battery": [124, 85],
+            "heading": 900,
+        }
+    )
+    assert status.id == "01"
+    assert status.position == GPSCoordinate(519976597, -7406863, 93765)
+    assert status.position.amsl == 93765
+    assert status.position.agl is _MISSING
+    assert status.battery == BatteryInfo(124, 85)
+    assert status.mode is None
+    assert status.to_json() == {
+        "id": "01",
+        "timestamp": 1449562661000,
+        "position": [519976597, -7406863, 93765],
+        "battery": [124, 85],
+        "heading": 900,
+    }
+
+
+def test_integral_floats_are_integers():
+    status = {"id": "01", "timestamp": 0, "position": [1.0, -2.0], "heading": 90.0}
+    validator = create_dispatching_validator("response")
+    validator({"type": "UAV-INF", "status": {"01": status}})
+
+    model = UAVStatusInfo.from_json(status)
+    assert model.heading == 90
+    assert model.position == GPSCoordinate(1, -2)
+    assert model.to_json() == status
+
+    for value in (1.5, float("inf"), float("nan"), True):
+        with raises(DecodeError, match=r"^data\.heading must be integer$"):
+            UAVStatusInfo.from_json({**status, "heading": value})
+
+
+@mark.parametrize(
+    ("kind", "body"),
+    [
+        ("request", {"type": "RTK-SOURCE", "id": None}),
+        ("request", {"type": "RTK-SOURCE"}),
+        ("request", {"type": "SHOW-CRTH-PLAN", "show": "", "min_distance": None}),
+        ("request", {"type": "UAV-FLY", "ids": ["01"], "target": [1, 2, None]}),
+        ("request", {"type": "UAV-FLY", "ids": ["01"], "target": [1, 2, None, 3]}),
+        ("request", {"type": "UAV-FLY", "ids": ["01"], "target": [1, 2]}),
+    ],
+)
+def test_explicit_nulls_round_trip(kind, body):
+    model = decode_body(body, kind)
+    assert model.to_json() == body
+    assert decode_body(model.to_json(), kind) == model
+
+
+def test_missing_nullable_values():
+    assert RtkSourceRequest().to_json() == {"type": "RTK-SOURCE"}
+    assert RtkSourceRequest(id=None).to_json() == {"type": "RTK-SOURCE", "id": None}
+    assert RtkSourceRequest.from_json({"type": "RTK-SOURCE"}).id is _MISSING
+
+    assert GPSCoordinate(1, 2).to_json() == [1, 2]
+    assert GPSCoordinate(1, 2, agl=3).to_json() == [1, 2, None, None, 3]
+    assert GPSCoordinate(1, 2, None).to_json() == [1, 2, None]
+
+
+def test_decode_errors():
+    body = {
+        "type": "UAV-INF",
+        "status": {"01": {"id": "01", "timestamp": 0, "heading": "north"}},
+    }
+    with raises(DecodeError, match=r"^data\.status\.01\.heading must be integer$"):
+        decode_body(body, "response")
+
+    body["status"]["01"] = {"id": "01", "timestamp": 0, "position": [1, 2, "3"]}
+    with raises(DecodeError, match=r"^data\.status\.01\.position\.2 must be integer$"):
+        decode_body(body, "response")
+
+    with raises(DecodeError, match=r"must contain \['id', 'timestamp'\]"):
+        UAVStatusInfo.from_json({"mode": "pos"})
+
+    with raises(DecodeError, match=r"^data\.mode must not be null$"):
+        UAVStatusInfo.from_json({"id": "01", "timestamp": 0, "mode": None})
+
+    with raises(DecodeError, match=r"^data\.type must be a known request type$"):
+        decode_body({"type": "NO-SUCH-TYPE"}, "request")
+
+
+def test_models_are_up_to_date():
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, str(root_dir / "etc" / "scripts" / "generate_models.py")]
+        + ["--check"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, (
+        "Schema files have changed since the model classes were generated; "
+        "run etc/scripts/generate_models.py to rebuild them"
+    )
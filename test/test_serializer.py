@@ -0,0 +1,175 @@
+import json
+import re
+from copy import deepcopy
+
+from pytest import fixture, mark, raises
+
+from flockwave.spec.generate import MessageGenerator
+from flockwave.spec.schema import get_message_types
+from flockwave.spec.serializer import MessageSerializer
+from flockwave.spec.validator import ValidationError, create_dispatching_validator
+
+
+@fixture
+def serializer() -> MessageSerializer:
+    return MessageSerializer("response")
+
+
+@mark.parametrize("kind", ["request", "response", "notification"])
+def test_equivalence_with_validator(kind):
+    serializer = MessageSerializer(kind)
+    validator = create_dispatching_validator(kind)
+    generator = MessageGenerator(kind, seed=7)  # type: ignore
+
+    outcomes = set()
+    for message_type in get_message_types(kind):  # type: ignore
+        for invalid in (False, True):
+            body = generator.generate_body(message_type, invalid=invalid)
+            expected = deepcopy(body)
+            try:
+                validator(expected)
+            except ValidationError as ex:
+                expected = None
+                expected_error = str(ex)
+
+            try:
+                encoded = serializer(body)
+            except ValidationError as ex:
+                encoded = None
+                error = str(ex)
+
+            if expected is None:
+                assert encoded is None, body
+                assert error == expected_error, body
+            else:
+                assert encoded is not None, body
+                assert json.loads(encoded) == expected
+            outcomes.add(expected is None)
+
+    assert outcomes == {True, False}
+
+
+def test_canonical_output(serializer):
+    body = {
+        "status": {"01": {"timestamp": 1, "zzz": 1, "id": "01", "aaa": [1]}},
+        "type": "UAV-INF",
+    }
+    assert serializer(body) == (
+        '{"type":"UAV-INF","status":{"01":{"id":"01","timestamp":1,"aaa":[1],"zzz":1}}}'
+    )
+
+
+def test_non_ascii_strings():
+    serializer = MessageSerializer("notification")
+    body = {"type": "SYS-MSG", "items": [{"message": 'árvíztűrő\n"x"'}]}
+    assert json.loads(serializer(body)) == body
+    assert serializer.encode(body) == serializer(body).encode("utf-8")
+
+
+def test_defaults_are_written():
+    serializer = MessageSerializer("notification")
+    body = {"type": "ASYNC-ST", "id": "x", "progress": {"percentage": 5}}
+    assert serializer(body) == (
+        '{"type":"ASYNC-ST","id":"x","progress":{"percentage":5},"suspended":false}'
+    )
+    assert "suspended" not in body
+
+
+@mark.parametrize(
+    ("body", "message"),
+    [
+        (
+            {"type": "UAV-INF", "status": {"01": {"id": 1}}},
+            re.escape("data.status.01 must contain ['timestamp'] properties"),
+        ),
+        (
+            {"type": "UAV-INF", "status": {"01": {"id": "01", "timestamp": "x"}}},
+            "data.status.01.timestamp must be",
+        ),
+        (
+            {"type": "UAV-INF", "status": {"01": {"id": 1, "timestamp": 1}}},
+            "data.status.01.id must be string",
+        ),
+        (
+            {"type": "UAV-INF", "status": {"01": {"id": "01", "timestamp": 1e400}}},
+            "data.status.01.timestamp must be finite",
+        ),
+        (
+            {"type": "UAV-INF", "status": {}, "failure": ["01"], "reasons": {}},
+            r"^data must not contain \{'(failure|reasons)', '(failure|reasons)'\}",
+        ),
+        ({"type": "NO-SUCH-TYPE"}, "data"),
+        ({"type": 42}, "data"),
+        ([], "data"),
+    ],
+)
+def test_invalid_bodies(serializer, body, message):
+    with raises(ValidationError, match=message):
+        serializer(body)
+
+
+def test_encode_into(serializer):
+    buffer = bytearray(b"[")
+    assert serializer.encode_into({"type": "ACK-ACK"}, buffer) == 18
+    buffer += b","
+    with raises(ValidationError):
+        serializer.encode_into({"type": "UAV-INF", "status": 42}, buffer)
+    assert serializer.encode_into({"type": "ACK-ACK"}, buffer) == 18
+    buffer += b"]"
+    assert json.loads(buffer) == [{"type": "ACK-ACK"}] * 2
+
+
+def test_lone_surrogates():
+    serializer = MessageSerializer("notification")
+    body = {"type": "SYS-MSG", "items": [{"message": "\ud800"}]}
+    buffer = bytearray(b"[")
+    with raises(ValidationError, match="encodable in UTF-8"):
+        serializer.encode(body)
+    with raises(ValidationError, match="encodable in UTF-8"):
+        serializer.encode_into(body, buffer)
+    assert buffer == b"["
+
+
+@mark.parametrize(
+    "status",
+    [
+        {"id": "01", "timestamp": 1, "position": [1, 2, 3], "rssi": [80, -1]},
+        {"id": "01", "timestamp": 1.5, "heading": 0, "battery": [124, 100]},
+        {"id": "01", "timestamp": 1, "position": (1, 2, 3), "errors": list(range(40))},
+        {"id": "01", "timestamp": 1, "position": [1.0, 2, None], "mode": "pos"},
+        {"id": "01", "timestamp": 1, "battery": [124, 50, True], "debug": "x"},
+        {"id": "01", "timestamp": 1, "gps": [3, None], "zzz": [1]},
+        {"id": "01", "timestamp": 1, "light": 65535, "errors": []},
+    ],
+)
+def test_uav_status_encoding(serializer, status):
+    body = {"type": "UAV-INF", "status": {"01": status}}
+    expected = deepcopy(body)
+    create_dispatching_validator("response")(expected)
+    assert json.loads(serializer(body)) == json.loads(json.dumps(expected))
+
+
+@mark.parametrize(
+    ("status", "message"),
+    [
+        ({"position": [1, "x"]}, "data.status.01.position[1] must be integer"),
+        ({"position": [1, True]}, "data.status.01.position[1] must be integer"),
+        ({"position": [1, 2**40]}, "data.status.01.position[1] must be smaller"),
+        ({"rssi": [80, 101]}, "data.status.01.rssi[1] must be smaller"),
+        ({"battery": [124, 50, 1]}, "data.status.01.battery[2] must be boolean"),
+        ({"heading": True}, "data.status.01.heading must be integer"),
+        ({"id": "a/b"}, "data.status.01.id must match pattern"),
+        ({"timestamp": float("nan")}, "data.status.01.timestamp must be finite"),
+    ],
+)
+def test_invalid_uav_status(serializer, status, message):
+    body = {"type": "UAV-INF", "status": {"01": {"id": "01", "timestamp": 1, **status}}}
+    with raises(ValidationError, match=re.escape(message)) as serializer_error:
+        serializer(body)
+
+    # Failures are reported in the same way as by the validator, except for
+    # values that cannot be represented in JSON
+    if "finite" not in message:
+        with raises(ValidationError) as validator_error:
+            create_dispatching_validator("response")(body)
+        assert str(serializer_error.value) == str(validator_error.value)
@@ -0,0 +1,65 @@
+from io import BytesIO
+
+from pytest import mark
+
+from flockwave.spec.stream import JSONStreamReader
+
+
+def read_all(data: str, **kwds):
+    reader = JSONStreamReader(BytesIO(data.encode("utf-8")), **kwds)
+    return [tuple(item) for item in reader], reader.bytes_read
+
+
+def test_empty_stream():
+    assert read_all("") == ([], 0)
+    assert read_all(" \n\n ") == ([], 4)
+
+
+def test_single_document():
+    items, num_bytes = read_all('{\n  "type": "SYS-PING",\n  "ids": ["01"]\n}\n')
+    assert items == [({"type": "SYS-PING", "ids": ["01"]}, 1, 1, None)]
+    assert num_bytes == 42
+
+
+@mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_ndjson_and_concatenated_stream(chunk_size: int):
+    data = '{"a": "x\\"yz"}\n[true, false, null]\n\n  12345 {"b":\n 2}{"c": "\\u00e1"}'
+    items, num_bytes = read_all(data, chunk_size=chunk_size)
+    assert items == [
+        ({"a": 'x"yz'}, 1, 1, None),
+        ([True, False, None], 2, 1, None),
+        (12345, 4, 3, None),
+        ({"b": 2}, 4, 9, None),
+        ({"c": "á"}, 5, 4, None),
+    ]
+    assert num_bytes == len(data.encode("utf-8"))
+
+
+@mark.parametrize("chunk_size", [1, 5, 1024])
+def test_syntax_errors(chunk_size: int):
+    data = '{"a": 1}\n{"b": ,}\n{"c": 3}\n{"d"'
+    items, _ = read_all(data, chunk_size=chunk_size)
+    assert items == [
+        ({"a": 1}, 1, 1, None),
+        (None, 2, 7, "Expecting value"),
+        ({"c": 3}, 3, 1, None),
+        (None, 4, 5, "Expecting ':' delimiter"),
+    ]
+
+
+def test_syntax_error_does_not_read_entire_stream():
+    data = '{"a": 1}\n{"b": ,}\n' + '{"c": 3}\n' * 10000
+    reader = JSONStreamReader(BytesIO(data.encode("utf-8")), chunk_size=64)
+    for item in reader:
+        if item.error is not None:
+            break
+    assert reader.bytes_read < 256
+
+
+def test_too_large_value():
+    items, _ = read_all(
+        '{"a": [' + "1, " * 20 + '1]}\n{"b": 2}\n', chunk_size=4, max_value_size=16
+    )
+    assert items[0][:2] == (None, 1)
+    assert "longer than 16 characters" in items[0][3]
+    assert items[1] == ({"b": 2}, 2, 1, None)
@@ -0,0 +1,213 @@
+from random import Random
+
+from pytest import fixture, mark, raises
+
+from flockwave.spec.schema import get_complex_object_schema
+from flockwave.spec.subscriptions import (
+    DeviceTreeUpdateBatch,
+    SubscriptionIndex,
+    is_valid_device_tree_path,
+)
+from flockwave.spec.validator import ValidationError, create_validator_for_schema
+
+
+@fixture
+def index() -> SubscriptionIndex[str]:
+    return SubscriptionIndex()
+
+
+@mark.parametrize(
+    ("path", "valid"),
+    [
+        ("/", True),
+        ("/1", True),
+        ("/1/battery/voltage", True),
+        ("", False),
+        ("1", False),
+        ("/1/", False),
+        ("//1", False),
+        (None, False),
+    ],
+)
+def test_is_valid_device_tree_path(path, valid):
+    assert is_valid_device_tree_path(path) is valid
+
+
+@mark.parametrize(
+    "path", ["/1/battery\n", "/\n", "\n/", "/1/\n", "/1\n/led", "/1/\n/led"]
+)
+def test_is_valid_device_tree_path_matches_schema(path):
+    validator = create_validator_for_schema(get_complex_object_schema("deviceTreePath"))
+    try:
+        validator(path)
+        valid = True
+    except ValidationError:
+        valid = False
+    assert is_valid_device_tree_path(path) is valid
+
+
+def test_subscribers(index):
+    index.subscribe("a", "/1/battery")
+    index.subscribe("b", "/1")
+    index.subscribe("c", "/")
+    index.subscribe("d", "/2")
+
+    assert index.get_subscribers("/1/battery/voltage") == {"a", "b", "c"}
+    assert index.get_subscribers("/1/battery") == {"a", "b", "c"}
+    assert index.get_subscribers("/1/batteryX") == {"b", "c"}
+    assert index.get_subscribers("/3/led") == {"c"}
+    assert index.get_subscribers("/1/led") is index.get_subscribers("/1/led")
+
+    with raises(ValueError):
+        index.get_subscribers("1/led")
+    with raises(ValueError):
+        index.subscribe("a", "/1/")
+
+    # Cached results are invalidated when subscriptions change
+    index.subscribe("d", "/1/battery/voltage")
+    assert index.get_subscribers("/1/battery/voltage") == {"a", "b", "c", "d"}
+    index.unsubscribe_all("c")
+    assert index.get_subscribers("/1/battery/voltage") == {"a", "b", "d"}
+    assert index.get_subscribers("/3/led") == frozenset()
+    assert "c" not in index
+
+
+def test_reference_counting(index):
+    assert index.subscribe("a", "/1") == 1
+    assert index.subscribe("a", "/1") == 2
+    assert index.subscribe("a", "/1/led", count=3) == 3
+
+    assert index.unsubscribe("a", "/1") == ["/1"]
+    assert index.get_subscribers("/1/gps") == {"a"}
+    assert index.unsubscribe("a", "/1") == ["/1"]
+    assert index.get_subscribers("/1/gps") == frozenset()
+    assert index.unsubscribe("a", "/1") == []
+
+    assert index.unsubscribe("a", "/1/led", remove_all=True) == ["/1/led"]
+    assert index.clients == []
+    assert index._root.children == {}
+
+    with raises(ValueError):
+        index.subscribe("a", "/1", count=0)
+    with raises(ValueError):
+        index.subscribe("a", "/1", count=-1)
+    assert index.clients == []
+
+
+def test_unsubscribe_subtrees(index):
+    index.subscribe("a", "/1")
+    index.subscribe("a", "/1/battery", count=2)
+    index.subscribe("a", "/1/led")
+    index.subscribe("a", "/10/led")
+
+    removed = index.unsubscribe("a", "/1", include_subtrees=True)
+    assert sorted(removed) == ["/1", "/1/battery", "/1/led"]
+    assert sorted(index.get_subscriptions("a")) == ["/1/battery", "/10/led"]
+
+    removed = index.unsubscribe("a", "/", include_subtrees=True, remove_all=True)
+    assert sorted(removed) == ["/1/battery", "/10/led"]
+    assert index.get_subscriptions("a") == []
+
+
+def test_matches_linear_scan():
+    rng = Random(42)  # noqa: S311
+    index = SubscriptionIndex(max_cache_size=50)
+    subscriptions: dict[str, dict[str, int]] = {}
+    paths = ["/"] + [
+        f"/{uav}/{device}/{channel}"[: rng.choice((2, 4, 6, 100))].rstrip("/")
+        for uav in range(5)
+        for device in ("gps", "led")
+        for channel in ("x", "y")
+    ]
+
+    def expected_subscribers(path: str) -> set[str]:
+        return {
+            client
+            for client, counts in subscriptions.items()
+            for other in counts
+            if other == "/" or path == other or path.startswith(other + "/")
+        }
+
+    for _ in range(2000):
+        client = rng.choice("abcde")
+        path = rng.choice(paths)
+        action = rng.random()
+        if action < 0.4:
+            index.subscribe(client, path)
+            counts = subscriptions.setdefault(client, {})
+            counts[path] = counts.get(path, 0) + 1
+        elif action < 0.6:
+            remove_all = rng.random() < 0.5
+            removed = index.unsubscribe(client, path, remove_all=remove_all)
+            counts = subscriptions.get(client, {})
+            assert removed == ([path] if path in counts else [])
+            if removed:
+                counts[path] = 0 if remove_all else counts[path] - 1
+                if not counts[path]:
+                    del counts[path]
+        else:
+            # Also query a path below the deepest node of the trie
+            below = path + "/z" if path != "/" else "/z"
+            assert index.get_subscribers(path) == expected_subscribers(path)
+            assert index.get_subscribers(below) == expected_subscribers(below)
+
+
+def test_handle_requests(index):
+    response = index.handle_request(
+        "a",
+        {"type": "DEV-SUB", "paths": ["/1/battery", "/1/led", "/2", "/1/"]},
+        path_exists=lambda path: path != "/2",
+    )
+    assert response == {
+        "type": "DEV-SUB",
+        "success": ["/1/battery", "/1/led"],
+        "error": {"/2": "Path does not exist", "/1/": "Invalid device tree path"},
+    }
+
+    response = index.handle_request(
+        "a",
+        {"type": "DEV-SUB", "paths": ["/2", "/1/led"], "lazy": True},
+        path_exists=lambda path: path != "/2",
+    )
+    assert response == {"type": "DEV-SUB", "success": ["/2", "/1/led"]}
+
+    response = index.handle_request("a", {"type": "DEV-LISTSUB", "pathFilter": ["/1"]})
+    assert response == {
+        "type": "DEV-LISTSUB",
+        "paths": ["/1/battery", "/1/led", "/1/led"],
+    }
+
+    response = index.handle_request(
+        "a", {"type": "DEV-UNSUB", "paths": ["/1/led", "/3"], "removeAll": True}
+    )
+    assert response == {
+        "type": "DEV-UNSUB",
+        "success": ["/1/led"],
+        "error": {"/3": "Not subscribed to this path"},
+    }
+    assert index.handle_request("a", {"type": "DEV-LISTSUB"})["paths"] == [
+        "/1/battery",
+        "/2",
+    ]
+
+    with raises(ValueError):
+        index.handle_request("a", {"type": "DEV-INF", "paths": []})
+
+
+def test_update_batch(index):
+    index.subscribe("a", "/1")
+    index.subscribe("b", "/1/battery")
+    index.subscribe("c", "/2")
+
+    batch = DeviceTreeUpdateBatch(index)
+    batch.add("/1/battery/voltage", 12.1)
+    batch.add("/1/led", 1)
+    batch.update({"/1/battery/voltage": 12.0, "/3/led": 5})
+    assert len(batch) == 3
+
+    assert batch.flush() == {
+        "a": {"type": "DEV-INF", "values": {"/1/battery/voltage": 12.0, "/1/led": 1}},
+        "b": {"type": "DEV-INF", "values": {"/1/battery/voltage": 12.0}},
+    }
+    assert len(batch) == 0
+    assert batch.flush() == {}
@@ -0,0 +1,48 @@
+from flockwave.spec.validator import ValidationFailure, validate_many
+
+
+def test_validate_many_empty():
+    assert validate_many([]) == []
+
+
+def test_validate_many():
+    bodies = [
+        {"type": "UAV-INF", "status": {}},
+        {"type": "UAV-INF", "status": {"01": {"id": "01"}}},
+        None,
+        {"type": "NO-SUCH-MESSAGE"},
+        {"type": "UAV-INF", "ids": ["01", "02"]},
+        42,
+    ]
+    results = validate_many(bodies)
+
+    assert len(results) == len(bodies)
+    assert results[0] is None
+    assert results[2] is None
+    assert results[4] is None
+    for index in (1, 3, 5):
+        assert isinstance(results[index], ValidationFailure)
+
+
+def test_validate_many_error_path():
+    bodies = (
+        {
+            "type": "UAV-INF",
+            "status": {"01": {"id": "01", "timestamp": 1234, "heading": 4000}},
+        }
+        for _ in range(3)
+    )
+    results = validate_many(bodies, "response")
+    assert len(results) == 3
+    for result in results:
+        assert result is not None
+        assert result.path == "data.status.01.heading"
+        assert "must be smaller than 3600" in result.message
+
+
+def test_validate_many_respects_kind():
+    bodies = [{"type": "UAV-INF", "ids": ["01"]}, {"type": "UAV-INF", "status": {}}]
+    assert [result is None for result in validate_many(bodies, "request")] == [
+        True,
+        False,
+    ]